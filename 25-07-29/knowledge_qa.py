@@ -13,6 +13,7 @@ from pathlib import Path
 current_dir = Path(__file__).parent
 parent_dir = current_dir.parent
 sys.path.append(str(parent_dir))
+sys.path.append(str(parent_dir / "legacy"))
 
 try:
     from embedding_service_v2 import get_embedding_service
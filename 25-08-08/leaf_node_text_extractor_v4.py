@@ -18,12 +18,19 @@
 
 import json
 import re
+import sys
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import logging
-from difflib import SequenceMatcher
 import gc
 
+# 공유 제목 위치 탐색기 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.title_locator import TitleLocator, TitleMatch
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -249,83 +256,32 @@ class HybridLeafNodeExtractorV4:
         Returns:
             str: 정밀 추출된 텍스트
         """
-        current_patterns = self.clean_title_for_matching(current_title)
+        # 범위 텍스트의 라인/오프셋/트라이그램 색인은 1회만 생성하고 현재/다음 제목 검색에 공유
+        locator = TitleLocator(content)
         
         # 현재 제목 위치 찾기
-        best_match_pos = -1
-        best_match_ratio = 0.0
-        best_pattern = ""
+        best_match, best_pattern = self._locate_best_pattern(locator, self.clean_title_for_matching(current_title))
         
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            line_clean = line.strip()
-            
-            # 각 패턴에 대해 매칭 시도
-            for pattern in current_patterns:
-                if not pattern:
-                    continue
-                    
-                # 완전 매칭 우선
-                if pattern in line_clean:
-                    ratio = 1.0
-                else:
-                    # 유사도 매칭
-                    ratio = SequenceMatcher(None, pattern.lower(), line_clean.lower()).ratio()
-                
-                if ratio > best_match_ratio and ratio > 0.6:  # 임계값 0.6
-                    best_match_ratio = ratio
-                    best_match_pos = content.find(line)
-                    best_pattern = pattern
-        
-        if best_match_pos == -1:
-            logger.warning(f"제목 '{current_title}' 매칭 실패 (최고 유사도: {best_match_ratio:.2f})")
+        if best_match is None:
+            logger.warning(f"제목 '{current_title}' 매칭 실패")
             self.stats['title_match_failures'] += 1
             return content  # 매칭 실패 시 전체 범위 반환
         
-        logger.info(f"제목 '{current_title}' 매칭 성공 (패턴: '{best_pattern}', 유사도: {best_match_ratio:.2f})")
+        logger.info(f"제목 '{current_title}' 매칭 성공 (패턴: '{best_pattern}', 유사도: {best_match.score:.2f})")
         self.stats['title_match_successes'] += 1
         
         # 매칭된 라인의 끝부분부터 시작
-        matched_line_start = best_match_pos
-        matched_line_end = best_match_pos
-        for line in lines:
-            if content.find(line) == best_match_pos:
-                matched_line_end = best_match_pos + len(line)
-                break
-        
-        start_pos = matched_line_end
+        start_pos = best_match.end
         
-        # 다음 제목 찾기
+        # 다음 제목 찾기 (start_pos 이후 라인에서만)
         if next_title:
-            next_patterns = self.clean_title_for_matching(next_title)
-            
-            next_match_pos = -1
-            next_best_ratio = 0.0
-            
-            # start_pos 이후의 텍스트에서 검색
-            remaining_text = content[start_pos:]
-            remaining_lines = remaining_text.split('\n')
+            next_match, _ = self._locate_best_pattern(
+                locator, self.clean_title_for_matching(next_title), min_offset=start_pos
+            )
             
-            for line in remaining_lines:
-                line_clean = line.strip()
-                
-                for pattern in next_patterns:
-                    if not pattern:
-                        continue
-                        
-                    if pattern in line_clean:
-                        ratio = 1.0
-                    else:
-                        ratio = SequenceMatcher(None, pattern.lower(), line_clean.lower()).ratio()
-                    
-                    if ratio > next_best_ratio and ratio > 0.6:
-                        next_best_ratio = ratio
-                        next_match_pos = remaining_text.find(line)
-            
-            if next_match_pos != -1:
-                end_pos = start_pos + next_match_pos
-                section_content = content[start_pos:end_pos]
-                logger.info(f"다음 제목 '{next_title}' 매칭 성공 (유사도: {next_best_ratio:.2f})")
+            if next_match is not None:
+                section_content = content[start_pos:next_match.start]
+                logger.info(f"다음 제목 '{next_title}' 매칭 성공 (유사도: {next_match.score:.2f})")
             else:
                 section_content = content[start_pos:]
                 logger.info(f"다음 제목 '{next_title}' 매칭 실패, 끝까지 추출")
@@ -334,6 +290,23 @@ class HybridLeafNodeExtractorV4:
         
         return section_content.strip()
     
+    def _locate_best_pattern(self, locator: TitleLocator, patterns: List[str], min_offset: int = 0) -> Tuple[Optional[TitleMatch], str]:
+        """
+        여러 매칭 패턴 중 최고 점수 라인 (같은 점수는 앞 라인 우선, 임계값 0.6)
+        
+        Returns:
+            (TitleMatch 또는 None, 매칭된 패턴)
+        """
+        best_match: Optional[TitleMatch] = None
+        best_pattern = ""
+        for pattern in patterns:
+            match = locator.locate(pattern, threshold=0.6, min_offset=min_offset)
+            if match is None:
+                continue
+            if best_match is None or (match.score, -match.line_index) > (best_match.score, -best_match.line_index):
+                best_match, best_pattern = match, pattern
+        return best_match, best_pattern
+    
     def format_extracted_content(self, node: Dict, content: str) -> str:
         """
         Level별 마크다운 헤더 적용 및 콘텐츠 형식화
@@ -12,7 +12,8 @@ Claude Code SDK 기반 리프 노드 경계 텍스트 추출기 (Max Plan 사용
 - Python 패키지: pip install claude-code-sdk
 
 사용법:
-python claude_sdk_leaf_boundary_extractor_v2.py [leaf_nodes_json] [chapter_markdown] [output_json]
+python claude_sdk_leaf_boundary_extractor_v2.py [leaf_nodes_json] [chapter_markdown] [output_json] [--cache=read|write|off]
+(--cache=read: 같은 프롬프트의 Claude 응답을 로컬 캐시에서 재사용, JSON 노드 목록으로 파싱되지 않는 응답은 저장하지 않음)
 """
 
 import json
@@ -24,9 +25,18 @@ import logging
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Tuple, Optional
-from claude_code_sdk import query, ClaudeCodeOptions, AssistantMessage, TextBlock
+from claude_code_sdk import ClaudeCodeOptions, AssistantMessage, TextBlock
 from claude_code_sdk import CLINotFoundError, ProcessError, CLIJSONDecodeError
 
+# 공유 제목 위치 탐색기 / LLM 호출 게이트웨이 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_cache import apply_cache_flag
+from shared.llm_gateway import get_llm_gateway, message_text
+from shared.title_locator import TitleLocator
+
 
 class ClaudeSDKLeafBoundaryExtractor:
     """Claude Code SDK를 활용한 리프 노드 경계 텍스트 추출기 (Max Plan 최적화)"""
@@ -223,7 +233,12 @@ class ClaudeSDKLeafBoundaryExtractor:
             self.stats['claude_api_calls'] += 1
             
             responses = []
-            async for message in query(prompt=prompt, options=self.options):
+            # JSON 노드 목록으로 파싱되지 않는 응답은 캐시하지 않음 (재실행 시 같은 실패 응답 재생 방지)
+            messages = await get_llm_gateway().query_messages(
+                prompt, options=self.options, label="leaf_boundary_batch",
+                cacheable=lambda msgs: self._has_node_json(message_text(msgs))
+            )
+            for message in messages:
                 if isinstance(message, AssistantMessage):
                     for block in message.content:
                         if isinstance(block, TextBlock):
@@ -384,26 +399,35 @@ class ClaudeSDKLeafBoundaryExtractor:
         
         return "\n".join(prompt_parts)
     
+    def _find_json_text(self, response_text: str) -> str:
+        """응답에서 JSON 블록 찾기 (여러 패턴 시도, 없으면 빈 문자열)"""
+        json_patterns = [
+            r'```json\s*([\s\S]*?)\s*```',  # 표준 JSON 블록
+            r'```\s*([\s\S]*?)\s*```',      # 일반 코드 블록
+            r'\[[\s\S]*?\]'                  # JSON 배열 직접
+        ]
+        
+        for pattern in json_patterns:
+            matches = re.findall(pattern, response_text, re.IGNORECASE)
+            if matches:
+                # 가장 큰 매치 선택
+                self.logger.debug(f"JSON 패턴 '{pattern}' 매치 성공")
+                return max(matches, key=len).strip()
+        return ""
+    
+    def _has_node_json(self, response_text: str) -> bool:
+        """응답이 JSON 노드 목록으로 파싱되는지 (캐시 저장 조건)"""
+        try:
+            return isinstance(json.loads(self._find_json_text(response_text)), list)
+        except ValueError:
+            return False
+    
     def _parse_claude_response_enhanced(self, response_text: str, original_nodes: List[Dict], section_analysis: Dict) -> Optional[List[Dict]]:
         """강화된 Claude 응답 파싱"""
         try:
             self.logger.debug(f"강화된 응답 파싱 시작: {response_text[:200]}...")
             
-            # JSON 블록 찾기 (여러 패턴 시도)
-            json_patterns = [
-                r'```json\s*([\s\S]*?)\s*```',  # 표준 JSON 블록
-                r'```\s*([\s\S]*?)\s*```',      # 일반 코드 블록
-                r'\[[\s\S]*?\]'                  # JSON 배열 직접
-            ]
-            
-            json_text = ""
-            for pattern in json_patterns:
-                matches = re.findall(pattern, response_text, re.IGNORECASE)
-                if matches:
-                    # 가장 큰 매치 선택
-                    json_text = max(matches, key=len).strip()
-                    self.logger.debug(f"JSON 패턴 '{pattern}' 매치 성공")
-                    break
+            json_text = self._find_json_text(response_text)
             
             if json_text:
                 parsed_data = json.loads(json_text)
@@ -516,13 +540,15 @@ class ClaudeSDKLeafBoundaryExtractor:
         """부분 실패한 노드들을 폴백으로 보완"""
         self.logger.info("🔄 부분 실패 노드들을 폴백으로 보완 중...")
         
+        # 챕터 라인 색인은 1회만 만들어 폴백 노드 전체가 공유
+        locator = TitleLocator(chapter_text)
         enhanced_nodes = []
         for node in partial_nodes:
             if node.get('needs_fallback', False) or not node.get('start_text', '').strip():
                 # 폴백 처리 필요
                 try:
                     title = node.get('title', '')
-                    start_pos, end_pos = self._fallback_search_enhanced(chapter_text, title, node.get('id'))
+                    start_pos, end_pos = self._fallback_search_enhanced(chapter_text, title, node.get('id'), locator)
                     
                     if start_pos != -1:
                         start_text, end_text = self._extract_boundary_texts(chapter_text, start_pos, end_pos)
@@ -673,13 +699,14 @@ JSON 배열만 반환하세요. 설명 금지."""
         self.stats['fallback_searches'] += 1
         
         updated_nodes = []
+        locator = TitleLocator(chapter_text)
         
         for node in leaf_nodes:
             try:
                 title = node.get('title', '')
                 
                 # 간단한 텍스트 검색
-                start_pos, end_pos = self._fallback_search(chapter_text, title)
+                start_pos, end_pos = self._fallback_search(chapter_text, title, locator)
                 
                 # 경계 텍스트 추출
                 start_text, end_text = self._extract_boundary_texts(chapter_text, start_pos, end_pos)
@@ -713,8 +740,8 @@ JSON 배열만 반환하세요. 설명 금지."""
         
         return updated_nodes
     
-    def _fallback_search_enhanced(self, text: str, title: str, node_id: int) -> Tuple[int, int]:
-        """강화된 폴백 검색 (더 많은 패턴 시도)"""
+    def _fallback_search_enhanced(self, text: str, title: str, node_id: int, locator: Optional[TitleLocator] = None) -> Tuple[int, int]:
+        """강화된 폴백 검색 (제목 라인 색인 조회 후, 실패 시 더 많은 패턴 시도)"""
         self.logger.debug(f"강화된 폴백 검색 시작: [{node_id}] {title}")
         
         # 1단계: 기본 패턴들
@@ -743,11 +770,18 @@ JSON 배열만 반환하세요. 설명 금지."""
                 if len(word) > 3:  # 의미있는 단어만
                     title_variants.append(word)
         
-        # 4단계: 정규식 패턴 검색
+        # 4단계: 제목 라인 색인 조회 (정규화 제목 포함 또는 유사 라인), 실패 시 패턴 검색
         start_pos = -1
         found_pattern = None
         
+        match = (locator or TitleLocator(text)).locate(title, threshold=0.8)
+        if match is not None:
+            start_pos = match.start
+            found_pattern = title
+        
         for variant in title_variants:
+            if start_pos != -1:
+                break
             if not variant:
                 continue
             
@@ -814,7 +848,7 @@ JSON 배열만 반환하세요. 설명 금지."""
         self.logger.debug(f"'{title}' 섹션 범위: {start_pos}-{end_pos} ({end_pos-start_pos}자)")
         return start_pos, end_pos
     
-    def _fallback_search(self, text: str, title: str) -> Tuple[int, int]:
+    def _fallback_search(self, text: str, title: str, locator: Optional[TitleLocator] = None) -> Tuple[int, int]:
         """간단한 폴백 검색"""
         # 제목 정규화
         title_variants = [
@@ -827,10 +861,15 @@ JSON 배열만 반환하세요. 설명 금지."""
         ]
         
         start_pos = -1
+        if locator is not None:
+            match = locator.locate(title, threshold=0.8)
+            if match is not None:
+                start_pos = match.start
+        
         for variant in title_variants:
-            start_pos = text.find(variant)
             if start_pos != -1:
                 break
+            start_pos = text.find(variant)
         
         if start_pos == -1:
             # 부분 매칭 시도
@@ -911,11 +950,12 @@ async def main():
     print("🚀 Claude Code SDK 리프 노드 경계 텍스트 추출기 (Max Plan 최적화)")
     print("=" * 70)
     
-    # 명령행 인수 처리
-    if len(sys.argv) == 4:
-        leaf_nodes_path = sys.argv[1]
-        chapter_path = sys.argv[2] 
-        output_path = sys.argv[3]
+    # 명령행 인수 처리 (--cache=read|write|off는 먼저 분리)
+    args = apply_cache_flag(sys.argv[1:])
+    if len(args) == 3:
+        leaf_nodes_path = args[0]
+        chapter_path = args[1] 
+        output_path = args[2]
     else:
         # 기본 파일 경로
         leaf_nodes_path = "/home/nadle/projects/Knowledge_Sherpa/v2/25-08-09/part2_scalability_leaf_nodes.json"
@@ -999,4 +1039,7 @@ python claude_sdk_leaf_boundary_extractor_v2.py
 
 # 사용자 지정 경로
 python claude_sdk_leaf_boundary_extractor_v2.py [리프노드JSON] [원문MD] [출력JSON]
+
+# 재실행 시 Claude 응답 캐시 재사용
+python claude_sdk_leaf_boundary_extractor_v2.py [리프노드JSON] [원문MD] [출력JSON] --cache=read
 """
\ No newline at end of file
@@ -23,9 +23,17 @@
 
 import json
 import asyncio
+import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
+# 공유 제목 위치 탐색기 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.title_locator import TitleLocator
+
 # Claude SDK 관련 임포트
 try:
     from claude_code_sdk import ClaudeSDKClient, ClaudeCodeOptions
@@ -89,7 +97,7 @@ class DynamicBoundaryExtractor:
         
         return source_text, leaf_nodes
     
-    async def extract_leaf_node_boundaries(self, source_text: str, target_node: Dict[str, Any], prev_node: Optional[Dict[str, Any]], next_node: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
+    async def extract_leaf_node_boundaries(self, source_text: str, target_node: Dict[str, Any], prev_node: Optional[Dict[str, Any]], next_node: Optional[Dict[str, Any]], locator: Optional[TitleLocator] = None) -> Tuple[Optional[str], Optional[str]]:
         """
         Claude SDK를 사용해 특정 리프노드의 섹션 경계를 동적으로 추출합니다.
         
@@ -98,6 +106,7 @@ class DynamicBoundaryExtractor:
             target_node: 추출할 타겟 리프노드
             prev_node: 이전 리프노드 (컨텍스트용)
             next_node: 다음 리프노드 (컨텍스트용)
+            locator: 원문 제목 위치 탐색기 (여러 노드 처리 시 1개를 공유)
             
         Returns:
             tuple: (시작 경계 문자열, 종료 경계 문자열)
@@ -115,7 +124,8 @@ class DynamicBoundaryExtractor:
         
         # 문서가 너무 길면 타겟 주변으로 샘플링
         if len(source_text) > 20000:
-            target_pos = source_text.find(target_title)
+            match = (locator or TitleLocator(source_text)).locate(target_title)
+            target_pos = match.start if match else -1
             if target_pos != -1:
                 start_sample = max(0, target_pos - 3000)
                 end_sample = min(len(source_text), target_pos + 12000)
@@ -304,7 +314,7 @@ async def main():
         # 경계 추출
         print(f"\n🔍 동적 경계 추출 시작...")
         start_boundary, end_boundary = await extractor.extract_leaf_node_boundaries(
-            source_text, target_node, prev_node, next_node
+            source_text, target_node, prev_node, next_node, TitleLocator(source_text)
         )
         
         if not start_boundary or not end_boundary:
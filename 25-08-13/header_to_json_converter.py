@@ -13,13 +13,19 @@
 참조: node_section_extractor_v3.py의 노드 구조 호환성 고려
 """
 
-import re
 import json
 import sys
 import argparse
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
+# 공유 마크다운 헤딩 토크나이저 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.markdown_headings import iter_headings
+
 def extract_headers(text: str) -> List[Tuple[str, int]]:
     """
     마크다운 텍스트에서 헤더를 추출합니다.
@@ -34,24 +40,10 @@ def extract_headers(text: str) -> List[Tuple[str, int]]:
     """
     headers = []
     
-    # 마크다운 헤더 패턴: 줄 시작에 1-6개의 # + 공백 + 제목
-    pattern = r'^(#{1,6})\s+(.+)$'
-    
-    lines = text.split('\n')
-    
-    for line_num, line in enumerate(lines, 1):
-        line = line.strip()
-        match = re.match(pattern, line)
-        
-        if match:
-            hash_marks = match.group(1)
-            title = match.group(2).strip()
-            
-            # 레벨 계산 (# 개수 - 1)
-            level = len(hash_marks) - 1
-            
-            headers.append((title, level))
-            print(f"📍 발견: {hash_marks} {title} (레벨 {level})")
+    # 마크다운 헤더: 줄 시작(앞 공백 허용)에 1-6개의 # + 공백 + 제목, 문서 1회 스캔
+    for heading in iter_headings(text, max_hashes=6):
+        headers.append((heading.title, heading.level))
+        print(f"📍 발견: {'#' * (heading.level + 1)} {heading.title} (레벨 {heading.level})")
     
     return headers
 
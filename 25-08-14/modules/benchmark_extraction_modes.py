@@ -0,0 +1,155 @@
+"""
+생성 시간: 2026-10-18 18:02:14
+핵심 내용: ContentAnalyzer 추출 모드 벤치마크 (섹션별 4회 병렬 호출 vs 단일 호출)
+상세 내용:
+    - 노드 정보 문서(*_info.md)의 # 내용 섹션을 모드별로 추출 → 섹션 검증 → 누락 섹션만 재추출 (ParentNodeProcessor와 같은 흐름)
+    - 모드별 지표 (shared.llm_gateway 호출 지표 차이): LLM 호출 수, 입력/출력 토큰, 비용, 노드당 지연 (평균 / p95),
+      1차 누락·형식 오류 섹션 비율, 재추출 후 최종 실패 섹션 비율 ("추출 실패" 값 포함)
+    - LLM 응답 캐시는 강제로 끔 (매 실행 실제 호출 측정)
+    - 사용법: python benchmark_extraction_modes.py <node_docs_dir> [--limit N] [--modes four_call,single_call] [--output report.json]
+상태: 활성
+주소: benchmark_extraction_modes
+참조: content_analysis_module_v3.py, parent_node_processor.py, shared/llm_gateway
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from content_analysis_module_v3 import EXTRACTION_SECTIONS
+from logging_system_v2 import ProcessLogger
+from parent_node_processor import ParentNodeProcessor
+
+# 공유 노드 문서 파서 / LLM 호출 게이트웨이 / 응답 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_cache import configure_llm_cache
+from shared.llm_gateway import get_llm_gateway, percentile
+from shared.node_document import load_node_document, section_lines
+
+MODES = ("four_call", "single_call")
+
+
+def load_documents(node_docs_dir: Path, limit: int) -> List[Tuple[str, str]]:
+    """(제목, 내용 섹션) 목록 (내용이 없는 문서 제외)"""
+    documents = []
+    for file_path in sorted(node_docs_dir.glob("*_info.md")):
+        content = section_lines(load_node_document(file_path).section("내용"))
+        if content:
+            documents.append((file_path.stem.replace("_info", ""), content))
+        if limit and len(documents) >= limit:
+            break
+    return documents
+
+
+def failed_sections(processor: ParentNodeProcessor, extracted_info: Dict[str, str]) -> List[str]:
+    """누락 섹션 + "추출 실패" 값으로 채워진 섹션"""
+    missing = processor.validate_extraction_sections(extracted_info)
+    return missing + [section for section in EXTRACTION_SECTIONS
+                      if section not in missing and extracted_info[section].startswith("추출 실패")]
+
+
+async def benchmark_mode(mode: str, documents: List[Tuple[str, str]], processor: ParentNodeProcessor) -> Dict[str, Any]:
+    """한 모드로 전체 문서 추출 (노드는 순차, 노드 안의 호출은 모드대로)"""
+    processor.content_analyzer.single_call = mode == "single_call"
+    gateway = get_llm_gateway()
+    before = dict(gateway.totals)
+    latencies = []
+    first_pass_missing = 0
+    final_failed = 0
+
+    for title, content in documents:
+        started = time.perf_counter()
+        extracted_info = await processor.content_analyzer.extract_content(content, title)
+        missing = processor.validate_extraction_sections(extracted_info)
+        first_pass_missing += len(missing)
+        if missing:
+            extracted_info.update(await processor.retry_missing_sections(content, title, missing))
+        final_failed += len(failed_sections(processor, extracted_info))
+        latencies.append(time.perf_counter() - started)
+        print(f"   {'✅' if not missing else '🔁'} [{mode}] {title}: {latencies[-1]:.1f}초, 1차 누락 {len(missing)}개")
+
+    after = gateway.totals
+    total_sections = len(documents) * len(EXTRACTION_SECTIONS)
+    latencies.sort()
+    return {
+        "mode": mode,
+        "nodes": len(documents),
+        "llm_calls": after["calls"] - before["calls"],
+        "llm_failures": after["failures"] - before["failures"],
+        "input_tokens": after["input_tokens"] - before["input_tokens"],
+        "output_tokens": after["output_tokens"] - before["output_tokens"],
+        "cost_usd": round(after["cost_usd"] - before["cost_usd"], 6),
+        "avg_latency": sum(latencies) / len(latencies) if latencies else 0.0,
+        "p95_latency": percentile(latencies, 0.95),
+        "first_pass_missing_rate": first_pass_missing / total_sections if total_sections else 0.0,
+        "final_failure_rate": final_failed / total_sections if total_sections else 0.0
+    }
+
+
+def print_report(results: List[Dict[str, Any]]):
+    rows = [
+        ("LLM 호출", "llm_calls", "{:d}"),
+        ("입력 토큰", "input_tokens", "{:,d}"),
+        ("출력 토큰", "output_tokens", "{:,d}"),
+        ("비용 ($)", "cost_usd", "{:.4f}"),
+        ("노드당 평균 지연 (초)", "avg_latency", "{:.2f}"),
+        ("노드당 p95 지연 (초)", "p95_latency", "{:.2f}"),
+        ("1차 누락/형식 오류율", "first_pass_missing_rate", "{:.1%}"),
+        ("최종 실패율", "final_failure_rate", "{:.1%}")
+    ]
+    print("\n" + "=" * 70)
+    print(f"{'지표':<24}" + "".join(f"{result['mode']:>20}" for result in results))
+    print("-" * 70)
+    for label, key, fmt in rows:
+        print(f"{label:<24}" + "".join(f"{fmt.format(result[key]):>20}" for result in results))
+    print("=" * 70)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="ContentAnalyzer 추출 모드 벤치마크 (4회 호출 vs 단일 호출)")
+    parser.add_argument("node_docs_dir", help="노드 정보 문서(*_info.md) 폴더")
+    parser.add_argument("--limit", type=int, default=5, help="벤치마크할 문서 수 (0이면 전체, 기본값: 5)")
+    parser.add_argument("--modes", default=",".join(MODES), help="실행할 모드 (쉼표 구분, 기본값: four_call,single_call)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    node_docs_dir = Path(args.node_docs_dir)
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        print(f"❌ 알 수 없는 모드: {unknown} (가능: {', '.join(MODES)})")
+        return 1
+
+    documents = load_documents(node_docs_dir, args.limit)
+    if not documents:
+        print(f"❌ 내용이 있는 노드 정보 문서가 없습니다: {node_docs_dir}")
+        return 1
+
+    # 캐시 적중이 섞이면 토큰/지연 비교가 무의미하므로 캐시 끔
+    configure_llm_cache("off")
+    output_dir = Path(args.output).resolve().parent if args.output else node_docs_dir.resolve().parent
+    processor = ParentNodeProcessor(str(node_docs_dir), ProcessLogger("benchmark_extraction_modes", output_dir))
+
+    print(f"🏁 추출 모드 벤치마크: 문서 {len(documents)}개, 모드 {', '.join(modes)}")
+    results = []
+    for mode in modes:
+        print(f"\n🔄 {mode} 실행 중...")
+        results.append(await benchmark_mode(mode, documents, processor))
+
+    print_report(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"documents": len(documents), "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
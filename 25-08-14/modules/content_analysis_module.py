@@ -9,16 +9,26 @@
     - _analyze_main_topics() (라인 165-): 주요 화제 분석
     - _analyze_sub_topics() (라인 215-): 부차 화제 분석
     - _extract_content_from_messages() (라인 265-): 메시지에서 텍스트 내용 추출 유틸리티
+    - 모든 LLM 호출은 shared.llm_gateway 경유 (전역 동시 요청 제한 + 속도 제한 + SDK 오류 백오프 재시도)
 상태: 활성
 주소: content_analysis_module
 참조: dialectical_synthesis_processor.py (기존 분석 로직 참조)
 """
 
 import asyncio
+import sys
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from claude_code_sdk import query, ClaudeCodeOptions
+from claude_code_sdk import ClaudeCodeOptions
 import logging
 
+# 공유 LLM 호출 게이트웨이 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_gateway import get_llm_gateway
+
 
 class ContentAnalyzer:
     """4가지 정보 추출을 위한 공통 모듈 - 모든 노드 타입(리프, 내부, 루트)에서 사용 가능"""
@@ -112,16 +122,15 @@ class ContentAnalyzer:
         prompt = prompt_templates.get(context_type, prompt_templates["section"])
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}의 핵심 내용을 간결하고 명확하게 요약하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_analyze_core_content"
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('핵심 내용', content_result)
@@ -167,16 +176,15 @@ class ContentAnalyzer:
         prompt = prompt_templates.get(context_type, prompt_templates["section"])
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}의 상세한 내용을 체계적이고 포괄적으로 정리하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_analyze_detailed_content"
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('상세 핵심 내용', content_result)
@@ -242,16 +250,15 @@ class ContentAnalyzer:
         prompt = prompt_templates.get(context_type, prompt_templates["section"])
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}에서 다루는 주요 화제를 체계적으로 식별하고 정리하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_analyze_main_topics"
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('주요 화제', content_result)
@@ -317,16 +324,15 @@ class ContentAnalyzer:
         prompt = prompt_templates.get(context_type, prompt_templates["section"])
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}에서 다루는 부차 화제를 체계적으로 식별하고 정리하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_analyze_sub_topics"
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('부차 화제', content_result)
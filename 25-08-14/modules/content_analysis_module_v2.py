@@ -7,16 +7,26 @@
     - update_extraction_section() (라인 73-): 전체 추출 섹션 통째로 업데이트하는 함수
     - _extract_content_from_messages() (라인 112-): 메시지에서 텍스트 내용 추출 유틸리티
     - 추출용 메서드들 (라인 124-): 4가지 정보별 순수 추출 메서드
+    - 모든 LLM 호출은 shared.llm_gateway 경유 (전역 동시 요청 제한 + 속도 제한 + SDK 오류 백오프 재시도)
 상태: 활성 (전체 섹션 업데이트 방식)
 주소: content_analysis_module_v2
 참조: content_analysis_module.py (원본 버전)
 """
 
 import asyncio
+import sys
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from claude_code_sdk import query, ClaudeCodeOptions
+from claude_code_sdk import ClaudeCodeOptions
 import logging
 
+# 공유 LLM 호출 게이트웨이 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_gateway import get_llm_gateway
+
 
 class ContentAnalyzer:
     """4가지 정보 추출 및 전체 추출 섹션 업데이트를 위한 단순화된 모듈"""
@@ -111,16 +121,15 @@ class ContentAnalyzer:
 [업데이트된 부차 화제]"""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=full_prompt,
+            messages = await get_llm_gateway().query_messages(
+                full_prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 업데이트 전문가. {title}의 추출 섹션을 개선하고 업데이트하는 것이 목표입니다.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="update_extraction_section"
+            )
             
             updated_content = self._extract_content_from_messages(messages)
             self.logger.info(f"✅ 전체 추출 섹션 업데이트 완료: {len(updated_content)}자")
@@ -154,16 +163,15 @@ class ContentAnalyzer:
 응답에 '핵심 내용'이라는 헤더는 포함하지 마세요."""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}의 핵심 내용을 간결하고 명확하게 요약하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_extract_core_content"
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('핵심 내용', content_result)
@@ -182,16 +190,15 @@ class ContentAnalyzer:
 헤더를 사용할 경우 ### 3레벨부터 사용하고, 응답에 '상세 핵심 내용'이라는 헤더는 포함하지 마세요."""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}의 상세한 내용을 체계적이고 포괄적으로 정리하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_extract_detailed_content"
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('상세 핵심 내용', content_result)
@@ -214,16 +221,15 @@ class ContentAnalyzer:
 반드시 - 기호로 시작하는 목록 형태로만 답변해주세요."""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}에서 다루는 주요 화제를 체계적으로 식별하고 정리하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_extract_main_topics"
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('주요 화제', content_result)
@@ -246,16 +252,15 @@ class ContentAnalyzer:
 반드시 - 기호로 시작하는 목록 형태로만 답변해주세요."""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}에서 다루는 부차 화제를 체계적으로 식별하고 정리하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_extract_sub_topics"
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('부차 화제', content_result)
@@ -9,22 +9,43 @@
     - format_extraction_section() (라인 185-): "# 추출" + "## 섹션명" 헤더 형식
     - _extract_core_sections() (라인 205-): 추출 섹션에서 핵심/상세핵심만 분리
     - _extract_all_sections() (라인 245-): 추출 섹션에서 모든 섹션 분리
+    - 단일 호출 모드 (single_call=True, 선택): 4개 섹션을 ## 헤더 스키마로 한 번에 요청 후 로컬 파싱
+      형식이 잘못된 섹션은 빈 값으로 반환 → parent_node_processor의 validate_extraction_sections / retry_missing_sections가 해당 섹션만 재추출
+    - LLM 응답 캐시: 형식이 맞는 응답만 저장, 섹션별 추출 메서드의 bypass_cache=True는 캐시를 읽지 않고 새로 호출 (재추출 경로)
+    - 모든 LLM 호출은 shared.llm_gateway 경유 (전역 동시 요청 제한 + 속도 제한 + SDK 오류 백오프 재시도)
 상태: 활성
 주소: content_analysis_module_v3/core_sections_separated
 참조: content_analysis_module_v2.py
 """
 
 import asyncio
+import sys
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from claude_code_sdk import query, ClaudeCodeOptions
+from claude_code_sdk import ClaudeCodeOptions
 import logging
 
+# 공유 LLM 호출 게이트웨이 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_gateway import get_llm_gateway
+
+EXTRACTION_SECTIONS = ["핵심 내용", "상세 핵심 내용", "주요 화제", "부차 화제"]
+
 
 class ContentAnalyzer:
     """추출/업데이트 분리 및 핵심 섹션 분리 처리를 위한 분석 모듈 V3"""
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None, single_call: bool = False):
+        """
+        Args:
+            logger: 로거
+            single_call: True면 extract_content가 4개 섹션을 한 번의 호출로 추출 (기본: 섹션별 4회 병렬 호출)
+        """
         self.logger = logger or logging.getLogger(__name__)
+        self.single_call = single_call
         
     async def extract_content(self, content: str, title: str) -> Dict[str, str]:
         """
@@ -39,6 +60,9 @@ class ContentAnalyzer:
         """
         self.logger.info(f"내용 추출 시작: {title}")
         
+        if self.single_call:
+            return await self._extract_content_single_call(content, title)
+        
         # 병렬 분석 실행
         tasks = [
             self._extract_core_content(content, title),
@@ -51,10 +75,9 @@ class ContentAnalyzer:
         
         # 결과 정리
         analysis_result = {}
-        sections = ["핵심 내용", "상세 핵심 내용", "주요 화제", "부차 화제"]
         
         for i, result in enumerate(results):
-            section = sections[i]
+            section = EXTRACTION_SECTIONS[i]
             if isinstance(result, Exception):
                 self.logger.error(f"❌ {section} 추출 실패: {result}")
                 analysis_result[section] = f"추출 실패: {str(result)}"
@@ -71,6 +94,82 @@ class ContentAnalyzer:
         
         return analysis_result
     
+    async def _extract_content_single_call(self, content: str, title: str) -> Dict[str, str]:
+        """
+        단일 호출 추출: 4개 섹션을 ## 헤더 스키마로 한 번에 요청 후 로컬 파싱
+        
+        Returns:
+            Dict[str, str]: 4개 섹션 (누락/형식 오류 섹션과 호출 실패 시에는 빈 문자열 → 호출 측에서 해당 섹션만 재추출)
+        """
+        prompt = f"""다음은 "{title}"의 내용입니다:
+
+{content}
+
+이 내용을 분석해 아래 4개 섹션을 정확히 이 순서와 헤더로 작성해주세요.
+헤더 앞뒤에 서론, 맺음말, 코드 블록 등 다른 텍스트는 쓰지 마세요.
+
+## 핵심 내용
+[이 내용의 핵심을 2-3문장으로 간결하게 요약, 헤더나 마크다운 형식 없이]
+
+## 상세 핵심 내용
+[상세 핵심 내용을 체계적으로 정리, 헤더를 사용할 경우 ### 3레벨부터]
+
+## 주요 화제
+- 주요 화제1(구체적인 주제명): 이 화제에 대해 다루는 내용
+- 주요 화제2(구체적인 주제명): 이 화제에 대해 다루는 내용
+
+## 부차 화제
+- 부차 화제1(구체적인 주제명): 이 화제에 대해 다루는 내용
+- 부차 화제2(구체적인 주제명): 이 화제에 대해 다루는 내용"""
+        
+        try:
+            messages = await get_llm_gateway().query_messages(
+                prompt,
+                options=ClaudeCodeOptions(
+                    max_turns=1,
+                    system_prompt=f"텍스트 분석 전문가. {title}의 핵심 내용, 상세 핵심 내용, 주요 화제, 부차 화제를 지정된 ## 헤더 형식으로만 정리하세요.",
+                    allowed_tools=[]
+                ),
+                label="_extract_content_single_call",
+                # 형식 오류 섹션이 있는 응답은 저장하지 않음 (재실행 시 다시 호출)
+                cacheable=lambda messages: self._all_sections_valid(self._extract_content_from_messages(messages))
+            )
+            response = self._extract_content_from_messages(messages)
+        except Exception as e:
+            self.logger.error(f"단일 호출 추출 중 오류 발생: {e}")
+            return {section: "" for section in EXTRACTION_SECTIONS}
+        
+        analysis_result = self._extract_all_sections(response)
+        for section in EXTRACTION_SECTIONS:
+            if not self._is_valid_section(section, analysis_result.get(section, "")):
+                self.logger.warning(f"⚠️ {section} 형식 오류 또는 누락 (단일 호출): 재추출 대상")
+                analysis_result[section] = ""
+        
+        success_count = sum(1 for v in analysis_result.values() if v)
+        self.logger.info(f"📊 내용 추출 완료 (단일 호출): {success_count}/4 섹션 성공")
+        
+        return analysis_result
+    
+    def _all_sections_valid(self, response: str) -> bool:
+        """단일 호출 응답의 4개 섹션이 모두 형식에 맞는지 (캐시 저장 조건)"""
+        sections = self._extract_all_sections(response)
+        return all(self._is_valid_section(section, sections.get(section, "")) for section in EXTRACTION_SECTIONS)
+    
+    def _section_cacheable(self, section: str):
+        """섹션별 추출 응답의 캐시 저장 조건 (형식이 맞는 응답만 저장)"""
+        return lambda messages: self._is_valid_section(section, self._extract_content_from_messages(messages))
+    
+    def _is_valid_section(self, section: str, text: str) -> bool:
+        """단일 호출 응답의 섹션 형식 검증 (화제 섹션은 - 목록 필수, 핵심 내용은 헤더 금지)"""
+        if not text.strip():
+            return False
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        if section in ("주요 화제", "부차 화제"):
+            return any(line.startswith('- ') for line in lines)
+        if section == "핵심 내용":
+            return not any(line.startswith('#') for line in lines)
+        return True
+    
     async def update_child_extraction(self, base_extraction: str, reference_extraction: str, 
                                     title: str) -> str:
         """
@@ -121,16 +220,15 @@ class ContentAnalyzer:
 [업데이트된 상세 핵심 내용]"""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"추출 섹션 업데이트 전문가. {title}의 핵심 내용과 상세 핵심 내용을 개선하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="update_child_extraction"
+            )
             
             updated_core_content = self._extract_content_from_messages(messages)
             
@@ -201,16 +299,15 @@ class ContentAnalyzer:
 [출처가 명시된 부차 화제들]"""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"추출 섹션 업데이트 전문가. {title}의 전체 추출 섹션을 자식 정보를 반영하여 종합적으로 개선하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="update_parent_extraction"
+            )
             
             updated_content = self._extract_content_from_messages(messages)
             self.logger.info(f"✅ 부모 노드 추출 업데이트 완료: {title}")
@@ -343,7 +440,7 @@ class ContentAnalyzer:
         return content.strip()
     
     # 순수 추출용 메서드들
-    async def _extract_core_content(self, content: str, title: str) -> Tuple[str, str]:
+    async def _extract_core_content(self, content: str, title: str, bypass_cache: bool = False) -> Tuple[str, str]:
         """핵심 내용 추출"""
         prompt = f"""다음은 "{title}"의 내용입니다:
 
@@ -353,16 +450,17 @@ class ContentAnalyzer:
 응답에 헤더나 마크다운 형식은 사용하지 마세요."""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}의 핵심 내용을 간결하고 명확하게 요약하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_extract_core_content",
+                cacheable=self._section_cacheable("핵심 내용"),
+                bypass_cache=bypass_cache
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('핵심 내용', content_result)
@@ -371,7 +469,7 @@ class ContentAnalyzer:
             self.logger.error(f"핵심 내용 추출 중 오류 발생: {e}")
             return ('핵심 내용', f"추출 실패: {str(e)}")
 
-    async def _extract_detailed_content(self, content: str, title: str) -> Tuple[str, str]:
+    async def _extract_detailed_content(self, content: str, title: str, bypass_cache: bool = False) -> Tuple[str, str]:
         """상세 핵심 내용 추출"""
         prompt = f"""다음은 "{title}"의 내용입니다:
 
@@ -381,16 +479,17 @@ class ContentAnalyzer:
 헤더를 사용할 경우 ### 3레벨부터 사용하고, 응답에 '상세 핵심 내용'이라는 헤더는 포함하지 마세요."""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}의 상세한 내용을 체계적이고 포괄적으로 정리하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_extract_detailed_content",
+                cacheable=self._section_cacheable("상세 핵심 내용"),
+                bypass_cache=bypass_cache
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('상세 핵심 내용', content_result)
@@ -399,7 +498,7 @@ class ContentAnalyzer:
             self.logger.error(f"상세 핵심 내용 추출 중 오류 발생: {e}")
             return ('상세 핵심 내용', f"추출 실패: {str(e)}")
 
-    async def _extract_main_topics(self, content: str, title: str) -> Tuple[str, str]:
+    async def _extract_main_topics(self, content: str, title: str, bypass_cache: bool = False) -> Tuple[str, str]:
         """주요 화제 추출"""
         prompt = f"""다음은 "{title}"의 내용입니다:
 
@@ -413,16 +512,17 @@ class ContentAnalyzer:
 반드시 - 기호로 시작하는 목록 형태로만 답변해주세요."""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}에서 다루는 주요 화제를 체계적으로 식별하고 정리하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_extract_main_topics",
+                cacheable=self._section_cacheable("주요 화제"),
+                bypass_cache=bypass_cache
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('주요 화제', content_result)
@@ -431,7 +531,7 @@ class ContentAnalyzer:
             self.logger.error(f"주요 화제 추출 중 오류 발생: {e}")
             return ('주요 화제', f"추출 실패: {str(e)}")
 
-    async def _extract_sub_topics(self, content: str, title: str) -> Tuple[str, str]:
+    async def _extract_sub_topics(self, content: str, title: str, bypass_cache: bool = False) -> Tuple[str, str]:
         """부차 화제 추출"""
         prompt = f"""다음은 "{title}"의 내용입니다:
 
@@ -445,16 +545,17 @@ class ContentAnalyzer:
 반드시 - 기호로 시작하는 목록 형태로만 답변해주세요."""
         
         try:
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=f"텍스트 분석 전문가. {title}에서 다루는 부차 화제를 체계적으로 식별하고 정리하세요.",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_extract_sub_topics",
+                cacheable=self._section_cacheable("부차 화제"),
+                bypass_cache=bypass_cache
+            )
             
             content_result = self._extract_content_from_messages(messages)
             return ('부차 화제', content_result)
@@ -5,26 +5,38 @@
     - DataLoader 클래스 (라인 26-): 목적별 분리 (추출/업데이트 전용), node_docs_dir 기반
     - DataProcessor 클래스 (라인 179-): 3단계 처리 로직 분리, 개선된 병렬 처리
     - DataSaver 클래스 (라인 344-): 결과 저장 및 status 관리
-    - DialecticalSynthesisProcessor 클래스 (라인 482-): 적응적 병렬 처리 및 안정성 강화
+    - DialecticalSynthesisProcessor 클래스 (라인 482-): 의존성(DAG) 스케줄링 및 안정성 강화
     - 핵심 개선: 
-      * 병렬 처리 간 적응적 대기 시간 (성공률에 따라 조정)
-      * 실패율 모니터링 및 배치 크기 동적 조정
+      * children_ids 기반 DAG 스케줄러: 자식이 모두 완료(process_status: true)된 노드를 즉시 시작 (레벨 배리어 없음)
+      * 전역 동시 실행 예산(max_concurrency) + 노드별 대기/소요/임계 경로 시간 기록
+      * LLM 호출 속도 제한 / 백오프는 shared.llm_gateway가 전역으로 처리 (고정 대기 없음)
       * 재시도 메커니즘 추가
       * 메모리 정리 및 자원 관리 강화
+    - 노드 정보 문서 읽기/갱신: shared.node_document (파일별 1회 파싱 + 캐시, 추출 섹션/process_status 제자리 갱신)
 상태: 활성
 주소: dialectical_synthesis_processor_v7/enhanced_parallel
 참조: dialectical_synthesis_processor_v6.py
 """
 
 import asyncio
+import sys
 import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from node_grouper import NodeGrouper
 from content_analysis_module import ContentAnalyzer
 from logging_system_v2 import ProcessLogger
 
+# 공유 노드 문서 파서 / LLM 호출 게이트웨이 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_cache import apply_cache_flag
+from shared.llm_gateway import get_llm_gateway
+from shared.node_document import load_node_document, replace_section, set_property
+
 
 class DataLoader:
     """목적별로 분리된 노드 정보 로딩 클래스"""
@@ -156,30 +168,8 @@ class DataLoader:
     def _extract_section_from_file(self, file_path: Path, section_name: str) -> str:
         """파일에서 특정 섹션 내용 추출 - 하위 헤더 포함"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            header_pattern = f"# {section_name}"
-            header_start = content.find(header_pattern)
-            
-            if header_start == -1:
-                return ""
-            
-            content_start = header_start + len(header_pattern)
-            
-            # 다음 메인 섹션 헤더를 찾기 (같은 레벨의 헤더만)
-            # 줄 시작에서 시작하는 "# " 패턴을 찾아야 함
-            lines = content[content_start:].split('\n')
-            section_lines = []
-            
-            for line in lines:
-                # 줄 시작에서 "# "로 시작하는 것은 메인 섹션 헤더
-                if line.strip().startswith('# ') and not line.strip().startswith('##'):
-                    break
-                section_lines.append(line)
-            
-            section_content = '\n'.join(section_lines).strip()
-            return section_content
+            # 공유 파서: 구조 헤더(# 속성/추출/내용/구성) 기준 섹션, 하위 헤더 포함 (파일별 1회 파싱 + 캐시)
+            return load_node_document(file_path).section(section_name)
             
         except Exception as e:
             self.logger.log_error(f"섹션추출_{file_path.name}", e)
@@ -188,17 +178,7 @@ class DataLoader:
     def _get_composition_files(self, node_file_path: Path) -> List[str]:
         """구성 섹션에서 파일 목록 추출"""
         try:
-            composition_content = self._extract_section_from_file(node_file_path, "구성")
-            if not composition_content:
-                return []
-            
-            files = []
-            for line in composition_content.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#') and line.endswith('.md'):
-                    files.append(line)
-            
-            return files
+            return load_node_document(node_file_path).composition_files()
             
         except Exception:
             return []
@@ -221,39 +201,12 @@ class DataLoader:
 class DataProcessor:
     """3단계 처리 로직을 분리한 데이터 가공 클래스 - 안정적 병렬 처리"""
     
-    def __init__(self, content_analyzer: ContentAnalyzer, logger: ProcessLogger):
+    def __init__(self, content_analyzer: ContentAnalyzer, logger: ProcessLogger, max_concurrency: int = 1):
         self.content_analyzer = content_analyzer
         self.logger = logger
-        # 병렬처리 제한: 초기값 1개로 시작해서 성공률에 따라 조정
-        self.semaphore = asyncio.Semaphore(1)
+        # 동시 추출 제한: 스케줄러의 전역 동시 실행 예산과 같은 크기
+        self.semaphore = asyncio.Semaphore(max_concurrency)
         self._active_tasks = set()  # 활성 태스크 추적
-        
-        # 적응적 병렬 처리를 위한 통계
-        self.success_rate_history = []
-        self.current_batch_size = 1
-        self.max_batch_size = 3
-        self.min_wait_time = 1.0  # 최소 대기 시간
-        self.max_wait_time = 5.0  # 최대 대기 시간
-    
-    def _calculate_adaptive_wait_time(self, success_rate: float) -> float:
-        """성공률에 따른 적응적 대기 시간 계산"""
-        if success_rate >= 0.8:  # 80% 이상 성공
-            return self.min_wait_time
-        elif success_rate >= 0.6:  # 60-80% 성공
-            return (self.min_wait_time + self.max_wait_time) / 2
-        else:  # 60% 미만 성공
-            return self.max_wait_time
-    
-    def _adjust_batch_size(self, success_rate: float):
-        """성공률에 따른 배치 크기 조정"""
-        if success_rate >= 0.9 and self.current_batch_size < self.max_batch_size:
-            self.current_batch_size += 1
-            self.logger.log_operation("배치크기증가", "조정", 
-                                    {"new_size": self.current_batch_size, "success_rate": success_rate})
-        elif success_rate < 0.7 and self.current_batch_size > 1:
-            self.current_batch_size = max(1, self.current_batch_size - 1)
-            self.logger.log_operation("배치크기감소", "조정", 
-                                    {"new_size": self.current_batch_size, "success_rate": success_rate})
     
     async def process_content_extraction(self, content: str, node_title: str, retry_count: int = 0) -> Dict[str, str]:
         """순수 추출 작업: 4가지 정보 추출 (리프/부모 공통) - 재시도 포함"""
@@ -292,7 +245,6 @@ class DataProcessor:
                 if success_rate < 0.5 and retry_count < max_retries:
                     self.logger.log_operation(f"재시도예정_{node_title}", "낮은성공률", 
                                             {"현재성공률": success_rate, "재시도횟수": retry_count + 1})
-                    await asyncio.sleep(2.0)  # 재시도 전 대기
                     return await self.process_content_extraction(content, node_title, retry_count + 1)
                 
                 process_time = time.time() - process_start
@@ -304,11 +256,10 @@ class DataProcessor:
                 return extracted_data
                 
             except Exception as e:
-                # 예외 발생 시 재시도
+                # 예외 발생 시 재시도 (호출 간 대기/백오프는 LLM 게이트웨이가 처리)
                 if retry_count < max_retries:
                     self.logger.log_operation(f"예외재시도_{node_title}", "예외발생", 
                                             {"error": str(e), "재시도횟수": retry_count + 1})
-                    await asyncio.sleep(3.0)  # 예외 후 더 긴 대기
                     return await self.process_content_extraction(content, node_title, retry_count + 1)
                 
                 self.logger.log_error(f"내용추출_{node_title}", e)
@@ -457,25 +408,10 @@ class DataSaver:
             if not file_path.exists():
                 self._create_basic_node_file(file_path)
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            extraction_start = content.find("# 추출")
-            if extraction_start == -1:
-                content += "\n\n# 추출\n\n"
-                extraction_start = content.find("# 추출")
-            
             extraction_content = self._build_extraction_content(data)
             
-            next_section_start = content.find("\n# ", extraction_start + 4)
-            
-            if next_section_start == -1:
-                new_content = content[:extraction_start] + f"# 추출\n\n{extraction_content}\n"
-            else:
-                new_content = content[:extraction_start] + f"# 추출\n\n{extraction_content}\n" + content[next_section_start:]
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # '# 추출' 본문만 교체 (섹션이 없으면 문서 끝에 추가)
+            replace_section(file_path, "추출", f"\n{extraction_content}")
             
             success_sections = len([v for v in data.values() if v and v != "추출 실패"])
             self.logger.log_operation(f"저장완료_{file_path.name}", "성공", {"성공섹션": success_sections})
@@ -491,37 +427,8 @@ class DataSaver:
             if not file_path.exists():
                 return False
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 속성 섹션에서 process_status 찾기/업데이트
-            status_pattern = "process_status:"
-            status_start = content.find(status_pattern)
-            
-            if status_start == -1:
-                # process_status가 없으면 속성 섹션에 추가
-                attr_start = content.find("# 속성")
-                if attr_start != -1:
-                    attr_end = content.find("\n# ", attr_start + 4)
-                    if attr_end == -1:
-                        # 속성이 마지막 섹션
-                        new_content = content + f"\nprocess_status: {str(status).lower()}\n"
-                    else:
-                        # 속성 섹션 끝에 추가
-                        new_content = content[:attr_end] + f"\nprocess_status: {str(status).lower()}\n" + content[attr_end:]
-                else:
-                    # 속성 섹션이 없으면 파일 시작에 추가
-                    new_content = f"# 속성\nprocess_status: {str(status).lower()}\n\n{content}"
-            else:
-                # 기존 process_status 값 업데이트
-                line_end = content.find('\n', status_start)
-                if line_end == -1:
-                    line_end = len(content)
-                
-                new_content = content[:status_start] + f"process_status: {str(status).lower()}" + content[line_end:]
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # process_status 라인만 제자리 교체 (없으면 '# 속성' 섹션에 추가)
+            set_property(file_path, "process_status", str(status).lower())
             
             self.logger.log_operation(f"상태업데이트_{file_path.name}", "성공", {"status": str(status).lower()})
             return True
@@ -536,21 +443,7 @@ class DataSaver:
             if not file_path.exists():
                 return False
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            status_pattern = "process_status:"
-            status_start = content.find(status_pattern)
-            
-            if status_start == -1:
-                return False
-            
-            line_end = content.find('\n', status_start)
-            if line_end == -1:
-                line_end = len(content)
-            
-            status_line = content[status_start:line_end]
-            return "true" in status_line.lower()
+            return load_node_document(file_path).process_status
             
         except Exception:
             return False
@@ -585,28 +478,31 @@ process_status: false
 class DialecticalSynthesisProcessor:
     """정반합 방법론 메인 처리 클래스 V7 - 안정적 병렬 처리 및 적응적 시간 차"""
     
-    def __init__(self, node_docs_dir: str):
+    def __init__(self, node_docs_dir: str, max_concurrency: int = 3):
         self.node_docs_dir = Path(node_docs_dir)  # 실제 노드 파일들이 있는 디렉토리
         self.node_docs_dir.mkdir(exist_ok=True)
         
         # 로그 출력용 디렉토리 (node_docs_dir의 부모 디렉토리)
         self.output_dir = self.node_docs_dir.parent
         
+        # 전역 동시 실행 예산 (동시에 파이프라인을 실행하는 노드 수)
+        self.max_concurrency = max(1, max_concurrency)
+        
         # 공통 모듈 초기화
         self.logger = ProcessLogger("dialectical_synthesis_v7", self.output_dir)
         self.content_analyzer = ContentAnalyzer(self.logger.logger)
         
         # 전담 클래스들 초기화 - DataLoader는 실제 노드 파일 디렉토리 사용
         self.data_loader = DataLoader(self.node_docs_dir, self.logger)
-        self.data_processor = DataProcessor(self.content_analyzer, self.logger)
+        self.data_processor = DataProcessor(self.content_analyzer, self.logger, self.max_concurrency)
         self.data_saver = DataSaver(self.node_docs_dir, self.logger)
         self.node_grouper = NodeGrouper(self.logger)
         
         # 처리 결과 추적
         self.processing_results = {}
         
-        # 성능 통계
-        self.batch_success_rates = []
+        # 노드별 시간 기록 (대기/시작/종료/소요/임계 경로)
+        self.node_timings = {}
     
     async def process_nodes_from_json(self, json_path: str) -> Dict[str, Any]:
         """JSON 파일에서 노드를 로드하여 의존성 기반 배치 처리"""
@@ -618,183 +514,149 @@ class DialecticalSynthesisProcessor:
         return await self.process_nodes_with_dependencies(self.node_grouper.nodes_data)
     
     async def process_nodes_with_dependencies(self, nodes_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """의존성 기반 노드 처리 - 레벨별 순차, 레벨 내 의존성 고려"""
-        batch_start = time.time()
-        self.logger.log_operation("의존성처리시작", "시작", {"총노드수": len(nodes_data)})
-        
-        # 1. 레벨별 노드 분류 (리프/부모 분리)
-        level_categories = self.categorize_nodes_by_level(nodes_data)
-        
-        # 2. 높은 레벨(하위)부터 순차 처리
+        """
+        의존성(DAG) 기반 노드 처리
+        - children_ids로 그래프 구성, 자식이 모두 완료된 노드는 레벨과 무관하게 즉시 시작
+        - 완료 판정은 노드 정보 파일의 process_status (check_node_status)
+        - 실패한 노드의 조상만 건너뜀 (다른 하위 트리는 계속 진행)
+        - 전역 동시 실행 예산(max_concurrency) 안에서 실행
+        """
+        run_start = time.time()
+        self.logger.log_operation("의존성처리시작", "시작", 
+                                {"총노드수": len(nodes_data), "동시실행예산": self.max_concurrency})
+        
+        # 1. DAG 구성 (자식 → 부모, 부모별 남은 자식 수)
+        nodes_by_id = {node.get("id"): node for node in nodes_data}
+        parent_of = {}
+        remaining_children = {}
+        for node_id, node in nodes_by_id.items():
+            children = [child_id for child_id in node.get("children_ids") or [] if child_id in nodes_by_id]
+            remaining_children[node_id] = len(children)
+            for child_id in children:
+                parent_of[child_id] = node_id
+        
+        budget = asyncio.Semaphore(self.max_concurrency)
+        self.node_timings = {}
         total_results = {}
-        for level in sorted(level_categories.keys(), reverse=True):
-            category = level_categories[level]
-            
-            self.logger.log_operation(f"레벨{level}처리시작", "시작", 
-                                    {"리프노드": len(category["leaf_nodes"]), 
-                                     "부모노드": len(category["parent_nodes"])})
-            
-            # 레벨별 처리
-            level_success = await self.process_level_with_dependencies(level, category)
-            
-            if not level_success:
-                self.logger.log_error(f"레벨{level}처리", "실패 - 상위 레벨 처리 중단")
-                break
-            
-            # 결과 수집
-            total_results.update(self.collect_level_results(category))
-        
-        batch_time = time.time() - batch_start
+        blocked = set()
+        running = {}
+        
+        def start(node_id):
+            task = asyncio.create_task(self.run_node_with_budget(nodes_by_id[node_id], budget, run_start))
+            running[task] = node_id
+        
+        def block_ancestors(node_id, failed_title):
+            while node_id is not None and node_id not in blocked:
+                blocked.add(node_id)
+                title = nodes_by_id[node_id].get("title", "")
+                total_results[title] = False
+                self.logger.log_error(f"의존성건너뜀_{title}", f"하위 노드 실패: {failed_title}")
+                node_id = parent_of.get(node_id)
+        
+        # 2. 자식이 없는 노드부터 시작, 완료될 때마다 준비된 부모 시작
+        for node_id, count in remaining_children.items():
+            if count == 0:
+                start(node_id)
+        
+        while running:
+            done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node_id = running.pop(task)
+                node_data = nodes_by_id[node_id]
+                node_title = node_data.get("title", "")
+                if task.exception() is not None:
+                    self.logger.log_error(f"노드실행_{node_title}", task.exception())
+                
+                # 준비 신호: 노드 정보 파일의 process_status
+                completed = self.data_saver.check_node_status(self.data_loader._get_node_file_path(node_data))
+                total_results[node_title] = completed
+                
+                parent_id = parent_of.get(node_id)
+                if parent_id is None or parent_id in blocked:
+                    continue
+                if not completed:
+                    self.logger.log_error(f"노드완료검증_{node_title}", "status가 true가 아님")
+                    block_ancestors(parent_id, node_title)
+                    continue
+                
+                remaining_children[parent_id] -= 1
+                if remaining_children[parent_id] == 0:
+                    start(parent_id)
+        
+        # 순환 참조 등으로 시작되지 못한 노드
+        for node_id, node in nodes_by_id.items():
+            node_title = node.get("title", "")
+            if node_id not in self.node_timings and node_title not in total_results:
+                self.logger.log_error(f"의존성미해결_{node_title}", "자식 노드가 완료되지 않아 시작하지 못함")
+                total_results[node_title] = False
+        
+        # 3. 결과 및 임계 경로 통계
+        run_time = time.time() - run_start
         success_count = sum(1 for r in total_results.values() if r)
         final_success_rate = success_count / len(total_results) if total_results else 0
+        critical_path, critical_time = self.get_critical_path()
         
         self.logger.log_operation("의존성처리완료", "완료", 
-                                {"처리시간": f"{batch_time:.2f}초", 
+                                {"처리시간": f"{run_time:.2f}초", 
+                                 "임계경로시간": f"{critical_time:.2f}초",
+                                 "임계경로": " → ".join(critical_path),
                                  "성공노드": f"{success_count}/{len(total_results)}",
                                  "최종성공률": f"{final_success_rate:.2f}"})
+        self.logger.log_operation("LLM호출통계", "완료", get_llm_gateway().summary())
         
         return total_results
     
-    def categorize_nodes_by_level(self, nodes_data: List[Dict[str, Any]]) -> Dict[int, Dict[str, List[Dict[str, Any]]]]:
-        """레벨별로 노드를 리프/부모로 분류"""
-        level_categories = {}
+    async def run_node_with_budget(self, node_data: Dict[str, Any], budget: asyncio.Semaphore, 
+                                   run_start: float) -> bool:
+        """전역 예산 슬롯을 얻어 노드 파이프라인 실행 + 시간 기록"""
+        node_id = node_data.get("id")
+        ready_at = time.time()
         
-        for node in nodes_data:
-            level = node.get("level", 0)
-            if level not in level_categories:
-                level_categories[level] = {"leaf_nodes": [], "parent_nodes": []}
-            
-            children_ids = node.get("children_ids", [])
-            if children_ids and len(children_ids) > 0:
-                level_categories[level]["parent_nodes"].append(node)
-            else:
-                level_categories[level]["leaf_nodes"].append(node)
-        
-        return level_categories
-    
-    async def process_level_with_dependencies(self, level: int, category: Dict[str, List[Dict[str, Any]]]) -> bool:
-        """레벨 내 의존성 기반 처리"""
-        
-        # 1단계: 모든 리프 노드 처리 (적응적 병렬)
-        if category["leaf_nodes"]:
-            leaf_results = await self.process_all_leaf_nodes_adaptive(category["leaf_nodes"])
-            
-            # 리프 노드 완료 검증
-            if not self.verify_nodes_completion(category["leaf_nodes"]):
-                self.logger.log_error(f"레벨{level}_리프노드", "완료 검증 실패")
-                return False
-        
-        # 2단계: 부모 노드들 처리 (이제 자식들의 추출 섹션 존재)
-        if category["parent_nodes"]:
-            parent_results = await self.process_all_parent_nodes(category["parent_nodes"])
-            
-            # 부모 노드 완료 검증
-            if not self.verify_nodes_completion(category["parent_nodes"]):
-                self.logger.log_error(f"레벨{level}_부모노드", "완료 검증 실패")
-                return False
+        async with budget:
+            started = time.time()
+            success = False
+            try:
+                if node_data.get("children_ids"):
+                    success = await self.process_parent_node_pipeline(node_data)
+                else:
+                    success = await self.process_leaf_node_pipeline(node_data)
+            finally:
+                finished = time.time()
+                duration = finished - started
+                
+                # 임계 경로: 자기 소요 시간 + 가장 긴 자식 임계 경로 (자식은 이미 완료됨)
+                child_paths = [self.node_timings[child_id]["critical_path"] 
+                               for child_id in node_data.get("children_ids") or [] 
+                               if child_id in self.node_timings]
+                self.node_timings[node_id] = {
+                    "title": node_data.get("title", ""),
+                    "ready": ready_at - run_start,
+                    "start": started - run_start,
+                    "end": finished - run_start,
+                    "queue_wait": started - ready_at,
+                    "duration": duration,
+                    "critical_path": duration + max(child_paths, default=0.0),
+                    "children_ids": [child_id for child_id in node_data.get("children_ids") or [] 
+                                     if child_id in self.node_timings]
+                }
         
-        self.logger.log_operation(f"레벨{level}처리완료", "성공")
-        return True
+        return success
     
-    async def process_all_leaf_nodes_adaptive(self, leaf_nodes: List[Dict[str, Any]]) -> Dict[str, bool]:
-        """적응적 병렬 처리로 모든 리프 노드 처리"""
-        results = {}
-        total_nodes = len(leaf_nodes)
-        
-        self.logger.log_operation("적응적리프처리시작", "시작", 
-                                {"총노드수": total_nodes, "초기배치크기": self.data_processor.current_batch_size})
+    def get_critical_path(self) -> Tuple[List[str], float]:
+        """기록된 시간으로 임계 경로(루트 → 리프 노드 제목 목록)와 그 길이(초) 계산"""
+        if not self.node_timings:
+            return [], 0.0
         
-        # 배치별 적응적 처리
-        processed = 0
-        while processed < total_nodes:
-            batch_size = self.data_processor.current_batch_size
-            batch = leaf_nodes[processed:processed + batch_size]
-            batch_start = time.time()
-            
-            self.logger.log_operation(f"배치{processed//batch_size + 1}시작", "시작", 
-                                    {"배치크기": len(batch), "현재배치크기설정": batch_size})
-            
-            # 배치 내 병렬 처리
-            tasks = []
-            for node_data in batch:
-                task = self.process_leaf_node_pipeline(node_data)
-                tasks.append(task)
-            
-            try:
-                # 배치 실행 및 결과 수집
-                task_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                batch_success_count = 0
-                for j, result in enumerate(task_results):
-                    node_title = batch[j].get("title", "")
-                    if isinstance(result, Exception):
-                        self.logger.log_error(f"리프노드적응_{node_title}", result)
-                        results[node_title] = False
-                    else:
-                        results[node_title] = result
-                        if result:
-                            batch_success_count += 1
-                
-                # 배치 성공률 계산 및 기록
-                batch_success_rate = batch_success_count / len(batch) if batch else 0
-                self.batch_success_rates.append(batch_success_rate)
-                
-                batch_time = time.time() - batch_start
-                batch_num = (processed // batch_size) + 1
-                
-                self.logger.log_operation(f"배치{batch_num}완료", "완료", 
-                                        {"소요시간": f"{batch_time:.2f}초", "노드수": len(batch),
-                                         "성공률": f"{batch_success_rate:.2f}"})
-                
-                # 성공률에 따른 적응적 조정
-                self.data_processor._adjust_batch_size(batch_success_rate)
-                wait_time = self.data_processor._calculate_adaptive_wait_time(batch_success_rate)
-                
-                processed += len(batch)
-                
-                # 다음 배치가 있으면 적응적 대기
-                if processed < total_nodes:
-                    self.logger.log_operation(f"적응적대기", "대기", 
-                                            {"대기시간": f"{wait_time:.1f}초", "성공률기반": f"{batch_success_rate:.2f}"})
-                    await asyncio.sleep(wait_time)
-                    
-            except Exception as e:
-                self.logger.log_error(f"배치{(processed // batch_size) + 1}처리", e)
-                # 배치 실패 시 해당 노드들 실패 처리
-                for node_data in batch:
-                    results[node_data.get("title", "")] = False
-                processed += len(batch)
-                # 실패 시 더 긴 대기
-                await asyncio.sleep(self.data_processor.max_wait_time)
-        
-        # 최종 통계
-        success_count = sum(1 for success in results.values() if success)
-        overall_success_rate = success_count / total_nodes if total_nodes else 0
-        avg_success_rate = sum(self.batch_success_rates) / len(self.batch_success_rates) if self.batch_success_rates else 0
-        
-        self.logger.log_operation("적응적리프처리완료", "완료", 
-                                {"성공": f"{success_count}/{total_nodes}",
-                                 "전체성공률": f"{overall_success_rate:.2f}",
-                                 "평균배치성공률": f"{avg_success_rate:.2f}",
-                                 "최종배치크기": self.data_processor.current_batch_size})
-        
-        return results
-    
-    async def process_all_parent_nodes(self, parent_nodes: List[Dict[str, Any]]) -> Dict[str, bool]:
-        """모든 부모 노드 처리 (순차 - 자식 의존성 때문)"""
-        results = {}
-        
-        for i, node_data in enumerate(parent_nodes):
-            node_title = node_data.get("title", "")
-            
-            # 부모 노드 간에도 적절한 간격 두기
-            if i > 0:
-                await asyncio.sleep(2.0)
-            
-            result = await self.process_parent_node_pipeline(node_data)
-            results[node_title] = result
+        node_id = max(self.node_timings, key=lambda nid: self.node_timings[nid]["critical_path"])
+        critical_time = self.node_timings[node_id]["critical_path"]
+        path = []
+        while node_id is not None:
+            timing = self.node_timings[node_id]
+            path.append(timing["title"])
+            children = timing["children_ids"]
+            node_id = max(children, key=lambda nid: self.node_timings[nid]["critical_path"]) if children else None
         
-        return results
+        return path, critical_time
     
     async def process_leaf_node_pipeline(self, node_data: Dict[str, Any]) -> bool:
         """리프 노드 파이프라인: 추출 → 저장 → status 업데이트"""
@@ -902,28 +764,6 @@ class DialecticalSynthesisProcessor:
                     success_count += 1
         
         return success_count == len([data for data in updated_children.values() if data])
-    
-    def verify_nodes_completion(self, nodes: List[Dict[str, Any]]) -> bool:
-        """노드들의 완료 상태 검증 (process_status가 true인지 확인)"""
-        for node_data in nodes:
-            node_file_path = self.data_loader._get_node_file_path(node_data)
-            if not self.data_saver.check_node_status(node_file_path):
-                node_title = node_data.get("title", "")
-                self.logger.log_error(f"노드완료검증_{node_title}", "status가 true가 아님")
-                return False
-        
-        return True
-    
-    def collect_level_results(self, category: Dict[str, List[Dict[str, Any]]]) -> Dict[str, bool]:
-        """레벨별 결과 수집"""
-        results = {}
-        
-        for node_data in category["leaf_nodes"] + category["parent_nodes"]:
-            node_title = node_data.get("title", "")
-            node_file_path = self.data_loader._get_node_file_path(node_data)
-            results[node_title] = self.data_saver.check_node_status(node_file_path)
-        
-        return results
 
 
 async def main():
@@ -952,4 +792,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # --cache=read|write|off: LLM 응답 캐시 (재실행 시 같은 프롬프트 재사용)
+    apply_cache_flag(sys.argv[1:])
     asyncio.run(main())
\ No newline at end of file
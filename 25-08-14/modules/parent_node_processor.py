@@ -9,12 +9,15 @@
     - update_child_extraction_sections() (라인 135-): 핵심/상세핵심만 업데이트
     - process_parent_extraction() (라인 175-): 부모 노드 추출 작업
     - finalize_parent_extraction() (라인 220-): 부모 노드 최종 업데이트
+    - single_call_extraction=True (선택): ContentAnalyzer 단일 호출 추출 (형식 오류 섹션만 retry_missing_sections로 재추출)
+    - 노드 정보 문서 읽기/갱신: shared.node_document (파일별 1회 파싱 + 캐시, 추출 섹션/process_status 제자리 갱신)
 상태: 활성
 주소: parent_node_processor/v3_integrated
 참조: content_analysis_module_v3.py
 """
 
 import asyncio
+import sys
 import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -22,11 +25,18 @@ from typing import List, Dict, Any, Optional
 from content_analysis_module_v3 import ContentAnalyzer
 from logging_system_v2 import ProcessLogger
 
+# 공유 노드 문서 파서 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.node_document import load_node_document, replace_section, set_property
+
 
 class ParentNodeProcessor:
     """부모 노드 전용 처리 클래스 - 자식 노드 우선 처리 및 개선된 업데이트 로직"""
     
-    def __init__(self, node_docs_dir: str, logger: Optional[ProcessLogger] = None):
+    def __init__(self, node_docs_dir: str, logger: Optional[ProcessLogger] = None, single_call_extraction: bool = False):
         self.node_docs_dir = Path(node_docs_dir)
         self.node_docs_dir.mkdir(exist_ok=True)
         
@@ -37,8 +47,8 @@ class ParentNodeProcessor:
         else:
             self.logger = logger
             
-        # 분석 모듈 초기화 (V3 사용)
-        self.content_analyzer = ContentAnalyzer(self.logger.logger)
+        # 분석 모듈 초기화 (V3 사용, single_call_extraction이면 4개 섹션을 한 번의 호출로 추출)
+        self.content_analyzer = ContentAnalyzer(self.logger.logger, single_call=single_call_extraction)
         self.data_loader = DataLoader(self.node_docs_dir, self.logger)
         
         # 세마포어로 동시 처리 제한
@@ -314,23 +324,8 @@ class ParentNodeProcessor:
     def save_extraction_text(self, file_path: Path, extraction_text: str) -> bool:
         """추출 섹션 텍스트를 파일에 저장"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            extraction_start = content.find("# 추출")
-            if extraction_start == -1:
-                content += "\n\n# 추출\n\n"
-                extraction_start = content.find("# 추출")
-            
-            next_section_start = content.find("\n# ", extraction_start + 4)
-            
-            if next_section_start == -1:
-                new_content = content[:extraction_start] + f"# 추출\n\n{extraction_text}\n"
-            else:
-                new_content = content[:extraction_start] + f"# 추출\n\n{extraction_text}\n" + content[next_section_start:]
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # '# 추출' 본문만 교체 (섹션이 없으면 문서 끝에 추가)
+            replace_section(file_path, "추출", f"\n{extraction_text}")
             
             self.logger.log_operation(f"추출저장완료_{file_path.name}", "성공")
             return True
@@ -350,33 +345,8 @@ class ParentNodeProcessor:
             if not file_path.exists():
                 return False
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            status_pattern = "process_status:"
-            status_start = content.find(status_pattern)
-            
-            if status_start == -1:
-                # process_status가 없으면 속성 섹션에 추가
-                attr_start = content.find("# 속성")
-                if attr_start != -1:
-                    attr_end = content.find("\n# ", attr_start + 4)
-                    if attr_end == -1:
-                        new_content = content + f"\nprocess_status: {str(status).lower()}\n"
-                    else:
-                        new_content = content[:attr_end] + f"\nprocess_status: {str(status).lower()}\n" + content[attr_end:]
-                else:
-                    new_content = f"# 속성\nprocess_status: {str(status).lower()}\n\n{content}"
-            else:
-                # 기존 process_status 값 업데이트
-                line_end = content.find('\n', status_start)
-                if line_end == -1:
-                    line_end = len(content)
-                
-                new_content = content[:status_start] + f"process_status: {str(status).lower()}" + content[line_end:]
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # process_status 라인만 제자리 교체 (없으면 '# 속성' 섹션에 추가)
+            set_property(file_path, "process_status", str(status).lower())
             
             self.logger.log_operation(f"상태업데이트_{file_path.name}", "성공", {"status": str(status).lower()})
             return True
@@ -391,21 +361,7 @@ class ParentNodeProcessor:
             if not file_path.exists():
                 return False
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            status_pattern = "process_status:"
-            status_start = content.find(status_pattern)
-            
-            if status_start == -1:
-                return False
-            
-            line_end = content.find('\n', status_start)
-            if line_end == -1:
-                line_end = len(content)
-            
-            status_line = content[status_start:line_end]
-            return "true" in status_line.lower()
+            return load_node_document(file_path).process_status
             
         except Exception:
             return False
@@ -436,19 +392,19 @@ process_status: false
         return missing_sections
     
     async def retry_missing_sections(self, extraction_data: str, title: str, missing_sections: List[str]) -> Dict[str, str]:
-        """누락된 섹션들만 재추출"""
+        """누락된 섹션들만 재추출 (1차와 같은 프롬프트이므로 캐시를 읽지 않고 새로 호출)"""
         retry_result = {}
         
         for section in missing_sections:
             try:
                 if section == "핵심 내용":
-                    section_name, content = await self.content_analyzer._extract_core_content(extraction_data, title)
+                    section_name, content = await self.content_analyzer._extract_core_content(extraction_data, title, bypass_cache=True)
                 elif section == "상세 핵심 내용":
-                    section_name, content = await self.content_analyzer._extract_detailed_content(extraction_data, title)
+                    section_name, content = await self.content_analyzer._extract_detailed_content(extraction_data, title, bypass_cache=True)
                 elif section == "주요 화제":
-                    section_name, content = await self.content_analyzer._extract_main_topics(extraction_data, title)
+                    section_name, content = await self.content_analyzer._extract_main_topics(extraction_data, title, bypass_cache=True)
                 elif section == "부차 화제":
-                    section_name, content = await self.content_analyzer._extract_sub_topics(extraction_data, title)
+                    section_name, content = await self.content_analyzer._extract_sub_topics(extraction_data, title, bypass_cache=True)
                 else:
                     continue
                 
@@ -534,27 +490,8 @@ class DataLoader:
     def _extract_section_from_file(self, file_path: Path, section_name: str) -> str:
         """파일에서 특정 섹션 내용 추출"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            header_pattern = f"# {section_name}"
-            header_start = content.find(header_pattern)
-            
-            if header_start == -1:
-                return ""
-            
-            content_start = header_start + len(header_pattern)
-            
-            lines = content[content_start:].split('\n')
-            section_lines = []
-            
-            for line in lines:
-                if line.strip().startswith('# ') and not line.strip().startswith('##'):
-                    break
-                section_lines.append(line)
-            
-            section_content = '\n'.join(section_lines).strip()
-            return section_content
+            # 공유 파서: 구조 헤더(# 속성/추출/내용/구성) 기준 섹션, 하위 헤더 포함 (파일별 1회 파싱 + 캐시)
+            return load_node_document(file_path).section(section_name)
             
         except Exception as e:
             self.logger.log_error(f"섹션추출_{file_path.name}", e)
@@ -563,17 +500,7 @@ class DataLoader:
     def _get_composition_files(self, node_file_path: Path) -> List[str]:
         """구성 섹션에서 파일 목록 추출"""
         try:
-            composition_content = self._extract_section_from_file(node_file_path, "구성")
-            if not composition_content:
-                return []
-            
-            files = []
-            for line in composition_content.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#') and line.endswith('.md'):
-                    files.append(line)
-            
-            return files
+            return load_node_document(node_file_path).composition_files()
             
         except Exception:
             return []
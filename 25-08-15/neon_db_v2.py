@@ -3,17 +3,20 @@
 핵심 내용: Neon PostgreSQL + pgvector를 사용한 새로운 벡터 데이터베이스 관리 모듈 (V2)
 상세 내용:
     - NeonVectorDBV2 클래스: 새로운 5개 테이블 스키마 관리
-    - DocumentParser 클래스: 마크다운 문서 섹션별 파싱 기능
+    - DocumentParser 클래스: 마크다운 문서 섹션별 파싱 기능 (shared.node_document 공유 파서 사용)
     - 4개 임베딩 테이블: core_content_embeddings, detailed_core_embeddings, main_topic_embeddings, sub_topic_embeddings
     - documents 테이블: 문서 메타데이터 및 내용 저장
+      (updated_at: 행이 바뀔 때마다 트리거로 갱신 → 25-08-18 DocumentReconstructor 문서 캐시의 버전 컬럼)
     - CRUD 메서드들: 각 테이블별 삽입, 검색, 조회 기능
     - 벡터 검색 인덱스: HNSW 인덱스를 통한 효율적인 유사도 검색
+    - 임베딩 모델: shared.embedding_service 공유 서비스 사용 (프로세스당 1회 로드)
 상태: 
 주소: neon_db_v2
 참조: 
 """
 
 import os
+import sys
 import json
 import re
 import psycopg2
@@ -22,7 +25,10 @@ from typing import List, Dict, Any, Optional, Tuple
 import logging
 from dotenv import load_dotenv
 from pathlib import Path
-from sentence_transformers import SentenceTransformer
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from shared.embedding_service import get_embedding_service
+from shared.node_document import load_node_document, section_lines
 
 load_dotenv()
 
@@ -47,91 +53,27 @@ class DocumentParser:
             섹션별 내용이 담긴 딕셔너리
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
+            # 공유 파서: 1회 스캔 섹션 오프셋 맵 (같은 파일 재파싱은 캐시 사용)
+            doc = load_node_document(file_path)
             
             # 파일명에서 제목 추출
             title = Path(file_path).name
             
-            # 섹션 분리
-            extracted_info = ""
-            document_content = ""
-            child_doc_ids = ""
-            core_content = ""
-            detailed_core = ""
-            main_topics = ""
-            sub_topics = ""
-            
-            current_section = None
-            content_started = False
+            # 추출 하위 섹션은 '##'로 시작하는 라인(소제목)을 제외하고 저장 ('상세 내용'은 상세 핵심 내용에 포함)
+            def subsection(name: str) -> str:
+                return section_lines(doc.subsection(name), skip_prefixes=("##",))
             
-            in_extraction = False
-            
-            for i, line in enumerate(lines):
-                # 메인 섹션 헤더 감지
-                if line.strip() == "# 추출":
-                    in_extraction = True
-                    current_section = "extraction"
-                    continue
-                elif line.strip() == "# 내용":
-                    in_extraction = False
-                    current_section = "content"
-                    continue
-                elif line.strip() == "# 구성":
-                    in_extraction = False
-                    current_section = "components"
-                    continue
-                
-                # 추출 섹션 내 서브섹션 헤더 감지
-                elif line.strip() == "## 핵심 내용" and in_extraction:
-                    current_section = "core_content"
-                    continue
-                elif line.strip() == "## 상세 핵심 내용" and in_extraction:
-                    current_section = "detailed_core"
-                    continue
-                elif line.strip() == "## 주요 화제" and in_extraction:
-                    current_section = "main_topics"
-                    continue
-                elif line.strip() == "## 부차 화제" and in_extraction:
-                    current_section = "sub_topics"
-                    continue
-                
-                # 내용 추가
-                if current_section == "extraction":
-                    # "---" 이후부터 섹션 헤더가 아닌 내용 추가
-                    if line.strip() == "---":
-                        continue
-                    elif line.strip() not in ["# 내용"] and not line.strip().startswith("##"):
-                        extracted_info += line + "\n"
-                elif current_section == "content":
-                    if line.strip() not in ["---"] and not line.strip().startswith("# 구성"):
-                        document_content += line + "\n"
-                elif current_section == "components":
-                    child_doc_ids += line + "\n"
-                elif current_section == "core_content":
-                    if not line.strip().startswith("##") and line.strip() not in ["# 내용", "# 구성"]:
-                        core_content += line + "\n"
-                elif current_section == "detailed_core":
-                    if not line.strip().startswith("##") and line.strip() not in ["# 내용", "# 구성"]:
-                        detailed_core += line + "\n"
-                elif current_section == "main_topics":
-                    if not line.strip().startswith("##") and line.strip() not in ["# 내용", "# 구성"]:
-                        main_topics += line + "\n"
-                elif current_section == "sub_topics":
-                    if not line.strip().startswith("##") and line.strip() not in ["# 내용", "# 구성"]:
-                        sub_topics += line + "\n"
+            child_doc_ids = doc.section("구성")
             
             return {
                 'title': title,
-                'extracted_info': extracted_info.strip(),
-                'content': document_content.strip(),
-                'child_doc_ids': child_doc_ids.strip() if child_doc_ids.strip() else None,
-                'core_content': core_content.strip(),
-                'detailed_core': detailed_core.strip(),
-                'main_topics': main_topics.strip(),
-                'sub_topics': sub_topics.strip()
+                'extracted_info': section_lines(doc.extraction_preamble(), skip_prefixes=("##",)),
+                'content': section_lines(doc.section("내용")),
+                'child_doc_ids': child_doc_ids if child_doc_ids else None,
+                'core_content': subsection("핵심 내용"),
+                'detailed_core': "\n\n".join(filter(None, [subsection("상세 핵심 내용"), subsection("상세 내용")])),
+                'main_topics': subsection("주요 화제"),
+                'sub_topics': subsection("부차 화제")
             }
             
         except Exception as e:
@@ -196,10 +138,28 @@ class NeonVectorDBV2:
                         content TEXT,
                         informed_toc TEXT,
                         child_doc_ids TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     );
                 """)
                 
+                # 문서 버전 컬럼 (기존 테이블에도 추가, 어떤 경로로 수정되든 트리거가 갱신)
+                cur.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;")
+                cur.execute("""
+                    CREATE OR REPLACE FUNCTION documents_touch_updated_at() RETURNS trigger AS $$
+                    BEGIN
+                        NEW.updated_at := clock_timestamp();
+                        RETURN NEW;
+                    END;
+                    $$ LANGUAGE plpgsql;
+                """)
+                cur.execute("DROP TRIGGER IF EXISTS documents_touch_updated_at ON documents;")
+                cur.execute("""
+                    CREATE TRIGGER documents_touch_updated_at
+                    BEFORE INSERT OR UPDATE ON documents
+                    FOR EACH ROW EXECUTE FUNCTION documents_touch_updated_at();
+                """)
+                
                 # 4개 임베딩 테이블 생성
                 embedding_tables = [
                     'core_content_embeddings',
@@ -236,9 +196,10 @@ class NeonVectorDBV2:
     def _load_embedding_model(self):
         """임베딩 모델 로드 (지연 로딩)"""
         if self.embedding_model is None:
-            logger.info(f"임베딩 모델 로드 중: {self.embedding_model_name}")
-            self.embedding_model = SentenceTransformer(self.embedding_model_name)
-            logger.info("임베딩 모델 로드 완료")
+            self.embedding_model = get_embedding_service(self.embedding_model_name)
+            # 데몬 사용 시 이 프로세스에서는 모델을 올리지 않음
+            if not self.embedding_model.uses_daemon():
+                self.embedding_model.load()
     
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
@@ -0,0 +1,168 @@
+"""
+생성 시간: 2026-10-18 16:44:12
+핵심 내용: shared/llm_cache 응답 캐시 테스트 스크립트 (임시 LLM_CACHE_PATH 사용)
+상세 내용:
+    - read / write / off 모드 처리 (LLMGateway.run의 cache_key 경로)
+    - 크기 초과 시 오래된 항목부터 EVICT_TARGET_RATIO 이하로 제거
+    - 손상된 항목은 삭제 후 미스 처리
+    - apply_cache_flag: --cache=MODE / --cache MODE 인자 처리, 잘못된 값은 종료
+상태:
+주소: test_llm_cache
+참조: shared/llm_cache, shared/llm_gateway, test_parser
+"""
+
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# 공유 LLM 응답 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_cache import (
+    CACHE_MODE_ENV, CACHE_PATH_ENV, EVICT_TARGET_RATIO, LLMResponseCache,
+    apply_cache_flag, configure_llm_cache, get_llm_cache
+)
+from shared.llm_gateway import LLMGateway
+
+
+def use_temp_cache(tmp_path: Path, mode: str) -> LLMResponseCache:
+    """공용 캐시를 임시 경로로 설정"""
+    os.environ[CACHE_PATH_ENV] = str(tmp_path / "responses.sqlite3")
+    return configure_llm_cache(mode)
+
+
+def run_counted(gateway: LLMGateway, calls: list, answer: str) -> str:
+    """같은 키로 게이트웨이 호출 (실제 호출 횟수는 calls에 기록)"""
+    async def call():
+        calls.append(answer)
+        return answer
+    return asyncio.run(gateway.run(call, label="test_llm_cache", cache_key="same-prompt"))
+
+
+def test_cache_modes(tmp_path):
+    gateway = LLMGateway(requests_per_minute=0)
+    calls = []
+
+    use_temp_cache(tmp_path, "read")
+    assert run_counted(gateway, calls, "first") == "first"
+    assert run_counted(gateway, calls, "second") == "first"
+    assert calls == ["first"]
+
+    # write: 항상 새로 호출하고 기존 항목을 덮어씀
+    use_temp_cache(tmp_path, "write")
+    assert run_counted(gateway, calls, "third") == "third"
+    assert calls == ["first", "third"]
+
+    use_temp_cache(tmp_path, "read")
+    assert run_counted(gateway, calls, "fourth") == "third"
+
+    # off: 캐시 객체 없이 매번 호출
+    assert use_temp_cache(tmp_path, "off") is None
+    assert get_llm_cache() is None
+    assert run_counted(gateway, calls, "fifth") == "fifth"
+    assert calls == ["first", "third", "fifth"]
+
+
+def test_size_eviction(tmp_path):
+    cache = LLMResponseCache(tmp_path / "evict.sqlite3", max_bytes=4000)
+    value = "x" * 900
+    for index in range(4):
+        cache.put(f"key{index}", value)
+    assert cache.stats()["entries"] == 4
+
+    # key0을 다시 읽어 최근 접근으로 만든 뒤 한도 초과 → key1부터 제거
+    assert cache.get("key0") == value
+    cache.put("key4", value)
+
+    stats = cache.stats()
+    assert stats["bytes"] <= int(cache.max_bytes * EVICT_TARGET_RATIO)
+    assert cache.get("key1") is None
+    assert cache.get("key0") == value
+    assert cache.get("key4") == value
+    cache.close()
+
+    # 다시 열어도 저장된 크기 합계가 같아야 함
+    reopened = LLMResponseCache(tmp_path / "evict.sqlite3", max_bytes=4000)
+    assert reopened.stats()["bytes"] == stats["bytes"]
+    reopened.close()
+
+
+def test_corrupt_entry_deleted(tmp_path):
+    path = tmp_path / "corrupt.sqlite3"
+    cache = LLMResponseCache(path)
+    cache.put("good", {"text": "ok"})
+    cache.put("bad", {"text": "will be corrupted"})
+
+    conn = sqlite3.connect(str(path))
+    conn.execute("UPDATE responses SET value = ? WHERE key = ?", (b"not a pickle", "bad"))
+    conn.commit()
+    conn.close()
+
+    assert cache.get("bad") is None
+    assert cache.get("good") == {"text": "ok"}
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["misses"] == 1
+    cache.close()
+
+
+def test_apply_cache_flag(tmp_path):
+    os.environ[CACHE_PATH_ENV] = str(tmp_path / "flag.sqlite3")
+
+    assert apply_cache_flag(["input.md", "--cache=read", "-v"]) == ["input.md", "-v"]
+    assert get_llm_cache().mode == "read"
+
+    assert apply_cache_flag(["--cache", "write", "input.md"]) == ["input.md"]
+    assert get_llm_cache().mode == "write"
+
+    # 플래그가 없으면 설정 유지
+    assert apply_cache_flag(["input.md"]) == ["input.md"]
+    assert get_llm_cache().mode == "write"
+
+    for argv in (["--cache=bogus"], ["--cache"]):
+        try:
+            apply_cache_flag(argv)
+        except SystemExit:
+            continue
+        raise AssertionError(f"SystemExit 미발생: {argv}")
+
+
+def main():
+    tests = [
+        test_cache_modes,
+        test_size_eviction,
+        test_corrupt_entry_deleted,
+        test_apply_cache_flag,
+    ]
+    saved_env = {key: os.environ.get(key) for key in (CACHE_MODE_ENV, CACHE_PATH_ENV)}
+
+    print("=== LLM 응답 캐시 테스트 ===")
+    failed = 0
+    for test in tests:
+        with tempfile.TemporaryDirectory() as directory:
+            try:
+                test(Path(directory))
+                print(f"✅ {test.__name__}")
+            except AssertionError as e:
+                failed += 1
+                print(f"❌ {test.__name__}: {e}")
+            finally:
+                configure_llm_cache("off")
+
+    for key, value in saved_env.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+    print(f"\n결과: {len(tests) - failed}/{len(tests)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+생성 시간: 2026-10-18 16:31:05
+핵심 내용: shared/node_document 섹션 제자리 갱신 테스트 스크립트
+상세 내용:
+    - 없는 섹션 추가 (문서 끝에 헤더 + 본문)
+    - 줄바꿈 없이 끝나는 마지막 줄 헤더의 본문 교체
+    - 길이가 같은 교체 (해당 바이트 범위만 덮어쓰기)
+    - 멀티바이트(한글) 본문 교체 후 뒤쪽 섹션 보존
+    - 갱신 후 load_node_document 캐시가 새 내용을 반환하는지 확인
+상태:
+주소: test_node_document
+참조: shared/node_document, test_parser
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 공유 노드 문서 파서 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.node_document import (
+    clear_node_document_cache, load_node_document, replace_section, set_property
+)
+
+SAMPLE_DOCUMENT = """# 속성
+process_status: false
+index: 3
+
+# 추출
+## 핵심 내용
+요약
+
+## 상세 핵심 내용
+상세
+
+# 내용
+본문 첫 줄
+# 본문 안의 마크다운 헤더
+
+# 구성
+child_a.md
+"""
+
+
+def write_temp_document(directory: Path, text: str) -> str:
+    """임시 문서 파일 생성 (줄바꿈 변환 없이 바이트 그대로 기록)"""
+    path = os.path.join(directory, "node_info.md")
+    with open(path, "wb") as f:
+        f.write(text.encode("utf-8"))
+    return path
+
+
+def read_disk(path: str) -> str:
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def test_append_missing_section(tmp_path):
+    path = write_temp_document(tmp_path, "# 속성\nindex: 1\n")
+    document = replace_section(path, "구성", "child.md")
+
+    assert read_disk(path) == "# 속성\nindex: 1\n\n# 구성\nchild.md\n"
+    assert document.text == read_disk(path)
+    assert document.composition_files() == ["child.md"]
+
+
+def test_header_on_last_line_without_newline(tmp_path):
+    path = write_temp_document(tmp_path, "# 속성\nindex: 1\n\n# 구성")
+    document = replace_section(path, "구성", "child.md")
+
+    assert read_disk(path) == "# 속성\nindex: 1\n\n# 구성\nchild.md\n"
+    assert document.section("구성") == "child.md"
+
+
+def test_unchanged_length_rewrite(tmp_path):
+    path = write_temp_document(tmp_path, SAMPLE_DOCUMENT)
+    size_before = os.path.getsize(path)
+    document = set_property(path, "process_status", "true!")
+
+    expected = SAMPLE_DOCUMENT.replace("process_status: false", "process_status: true!")
+    assert os.path.getsize(path) == size_before
+    assert read_disk(path) == expected
+    assert document.get_property("process_status") == "true!"
+    assert document.get_property("index") == "3"
+
+
+def test_multibyte_rewrite(tmp_path):
+    path = write_temp_document(tmp_path, SAMPLE_DOCUMENT)
+    document = replace_section(path, "내용", "한글 본문 교체 ✅\n두 번째 줄")
+
+    disk = read_disk(path)
+    assert document.text == disk
+    assert document.section("내용") == "한글 본문 교체 ✅\n두 번째 줄"
+    assert document.subsection("핵심 내용") == "요약"
+    assert document.composition_files() == ["child_a.md"]
+    assert disk.endswith("# 구성\nchild_a.md\n")
+
+
+def test_cache_refresh_after_rewrite(tmp_path):
+    path = write_temp_document(tmp_path, SAMPLE_DOCUMENT)
+    before = load_node_document(path)
+    assert before.subsection("핵심 내용") == "요약"
+
+    replace_section(path, "구성", "child_b.md\nchild_c.md")
+    cached = load_node_document(path)
+    assert cached is not before
+    assert cached.composition_files() == ["child_b.md", "child_c.md"]
+
+    # 캐시를 비운 뒤 디스크에서 다시 읽어도 같은 내용
+    clear_node_document_cache()
+    assert load_node_document(path).text == cached.text
+
+
+def main():
+    tests = [
+        test_append_missing_section,
+        test_header_on_last_line_without_newline,
+        test_unchanged_length_rewrite,
+        test_multibyte_rewrite,
+        test_cache_refresh_after_rewrite,
+    ]
+
+    print("=== 노드 문서 갱신 테스트 ===")
+    failed = 0
+    for test in tests:
+        clear_node_document_cache()
+        with tempfile.TemporaryDirectory() as directory:
+            try:
+                test(Path(directory))
+                print(f"✅ {test.__name__}")
+            except AssertionError as e:
+                failed += 1
+                print(f"❌ {test.__name__}: {e}")
+
+    print(f"\n결과: {len(tests) - failed}/{len(tests)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
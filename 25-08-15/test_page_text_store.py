@@ -0,0 +1,100 @@
+"""
+생성 시간: 2026-10-18 16:52:40
+핵심 내용: shared/page_text_store 페이지 텍스트 캐시 왕복 테스트 스크립트 (임시 store_dir 사용)
+상세 내용:
+    - put_many 저장 후 get 조회 (빈 페이지, 한글 텍스트, 범위 밖 번호 포함)
+    - open_existing으로 다시 열어 헤더의 페이지 수와 저장된 텍스트 확인
+    - 먼저 매핑해 둔 다른 인스턴스가 이후 추가된 페이지를 get / missing_pages로 확인
+상태:
+주소: test_page_text_store
+참조: shared/page_text_store, test_parser
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# 공유 페이지 텍스트 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.page_text_store import PageTextStore
+
+CONTENT_HASH = "0123456789abcdef" * 4
+SETTINGS = {"layout": True}
+PAGE_COUNT = 5
+
+
+def test_put_many_and_get(tmp_path):
+    store = PageTextStore(CONTENT_HASH, PAGE_COUNT, SETTINGS, str(tmp_path))
+    store.put_many({0: "첫 페이지 ✅", 2: "", 4: "last page", 7: "범위 밖"})
+
+    assert store.get(0) == "첫 페이지 ✅"
+    assert store.get(2) == ""
+    assert store.get(4) == "last page"
+    assert store.get(1) is None
+    assert store.get(7) is None
+    assert store.missing_pages() == [1, 3]
+    store.close()
+
+
+def test_reopen_existing(tmp_path):
+    store = PageTextStore(CONTENT_HASH, PAGE_COUNT, SETTINGS, str(tmp_path))
+    store.put_many({index: f"page {index}" for index in range(PAGE_COUNT)})
+    store.close()
+
+    # 설정이 다르면 다른 캐시 파일
+    assert PageTextStore.open_existing(CONTENT_HASH, {}, str(tmp_path)) is None
+
+    reopened = PageTextStore.open_existing(CONTENT_HASH, SETTINGS, str(tmp_path))
+    assert reopened is not None
+    assert reopened.page_count == PAGE_COUNT
+    assert reopened.missing_pages() == []
+    assert [reopened.get(index) for index in range(PAGE_COUNT)] == [f"page {index}" for index in range(PAGE_COUNT)]
+    reopened.close()
+
+
+def test_other_instance_sees_appended_pages(tmp_path):
+    writer = PageTextStore(CONTENT_HASH, PAGE_COUNT, SETTINGS, str(tmp_path))
+    reader = PageTextStore(CONTENT_HASH, PAGE_COUNT, SETTINGS, str(tmp_path))
+
+    writer.put_many({0: "first"})
+    assert reader.get(0) == "first"
+    assert reader.missing_pages() == [1, 2, 3, 4]
+
+    # reader는 이미 매핑된 상태 → 추가된 blob은 재매핑으로 보여야 함
+    writer.put_many({1: "두 번째 " * 100, 3: "fourth"})
+    assert reader.missing_pages() == [2, 4]
+    assert reader.get(1) == "두 번째 " * 100
+    assert reader.get(3) == "fourth"
+    assert reader.stats["hits"] == 3
+
+    writer.close()
+    reader.close()
+
+
+def main():
+    tests = [
+        test_put_many_and_get,
+        test_reopen_existing,
+        test_other_instance_sees_appended_pages,
+    ]
+
+    print("=== 페이지 텍스트 캐시 테스트 ===")
+    failed = 0
+    for test in tests:
+        with tempfile.TemporaryDirectory() as directory:
+            try:
+                test(Path(directory))
+                print(f"✅ {test.__name__}")
+            except AssertionError as e:
+                failed += 1
+                print(f"❌ {test.__name__}: {e}")
+
+    print(f"\n결과: {len(tests) - failed}/{len(tests)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
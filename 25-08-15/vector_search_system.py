@@ -26,11 +26,8 @@ from dotenv import load_dotenv
 from neon_db_v2 import NeonVectorDBV2
 
 # 선택적 import들
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.embedding_service import get_embedding_service, SENTENCE_TRANSFORMERS_AVAILABLE
 
 try:
     import openai
@@ -68,9 +65,10 @@ class SentenceTransformerProvider(EmbeddingProvider):
     def _load_model(self):
         """모델 지연 로딩"""
         if self.model is None:
-            logger.info(f"SentenceTransformer 모델 로드 중: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
-            logger.info("모델 로드 완료")
+            self.model = get_embedding_service(self.model_name)
+            # 데몬이 없을 때만 로컬 로드
+            if not self.model.uses_daemon():
+                self.model.load()
     
     def get_embedding(self, text: str) -> Optional[List[float]]:
         try:
@@ -8,6 +8,10 @@
     - async_execute_query 메서드 (라인 135-170): 원시 SQL 실행
     - connection_pool 지원 (라인 180-220): 연결 풀링으로 성능 최적화
     - 벡터 유사도 검색 최적화 (라인 225-280): PostgreSQL pgvector 전용 메서드
+    - top_k 검색 모드: 인덱스 순서 ORDER BY embedding <=> $1 LIMIT k 후 임계값 적용 (HNSW/IVFFlat 인덱스 사용)
+    - set_vector_search_params 메서드: 기본 hnsw.ef_search / ivfflat.probes 설정
+      (모든 벡터 검색이 트랜잭션 범위 SET LOCAL로 적용 → 풀 반납 시 RESET ALL과 무관하게 매 검색에 반영)
+    - waterfall_vector_search 메서드: 여러 테이블 top-k + 폭포수 우선순위 + 중복 제거를 단일 SQL로 실행
 상태: 
 주소: async_postgresql_adapter
 참조: postgresql_adapter
@@ -56,6 +60,13 @@ class AsyncPostgreSQLAdapter:
         self.min_pool_size = 2
         self.max_pool_size = 10
         self.command_timeout = 30
+        
+        # 벡터 검색 설정 (config의 vector_search 섹션)
+        vector_config = self.config.get('vector_search', {})
+        self.search_mode = vector_config.get('search_mode', 'top_k')
+        self.hnsw_ef_search = vector_config.get('hnsw_ef_search')
+        self.ivfflat_probes = vector_config.get('ivfflat_probes')
+        self.include_embedding = vector_config.get('include_embedding', False)
     
     def _build_connection_string(self):
         """연결 설정에서 연결 문자열 구성"""
@@ -98,6 +109,63 @@ class AsyncPostgreSQLAdapter:
             logger.error(f"비동기 PostgreSQL 연결 실패: {e}")
             return False
     
+    def _vector_session_settings(
+        self,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
+    ) -> List[str]:
+        """벡터 인덱스 트랜잭션 설정 SQL 목록 구성 (지정하지 않은 값은 기본 설정)"""
+        statements = []
+        ef_search = ef_search if ef_search is not None else self.hnsw_ef_search
+        probes = probes if probes is not None else self.ivfflat_probes
+        
+        if ef_search is not None:
+            statements.append(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+        if probes is not None:
+            statements.append(f"SET LOCAL ivfflat.probes = {int(probes)}")
+        
+        return statements
+    
+    async def _fetch_vector_rows(
+        self,
+        conn,
+        query: str,
+        *args,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
+    ):
+        """
+        벡터 검색 쿼리 실행 (인덱스 파라미터는 트랜잭션 범위 SET LOCAL로 적용)
+        
+        풀 연결은 반납 시 RESET ALL로 세션 설정이 초기화되므로 검색마다 적용
+        """
+        settings = self._vector_session_settings(ef_search, probes)
+        if not settings:
+            return await conn.fetch(query, *args)
+        
+        async with conn.transaction():
+            await conn.execute('; '.join(settings))
+            return await conn.fetch(query, *args)
+    
+    async def set_vector_search_params(
+        self,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
+    ):
+        """
+        기본 벡터 인덱스 검색 파라미터 설정 (이후 모든 벡터 검색에 적용)
+        
+        Args:
+            ef_search: HNSW 후보 리스트 크기 (hnsw.ef_search, 클수록 정확/느림)
+            probes: IVFFlat 탐색 리스트 수 (ivfflat.probes)
+        """
+        if ef_search is not None:
+            self.hnsw_ef_search = ef_search
+        if probes is not None:
+            self.ivfflat_probes = probes
+        
+        logger.info(f"벡터 검색 파라미터 설정: ef_search={self.hnsw_ef_search}, probes={self.ivfflat_probes}")
+    
     async def close(self):
         """연결 풀 종료"""
         if self.connection_pool:
@@ -216,7 +284,11 @@ class AsyncPostgreSQLAdapter:
         table_name: str,
         query_embedding: List[float],
         similarity_threshold: float = 0.7,
-        limit: int = 5
+        limit: int = 5,
+        search_mode: Optional[str] = None,
+        include_embedding: Optional[bool] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         벡터 유사도 검색 전용 메서드 (PostgreSQL pgvector 최적화)
@@ -226,6 +298,10 @@ class AsyncPostgreSQLAdapter:
             query_embedding: 질의 벡터
             similarity_threshold: 유사도 임계값
             limit: 결과 제한
+            search_mode: 'top_k' (인덱스 순서 검색 후 임계값 적용) 또는 'threshold' (기존 전체 스캔 방식)
+            include_embedding: 결과에 embedding 컬럼 포함 여부
+            ef_search: 이번 검색에만 적용할 hnsw.ef_search (None이면 기본 설정)
+            probes: 이번 검색에만 적용할 ivfflat.probes (None이면 기본 설정)
             
         Returns:
             유사도 검색 결과
@@ -234,24 +310,52 @@ class AsyncPostgreSQLAdapter:
             # 벡터를 PostgreSQL vector 형식으로 변환
             embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
             
-            # 코사인 유사도 검색 쿼리 (pgvector 연산자 사용)
-            query = f"""
-            SELECT 
-                id,
-                document_id,
-                embedding,
-                metadata,
-                (1 - (embedding <=> $1::vector)) as similarity_score
-            FROM {table_name}
-            WHERE (1 - (embedding <=> $1::vector)) >= $2
-            ORDER BY similarity_score DESC
-            LIMIT $3
-            """
+            search_mode = search_mode or self.search_mode
+            if include_embedding is None:
+                include_embedding = self.include_embedding
+            embedding_column = "embedding," if include_embedding else ""
+            
+            if search_mode == 'top_k':
+                # 인덱스 순서 검색: ORDER BY 거리 연산자 + LIMIT → HNSW/IVFFlat 인덱스 사용
+                # 임계값은 상위 k개를 가져온 후 외부 쿼리에서 적용
+                query = f"""
+                SELECT *
+                FROM (
+                    SELECT 
+                        id,
+                        document_id,
+                        {embedding_column}
+                        metadata,
+                        (1 - (embedding <=> $1::vector)) as similarity_score
+                    FROM {table_name}
+                    ORDER BY embedding <=> $1::vector
+                    LIMIT $3
+                ) AS nearest
+                WHERE similarity_score >= $2
+                ORDER BY similarity_score DESC
+                """
+            else:
+                # 코사인 유사도 검색 쿼리 (pgvector 연산자 사용, 전체 스캔)
+                query = f"""
+                SELECT 
+                    id,
+                    document_id,
+                    {embedding_column}
+                    metadata,
+                    (1 - (embedding <=> $1::vector)) as similarity_score
+                FROM {table_name}
+                WHERE (1 - (embedding <=> $1::vector)) >= $2
+                ORDER BY similarity_score DESC
+                LIMIT $3
+                """
             
             start_time = time.time()
             
             async with self.connection_pool.acquire() as conn:
-                rows = await conn.fetch(query, embedding_str, similarity_threshold, limit)
+                rows = await self._fetch_vector_rows(
+                    conn, query, embedding_str, similarity_threshold, limit,
+                    ef_search=ef_search, probes=probes
+                )
                 
                 results = []
                 for row in rows:
@@ -259,7 +363,7 @@ class AsyncPostgreSQLAdapter:
                     results.append(result_dict)
             
             search_time = time.time() - start_time
-            logger.info(f"벡터 검색 완료: {table_name} - {len(results)}개 결과 ({search_time:.3f}초)")
+            logger.info(f"벡터 검색 완료: {table_name} ({search_mode}) - {len(results)}개 결과 ({search_time:.3f}초)")
             
             return results
             
@@ -267,18 +371,121 @@ class AsyncPostgreSQLAdapter:
             logger.error(f"벡터 유사도 검색 오류 ({table_name}): {e}")
             return []
     
+    async def waterfall_vector_search(
+        self,
+        table_specs: List[Dict[str, str]],
+        query_embedding: List[float],
+        similarity_threshold: float = 0.7,
+        limit: int = 5,
+        total_limit: int = 10,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 테이블의 폭포수 검색을 단일 SQL 문(1회 왕복)으로 실행
+        
+        - 테이블별 인덱스 순서 top-k 서브쿼리를 UNION ALL로 결합
+        - 차원별로 primary 결과가 있으면 secondary 결과 제외 (폭포수 우선순위)
+        - document_id 기준 중복 제거 (더 높은 유사도 유지) 후 유사도 순 정렬
+        
+        Args:
+            table_specs: 테이블 명세 리스트
+                [{"table": "core_content_embeddings", "dimension": "content", "search_level": "primary"}, ...]
+            query_embedding: 질의 벡터
+            similarity_threshold: 유사도 임계값
+            limit: 테이블별 결과 제한
+            total_limit: 최종 결과 제한
+            ef_search: 이번 검색에만 적용할 hnsw.ef_search (None이면 기본 설정)
+            probes: 이번 검색에만 적용할 ivfflat.probes (None이면 기본 설정)
+            
+        Returns:
+            통합된 검색 결과 (dimension, search_level, table_name 컬럼 포함)
+        """
+        try:
+            embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
+            
+            # 테이블명/차원명은 SQL 식별자·리터럴로 삽입되므로 파라미터 대신 검증 후 사용
+            subqueries = []
+            for spec in table_specs:
+                table_name = spec['table']
+                dimension = spec['dimension']
+                search_level = spec['search_level']
+                for value in (table_name, dimension, search_level):
+                    if not value.replace('_', '').isalnum():
+                        raise ValueError(f"허용되지 않는 식별자: {value}")
+                
+                subqueries.append(f"""
+                    (SELECT 
+                        '{dimension}' AS dimension,
+                        '{search_level}' AS search_level,
+                        '{table_name}' AS table_name,
+                        document_id,
+                        metadata,
+                        (1 - (embedding <=> $1::vector)) AS similarity_score
+                    FROM {table_name}
+                    ORDER BY embedding <=> $1::vector
+                    LIMIT $3)""")
+            
+            query = f"""
+            WITH candidates AS ({' UNION ALL '.join(subqueries)}
+            ),
+            filtered AS (
+                SELECT * FROM candidates WHERE similarity_score >= $2
+            ),
+            waterfall AS (
+                SELECT f.*
+                FROM filtered f
+                WHERE f.search_level = 'primary'
+                   OR NOT EXISTS (
+                        SELECT 1 FROM filtered p
+                        WHERE p.dimension = f.dimension AND p.search_level = 'primary'
+                   )
+            ),
+            deduped AS (
+                SELECT DISTINCT ON (document_id) *
+                FROM waterfall
+                ORDER BY document_id, similarity_score DESC, dimension
+            )
+            SELECT * FROM deduped
+            ORDER BY similarity_score DESC
+            LIMIT $4
+            """
+            
+            start_time = time.time()
+            
+            async with self.connection_pool.acquire() as conn:
+                rows = await self._fetch_vector_rows(
+                    conn, query, embedding_str, similarity_threshold, limit, total_limit,
+                    ef_search=ef_search, probes=probes
+                )
+                results = [dict(row) for row in rows]
+            
+            search_time = time.time() - start_time
+            logger.info(f"통합 폭포수 검색 완료: {len(table_specs)}개 테이블 - {len(results)}개 결과 ({search_time:.3f}초)")
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"통합 폭포수 검색 오류: {e}")
+            raise
+    
     async def batch_vector_search(
         self,
         table_configs: List[Dict[str, Any]],
-        query_embedding: List[float]
+        query_embedding: List[float],
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         여러 테이블에 대한 병렬 벡터 검색
         
         Args:
             table_configs: 테이블별 검색 설정 리스트
-                [{"table": "table1", "threshold": 0.7, "limit": 5}, ...]
+                [{"table": "table1", "threshold": 0.7, "limit": 5, "search_mode": "top_k",
+                  "ef_search": 100, "probes": 10}, ...] (ef_search / probes는 선택, 테이블별 우선)
             query_embedding: 질의 벡터
+            ef_search: 모든 테이블에 적용할 hnsw.ef_search (None이면 기본 설정)
+            probes: 모든 테이블에 적용할 ivfflat.probes (None이면 기본 설정)
             
         Returns:
             테이블별 검색 결과 딕셔너리
@@ -295,7 +502,11 @@ class AsyncPostgreSQLAdapter:
             limit = config.get('limit', 5)
             
             task = self.vector_similarity_search(
-                table_name, query_embedding, threshold, limit
+                table_name, query_embedding, threshold, limit,
+                search_mode=config.get('search_mode'),
+                include_embedding=config.get('include_embedding'),
+                ef_search=config.get('ef_search', ef_search),
+                probes=config.get('probes', probes)
             )
             tasks.append(task)
             table_names.append(table_name)
@@ -8,6 +8,8 @@
     - 스키마 관리 (라인 167-245): add_column, modify_column, drop_column 구현
     - 데이터 관리 (라인 247-340): insert_data, query_data, update_data, delete_data 구현
     - 백업/복원 (라인 342-380): backup_table, restore_table 구현
+    - bulk_upsert 메서드: execute_values 기반 다중 테이블 일괄 UPSERT/삭제 (배치당 단일 트랜잭션)
+    - execute_query 메서드: 파라미터 바인딩 원시 SQL 실행
     - 환경변수 및 직접 연결 문자열 지원
 상태: 
 주소: postgresql_adapter
@@ -23,7 +25,7 @@ from pathlib import Path
 
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.extras import RealDictCursor, execute_values
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
@@ -312,6 +314,87 @@ class PostgreSQLAdapter(DatabaseInterface):
             logger.error(f"데이터 삽입 실패 ({table_name}): {e}")
             return False
     
+    def execute_query(self, query: str, params: Optional[List[Any]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        원시 SQL 쿼리 실행
+        
+        Args:
+            query: SQL 쿼리 (%s 플레이스홀더)
+            params: 쿼리 파라미터
+            
+        Returns:
+            조회 결과 (결과 행이 있는 경우), 없으면 None
+        """
+        if not self.test_connection():
+            raise ConnectionError("데이터베이스 연결이 없습니다.")
+        
+        with self.connection.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(query, params)
+            if cur.description is None:
+                return None
+            return [dict(row) for row in cur.fetchall()]
+    
+    def bulk_upsert(self, table_rows: Dict[str, List[Dict[str, Any]]],
+                    conflict_column: str = 'id', page_size: int = 500,
+                    deletes: Optional[Dict[str, List[str]]] = None) -> int:
+        """
+        여러 테이블에 다중 행을 일괄 UPSERT (단일 트랜잭션)
+        
+        Args:
+            table_rows: {테이블명: 행 딕셔너리 리스트} (삽입 순서대로 처리, 외래키 부모 테이블을 먼저 배치)
+            conflict_column: 충돌 판단 컬럼
+            page_size: execute_values 페이지 크기
+            deletes: 같은 트랜잭션에서 삭제할 행 {테이블명: conflict_column 값 리스트}
+            
+        Returns:
+            처리된 총 행 수 (삭제 포함)
+        """
+        if not self.test_connection():
+            raise ConnectionError("데이터베이스 연결이 없습니다.")
+        
+        total_rows = 0
+        previous_autocommit = self.connection.autocommit
+        self.connection.autocommit = False
+        try:
+            with self.connection.cursor() as cur:
+                for table_name, rows in table_rows.items():
+                    if not rows:
+                        continue
+                    
+                    columns = list(rows[0].keys())
+                    update_clauses = [f"{col} = EXCLUDED.{col}" for col in columns if col != conflict_column]
+                    conflict_sql = (
+                        f"ON CONFLICT ({conflict_column}) DO UPDATE SET {', '.join(update_clauses)}"
+                        if update_clauses else "ON CONFLICT DO NOTHING"
+                    )
+                    insert_sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s {conflict_sql}"
+                    
+                    # 값 처리 (JSON 타입 변환, insert_data와 동일)
+                    values = [
+                        tuple(json.dumps(row[col]) if isinstance(row[col], (dict, list)) else row[col]
+                              for col in columns)
+                        for row in rows
+                    ]
+                    
+                    execute_values(cur, insert_sql, values, page_size=page_size)
+                    total_rows += len(values)
+                
+                for table_name, keys in (deletes or {}).items():
+                    if not keys:
+                        continue
+                    cur.execute(f"DELETE FROM {table_name} WHERE {conflict_column} = ANY(%s)", (list(keys),))
+                    total_rows += cur.rowcount
+            
+            self.connection.commit()
+            logger.info(f"일괄 UPSERT 완료: {len(table_rows)}개 테이블, {total_rows}행")
+            return total_rows
+        except Exception as e:
+            self.connection.rollback()
+            logger.error(f"일괄 UPSERT 실패: {e}")
+            raise
+        finally:
+            self.connection.autocommit = previous_autocommit
+    
     def query_data(self, table_name: str, 
                    columns: Optional[List[str]] = None,
                    where_clause: Optional[str] = None,
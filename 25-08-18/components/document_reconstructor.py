@@ -4,7 +4,9 @@
 상세 내용:
     - DocumentReconstructor 클래스 (라인 25-180): 문서 재구성 및 포맷팅
     - reconstruct_documents 메서드 (라인 40-75): 메인 문서 재구성 로직
-    - get_document_metadata 메서드 (라인 77-105): DB에서 문서 메타데이터 조회
+    - get_documents_bulk 메서드: WHERE id = ANY($1) 단일 쿼리 일괄 조회 + updated_at 검증 LRU 캐시
+      (updated_at은 25-08-15/neon_db_v2의 documents 트리거가 갱신, 컬럼이 없는 스키마에서만 캐시 비활성화)
+    - _resolve_columns 메서드: 첫 조회 시 information_schema.columns 1회 확인 → 존재하는 DOCUMENT_COLUMNS만 조회
     - format_document 메서드 (라인 107-145): 마크다운 형식으로 문서 포맷팅
     - determine_search_dimension 메서드 (라인 147-165): 검색 차원 결정
     - ReconstructedDocument 클래스 (라인 182-195): 재구성된 문서 데이터 구조
@@ -14,6 +16,7 @@
 """
 
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -31,6 +34,21 @@ class ReconstructedDocument:
     search_dimension: str
     metadata: Dict[str, Any]
 
+# 존재하지 않는 컬럼 참조 오류 (PostgreSQL SQLSTATE undefined_column)
+UNDEFINED_COLUMN_SQLSTATE = '42703'
+
+# format_document / ReconstructedDocument 에서 실제 사용하는 컬럼
+DOCUMENT_COLUMNS = [
+    'id',
+    'title',
+    'source_type',
+    'structure_type',
+    'document_language',
+    'extracted_info',
+    'content',
+    'child_doc_ids'
+]
+
 class DocumentReconstructor:
     """
     검색 결과를 원본 문서 형식으로 재구성
@@ -41,6 +59,15 @@ class DocumentReconstructor:
     def __init__(self, db_adapter, config: Dict[str, Any]):
         self.db_adapter = db_adapter
         self.config = config
+        
+        # 최근 조회 문서 LRU 캐시 {document_id: (version, document_data)}
+        self.cache_size = config.get('document_cache_size', 256)
+        self.version_column = config.get('document_version_column', 'updated_at')
+        self._document_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self.cache_stats = {'hits': 0, 'misses': 0, 'stale': 0}
+        
+        # documents 테이블에 실제 존재하는 조회 컬럼 (첫 조회 시 information_schema로 확인)
+        self.document_columns: Optional[List[str]] = None
     
     async def reconstruct_documents(
         self, 
@@ -61,13 +88,15 @@ class DocumentReconstructor:
         
         reconstructed_docs = []
         
+        # 모든 결과 문서를 단일 쿼리로 일괄 조회 (순위 순서는 search_results 순회로 유지)
+        documents = await self.get_documents_bulk(
+            [result.document_id for result in search_results],
+            project_name
+        )
+        
         for result in search_results:
             try:
-                # 문서 메타데이터 및 전체 내용 조회
-                document_data = await self.get_document_metadata(
-                    result.document_id, 
-                    project_name
-                )
+                document_data = documents.get(result.document_id)
                 
                 if not document_data:
                     logger.warning(f"문서 데이터 없음: {result.document_id}")
@@ -102,46 +131,158 @@ class DocumentReconstructor:
         logger.info(f"문서 재구성 완료: {len(reconstructed_docs)}개 문서")
         return reconstructed_docs
     
-    async def get_document_metadata(
-        self, 
-        document_id: str, 
+    async def get_documents_bulk(
+        self,
+        document_ids: List[str],
         project_name: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        DB에서 문서의 완전한 메타데이터 및 내용 조회
+        여러 문서를 단일 쿼리로 일괄 조회 (LRU 캐시 사용)
+        
+        캐시된 문서는 버전 컬럼(updated_at)만 비교하여 변경되지 않았으면 본문을 다시 받지 않음
         
         Args:
-            document_id: 문서 ID
+            document_ids: 문서 ID 리스트
             project_name: 프로젝트명
             
         Returns:
-            문서 데이터 딕셔너리
+            {document_id: 문서 데이터} 딕셔너리
         """
+        unique_ids = list(dict.fromkeys(document_ids))
+        if not unique_ids:
+            return {}
+        
+        columns = await self._resolve_columns()
+        if self.version_column is None:
+            return await self._fetch_documents(unique_ids)
+        
+        cached_ids = [doc_id for doc_id in unique_ids if doc_id in self._document_cache]
+        cached_versions = [self._document_cache[doc_id][0] for doc_id in cached_ids]
+        
+        # 캐시 버전과 같은 문서는 본문 컬럼을 NULL로 받아 전송량 절감
+        data_columns = [col for col in columns if col != 'id']
+        select_columns = ",\n                ".join(
+            f"CASE WHEN c.version = d.{self.version_column}::text THEN NULL ELSE d.{col} END AS {col}"
+            for col in data_columns
+        )
+        query = f"""
+            SELECT
+                d.id,
+                d.{self.version_column}::text AS _version,
+                COALESCE(c.version = d.{self.version_column}::text, FALSE) AS _cache_fresh,
+                {select_columns}
+            FROM documents d
+            LEFT JOIN unnest($2::text[], $3::text[]) AS c(id, version) ON c.id = d.id
+            WHERE d.id = ANY($1::text[])
+        """
+        
         try:
-            # documents 테이블에서 기본 정보 조회
-            query = """
-            SELECT *
-            FROM documents
-            WHERE id = $1
-            """
-            
-            results = await self.db_adapter.query_data(
-                "documents",
-                custom_query=query,
-                params=[document_id]
+            rows = await self.db_adapter.execute_query(
+                query, [unique_ids, cached_ids, cached_versions]
             )
+        except Exception as e:
+            if getattr(e, 'sqlstate', None) == UNDEFINED_COLUMN_SQLSTATE:
+                # 확인 이후 스키마 변경 → 다음 조회에서 컬럼 목록 재확인
+                self.document_columns = None
+            # 이번 조회만 캐시 없이 (캐시는 유지)
+            logger.warning(f"문서 캐시 검증 조회 실패, 캐시 없이 재조회: {e}")
+            return await self._fetch_documents(unique_ids)
+        
+        documents = {}
+        for row in rows or []:
+            doc_id = row['id']
+            if row['_cache_fresh']:
+                self.cache_stats['hits'] += 1
+                self._document_cache.move_to_end(doc_id)
+                documents[doc_id] = self._document_cache[doc_id][1]
+                continue
             
-            if not results:
-                return None
-            
-            document_data = results[0]
-            logger.info(f"문서 메타데이터 조회 완료: {document_id}")
-            
-            return document_data
+            if doc_id in self._document_cache:
+                self.cache_stats['stale'] += 1
+            else:
+                self.cache_stats['misses'] += 1
             
+            document_data = {col: row[col] for col in columns}
+            documents[doc_id] = document_data
+            self._cache_document(doc_id, row['_version'], document_data)
+        
+        logger.info(f"문서 일괄 조회 완료: {len(documents)}/{len(unique_ids)}개 (캐시: {self.cache_stats})")
+        return documents
+    
+    async def _resolve_columns(self) -> List[str]:
+        """
+        documents 테이블의 실제 컬럼을 1회 확인하여 조회 컬럼 목록 결정
+        
+        버전 컬럼 자체가 없을 때만 캐시를 비활성화하고, 다른 컬럼이 빠진 스키마는
+        존재하는 컬럼만 조회 (확인 실패 시 이번 조회는 DOCUMENT_COLUMNS 그대로 사용)
+        
+        Returns:
+            조회할 컬럼 리스트
+        """
+        if self.document_columns is not None:
+            return self.document_columns
+        
+        query = """
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_schema = 'public'
+            AND table_name = $1
+        """
+        try:
+            rows = await self.db_adapter.execute_query(query, ['documents'])
         except Exception as e:
-            logger.error(f"문서 메타데이터 조회 오류 ({document_id}): {e}")
-            return None
+            logger.warning(f"documents 컬럼 확인 실패, 기본 컬럼으로 조회: {e}")
+            return DOCUMENT_COLUMNS
+        
+        existing = {row['column_name'] for row in rows or []}
+        if not existing:
+            # 테이블을 찾지 못함 (다른 스키마 등) → 기본 컬럼으로 조회, 다음 호출에서 재확인
+            return DOCUMENT_COLUMNS
+        
+        missing = [col for col in DOCUMENT_COLUMNS if col not in existing]
+        if missing:
+            logger.warning(f"documents 테이블에 없는 컬럼 제외: {missing}")
+        self.document_columns = [col for col in DOCUMENT_COLUMNS if col in existing]
+        
+        if self.version_column is not None and self.version_column not in existing:
+            logger.warning(f"문서 버전 컬럼({self.version_column}) 없음, 캐시 비활성화")
+            self.version_column = None
+            self._document_cache.clear()
+        
+        return self.document_columns
+    
+    async def _fetch_documents(self, document_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """캐시 없이 필요한 컬럼만 단일 쿼리로 일괄 조회"""
+        columns = self.document_columns or DOCUMENT_COLUMNS
+        query = f"""
+            SELECT {', '.join(columns)}
+            FROM documents
+            WHERE id = ANY($1::text[])
+        """
+        try:
+            rows = await self.db_adapter.execute_query(query, [document_ids])
+        except Exception as e:
+            # 일부 컬럼이 없는 스키마 → 전체 컬럼 조회
+            logger.warning(f"선택 컬럼 조회 실패, 전체 컬럼으로 재시도: {e}")
+            rows = await self.db_adapter.query_data(
+                "documents",
+                custom_query="SELECT * FROM documents WHERE id = ANY($1::text[])",
+                params=[document_ids]
+            )
+        return {row['id']: row for row in rows or []}
+    
+    def _cache_document(self, document_id: str, version: Optional[str], document_data: Dict[str, Any]):
+        """LRU 캐시에 문서 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        if self.cache_size <= 0:
+            return
+        self._document_cache[document_id] = (version, document_data)
+        self._document_cache.move_to_end(document_id)
+        while len(self._document_cache) > self.cache_size:
+            self._document_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """문서 캐시 초기화"""
+        self._document_cache.clear()
     
     async def format_document(
         self, 
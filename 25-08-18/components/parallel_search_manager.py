@@ -5,6 +5,7 @@
     - ParallelSearchManager 클래스 (라인 25-140): 내용/화제 차원 병렬 검색 관리
     - parallel_search 메서드 (라인 40-75): 메인 병렬 검색 로직
     - merge_search_results 메서드 (라인 77-105): 검색 결과 통합 및 중복 제거
+    - fused_search 메서드: 두 차원 검색 + 통합을 단일 DB 왕복으로 수행
     - rank_results 메서드 (라인 107-125): 유사도 기반 결과 순위 매기기
     - SearchDimensionResult 클래스 (라인 142-155): 차원별 검색 결과 구조
 상태: 
@@ -113,6 +114,48 @@ class ParallelSearchManager:
             logger.error(f"병렬 검색 오류: {e}")
             return {'content': [], 'topic': [], 'search_time': 0.0}
     
+    async def fused_search(
+        self,
+        query_embedding: List[float],
+        project_name: str
+    ) -> List[SearchResult]:
+        """
+        내용/화제 차원의 폭포수 검색과 결과 통합을 단일 DB 왕복으로 수행
+        
+        Args:
+            query_embedding: 질의 임베딩 벡터
+            project_name: 프로젝트명
+            
+        Returns:
+            통합된 검색 결과 (중복 제거, 유사도 순 정렬) - merge_search_results와 동일한 형식
+        """
+        logger.info("통합 검색 시작: 내용 차원 + 화제 차원 (단일 쿼리)")
+        
+        start_time = asyncio.get_event_loop().time()
+        
+        try:
+            results = await self.waterfall_searcher.search_fused(
+                {
+                    'content': self._get_content_table_names(project_name),
+                    'topic': self._get_topic_table_names(project_name)
+                },
+                query_embedding,
+                self.max_total_results
+            )
+        except Exception as e:
+            # 단일 쿼리 실패 시 (예: 일부 테이블 없음) 차원별 병렬 검색으로 대체
+            logger.warning(f"통합 검색 실패, 병렬 검색으로 대체: {e}")
+            search_results = await self.parallel_search(query_embedding, project_name)
+            return self.merge_search_results(
+                search_results.get('content', []),
+                search_results.get('topic', [])
+            )
+        
+        search_time = asyncio.get_event_loop().time() - start_time
+        logger.info(f"통합 검색 완료 ({search_time:.2f}초): {len(results)}개 (최종)")
+        
+        return results
+    
     def merge_search_results(
         self, 
         content_results: List[SearchResult], 
@@ -0,0 +1,214 @@
+"""
+생성 시간: 2026-10-18 10:12:40
+핵심 내용: 질의 처리 결과(문서 언어 분포, 번역, 임베딩) 계층형 캐시
+상세 내용:
+    - SQLiteCacheBackend 클래스: 재시작 후에도 유지되는 디스크 캐시 (선택)
+    - LayeredCache 클래스: 메모리 LRU + TTL 캐시, 디스크 백엔드 read-through
+    - get / set 메서드: 캐시 조회 및 저장 (hit/miss 카운터 갱신)
+    - get_stats 메서드: 캐시 통계 반환
+    - normalize_query_text 함수: 캐시 키용 질의 정규화
+상태:
+주소: query_cache
+참조: query_processor
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+def normalize_query_text(text: str) -> str:
+    """
+    캐시 키용 질의 정규화 (유니코드 NFC, 공백 정리)
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        정규화된 텍스트
+    """
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+class SQLiteCacheBackend:
+    """
+    SQLite 기반 디스크 캐시 백엔드
+    - 네임스페이스별 키/값(JSON) 저장
+    - 프로세스 재시작 후에도 캐시 유지
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS query_cache (
+                namespace TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (namespace, cache_key)
+            )
+        """)
+        self._conn.commit()
+        logger.info(f"디스크 캐시 백엔드 초기화: {self.db_path}")
+
+    def get(self, namespace: str, key: str) -> Optional[Tuple[Any, float]]:
+        """(값, 저장 시각) 반환, 없으면 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM query_cache WHERE namespace = ? AND cache_key = ?",
+                (namespace, key)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, namespace: str, key: str, value: Any, created_at: float):
+        """값 저장 (기존 값 덮어쓰기)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO query_cache (namespace, cache_key, value, created_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value, ensure_ascii=False), created_at)
+            )
+            self._conn.commit()
+
+    def delete(self, namespace: str, key: str):
+        """값 삭제"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM query_cache WHERE namespace = ? AND cache_key = ?",
+                (namespace, key)
+            )
+            self._conn.commit()
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+class LayeredCache:
+    """
+    계층형 캐시
+    - 1계층: 메모리 LRU (max_size 초과 시 가장 오래 사용되지 않은 항목 제거)
+    - 2계층: 디스크 백엔드 (선택, 메모리 미스 시 조회)
+    - TTL 만료 항목은 미스로 처리
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        backend: Optional[SQLiteCacheBackend] = None
+    ):
+        """
+        Args:
+            namespace: 캐시 이름 (디스크 백엔드 구분용)
+            max_size: 메모리 캐시 최대 항목 수
+            ttl: 만료 시간(초), None이면 만료 없음
+            backend: 디스크 캐시 백엔드
+        """
+        self.namespace = namespace
+        self.max_size = max_size
+        self.ttl = ttl
+        self.backend = backend
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0, 'disk_hits': 0, 'expired': 0, 'evictions': 0}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """키 구성 요소들을 문자열 키로 변환"""
+        return json.dumps(parts, ensure_ascii=False)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and (time.time() - created_at) > self.ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 값 (없거나 만료되면 None)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, created_at = entry
+            if not self._is_expired(created_at):
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return value
+            del self._entries[key]
+            self.stats['expired'] += 1
+
+        if self.backend is not None:
+            try:
+                stored = self.backend.get(self.namespace, key)
+            except Exception as e:
+                logger.warning(f"디스크 캐시 조회 오류 ({self.namespace}): {e}")
+                stored = None
+            if stored is not None:
+                value, created_at = stored
+                if not self._is_expired(created_at):
+                    self._store(key, value, created_at)
+                    self.stats['hits'] += 1
+                    self.stats['disk_hits'] += 1
+                    return value
+                self.stats['expired'] += 1
+
+        self.stats['misses'] += 1
+        return None
+
+    def set(self, key: str, value: Any):
+        """
+        캐시 저장 (메모리 + 디스크)
+
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 값
+        """
+        created_at = time.time()
+        self._store(key, value, created_at)
+
+        if self.backend is not None:
+            try:
+                self.backend.set(self.namespace, key, value, created_at)
+            except Exception as e:
+                logger.warning(f"디스크 캐시 저장 오류 ({self.namespace}): {e}")
+
+    def invalidate(self, key: str):
+        """항목 무효화"""
+        self._entries.pop(key, None)
+        if self.backend is not None:
+            self.backend.delete(self.namespace, key)
+
+    def clear(self):
+        """메모리 캐시 초기화"""
+        self._entries.clear()
+
+    def _store(self, key: str, value: Any, created_at: float):
+        self._entries[key] = (value, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'size': len(self._entries),
+            'hit_rate': (self.stats['hits'] / lookups * 100) if lookups else 0.0
+        }
@@ -7,28 +7,39 @@
     - translate_to_document_language 메서드 (라인 57-75): Claude SDK 기반 번역
     - generate_embedding 메서드 (라인 77-95): OpenAI 임베딩 생성
     - get_document_language 메서드 (라인 97-115): DB에서 문서 언어 조회
+    - 계층형 캐시: 문서 언어 분포(주기적 갱신), 번역(질의, 목표 언어), 임베딩(모델명, 정규화 텍스트)
+    - get_cache_stats 메서드: 캐시 hit/miss 통계 반환
+    - 공유 임베딩 서비스(shared.embedding_service) 사용: 모델 1회 로드, 스레드 풀 인코딩
+    - 번역 호출은 공용 LLM 게이트웨이(shared.llm_gateway) 경유: 동시 요청 제한 + 속도 제한 + 응답 캐시
 상태: 
 주소: query_processor
-참조: 
+참조: query_cache
 """
 
 import asyncio
 import logging
 import os
+import sys
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 import openai
 
-# Sentence transformers for local embedding generation
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+from .query_cache import LayeredCache, SQLiteCacheBackend, normalize_query_text
+
+# 공유 임베딩 서비스 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.embedding_service import get_embedding_service, SENTENCE_TRANSFORMERS_AVAILABLE
+from shared.llm_gateway import get_llm_gateway
+
+if not SENTENCE_TRANSFORMERS_AVAILABLE:
     print("⚠️ sentence-transformers를 찾을 수 없습니다. uv add sentence-transformers")
 
 # Claude SDK 임포트
 try:
-    from claude_code_sdk import query, ClaudeCodeOptions
+    from claude_code_sdk import ClaudeCodeOptions
     CLAUDE_SDK_AVAILABLE = True
 except ImportError:
     CLAUDE_SDK_AVAILABLE = False
@@ -51,10 +62,13 @@ class QueryProcessor:
         # 임베딩 모델 선택 (환경변수 또는 기본값)
         self.embedding_model_name = os.getenv("EMBEDDING_MODEL", "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
         
-        # Sentence Transformers 모델 초기화 (우선순위)
+        # Sentence Transformers 모델 초기화 (우선순위, 프로세스 전역 공유 서비스)
         if SENTENCE_TRANSFORMERS_AVAILABLE:
             try:
-                self.embedding_model = SentenceTransformer(self.embedding_model_name)
+                self.embedding_service = get_embedding_service(self.embedding_model_name)
+                # 임베딩 데몬이 실행 중이면 로컬 모델 로드 생략 (데몬 실패 시 encode가 로컬 모델을 지연 로드)
+                if not self.embedding_service.uses_daemon():
+                    self.embedding_service.load()
                 self.use_local_model = True
                 logger.info(f"✅ Sentence Transformers 모델 로드됨: {self.embedding_model_name}")
             except Exception as e:
@@ -72,6 +86,27 @@ class QueryProcessor:
         
         # Claude SDK 사용 가능 여부 확인
         self.claude_sdk_available = CLAUDE_SDK_AVAILABLE
+        
+        # 계층형 캐시 초기화 (query_cache_path 지정 시 디스크 백엔드 사용)
+        cache_path = config.get('query_cache_path')
+        cache_backend = SQLiteCacheBackend(cache_path) if cache_path else None
+        self.language_cache = LayeredCache(
+            'document_languages',
+            max_size=1,
+            ttl=config.get('language_cache_ttl', 300)
+        )
+        self.translation_cache = LayeredCache(
+            'translations',
+            max_size=config.get('translation_cache_size', 1024),
+            ttl=config.get('translation_cache_ttl', 7 * 24 * 3600),
+            backend=cache_backend
+        )
+        self.embedding_cache = LayeredCache(
+            'embeddings',
+            max_size=config.get('embedding_cache_size', 2048),
+            ttl=config.get('embedding_cache_ttl'),
+            backend=cache_backend
+        )
     
     async def process_query(self, query: str, project_name: str) -> List[float]:
         """
@@ -128,7 +163,21 @@ class QueryProcessor:
         if not self.claude_sdk_available:
             logger.warning("Claude SDK 사용 불가, 원본 질의 반환")
             return query
-            
+        
+        cache_key = LayeredCache.make_key(normalize_query_text(query), target_language)
+        cached = self.translation_cache.get(cache_key)
+        if cached is not None:
+            logger.info("번역 캐시 적중")
+            return cached
+        
+        translated = await self._translate_with_claude(query, target_language)
+        if translated != query:
+            # 실패 시 원본이 반환되므로 실제 번역 결과만 캐시
+            self.translation_cache.set(cache_key, translated)
+        return translated
+    
+    async def _translate_with_claude(self, query: str, target_language: str) -> str:
+        """Claude SDK 번역 호출 (캐시 미스 시)"""
         try:
             language_map = {
                 "english": "English",
@@ -143,16 +192,15 @@ class QueryProcessor:
             prompt = f"다음 한국어 질의를 {target_lang_name}로 정확히 번역해주세요. 번역문만 출력하세요:\n\n{query}"
             system_prompt = f"번역 전문가. 한국어를 {target_lang_name}로 정확하고 자연스럽게 번역하세요."
             
-            messages = []
-            async for message in query(
-                prompt=prompt,
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=ClaudeCodeOptions(
                     max_turns=1,
                     system_prompt=system_prompt,
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="_translate_with_claude"
+            )
             
             if messages:
                 # 메시지 결과 추출 (참조 파일의 패턴 사용)
@@ -191,15 +239,29 @@ class QueryProcessor:
         Returns:
             임베딩 벡터
         """
+        model_name = self.embedding_model_name if self.use_local_model else "text-embedding-3-small"
+        cache_key = LayeredCache.make_key(model_name, normalize_query_text(text))
+        cached = self.embedding_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"임베딩 캐시 적중: {len(cached)}차원")
+            return cached
+        
+        embedding = await self._encode(text)
+        self.embedding_cache.set(cache_key, embedding)
+        return embedding
+    
+    async def _encode(self, text: str) -> List[float]:
+        """임베딩 모델 호출 (캐시 미스 시)"""
         try:
             if self.use_local_model:
-                # Sentence Transformers 모델 사용 (기존 데이터와 호환)
-                embedding = self.embedding_model.encode(text).tolist()
+                # Sentence Transformers 모델 사용 (기존 데이터와 호환, 스레드 풀에서 마이크로 배치 인코딩)
+                embedding = await self.embedding_service.encode_async(text)
                 logger.debug(f"로컬 모델 임베딩 생성: {len(embedding)}차원")
                 return embedding
             else:
-                # OpenAI API 사용 (백업)
-                response = self.openai_client.embeddings.create(
+                # OpenAI API 사용 (백업, 이벤트 루프 차단 방지)
+                response = await asyncio.to_thread(
+                    self.openai_client.embeddings.create,
                     input=text,
                     model="text-embedding-3-small"
                 )
@@ -218,6 +280,10 @@ class QueryProcessor:
         Returns:
             언어별 문서 수 딕셔너리
         """
+        cached = self.language_cache.get('distribution')
+        if cached is not None:
+            return cached
+        
         try:
             query = """
             SELECT document_language, COUNT(*) as count 
@@ -234,9 +300,23 @@ class QueryProcessor:
             language_counts = {row['document_language']: row['count'] for row in results}
             logger.info(f"문서 언어 분포: {language_counts}")
             
+            self.language_cache.set('distribution', language_counts)
             return language_counts
             
         except Exception as e:
             logger.error(f"문서 언어 조회 오류: {e}")
             # 기본값으로 한국어 반환
-            return {"korean": 1}
\ No newline at end of file
+            return {"korean": 1}
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        캐시별 hit/miss 통계 반환
+        
+        Returns:
+            캐시명별 통계 딕셔너리
+        """
+        return {
+            'document_languages': self.language_cache.get_stats(),
+            'translations': self.translation_cache.get_stats(),
+            'embeddings': self.embedding_cache.get_stats()
+        }
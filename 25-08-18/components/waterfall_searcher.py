@@ -6,6 +6,7 @@
     - search_with_waterfall 메서드 (라인 35-65): 메인 폭포수 검색 로직
     - search_embeddings 메서드 (라인 67-100): 개별 테이블 벡터 검색
     - calculate_similarity 메서드 (라인 102-120): 코사인 유사도 계산
+    - search_fused 메서드: 여러 차원의 폭포수 검색을 단일 쿼리로 수행
     - SearchResult 클래스 (라인 152-165): 검색 결과 데이터 구조
 상태: 
 주소: waterfall_searcher
@@ -138,6 +139,54 @@ class WaterfallSearcher:
             logger.error(f"{table_name} 검색 오류: {e}")
             return []
     
+    async def search_fused(
+        self,
+        table_groups: Dict[str, Dict[str, str]],
+        query_embedding: List[float],
+        total_limit: int
+    ) -> List[SearchResult]:
+        """
+        여러 차원의 폭포수 검색을 단일 쿼리로 수행 (우선순위 적용 및 중복 제거 포함)
+        
+        Args:
+            table_groups: 차원별 테이블 {'content': {'primary': ..., 'secondary': ...}, ...}
+            query_embedding: 질의 임베딩 벡터
+            total_limit: 최종 결과 제한
+            
+        Returns:
+            통합된 검색 결과 리스트 (유사도 순)
+        """
+        table_specs = []
+        for dimension, tables in table_groups.items():
+            for search_level in ('primary', 'secondary'):
+                table_specs.append({
+                    'table': tables[search_level],
+                    'dimension': dimension,
+                    'search_level': search_level
+                })
+        
+        rows = await self.db_adapter.waterfall_vector_search(
+            table_specs=table_specs,
+            query_embedding=query_embedding,
+            similarity_threshold=self.similarity_threshold,
+            limit=self.max_results,
+            total_limit=total_limit
+        )
+        
+        search_results = []
+        for row in rows:
+            search_results.append(SearchResult(
+                document_id=row['document_id'],
+                similarity_score=row['similarity_score'],
+                table_name=row['table_name'],
+                search_level=row['search_level'],
+                content=row.get('content', ''),
+                metadata=row.get('metadata', {})
+            ))
+        
+        logger.info(f"통합 폭포수 검색: {len(search_results)}개 결과 (임계값: {self.similarity_threshold})")
+        return search_results
+    
     def calculate_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """
         두 벡터 간 코사인 유사도 계산
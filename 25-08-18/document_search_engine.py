@@ -40,6 +40,8 @@ class SearchConfig:
     max_total_results: int = 10
     enable_translation: bool = True
     log_search_metrics: bool = True
+    use_fused_search: bool = True  # 두 차원 검색 + 통합을 단일 SQL로 수행
+    query_cache_path: Optional[str] = None  # 번역/임베딩 디스크 캐시 경로 (None이면 메모리만 사용)
 
 class DocumentSearchEngine:
     """
@@ -115,18 +117,24 @@ class DocumentSearchEngine:
             # 1. 질의 처리 및 임베딩 생성
             query_embedding = await self.query_processor.process_query(query, project_name)
             
-            # 2. 병렬 벡터 검색 (내용 + 화제 차원)
-            search_results = await self.search_manager.parallel_search(
-                query_embedding, project_name
-            )
-            
-            # 3. 검색 결과 통합
-            content_results = search_results.get('content', [])
-            topic_results = search_results.get('topic', [])
-            
-            merged_results = self.search_manager.merge_search_results(
-                content_results, topic_results
-            )
+            if self.search_config.use_fused_search:
+                # 2-3. 통합 벡터 검색 (내용 + 화제 차원, 단일 DB 왕복으로 통합까지 수행)
+                merged_results = await self.search_manager.fused_search(
+                    query_embedding, project_name
+                )
+            else:
+                # 2. 병렬 벡터 검색 (내용 + 화제 차원)
+                search_results = await self.search_manager.parallel_search(
+                    query_embedding, project_name
+                )
+                
+                # 3. 검색 결과 통합
+                content_results = search_results.get('content', [])
+                topic_results = search_results.get('topic', [])
+                
+                merged_results = self.search_manager.merge_search_results(
+                    content_results, topic_results
+                )
             
             # 4. 결과 수 제한
             if max_results:
@@ -160,7 +168,8 @@ class DocumentSearchEngine:
         search_config_dict = {
             'similarity_threshold': self.search_config.similarity_threshold,
             'max_results_per_search': self.search_config.max_results_per_search,
-            'max_total_results': self.search_config.max_total_results
+            'max_total_results': self.search_config.max_total_results,
+            'query_cache_path': self.search_config.query_cache_path
         }
         
         # 컴포넌트 초기화
@@ -295,9 +304,16 @@ class DocumentSearchEngine:
                     self.reconstructor is not None
                 ]),
                 'search_stats': self.search_stats.copy(),
+                'document_cache': (
+                    self.reconstructor.cache_stats.copy() if self.reconstructor else {}
+                ),
+                'query_cache': (
+                    self.query_processor.get_cache_stats() if self.query_processor else {}
+                ),
                 'config': {
                     'similarity_threshold': self.search_config.similarity_threshold,
-                    'max_total_results': self.search_config.max_total_results
+                    'max_total_results': self.search_config.max_total_results,
+                    'use_fused_search': self.search_config.use_fused_search
                 }
             }
             
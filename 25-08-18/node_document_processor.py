@@ -5,10 +5,14 @@
     - NodeDocumentProcessor 클래스 (라인 30-250): 노드 문서 처리 메인 클래스
     - Enhanced DocumentParser 클래스 (라인 252-380): 메타데이터 포함 문서 파싱
     - parse_metadata 메서드 (라인 50-80): YAML 메타데이터 파싱
-    - parse_document_sections 메서드 (라인 82-150): 문서 섹션별 파싱
+    - parse_document_sections 메서드 (라인 82-150): 문서 섹션별 파싱 (shared.node_document 공유 파서의 섹션 오프셋 맵 사용)
     - process_node_document 메서드 (라인 152-220): 문서 처리 및 DB 저장
     - generate_and_store_embeddings 메서드 (라인 222-250): 임베딩 생성 및 저장
     - 새 필드 지원: source, source_type, structure_type, document_language
+    - 임베딩 모델: shared.embedding_service 공유 서비스 사용 (프로세스당 1회 로드)
+    - parse_node_document_file 함수: 파일 1개 파싱 (프로세스 풀 작업 단위)
+    - bulk_ingest_directory 메서드: 병렬 파싱 + 대용량 배치 인코딩 + 배치당 단일 트랜잭션 일괄 저장
+    - 증분 재임베딩: 섹션별 content_hash / embedding_model 컬럼 비교로 변경 섹션만 인코딩, 삭제된 섹션 벡터 제거
 상태: 
 주소: node_document_processor
 참조: neon_db_v2, database_interface
@@ -18,9 +22,12 @@ import os
 import sys
 import re
 import yaml
+import hashlib
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 # 환경변수 로드
@@ -29,16 +36,14 @@ load_dotenv('/home/nadle/projects/Knowledge_Sherpa/v2/.env')
 
 # 프로젝트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from adapters.postgresql_adapter import PostgreSQLAdapter
 from utils.config_loader import ConfigLoader
 
-# 임베딩 관련 imports
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+# 임베딩 관련 imports (공유 임베딩 서비스)
+from shared.embedding_service import get_embedding_service, SENTENCE_TRANSFORMERS_AVAILABLE
+from shared.node_document import NodeDocument, load_node_document, section_lines
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -59,26 +64,7 @@ class EnhancedDocumentParser:
         Returns:
             메타데이터 딕셔너리
         """
-        metadata = {}
-        lines = content.split('\n')
-        
-        # 첫 번째 # 속성 섹션에서 메타데이터 추출
-        in_metadata = False
-        for line in lines:
-            line = line.strip()
-            
-            if line == "# 속성":
-                in_metadata = True
-                continue
-            elif line.startswith("# ") and in_metadata:
-                break
-            elif line == "---" and in_metadata:
-                continue
-            elif in_metadata and line and ':' in line:
-                key, value = line.split(':', 1)
-                metadata[key.strip()] = value.strip()
-        
-        return metadata
+        return EnhancedDocumentParser.metadata_from_document(NodeDocument(content))
     
     @staticmethod
     def parse_document_sections(content: str) -> Dict[str, str]:
@@ -91,76 +77,109 @@ class EnhancedDocumentParser:
         Returns:
             섹션별 내용 딕셔너리
         """
-        lines = content.split('\n')
-        
-        # 섹션 분리
-        sections = {
-            'core_content': "",
-            'detailed_core': "",
-            'main_topics': "",
-            'sub_topics': "",
-            'document_content': "",
-            'child_doc_ids': ""
-        }
+        return EnhancedDocumentParser.sections_from_document(NodeDocument(content))
+    
+    @staticmethod
+    def metadata_from_document(doc: NodeDocument) -> Dict[str, Any]:
+        """공유 파서 결과에서 '# 속성' 메타데이터 추출"""
+        return {key: prop.value for key, prop in doc.properties.items()}
+    
+    @staticmethod
+    def sections_from_document(doc: NodeDocument) -> Dict[str, str]:
+        """공유 파서 결과(섹션 오프셋 맵)에서 섹션별 내용 구성"""
+        # 추출 하위 섹션은 '##'로 시작하는 라인(소제목)과 구분선을 제외 ('상세 내용'은 상세 핵심 내용에 포함)
+        def subsection(name: str) -> str:
+            return section_lines(doc.subsection(name), skip_prefixes=("##",))
         
-        current_section = None
-        in_extraction = False
+        return {
+            'core_content': subsection("핵심 내용"),
+            'detailed_core': "\n\n".join(filter(None, [subsection("상세 핵심 내용"), subsection("상세 내용")])),
+            'main_topics': subsection("주요 화제"),
+            'sub_topics': subsection("부차 화제"),
+            'document_content': section_lines(doc.section("내용")),
+            'child_doc_ids': doc.section("구성")
+        }
+
+# 임베딩을 생성할 섹션들: (테이블명, 섹션 타입, sections 키)
+EMBEDDING_SECTIONS = [
+    ("core_content_embeddings", "core", "core_content"),
+    ("detailed_core_embeddings", "detailed", "detailed_core"),
+    ("main_topic_embeddings", "main", "main_topics"),
+    ("sub_topic_embeddings", "sub", "sub_topics")
+]
+
+def parse_node_document_file(file_path: str, doc_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    노드 문서 파일 1개를 파싱하여 documents 행과 섹션 정보 반환
+    (ProcessPoolExecutor에서 실행 가능하도록 모듈 수준 함수)
+    
+    Args:
+        file_path: 문서 파일 경로
+        doc_id: 문서 ID (None이면 파일명 사용)
         
-        for line in lines:
-            line_stripped = line.strip()
-            
-            # 메인 섹션 헤더 감지
-            if line_stripped == "# 추출":
-                in_extraction = True
-                current_section = "extraction"
-                continue
-            elif line_stripped == "# 내용":
-                in_extraction = False
-                current_section = "content"
-                continue
-            elif line_stripped == "# 구성":
-                in_extraction = False
-                current_section = "components"
-                continue
-            
-            # 추출 섹션 내 서브섹션 헤더 감지
-            elif line_stripped == "## 핵심 내용" and in_extraction:
-                current_section = "core_content"
-                continue
-            elif line_stripped == "## 상세 핵심 내용" and in_extraction:
-                current_section = "detailed_core"
-                continue
-            elif line_stripped == "## 주요 화제" and in_extraction:
-                current_section = "main_topics"
-                continue
-            elif line_stripped == "## 부차 화제" and in_extraction:
-                current_section = "sub_topics"
-                continue
-            
-            # 내용 추가
-            if current_section == "core_content":
-                if not line_stripped.startswith("##") and line_stripped not in ["# 내용", "# 구성", "---"]:
-                    sections['core_content'] += line + "\n"
-            elif current_section == "detailed_core":
-                if not line_stripped.startswith("##") and line_stripped not in ["# 내용", "# 구성", "---"]:
-                    sections['detailed_core'] += line + "\n"
-            elif current_section == "main_topics":
-                if not line_stripped.startswith("##") and line_stripped not in ["# 내용", "# 구성", "---"]:
-                    sections['main_topics'] += line + "\n"
-            elif current_section == "sub_topics":
-                if not line_stripped.startswith("##") and line_stripped not in ["# 내용", "# 구성", "---"]:
-                    sections['sub_topics'] += line + "\n"
-            elif current_section == "content":
-                if line_stripped not in ["---"] and not line_stripped.startswith("# 구성"):
-                    sections['document_content'] += line + "\n"
-            elif current_section == "components":
-                sections['child_doc_ids'] += line + "\n"
-        
-        # 문자열 정리
-        for key in sections:
-            sections[key] = sections[key].strip()
-        
-        return sections
+    Returns:
+        {'document': documents 행, 'sections': 섹션별 내용, 'metadata': 속성 메타데이터}
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    
+    # 문서 ID 생성
+    if doc_id is None:
+        doc_id = file_path.stem
+    
+    # 문서 1회 읽기 + 1회 스캔 (공유 파서 캐시)
+    doc = load_node_document(file_path)
+    
+    # 메타데이터 파싱
+    metadata = EnhancedDocumentParser.metadata_from_document(doc)
+    
+    # 문서 섹션 파싱
+    sections = EnhancedDocumentParser.sections_from_document(doc)
+    
+    # 전체 추출 정보 구성
+    extracted_sections = []
+    if sections['core_content']:
+        extracted_sections.append(f"## 핵심 내용\n{sections['core_content']}")
+    if sections['detailed_core']:
+        extracted_sections.append(f"## 상세 핵심 내용\n{sections['detailed_core']}")
+    if sections['main_topics']:
+        extracted_sections.append(f"## 주요 화제\n{sections['main_topics']}")
+    if sections['sub_topics']:
+        extracted_sections.append(f"## 부차 화제\n{sections['sub_topics']}")
+    
+    extracted_info = "\n\n".join(extracted_sections)
+    
+    # 문서 데이터 준비 (파일명에서 source 정보 추출)
+    document_data = {
+        'id': doc_id,
+        'title': file_path.name,
+        'extracted_info': extracted_info,
+        'content': sections['document_content'],
+        'informed_toc': None,  # 필요시 설정
+        'child_doc_ids': sections['child_doc_ids'] if sections['child_doc_ids'] else None,
+        'source': file_path.name,
+        'source_type': metadata.get('source_type', 'unknown'),
+        'structure_type': metadata.get('structure_type', 'unknown'),
+        'document_language': metadata.get('document_language', 'unknown')
+    }
+    
+    return {'document': document_data, 'sections': sections, 'metadata': metadata}
+
+def compute_content_hash(content: str) -> str:
+    """섹션 내용 해시 (앞뒤 공백 무시)"""
+    return hashlib.sha256(content.strip().encode('utf-8')).hexdigest()
+
+def build_embedding_metadata(section_type: str, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """임베딩 행 메타데이터 구성"""
+    return {
+        "section_type": section_type,
+        "source_type": metadata.get('source_type', 'unknown'),
+        "structure_type": metadata.get('structure_type', 'unknown'),
+        "document_language": metadata.get('document_language', 'unknown'),
+        "content_length": len(content),
+        "created_at": datetime.now().isoformat()
+    }
 
 class NodeDocumentProcessor:
     """
@@ -178,6 +197,8 @@ class NodeDocumentProcessor:
         self.config_loader = ConfigLoader()
         self.db_adapter = None
         self.embedding_model = None
+        self.embedding_model_name = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+        self._tracking_columns_ready = False
         
         # 프로젝트 로드
         self._load_project()
@@ -211,10 +232,10 @@ class NodeDocumentProcessor:
             return
         
         if self.embedding_model is None:
-            model_name = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
-            logger.info(f"임베딩 모델 로드 중: {model_name}")
-            self.embedding_model = SentenceTransformer(model_name)
-            logger.info("임베딩 모델 로드 완료")
+            self.embedding_model = get_embedding_service(self.embedding_model_name)
+            # 임베딩 데몬이 실행 중이면 로컬 모델 로드 생략
+            if not self.embedding_model.uses_daemon():
+                self.embedding_model.load()
     
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
@@ -255,7 +276,7 @@ class NodeDocumentProcessor:
             return []
     
     def process_node_document(self, file_path: str, doc_id: Optional[str] = None, 
-                             generate_embeddings: bool = True) -> str:
+                             generate_embeddings: bool = True, force_reembed: bool = False) -> str:
         """
         노드 문서 파일을 처리하여 데이터베이스에 저장
         
@@ -263,58 +284,17 @@ class NodeDocumentProcessor:
             file_path: 문서 파일 경로
             doc_id: 문서 ID (None이면 파일명 사용)
             generate_embeddings: 임베딩을 생성할지 여부
+            force_reembed: 변경되지 않은 섹션도 재인코딩할지 여부
             
         Returns:
             생성된 문서 ID
         """
         try:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
-            
-            # 문서 ID 생성
-            if doc_id is None:
-                doc_id = file_path.stem
-            
-            # 문서 내용 읽기
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 메타데이터 파싱
-            metadata = EnhancedDocumentParser.parse_metadata(content)
-            
-            # 문서 섹션 파싱
-            sections = EnhancedDocumentParser.parse_document_sections(content)
-            
-            # 전체 추출 정보 구성
-            extracted_sections = []
-            if sections['core_content']:
-                extracted_sections.append(f"## 핵심 내용\n{sections['core_content']}")
-            if sections['detailed_core']:
-                extracted_sections.append(f"## 상세 핵심 내용\n{sections['detailed_core']}")
-            if sections['main_topics']:
-                extracted_sections.append(f"## 주요 화제\n{sections['main_topics']}")
-            if sections['sub_topics']:
-                extracted_sections.append(f"## 부차 화제\n{sections['sub_topics']}")
-            
-            extracted_info = "\n\n".join(extracted_sections)
-            
-            # 파일명에서 source 정보 추출
-            source = file_path.name
-            
-            # 문서 데이터 준비
-            document_data = {
-                'id': doc_id,
-                'title': file_path.name,
-                'extracted_info': extracted_info,
-                'content': sections['document_content'],
-                'informed_toc': None,  # 필요시 설정
-                'child_doc_ids': sections['child_doc_ids'] if sections['child_doc_ids'] else None,
-                'source': source,
-                'source_type': metadata.get('source_type', 'unknown'),
-                'structure_type': metadata.get('structure_type', 'unknown'),
-                'document_language': metadata.get('document_language', 'unknown')
-            }
+            parsed = parse_node_document_file(file_path, doc_id)
+            document_data = parsed['document']
+            sections = parsed['sections']
+            metadata = parsed['metadata']
+            doc_id = document_data['id']
             
             # documents 테이블에 삽입
             success = self.db_adapter.insert_data('documents', document_data)
@@ -325,7 +305,7 @@ class NodeDocumentProcessor:
             
             # 임베딩 생성 및 저장
             if generate_embeddings:
-                self._generate_and_store_embeddings(doc_id, sections, metadata)
+                self._generate_and_store_embeddings(doc_id, sections, metadata, force=force_reembed)
             
             return doc_id
             
@@ -333,15 +313,100 @@ class NodeDocumentProcessor:
             logger.error(f"문서 처리 실패 ({file_path}): {e}")
             raise
     
+    def _ensure_tracking_columns(self):
+        """임베딩 테이블에 content_hash / embedding_model 컬럼 추가 (없을 때만)"""
+        if self._tracking_columns_ready:
+            return
+        for table_name, _, _ in EMBEDDING_SECTIONS:
+            self.db_adapter.execute_query(
+                f"ALTER TABLE {table_name} "
+                f"ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64), "
+                f"ADD COLUMN IF NOT EXISTS embedding_model TEXT"
+            )
+        self._tracking_columns_ready = True
+    
+    def _prepare_embedding_changes(self, parsed_docs: List[Dict[str, Any]],
+                                   force: bool = False) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[str]], Dict[str, int]]:
+        """
+        파싱된 문서들의 섹션 해시를 저장된 값과 비교하여 변경분만 인코딩
+        
+        Args:
+            parsed_docs: parse_node_document_file 결과 리스트
+            force: True면 해시와 관계없이 모든 섹션 재인코딩
+            
+        Returns:
+            (UPSERT할 임베딩 행 {테이블명: 행 리스트}, 삭제할 임베딩 ID {테이블명: ID 리스트}, 통계)
+        """
+        self._ensure_tracking_columns()
+        doc_ids = [parsed['document']['id'] for parsed in parsed_docs]
+        
+        # 저장된 섹션 해시 조회 {테이블명: {임베딩 ID: (content_hash, embedding_model)}}
+        existing: Dict[str, Dict[str, Tuple[Optional[str], Optional[str]]]] = {}
+        for table_name, _, _ in EMBEDDING_SECTIONS:
+            rows = self.db_adapter.execute_query(
+                f"SELECT id, content_hash, embedding_model FROM {table_name} WHERE document_id = ANY(%s)",
+                [doc_ids]
+            ) or []
+            existing[table_name] = {row['id']: (row['content_hash'], row['embedding_model']) for row in rows}
+        
+        targets = []
+        current_ids: Dict[str, set] = {table_name: set() for table_name, _, _ in EMBEDDING_SECTIONS}
+        stats = {'encoded': 0, 'skipped': 0, 'deleted': 0}
+        
+        for parsed in parsed_docs:
+            doc_id = parsed['document']['id']
+            for table_name, section_type, key in EMBEDDING_SECTIONS:
+                content = parsed['sections'][key]
+                if not content.strip():
+                    continue
+                
+                embedding_id = f"{doc_id}_{section_type}_001"
+                content_hash = compute_content_hash(content)
+                current_ids[table_name].add(embedding_id)
+                
+                if not force and existing[table_name].get(embedding_id) == (content_hash, self.embedding_model_name):
+                    stats['skipped'] += 1
+                    continue
+                
+                targets.append((parsed, table_name, embedding_id, section_type, content, content_hash))
+        
+        # 변경된 섹션만 한 번에 인코딩
+        embeddings = self.generate_embeddings([target[4] for target in targets])
+        if len(embeddings) != len(targets):
+            raise RuntimeError(f"임베딩 생성 실패: {len(embeddings)}/{len(targets)}개")
+        
+        upserts: Dict[str, List[Dict[str, Any]]] = {}
+        for (parsed, table_name, embedding_id, section_type, content, content_hash), embedding in zip(targets, embeddings):
+            upserts.setdefault(table_name, []).append({
+                'id': embedding_id,
+                'embedding': embedding,
+                'document_id': parsed['document']['id'],
+                'metadata': build_embedding_metadata(section_type, content, parsed['metadata']),
+                'content_hash': content_hash,
+                'embedding_model': self.embedding_model_name
+            })
+        stats['encoded'] = len(targets)
+        
+        # 내용이 사라진 섹션의 벡터 삭제
+        deletes = {
+            table_name: [embedding_id for embedding_id in existing[table_name] if embedding_id not in current_ids[table_name]]
+            for table_name in existing
+        }
+        deletes = {table_name: ids for table_name, ids in deletes.items() if ids}
+        stats['deleted'] = sum(len(ids) for ids in deletes.values())
+        
+        return upserts, deletes, stats
+    
     def _generate_and_store_embeddings(self, doc_id: str, sections: Dict[str, str], 
-                                      metadata: Dict[str, Any]):
+                                      metadata: Dict[str, Any], force: bool = False):
         """
-        각 섹션의 임베딩을 생성하고 해당 테이블에 저장
+        각 섹션의 임베딩을 생성하고 해당 테이블에 저장 (변경된 섹션만)
         
         Args:
             doc_id: 문서 ID
             sections: 파싱된 섹션들
             metadata: 문서 메타데이터
+            force: True면 변경 여부와 관계없이 재인코딩
         """
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             logger.warning("임베딩 생성을 건너뜁니다 (sentence-transformers 미설치)")
@@ -350,47 +415,11 @@ class NodeDocumentProcessor:
         try:
             logger.info(f"임베딩 생성 시작: {doc_id}")
             
-            # 임베딩을 생성할 섹션들
-            embedding_data = [
-                ("core_content_embeddings", "core", sections['core_content']),
-                ("detailed_core_embeddings", "detailed", sections['detailed_core']),
-                ("main_topic_embeddings", "main", sections['main_topics']),
-                ("sub_topic_embeddings", "sub", sections['sub_topics'])
-            ]
+            parsed = {'document': {'id': doc_id}, 'sections': sections, 'metadata': metadata}
+            upserts, deletes, stats = self._prepare_embedding_changes([parsed], force=force)
+            self.db_adapter.bulk_upsert(upserts, deletes=deletes)
             
-            for table_name, section_type, content in embedding_data:
-                if content.strip():  # 내용이 있는 경우만 처리
-                    # 임베딩 생성
-                    embeddings = self.generate_embeddings([content])
-                    if embeddings:
-                        embedding_id = f"{doc_id}_{section_type}_001"
-                        
-                        # 메타데이터 구성
-                        embedding_metadata = {
-                            "section_type": section_type,
-                            "source_type": metadata.get('source_type', 'unknown'),
-                            "structure_type": metadata.get('structure_type', 'unknown'),
-                            "document_language": metadata.get('document_language', 'unknown'),
-                            "content_length": len(content),
-                            "created_at": datetime.now().isoformat()
-                        }
-                        
-                        # 임베딩 데이터 준비
-                        embedding_data_row = {
-                            'id': embedding_id,
-                            'embedding': embeddings[0],
-                            'document_id': doc_id,
-                            'metadata': embedding_metadata
-                        }
-                        
-                        # 임베딩 저장
-                        success = self.db_adapter.insert_data(table_name, embedding_data_row)
-                        if success:
-                            logger.info(f"임베딩 저장 완료: {table_name} - {embedding_id}")
-                        else:
-                            logger.error(f"임베딩 저장 실패: {table_name} - {embedding_id}")
-            
-            logger.info(f"모든 임베딩 처리 완료: {doc_id}")
+            logger.info(f"모든 임베딩 처리 완료: {doc_id} (인코딩 {stats['encoded']}, 생략 {stats['skipped']}, 삭제 {stats['deleted']})")
             
         except Exception as e:
             logger.error(f"임베딩 처리 실패 ({doc_id}): {e}")
@@ -435,6 +464,90 @@ class NodeDocumentProcessor:
             logger.error(f"디렉토리 처리 실패 ({directory_path}): {e}")
             raise
     
+    def bulk_ingest_directory(self, directory_path: str, pattern: str = "*_info.md",
+                              batch_size: int = 64, workers: Optional[int] = None,
+                              generate_embeddings: bool = True, force_reembed: bool = False) -> Dict[str, Any]:
+        """
+        디렉토리 내 노드 문서 일괄 수집
+        - 파일 파싱: 프로세스 풀 병렬 처리
+        - 임베딩: 배치 내 모든 문서의 변경된 섹션을 한 번에 인코딩 (내용 해시 비교)
+        - 저장: 배치당 단일 트랜잭션 execute_values UPSERT
+        
+        Args:
+            directory_path: 처리할 디렉토리 경로
+            pattern: 파일 패턴 (기본값: *_info.md)
+            batch_size: 트랜잭션/인코딩 배치당 문서 수
+            workers: 파싱 프로세스 수 (None이면 CPU 수)
+            generate_embeddings: 임베딩을 생성할지 여부
+            force_reembed: 변경되지 않은 섹션도 재인코딩할지 여부
+            
+        Returns:
+            처리 통계 (문서 수, 임베딩/생략/삭제 수, 소요 시간, docs/sec)
+        """
+        directory = Path(directory_path)
+        if not directory.exists():
+            raise FileNotFoundError(f"디렉토리를 찾을 수 없습니다: {directory_path}")
+        
+        files = sorted(directory.glob(pattern))
+        if not files:
+            logger.warning(f"패턴 '{pattern}'에 맞는 파일이 없습니다: {directory_path}")
+            return {'documents': 0, 'embeddings': 0, 'skipped': 0, 'deleted': 0,
+                    'failed': 0, 'elapsed': 0.0, 'docs_per_sec': 0.0}
+        
+        start_time = time.time()
+        
+        # 1. 병렬 파싱
+        parsed_docs = []
+        failed = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [(file_path, executor.submit(parse_node_document_file, str(file_path))) for file_path in files]
+            for file_path, future in futures:
+                try:
+                    parsed_docs.append(future.result())
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"파일 파싱 실패 ({file_path}): {e}")
+        
+        parse_time = time.time() - start_time
+        logger.info(f"병렬 파싱 완료: {len(parsed_docs)}개 문서 ({parse_time:.2f}초)")
+        
+        # 2. 배치 단위 인코딩 + 저장
+        total_docs = 0
+        total_embeddings = 0
+        total_skipped = 0
+        total_deleted = 0
+        for batch_start in range(0, len(parsed_docs), batch_size):
+            batch = parsed_docs[batch_start:batch_start + batch_size]
+            
+            table_rows: Dict[str, List[Dict[str, Any]]] = {'documents': [parsed['document'] for parsed in batch]}
+            deletes: Dict[str, List[str]] = {}
+            
+            if generate_embeddings and SENTENCE_TRANSFORMERS_AVAILABLE:
+                upserts, deletes, stats = self._prepare_embedding_changes(batch, force=force_reembed)
+                table_rows.update(upserts)
+                total_embeddings += stats['encoded']
+                total_skipped += stats['skipped']
+                total_deleted += stats['deleted']
+            
+            self.db_adapter.bulk_upsert(table_rows, deletes=deletes)
+            total_docs += len(batch)
+            
+            elapsed = time.time() - start_time
+            logger.info(f"배치 저장 완료: {total_docs}/{len(parsed_docs)}개 문서 ({total_docs / elapsed:.1f} docs/sec)")
+        
+        elapsed = time.time() - start_time
+        stats = {
+            'documents': total_docs,
+            'embeddings': total_embeddings,
+            'skipped': total_skipped,
+            'deleted': total_deleted,
+            'failed': failed,
+            'elapsed': elapsed,
+            'docs_per_sec': total_docs / elapsed if elapsed > 0 else 0.0
+        }
+        logger.info(f"일괄 수집 완료: {stats}")
+        return stats
+    
     def close(self):
         """리소스 정리"""
         if self.db_adapter:
@@ -451,6 +564,10 @@ def main():
     parser.add_argument('--pattern', '-p', default='*_info.md', help='파일 패턴 (기본값: *_info.md)')
     parser.add_argument('--project', default='knowledge_sherpa', help='사용할 프로젝트명')
     parser.add_argument('--no-embeddings', action='store_true', help='임베딩 생성 건너뛰기')
+    parser.add_argument('--bulk', action='store_true', help='디렉토리 일괄 수집 모드 (병렬 파싱 + 배치 인코딩/저장)')
+    parser.add_argument('--batch-size', type=int, default=64, help='일괄 수집 배치당 문서 수 (기본값: 64)')
+    parser.add_argument('--workers', type=int, default=None, help='일괄 수집 파싱 프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--force-reembed', action='store_true', help='변경되지 않은 섹션도 재임베딩')
     
     args = parser.parse_args()
     
@@ -467,10 +584,23 @@ def main():
         
         if args.file:
             # 단일 파일 처리
-            doc_id = processor.process_node_document(args.file, generate_embeddings=generate_embeddings)
+            doc_id = processor.process_node_document(args.file, generate_embeddings=generate_embeddings,
+                                                     force_reembed=args.force_reembed)
             print(f"문서 처리 완료: {doc_id}")
         
-        if args.directory:
+        if args.directory and args.bulk:
+            # 디렉토리 일괄 수집
+            stats = processor.bulk_ingest_directory(
+                args.directory, args.pattern,
+                batch_size=args.batch_size,
+                workers=args.workers,
+                generate_embeddings=generate_embeddings,
+                force_reembed=args.force_reembed
+            )
+            print(f"일괄 수집 완료: {stats['documents']}개 문서, {stats['embeddings']}개 임베딩 "
+                  f"(생략 {stats['skipped']}, 삭제 {stats['deleted']}), "
+                  f"실패 {stats['failed']}개 ({stats['elapsed']:.2f}초, {stats['docs_per_sec']:.1f} docs/sec)")
+        elif args.directory:
             # 디렉토리 처리
             processed_docs = processor.process_directory(args.directory, args.pattern)
             print(f"처리 완료: {len(processed_docs)}개 문서")
@@ -1,23 +1,32 @@
 # 생성 시간: 2025-08-18 17:25:00 KST
 # 핵심 내용: 포스트 전용 노드 JSON에 부모-자식 관계 및 has_content 필드를 추가하는 모듈
 # 상세 내용:
-#   - PostNodeEnhancer 클래스 (라인 21-170): 포스트 노드 정보 확장 기능
-#   - build_hierarchy 메서드 (라인 31-75): 부모-자식 관계 구축
-#   - analyze_content_for_all_nodes 메서드 (라인 77-105): 모든 노드 직접 콘텐츠 분석
-#   - extract_node_content 메서드 (라인 107-140): 개별 노드 콘텐츠 추출
-#   - enhance_nodes 메서드 (라인 142-160): 전체 노드 확장 처리
-#   - save_enhanced_json 메서드 (라인 162-170): 확장된 노드 JSON 저장
-#   - main 함수 (라인 172-210): CLI 인터페이스
+#   - PostNodeEnhancer 클래스: 포스트 노드 정보 확장 기능
+#   - build_hierarchy 메서드: 부모-자식 관계 구축 (shared.markdown_headings 스택 기반 O(n))
+#   - analyze_content_for_all_nodes 메서드: 모든 노드 직접 콘텐츠 분석 (헤딩 1회 토큰화)
+#   - match_node_sections 메서드: 노드를 문서 헤딩 섹션에 순서대로 대응
+#   - enhance_nodes 메서드: 전체 노드 확장 처리
+#   - save_enhanced_json 메서드: 확장된 노드 JSON 저장
+#   - main 함수: CLI 인터페이스
 # 상태: 활성
 # 주소: post_node_enhancer
 # 참조: node_enhancer (부모-자식 관계 로직)
 
 import json
 import re
+import sys
 import argparse
+from bisect import bisect_right
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+# 공유 마크다운 헤딩 토크나이저 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.markdown_headings import HeadingSection, build_hierarchy, heading_sections
+
 
 class PostNodeEnhancer:
     def __init__(self):
@@ -27,25 +36,8 @@ class PostNodeEnhancer:
         """레벨 기반으로 부모-자식 관계를 구축"""
         print("🔗 부모-자식 관계 구축 중...")
         
-        # 각 노드에 관계 필드 초기화
-        for node in nodes:
-            node['parent_id'] = None
-            node['children_ids'] = []
-        
-        # 부모-자식 관계 구축
-        for i, current_node in enumerate(nodes):
-            current_level = current_node.get('level', 0)
-            
-            # 현재 노드의 부모 찾기 (더 낮은 레벨의 가장 가까운 이전 노드)
-            for j in range(i-1, -1, -1):
-                potential_parent = nodes[j]
-                parent_level = potential_parent.get('level', 0)
-                
-                if parent_level < current_level:
-                    # 부모 발견
-                    current_node['parent_id'] = potential_parent['id']
-                    potential_parent['children_ids'].append(current_node['id'])
-                    break
+        # 부모 = 더 낮은 레벨의 가장 가까운 이전 노드
+        build_hierarchy(nodes)
         
         # 계층 구조 통계 출력
         root_nodes = [n for n in nodes if n['parent_id'] is None]
@@ -64,19 +56,17 @@ class PostNodeEnhancer:
         
         content_count = 0
         
-        for i, node in enumerate(nodes):
-            # 각 노드의 실제 콘텐츠 추출
-            node_content = self.extract_node_content(node, nodes, i, markdown_content)
+        # 문서 헤딩을 1회 토큰화하고 각 노드를 해당 헤딩 섹션에 대응
+        node_sections = self.match_node_sections(nodes, markdown_content)
+        
+        for node, section in zip(nodes, node_sections):
+            # 각 노드의 실제 콘텐츠 (헤딩 다음 ~ 다음 같은/상위 레벨 헤딩 전)
+            node_content = markdown_content[section.content_start:section.content_end] if section else None
             
             # 콘텐츠 존재 여부 판단
             if node_content and node_content.strip():
-                # 실제 의미있는 콘텐츠가 있는지 확인 (빈 줄, 공백만 있는 경우 제외)
-                cleaned_content = re.sub(r'\s+', ' ', node_content.strip())
-                if len(cleaned_content) > 0:
-                    node['has_content'] = True
-                    content_count += 1
-                else:
-                    node['has_content'] = False
+                node['has_content'] = True
+                content_count += 1
             else:
                 node['has_content'] = False
         
@@ -85,48 +75,38 @@ class PostNodeEnhancer:
         
         return nodes
 
-    def extract_node_content(self, current_node: Dict[str, Any], all_nodes: List[Dict[str, Any]], 
-                           current_index: int, markdown_content: str) -> Optional[str]:
-        """개별 노드의 실제 콘텐츠를 추출"""
-        try:
-            # 현재 노드의 헤더 패턴 생성
-            current_level = current_node.get('level', 0)
-            current_title = current_node.get('title', '')
-            current_header_pattern = '#' * (current_level + 1) + r'\s+' + re.escape(current_title)
-            
-            # 현재 헤더 위치 찾기
-            current_match = re.search(current_header_pattern, markdown_content)
-            if not current_match:
-                return None
-            
-            start_pos = current_match.end()
-            
-            # 다음 헤더 위치 찾기 (현재 레벨 이하의 다음 헤더)
-            end_pos = len(markdown_content)  # 기본값: 문서 끝
-            
-            for j in range(current_index + 1, len(all_nodes)):
-                next_node = all_nodes[j]
-                next_level = next_node.get('level', 0)
-                next_title = next_node.get('title', '')
-                
-                # 현재 레벨 이하의 헤더를 찾으면 콘텐츠 끝
-                if next_level <= current_level:
-                    next_header_pattern = '#' * (next_level + 1) + r'\s+' + re.escape(next_title)
-                    next_match = re.search(next_header_pattern, markdown_content[start_pos:])
-                    if next_match:
-                        end_pos = start_pos + next_match.start()
-                        break
-            
-            # 콘텐츠 추출
-            if start_pos < end_pos:
-                content = markdown_content[start_pos:end_pos]
-                return content.strip()
-            
-            return None
+    def match_node_sections(self, nodes: List[Dict[str, Any]], markdown_content: str) -> List[Optional[HeadingSection]]:
+        """
+        노드(문서 순서)마다 대응하는 헤딩 섹션 찾기
+        - (레벨, 제목)이 같은 헤딩 중 직전 노드 헤딩 이후의 첫 번째를 사용 (중복 제목도 순서대로 대응)
+        - 정확히 같은 제목이 없으면 같은 레벨에서 노드 제목으로 시작하는 헤딩 사용
+        """
+        sections = heading_sections(markdown_content, max_hashes=6, allow_indent=False)
+        positions: Dict[tuple, List[int]] = {}
+        for index, section in enumerate(sections):
+            positions.setdefault((section.heading.level, section.heading.title), []).append(index)
+        
+        matched: List[Optional[HeadingSection]] = []
+        last_index = -1
+        for node in nodes:
+            level = node.get('level', 0)
+            title = node.get('title', '').strip()
+            candidates = positions.get((level, title))
+            if candidates is None:
+                candidates = [
+                    index for index, section in enumerate(sections)
+                    if section.heading.level == level and title and section.heading.title.startswith(title)
+                ]
+            if not candidates:
+                matched.append(None)
+                continue
             
-        except Exception as e:
-            print(f"   ⚠️ 노드 {current_node.get('id', 'N/A')} 콘텐츠 추출 중 오류: {e}")
-            return None
+            after = bisect_right(candidates, last_index)
+            index = candidates[after] if after < len(candidates) else candidates[0]
+            last_index = index
+            matched.append(sections[index])
+        
+        return matched
 
     def enhance_nodes(self, nodes: List[Dict[str, Any]], markdown_content: str) -> List[Dict[str, Any]]:
         """노드 정보에 부모-자식 관계와 has_content 필드 추가"""
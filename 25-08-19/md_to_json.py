@@ -12,20 +12,26 @@
 """
 
 import sys
-import re
 import json
 import os
+from pathlib import Path
+
+# 공유 마크다운 헤딩 토크나이저 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.markdown_headings import iter_headings
 
 
 def extract_first_header(md_file_path: str) -> str:
     """MD 파일에서 첫 번째 # 헤더의 텍스트를 추출"""
     try:
         with open(md_file_path, 'r', encoding='utf-8') as file:
-            for line in file:
-                # 첫 번째 # 헤더 찾기 (## 등은 제외)
-                match = re.match(r'^#\s+(.*)', line.strip())
-                if match:
-                    return match.group(1).strip()
+            # 첫 번째 # 헤더 찾기 (## 등은 제외)
+            for heading in iter_headings(file.read()):
+                if heading.level == 0:
+                    return heading.title
         return "제목 없음"
     except FileNotFoundError:
         print(f"오류: 파일을 찾을 수 없습니다: {md_file_path}")
@@ -15,17 +15,24 @@ import sys
 import re
 import json
 import os
+from pathlib import Path
+
+# 공유 마크다운 헤딩 토크나이저 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.markdown_headings import iter_headings
 
 
 def extract_first_header(md_file_path: str) -> str:
     """MD 파일에서 첫 번째 # 헤더의 텍스트를 추출 (숫자. 형태 제거)"""
     try:
         with open(md_file_path, 'r', encoding='utf-8') as file:
-            for line in file:
-                # 첫 번째 # 헤더 찾기 (## 등은 제외)
-                match = re.match(r'^#\s+(.*)', line.strip())
-                if match:
-                    title = match.group(1).strip()
+            # 첫 번째 # 헤더 찾기 (## 등은 제외)
+            for heading in iter_headings(file.read()):
+                if heading.level == 0:
+                    title = heading.title
                     # 앞의 숫자. 형태 제거 (예: "1. Build a basic chatbot" -> "Build a basic chatbot")
                     clean_title = re.sub(r'^\d+\.\s*', '', title)
                     return clean_title
@@ -4,6 +4,7 @@
 핵심 내용: Gemini 2.0 Flash-lite 모델을 사용해 문서에서 핵심 정보, 상세 핵심 정보, 상세 정보, 주요 화제, 부차 화제를 추출하는 스크립트
 상세 내용: 
     - GeminiProvider (line 30): Gemini 2.0 Flash-lite API 구현체
+      (shared.llm_gateway 경유, --cache=read|write|off: 모델 + 시스템 지시사항 + 프롬프트 기준 LLM 응답 캐시)
     - extract_content_with_gemini() (line 80): Gemini를 사용한 내용 추출
     - extract_all_information() (line 120): 5가지 정보를 순차적으로 추출
     - save_extracted_info() (line 200): 추출된 정보를 파일로 저장
@@ -13,6 +14,7 @@
 """
 
 import os
+import sys
 import asyncio
 import argparse
 from datetime import datetime
@@ -28,6 +30,14 @@ except ImportError:
     print("⚠️ google-generativeai 패키지가 설치되지 않았습니다.")
     print("설치 명령어: pip install google-generativeai")
 
+# 공유 LLM 호출 게이트웨이 / 응답 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_cache import configure_llm_cache, make_cache_key
+from shared.llm_gateway import get_llm_gateway
+
 
 class GeminiProvider:
     """Gemini 2.0 Flash-lite API 구현체"""
@@ -47,7 +57,8 @@ class GeminiProvider:
             genai.configure(api_key=api_key)
         
         # Gemini 2.0 Flash-lite 모델 설정
-        self.model = genai.GenerativeModel('models/gemini-2.0-flash-lite')
+        self.model_name = 'models/gemini-2.0-flash-lite'
+        self.model = genai.GenerativeModel(self.model_name)
         print("✅ Gemini 2.0 Flash-lite 모델 초기화 완료")
     
     async def generate_content(self, prompt: str, system_instruction: str = "") -> str:
@@ -65,16 +76,23 @@ class GeminiProvider:
             # 시스템 지시사항이 있으면 프롬프트 앞에 추가
             full_prompt = f"{system_instruction}\n\n{prompt}" if system_instruction else prompt
             
-            # 비동기 생성 (실제로는 동기 호출이지만 asyncio와 호환되도록 처리)
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, 
-                lambda: self.model.generate_content(full_prompt)
-            )
-            
-            if response and response.text:
+            async def generate() -> str:
+                # 비동기 생성 (실제로는 동기 호출이지만 asyncio와 호환되도록 처리)
+                response = await asyncio.get_event_loop().run_in_executor(
+                    None, 
+                    lambda: self.model.generate_content(full_prompt)
+                )
+                if not (response and response.text):
+                    # 빈 응답은 캐시에 저장되지 않도록 예외로 처리
+                    raise ValueError("Gemini API에서 응답을 생성하지 못했습니다")
                 return response.text.strip()
-            else:
-                return "❌ Gemini API에서 응답을 생성하지 못했습니다"
+            
+            # 공용 게이트웨이 경유 (모델 + 시스템 지시사항 + 프롬프트 기준 응답 캐시)
+            return await get_llm_gateway().run(
+                generate,
+                label="gemini_generate",
+                cache_key=make_cache_key(self.model_name, system_instruction, prompt, {"provider": "gemini"})
+            )
                 
         except Exception as e:
             print(f"❌ Gemini API 호출 실패: {e}")
@@ -252,8 +270,12 @@ async def main():
     parser.add_argument('input_file', help='처리할 문서 파일 경로')
     parser.add_argument('--api-key', help='Gemini API 키 (환경 변수 GEMINI_API_KEY 사용 가능)')
     parser.add_argument('--output-dir', help='출력 디렉토리 (기본값: 현재 날짜 디렉토리)')
+    parser.add_argument('--cache', choices=['read', 'write', 'off'],
+                        help='LLM 응답 캐시 모드 (기본값: 환경 변수 LLM_CACHE 또는 off)')
     
     args = parser.parse_args()
+    if args.cache:
+        configure_llm_cache(args.cache)
     
     # 파일 존재 확인
     if not os.path.exists(args.input_file):
@@ -11,6 +11,7 @@
     - 오류 처리 로직 (라인 35-43, 82-94): 파일 없음, API 호출 실패 등의 오류 상황 처리
     - 타임스탬프 기록 (라인 153-162): 소요 시간 계산 기능
     - 연속 대화 지원 (라인 101-116): 같은 세션 내에서 대화 배열로 누적 저장
+    - Claude 호출 (전체): shared.claude_client_pool 공용 풀에서 연결된 ClaudeSDKClient 임대 (질문마다 CLI 프로세스 생성/종료 없음)
 - 상태: active
 - 참조: document_based_qa_system_v4.py, simple_qa_system.py에서 Claude SDK 연결 및 파일 처리 로직 참조
 """
@@ -18,17 +19,26 @@
 import asyncio
 import json
 import os
+import sys
 import time
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Any, Optional
 
 try:
-    from claude_code_sdk import ClaudeSDKClient, CLINotFoundError, ProcessError
+    from claude_code_sdk import CLINotFoundError, ProcessError
 except ImportError as e:
     print(f"claude_code_sdk 모듈을 찾을 수 없습니다: {e}")
     print("다음 명령어로 설치하세요: npm install -g @anthropic-ai/claude-code")
     exit(1)
 
+# 공유 ClaudeSDKClient 웜 세션 풀 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.claude_client_pool import get_claude_client_pool
+
 class ConversationModule:
     """문서 기반 대화 처리를 담당하는 메인 클래스"""
     
@@ -63,7 +73,7 @@ class ConversationModule:
     async def _call_claude_api(self, enhanced_prompt: str) -> Dict[str, Any]:
         """Claude SDK를 통해 API 호출하고 응답을 받는 비동기 함수"""
         try:
-            async with ClaudeSDKClient() as client:
+            async with get_claude_client_pool().lease() as client:
                 await client.query(enhanced_prompt)
                 text_parts = []
                 
@@ -7,6 +7,7 @@
     - get_response_for_document 함수 (라인 36-108): 개별 문서에 대해 Claude로부터 답변을 받고 구조화된 형태로 반환하는 비동기 함수
     - save_individual_result 함수 (라인 110-122): 구조화된 각 답변을 개별 JSON 파일로 즉시 저장하는 함수
     - process_documents_realtime 함수 (라인 124-182): asyncio.as_completed를 사용한 실시간 처리 함수
+    - get_response_with_pooled_client 함수: shared.claude_client_pool에서 연결된 클라이언트를 임대해 답변 생성 (문서마다 CLI 프로세스 생성 없음)
     - main 함수 (라인 184-196): 새로운 실시간 처리 방식을 사용하는 메인 함수
     - test_document_qa_system_v4 함수 (라인 198-261): 구조화된 결과 저장 테스트 함수
     - 구조화된 결과 형태 (라인 82-108): user_question, reference_document, model_response, metadata로 분리된 결과 구조
@@ -18,7 +19,9 @@
 import asyncio
 import json
 import os
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 try:
@@ -28,6 +31,13 @@ except ImportError as e:
     print("다음 명령어로 설치하세요: npm install -g @anthropic-ai/claude-code")
     exit(1)
 
+# 공유 ClaudeSDKClient 웜 세션 풀 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.claude_client_pool import get_claude_client_pool, close_claude_client_pool
+
 class DocumentBasedQASystemV4:
     """구조화된 결과 저장 기능이 추가된 문서 기반 질의응답 시스템"""
     
@@ -130,80 +140,74 @@ class DocumentBasedQASystemV4:
             print(f"개별 결과 저장 실패 ({result['reference_document']['name']}): {e}")
             return ""
     
+    async def get_response_with_pooled_client(self, question: str, document_path: str, 
+                                              document_name: str) -> Dict[str, Any]:
+        """공용 풀에서 연결된 클라이언트를 임대해 문서 답변 생성 (요청마다 CLI 프로세스를 새로 띄우지 않음)"""
+        pool = get_claude_client_pool()
+        async with pool.lease() as client:
+            result = await self.get_response_for_document(client, question, document_path, document_name)
+            # 오류는 결과로 반환되므로 직접 표시 (응답 도중 실패한 클라이언트는 재사용하지 않고 교체)
+            if result['metadata']['status'] == 'error':
+                pool.discard(client)
+            return result
+    
     async def process_documents_realtime(self, question: str, 
                                        document_paths: List[str]) -> Dict[str, Any]:
         """asyncio.as_completed를 사용한 실시간 처리 함수"""
-        clients = []
         tasks = []
         completed_results = []
         
-        try:
-            print(f"📄 {len(document_paths)}개 문서 처리 시작...")
-            print("💫 각 답변이 완료되는 즉시 구조화된 형태로 개별 파일 저장됩니다.")
-            print(f"❓ 질문: {question}\n")
+        print(f"📄 {len(document_paths)}개 문서 처리 시작...")
+        print("💫 각 답변이 완료되는 즉시 구조화된 형태로 개별 파일 저장됩니다.")
+        print(f"❓ 질문: {question}\n")
+        
+        # 각 문서에 대해 태스크 준비 (클라이언트는 풀 크기만큼 동시 임대)
+        for document_path in document_paths:
+            # 문서 이름 추출 (파일명만)
+            document_name = os.path.basename(document_path)
             
-            # 각 문서에 대해 클라이언트 생성 및 태스크 준비
-            for document_path in document_paths:
-                client = ClaudeSDKClient()
-                clients.append(client)
-                
-                # 컨텍스트 매니저 진입
-                await client.__aenter__()
-                
-                # 문서 이름 추출 (파일명만)
-                document_name = os.path.basename(document_path)
-                
-                task = self.get_response_for_document(
-                    client, 
-                    question, 
-                    document_path,
-                    document_name
-                )
-                tasks.append(task)
+            task = self.get_response_with_pooled_client(
+                question, 
+                document_path,
+                document_name
+            )
+            tasks.append(task)
+        
+        # 완료되는 대로 실시간 처리
+        for completed_task in asyncio.as_completed(tasks):
+            result = await completed_task
             
-            # 완료되는 대로 실시간 처리
-            for completed_task in asyncio.as_completed(tasks):
-                result = await completed_task
-                
-                if isinstance(result, Exception):
-                    print(f"❌ 처리 중 오류: {result}")
-                    continue
-                
-                # 즉시 개별 파일 저장
-                saved_file = self.save_individual_result(result)
-                
-                # 즉시 출력
-                print(f"✅ 완료: {result['reference_document']['name']}")
-                print(f"   상태: {result['metadata']['status']}")
-                print(f"   시간: {result['metadata']['timestamp']}")
-                
-                if result['metadata']['status'] == 'success':
-                    print(f"   답변 길이: {len(result['model_response'])} 문자")
-                    print(f"   비용: ${result['metadata']['cost']:.4f}")
-                    if saved_file:
-                        print(f"   📁 저장: {os.path.basename(saved_file)}")
-                else:
-                    print(f"   ❌ 오류: {result['metadata'].get('error', '알 수 없는 오류')}")
-                
-                print("-" * 50)
-                completed_results.append(result)
-                self.results.append(result)
+            if isinstance(result, Exception):
+                print(f"❌ 처리 중 오류: {result}")
+                continue
             
-            return {
-                'question': question,
-                'results': completed_results,
-                'total_documents': len(document_paths),
-                'session_id': self.session_id,
-                'execution_time': datetime.now().isoformat()
-            }
+            # 즉시 개별 파일 저장
+            saved_file = self.save_individual_result(result)
             
-        finally:
-            # 모든 클라이언트 정리
-            for client in clients:
-                try:
-                    await client.__aexit__(None, None, None)
-                except:
-                    pass
+            # 즉시 출력
+            print(f"✅ 완료: {result['reference_document']['name']}")
+            print(f"   상태: {result['metadata']['status']}")
+            print(f"   시간: {result['metadata']['timestamp']}")
+            
+            if result['metadata']['status'] == 'success':
+                print(f"   답변 길이: {len(result['model_response'])} 문자")
+                print(f"   비용: ${result['metadata']['cost']:.4f}")
+                if saved_file:
+                    print(f"   📁 저장: {os.path.basename(saved_file)}")
+            else:
+                print(f"   ❌ 오류: {result['metadata'].get('error', '알 수 없는 오류')}")
+            
+            print("-" * 50)
+            completed_results.append(result)
+            self.results.append(result)
+        
+        return {
+            'question': question,
+            'results': completed_results,
+            'total_documents': len(document_paths),
+            'session_id': self.session_id,
+            'execution_time': datetime.now().isoformat()
+        }
     
     async def main(self, question: str, document_paths: List[str]):
         """실시간 처리 방식을 사용하는 메인 함수"""
@@ -260,6 +264,9 @@ async def test_document_qa_system_v4():
         import traceback
         traceback.print_exc()
 
+    finally:
+        await close_claude_client_pool()
+
     # 최종 요약 정보를 별도 파일로 저장
     try:
         summary_file = f"/home/nadle/projects/Concept_Sherpa_V2/25-08-23/qa_summary_{qa_system.session_id}.json"
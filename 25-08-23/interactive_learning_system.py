@@ -7,11 +7,15 @@
     - answer_first_question 함수 (라인 36-95): 1차 질문에 대한 답변을 생성하고 파일로 저장하는 함수
     - answer_followup_question 함수 (라인 97-156): 2차 질문에 대한 답변을 생성하는 함수
     - analyze_knowledge_gap 함수 (라인 158-191): 1차, 2차 QA를 바탕으로 갭 분석을 수행하는 함수
-    - process_gap_questions 함수 (라인 193-226): 갭 분석 결과로 생성된 질의문을 처리하는 함수
-    - run_complete_workflow 함수 (라인 228-258): 전체 워크플로우를 순차 실행하는 함수
+    - process_gap_questions 함수 (라인 193-226): 갭 분석 결과로 생성된 질의문을 최대 max_concurrent_questions개씩 동시에 처리하는 함수
+      (완료되는 순서대로 파일 저장 + on_answer 콜백 호출, 반환 목록은 질문 순서)
+    - answer_gap_question 함수: 보완 질의문 1개에 대한 답변 생성 및 저장
+    - run_complete_workflow 함수 (라인 228-258): 전체 워크플로우 실행 함수
+      (2차 답변과 갭 분석은 서로 의존하지 않으므로 동시 실행, 갭 분석이 끝나는 즉시 보완 답변 시작)
     - test_interactive_learning 함수 (라인 260-306): 시스템 전체 테스트 함수
-    - 워크플로우 자동화 (라인 228-258): 1차→2차→갭분석→보완답변 자동 연계
+    - 워크플로우 자동화 (라인 228-258): 1차→(2차 ∥ 갭분석→보완답변) 자동 연계
     - 파일 기반 결과 저장 (전체): 모든 단계의 결과를 구조화된 파일로 저장
+    - Claude 호출 (전체): shared.claude_client_pool 공용 풀에서 연결된 ClaudeSDKClient 임대 (질문마다 CLI 프로세스 생성/종료 없음)
 - 상태: active
 - 참조: document_based_qa_system_v4.py, knowledge_gap_analyzer_v2.py, question_answering_processor.py 통합
 """
@@ -19,23 +23,37 @@
 import asyncio
 import json
 import os
+import sys
 import re
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 try:
-    from claude_code_sdk import ClaudeSDKClient, CLINotFoundError, ProcessError
+    from claude_code_sdk import CLINotFoundError, ProcessError
 except ImportError as e:
     print(f"claude_code_sdk 모듈을 찾을 수 없습니다: {e}")
     print("다음 명령어로 설치하세요: npm install -g @anthropic-ai/claude-code")
     exit(1)
 
+# 공유 ClaudeSDKClient 웜 세션 풀 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.claude_client_pool import get_claude_client_pool, close_claude_client_pool
+
 class InteractiveLearningSystem:
     """전체 대화형 학습 프로세스를 관리하는 메인 클래스"""
     
-    def __init__(self):
+    def __init__(self, max_concurrent_questions: int = 4):
+        """
+        Args:
+            max_concurrent_questions: 보완 질의문 동시 처리 수 (공용 클라이언트 풀도 이만큼 이상으로 늘림)
+        """
         self.session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
         self.reference_document = "/home/nadle/projects/Concept_Sherpa_V2/25-08-23/ref.md"
+        self.max_concurrent_questions = max(1, max_concurrent_questions)
         
     async def answer_first_question(self, question: str) -> Dict[str, Any]:
         """1차 질문에 대한 답변을 생성하고 파일로 저장하는 함수"""
@@ -60,7 +78,7 @@ class InteractiveLearningSystem:
 가능하다면 예시나 활용 방법도 포함해줘."""
         
         try:
-            async with ClaudeSDKClient() as client:
+            async with get_claude_client_pool().lease() as client:
                 await client.query(prompt)
                 text_parts = []
                 total_cost = 0.0
@@ -133,7 +151,7 @@ class InteractiveLearningSystem:
 가능하다면 예시나 활용 방법도 포함해줘."""
         
         try:
-            async with ClaudeSDKClient() as client:
+            async with get_claude_client_pool().lease() as client:
                 await client.query(prompt)
                 text_parts = []
                 total_cost = 0.0
@@ -224,7 +242,7 @@ class InteractiveLearningSystem:
 ```"""
         
         try:
-            async with ClaudeSDKClient() as client:
+            async with get_claude_client_pool().lease() as client:
                 await client.query(prompt)
                 text_parts = []
                 total_cost = 0.0
@@ -271,8 +289,15 @@ class InteractiveLearningSystem:
                 }
             }
     
-    async def process_gap_questions(self, gap_analysis_response: str) -> Dict[str, Any]:
-        """갭 분석 결과로 생성된 질의문을 처리하는 함수"""
+    async def process_gap_questions(self, gap_analysis_response: str,
+                                    on_answer: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        갭 분석 결과로 생성된 질의문을 처리하는 함수
+
+        Args:
+            gap_analysis_response: 갭 분석 응답 (followup_questions를 포함한 JSON)
+            on_answer: 답변 1개가 완료될 때마다 호출되는 콜백 (완료 순서)
+        """
         
         # JSON에서 질의문 추출
         try:
@@ -288,10 +313,35 @@ class InteractiveLearningSystem:
         with open(self.reference_document, 'r', encoding='utf-8') as f:
             doc_content = f.read()
         
-        # 각 질의문에 대해 답변 생성
+        # 각 질의문을 동시에 처리 (동시 처리 수 제한, 완료되는 순서대로 저장/전달)
+        semaphore = asyncio.Semaphore(self.max_concurrent_questions)
+        
+        async def answer_limited(i: int, question_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.answer_gap_question(i, question_data, doc_content)
+        
+        tasks = [asyncio.ensure_future(answer_limited(i, question_data)) for i, question_data in enumerate(questions)]
         answers = []
-        for i, question_data in enumerate(questions):
-            prompt = f"""태수야, 다음 질문에 대해 참고 문서를 바탕으로 구체적이고 실용적인 답변을 해줘:
+        try:
+            for completed in asyncio.as_completed(tasks):
+                answer_result = await completed
+                answers.append(answer_result)
+                if on_answer:
+                    on_answer(answer_result)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        answers.sort(key=lambda answer: answer['question_index'])
+        return {
+            'status': 'success',
+            'answers': answers,
+            'total_questions': len(questions)
+        }
+    
+    async def answer_gap_question(self, i: int, question_data: Dict[str, Any], doc_content: str) -> Dict[str, Any]:
+        """보완 질의문 1개에 대한 답변을 생성하고 개별 파일로 저장하는 함수 (오류도 결과로 반환)"""
+        prompt = f"""태수야, 다음 질문에 대해 참고 문서를 바탕으로 구체적이고 실용적인 답변을 해줘:
 
 **질문:** {question_data.get('question', '')}
 **카테고리:** {question_data.get('category', '')}
@@ -301,62 +351,57 @@ class InteractiveLearningSystem:
 {doc_content}
 
 참고 문서에서 관련 정보를 찾아서 구체적이고 실용적인 답변을 제공해줘."""
-            
-            try:
-                async with ClaudeSDKClient() as client:
-                    await client.query(prompt)
-                    text_parts = []
-                    total_cost = 0.0
-                    
-                    async for msg in client.receive_response():
-                        if hasattr(msg, 'content'):
-                            for block in msg.content:
-                                if hasattr(block, 'text'):
-                                    text_parts.append(block.text)
-                        
-                        if type(msg).__name__ == "ResultMessage":
-                            total_cost = getattr(msg, 'total_cost_usd', 0.0)
-                    
-                    answer_result = {
-                        'question_index': i,
-                        'original_question': question_data,
-                        'answer': ''.join(text_parts),
-                        'metadata': {
-                            'cost': total_cost,
-                            'timestamp': datetime.now().isoformat(),
-                            'status': 'success'
-                        }
-                    }
-                    
-                    # 개별 답변 파일로 저장
-                    answer_file = f"/home/nadle/projects/Concept_Sherpa_V2/25-08-23/gap_answer_{self.session_id}_q{i:02d}.json"
-                    with open(answer_file, 'w', encoding='utf-8') as f:
-                        json.dump(answer_result, f, ensure_ascii=False, indent=2)
-                    
-                    answer_result['saved_file'] = answer_file
-                    answers.append(answer_result)
-                    
-            except Exception as e:
-                answers.append({
-                    'question_index': i,
-                    'original_question': question_data,
-                    'answer': '',
-                    'metadata': {
-                        'cost': 0.0,
-                        'timestamp': datetime.now().isoformat(),
-                        'status': 'error',
-                        'error': str(e)
-                    }
-                })
         
-        return {
-            'status': 'success',
-            'answers': answers,
-            'total_questions': len(questions)
-        }
+        try:
+            pool = get_claude_client_pool(min_size=self.max_concurrent_questions)
+            async with pool.lease() as client:
+                await client.query(prompt)
+                text_parts = []
+                total_cost = 0.0
+                
+                async for msg in client.receive_response():
+                    if hasattr(msg, 'content'):
+                        for block in msg.content:
+                            if hasattr(block, 'text'):
+                                text_parts.append(block.text)
+                    
+                    if type(msg).__name__ == "ResultMessage":
+                        total_cost = getattr(msg, 'total_cost_usd', 0.0)
+            
+            answer_result = {
+                'question_index': i,
+                'original_question': question_data,
+                'answer': ''.join(text_parts),
+                'metadata': {
+                    'cost': total_cost,
+                    'timestamp': datetime.now().isoformat(),
+                    'status': 'success'
+                }
+            }
+            
+            # 개별 답변 파일로 저장
+            answer_file = f"/home/nadle/projects/Concept_Sherpa_V2/25-08-23/gap_answer_{self.session_id}_q{i:02d}.json"
+            with open(answer_file, 'w', encoding='utf-8') as f:
+                json.dump(answer_result, f, ensure_ascii=False, indent=2)
+            
+            answer_result['saved_file'] = answer_file
+            return answer_result
+            
+        except Exception as e:
+            return {
+                'question_index': i,
+                'original_question': question_data,
+                'answer': '',
+                'metadata': {
+                    'cost': 0.0,
+                    'timestamp': datetime.now().isoformat(),
+                    'status': 'error',
+                    'error': str(e)
+                }
+            }
     
     async def run_complete_workflow(self, first_question: str, second_question: str) -> Dict[str, Any]:
-        """전체 워크플로우를 순차 실행하는 함수"""
+        """전체 워크플로우를 실행하는 함수 (의존 관계가 없는 단계는 동시 실행)"""
         
         print(f"🚀 대화형 학습 시스템 시작 (세션 ID: {self.session_id})")
         print("="*70)
@@ -368,23 +413,32 @@ class InteractiveLearningSystem:
             return {'status': 'error', 'step': '1차 질문', 'error': first_result}
         print(f"   ✅ 완료 - 저장: {os.path.basename(first_result['saved_file'])}")
         
-        # 2단계: 2차 질문 답변
-        print("2️⃣ 2차 질문 처리 중...")
-        second_result = await self.answer_followup_question(second_question, first_result)
+        # 2단계(2차 질문 답변)와 3~4단계(갭 분석 → 보완 답변)는 모두 1차 결과와 2차 질문만 필요 → 동시 실행
+        print("2️⃣ 2차 질문 처리 + 3️⃣ 지식 갭 분석 동시 진행 중...")
+        
+        async def second_stage() -> Dict[str, Any]:
+            result = await self.answer_followup_question(second_question, first_result)
+            if result['metadata']['status'] == 'success':
+                print(f"   ✅ 2차 질문 완료 - 저장: {os.path.basename(result['saved_file'])}")
+            return result
+        
+        def report_answer(answer: Dict[str, Any]):
+            mark = "✅" if answer['metadata']['status'] == 'success' else "❌"
+            print(f"   {mark} 보완 답변 q{answer['question_index']:02d} 완료")
+        
+        async def gap_stages():
+            gap_result = await self.analyze_knowledge_gap(first_result, second_question)
+            if gap_result['metadata']['status'] != 'success':
+                return gap_result, None
+            print(f"   ✅ 갭 분석 완료 - 저장: {os.path.basename(gap_result['saved_file'])}")
+            print(f"4️⃣ 보완 답변 생성 중... (최대 {self.max_concurrent_questions}개 동시)")
+            return gap_result, await self.process_gap_questions(gap_result['gap_analysis_response'], on_answer=report_answer)
+        
+        second_result, (gap_result, gap_answers) = await asyncio.gather(second_stage(), gap_stages())
         if second_result['metadata']['status'] != 'success':
             return {'status': 'error', 'step': '2차 질문', 'error': second_result}
-        print(f"   ✅ 완료 - 저장: {os.path.basename(second_result['saved_file'])}")
-        
-        # 3단계: 갭 분석
-        print("3️⃣ 지식 갭 분석 중...")
-        gap_result = await self.analyze_knowledge_gap(first_result, second_question)
         if gap_result['metadata']['status'] != 'success':
             return {'status': 'error', 'step': '갭 분석', 'error': gap_result}
-        print(f"   ✅ 완료 - 저장: {os.path.basename(gap_result['saved_file'])}")
-        
-        # 4단계: 갭 기반 보완 답변 생성
-        print("4️⃣ 보완 답변 생성 중...")
-        gap_answers = await self.process_gap_questions(gap_result['gap_analysis_response'])
         if gap_answers['status'] != 'success':
             return {'status': 'error', 'step': '보완 답변', 'error': gap_answers}
         print(f"   ✅ 완료 - {gap_answers['total_questions']}개 답변 생성")
@@ -436,6 +490,8 @@ async def test_interactive_learning():
         print(f"❌ 시스템 오류: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await close_claude_client_pool()
 
 if __name__ == "__main__":
     asyncio.run(test_interactive_learning())
\ No newline at end of file
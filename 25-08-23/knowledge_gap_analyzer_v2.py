@@ -11,6 +11,7 @@
     - test_knowledge_gap_analyzer_v2 함수 (라인 183-249): 시스템 테스트 함수 (파일 저장 기능 포함)
     - 갭 분석 로직 (라인 56-87): 이전 응답과 현재 질문의 차이점을 Claude로 분석
     - 질의문 저장 로직 (라인 172-181): 생성된 질의문을 구조화된 JSON 파일로 저장
+    - Claude 호출 (전체): shared.claude_client_pool 공용 풀에서 연결된 ClaudeSDKClient 임대 (질문마다 CLI 프로세스 생성/종료 없음)
 - 상태: active
 - 참조: knowledge_gap_analyzer.py를 기반으로 파일 저장 기능 추가
 """
@@ -18,16 +19,25 @@
 import asyncio
 import json
 import os
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 try:
-    from claude_code_sdk import ClaudeSDKClient, CLINotFoundError, ProcessError
+    from claude_code_sdk import CLINotFoundError, ProcessError
 except ImportError as e:
     print(f"claude_code_sdk 모듈을 찾을 수 없습니다: {e}")
     print("다음 명령어로 설치하세요: npm install -g @anthropic-ai/claude-code")
     exit(1)
 
+# 공유 ClaudeSDKClient 웜 세션 풀 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.claude_client_pool import get_claude_client_pool, close_claude_client_pool
+
 class KnowledgeGapAnalyzerV2:
     """사용자 이해도 분석 및 질의문 생성을 담당하는 메인 클래스 (파일 저장 기능 추가)"""
     
@@ -79,7 +89,7 @@ JSON 형식:
 }}"""
         
         try:
-            async with ClaudeSDKClient() as client:
+            async with get_claude_client_pool().lease() as client:
                 await client.query(prompt)
                 text_parts = []
                 total_cost = 0.0
@@ -151,7 +161,7 @@ JSON 형식으로 답변해줘:
 }}"""
         
         try:
-            async with ClaudeSDKClient() as client:
+            async with get_claude_client_pool().lease() as client:
                 await client.query(prompt)
                 text_parts = []
                 total_cost = 0.0
@@ -300,6 +310,8 @@ async def test_knowledge_gap_analyzer_v2():
         print(f"❌ 예상치 못한 오류: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await close_claude_client_pool()
 
 if __name__ == "__main__":
     asyncio.run(test_knowledge_gap_analyzer_v2())
\ No newline at end of file
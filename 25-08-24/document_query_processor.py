@@ -9,6 +9,7 @@
     - collective_answer 함수 (라인 90-112): 모든 참고문서를 결합하여 단일 답변 생성
     - individual_answers 함수 (라인 114-138): 각 참고문서에 대해 병렬로 개별 답변 생성
     - main 함수 (라인 140-168): 테스트 실행을 위한 메인 함수
+    - Claude 호출 (전체): shared.claude_client_pool 공용 풀에서 연결된 ClaudeSDKClient 임대 (질문마다 CLI 프로세스 생성/종료 없음)
 - 상태: active
 - 주소: document_query_processor
 - 참조: conversation_module.py의 Claude SDK 패턴과 multi_agent_claude_tester_haiku3_final.py의 병렬 처리 패턴 결합
@@ -17,17 +18,26 @@
 import asyncio
 import json
 import os
+import sys
 import time
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Any, List
 
 try:
-    from claude_code_sdk import ClaudeSDKClient, CLINotFoundError, ProcessError
+    from claude_code_sdk import CLINotFoundError, ProcessError
 except ImportError as e:
     print(f"claude_code_sdk 모듈을 찾을 수 없습니다: {e}")
     print("다음 명령어로 설치하세요: npm install -g @anthropic-ai/claude-code")
     exit(1)
 
+# 공유 ClaudeSDKClient 웜 세션 풀 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.claude_client_pool import get_claude_client_pool, close_claude_client_pool
+
 class DocumentQueryProcessor:
     """참고 문서들에 대한 질의 처리를 담당하는 메인 클래스"""
     
@@ -49,7 +59,7 @@ class DocumentQueryProcessor:
 
 질의: {query}"""
 
-            async with ClaudeSDKClient() as client:
+            async with get_claude_client_pool().lease() as client:
                 await client.query(enhanced_prompt)
                 text_parts = []
                 
@@ -259,6 +269,8 @@ async def main():
         
     except Exception as e:
         print(f"테스트 실행 중 오류: {e}")
+    finally:
+        await close_claude_client_pool()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -4,14 +4,22 @@ PDF 콘텐츠 추출기 - Leaf node용
 생성된 폴더 구조에서 leaf node들을 찾아 PDF에서 해당 콘텐츠를 추출하여 파일 생성
 """
 
-import pdfplumber
 import re
 import os
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
+# 공유 페이지 텍스트 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.pdf_page_engine import ParallelPageExtractor
+
 @dataclass
 class LeafNodeInfo:
     """Leaf node 정보"""
@@ -20,11 +28,13 @@ class LeafNodeInfo:
     parent_path: str
     page_range: Optional[Tuple[int, int]] = None
     content: str = ""
+    content_length: int = 0  # 파일 저장 후 content를 비워도 보고서에서 사용
     extraction_status: str = "pending"
 
 class PDFContentExtractor:
-    def __init__(self, pdf_path: str, base_dir: str = "/home/nadle/projects/Knowledge_Sherpa/v2/Data_Extraction/Data_Oriented_Programming", toc_file: str = "/home/nadle/projects/Knowledge_Sherpa/v2/TOC_Normalization/normalized_toc_with_node_types_v2.md"):
+    def __init__(self, pdf_path: str, base_dir: str = "/home/nadle/projects/Knowledge_Sherpa/v2/Data_Extraction/Data_Oriented_Programming", toc_file: str = "/home/nadle/projects/Knowledge_Sherpa/v2/TOC_Normalization/normalized_toc_with_node_types_v2.md", pdf_workers: Optional[int] = None):
         self.pdf_path = pdf_path
+        self.pdf_workers = pdf_workers
         self.base_dir = Path(base_dir)
         self.toc_file = Path(toc_file)
         self.leaf_nodes = []
@@ -181,69 +191,115 @@ class PDFContentExtractor:
         
         return (app_start, app_start + 3)
     
-    def extract_all_content(self) -> None:
-        """모든 leaf node의 콘텐츠 추출"""
+    def extract_all_content(self, write_workers: int = 1) -> None:
+        """
+        모든 leaf node의 콘텐츠 추출
+        - leaf 페이지 범위 합집합을 페이지 순서대로 1회만 추출 (캐시 미스 페이지는 워커 프로세스에서 병렬 추출)
+        - 각 페이지 블록을 해당 범위의 진행 중인 leaf들에 나눠 담고, 범위가 끝난 leaf는 즉시 파일로 저장 후 메모리 해제
+        
+        Args:
+            write_workers: leaf 파일 저장 스레드 수 (1이면 추출 루프에서 바로 저장)
+        """
         if not self.leaf_nodes:
             print("❌ Leaf node가 없습니다. 먼저 discover_leaf_nodes()를 실행하세요.")
             return
             
         print(f"PDF 콘텐츠 추출 시작: {len(self.leaf_nodes)}개 leaf node")
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            total_pages = len(pdf.pages)
+        extractor = ParallelPageExtractor(self.pdf_path, workers=self.pdf_workers)
+        writer = ThreadPoolExecutor(max_workers=write_workers) if write_workers > 1 else None
+        write_futures: List[Future] = []
+        results: List[bool] = []
+        
+        def finish(index: int, leaf_node: LeafNodeInfo, parts: List[str]):
+            if writer is None:
+                results.append(self._finish_leaf(index, leaf_node, parts))
+            else:
+                write_futures.append(writer.submit(self._finish_leaf, index, leaf_node, parts))
+        
+        try:
+            total_pages = extractor.page_count
             print(f"PDF 총 페이지: {total_pages}")
             
-            success_count = 0
-            failed_count = 0
-            
-            for i, leaf_node in enumerate(self.leaf_nodes, 1):
-                print(f"[{i}/{len(self.leaf_nodes)}] {leaf_node.title}", end=" ")
-                
+            # leaf별 0 기반 페이지 구간 (시작 페이지 순)
+            pending = []
+            for index, leaf_node in enumerate(self.leaf_nodes, 1):
                 if not leaf_node.page_range:
-                    print("❌ 페이지 범위 없음")
+                    print(f"[{index}/{len(self.leaf_nodes)}] {leaf_node.title} ❌ 페이지 범위 없음")
                     leaf_node.extraction_status = "failed"
-                    failed_count += 1
+                    results.append(False)
+                    continue
+                start_page, end_page = leaf_node.page_range
+                start_index, end_index = max(1, start_page) - 1, min(total_pages, end_page) - 1
+                if end_index < start_index:
+                    finish(index, leaf_node, [])
                     continue
+                pending.append((start_index, end_index, index, leaf_node))
+            pending.sort(key=lambda item: item[0])
+            
+            needed_pages = set()
+            for start_index, end_index, _, _ in pending:
+                needed_pages.update(range(start_index, end_index + 1))
+            
+            # 진행 중인 leaf: [끝 페이지, 번호, leaf, 페이지 블록 목록]
+            active = []
+            next_pending = 0
+            for page_num, page_text in extractor.iter_pages(needed_pages):
+                while next_pending < len(pending) and pending[next_pending][0] <= page_num:
+                    _, end_index, index, leaf_node = pending[next_pending]
+                    active.append((end_index, index, leaf_node, []))
+                    next_pending += 1
                 
-                try:
-                    content = self._extract_content(pdf, leaf_node.page_range, total_pages)
-                    if content.strip():
-                        leaf_node.content = content
-                        leaf_node.extraction_status = "success"
-                        self._save_content_file(leaf_node)
-                        success_count += 1
-                        print(f"✅ ({leaf_node.page_range[0]}-{leaf_node.page_range[1]})")
+                if page_text.strip():
+                    block = f"=== PAGE {page_num + 1} ===\n{page_text}\n\n"
+                    for _, _, _, parts in active:
+                        parts.append(block)
+                
+                still_active = []
+                for entry in active:
+                    if entry[0] <= page_num:
+                        finish(entry[1], entry[2], entry[3])
                     else:
-                        leaf_node.extraction_status = "empty"
-                        failed_count += 1
-                        print("❌ 빈 콘텐츠")
-                        
-                except Exception as e:
-                    leaf_node.extraction_status = "error"
-                    failed_count += 1
-                    print(f"❌ 오류: {str(e)[:50]}")
+                        still_active.append(entry)
+                active = still_active
             
-            print(f"\n📊 추출 결과: ✅ {success_count}개 성공, ❌ {failed_count}개 실패")
-            self._create_extraction_report(success_count, failed_count)
-    
-    def _extract_content(self, pdf, page_range: Tuple[int, int], total_pages: int) -> str:
-        """지정된 페이지 범위에서 텍스트 추출"""
-        start_page, end_page = page_range
-        start_page = max(1, start_page) - 1  # 0-based 인덱스로 변환
-        end_page = min(total_pages, end_page) - 1
+            for _, index, leaf_node, parts in active:
+                finish(index, leaf_node, parts)
+        finally:
+            extractor.close()
+            if writer is not None:
+                writer.shutdown(wait=True)
+                results.extend(future.result() for future in write_futures)
         
-        content = ""
-        for page_num in range(start_page, end_page + 1):
-            if page_num >= total_pages:
-                break
-                
-            page = pdf.pages[page_num]
-            page_text = page.extract_text() or ""
-            
-            if page_text.strip():
-                content += f"=== PAGE {page_num + 1} ===\n{page_text}\n\n"
+        print(f"📄 페이지 준비: 캐시 {extractor.stats['cached_pages']}페이지, 추출 {extractor.stats['extracted_pages']}페이지")
         
-        return content.strip()
+        success_count = sum(results)
+        failed_count = len(results) - success_count
+        print(f"\n📊 추출 결과: ✅ {success_count}개 성공, ❌ {failed_count}개 실패")
+        self._create_extraction_report(success_count, failed_count)
+    
+    def _finish_leaf(self, index: int, leaf_node: LeafNodeInfo, parts: List[str]) -> bool:
+        """모인 페이지 블록으로 leaf 콘텐츠를 만들고 저장 (저장 후 본문은 메모리에서 해제)"""
+        prefix = f"[{index}/{len(self.leaf_nodes)}] {leaf_node.title}"
+        try:
+            content = "".join(parts).strip()
+            if not content:
+                leaf_node.extraction_status = "empty"
+                print(f"{prefix} ❌ 빈 콘텐츠")
+                return False
+            
+            leaf_node.content = content
+            leaf_node.content_length = len(content)
+            leaf_node.extraction_status = "success"
+            self._save_content_file(leaf_node)
+            print(f"{prefix} ✅ ({leaf_node.page_range[0]}-{leaf_node.page_range[1]})")
+            return True
+        except Exception as e:
+            leaf_node.extraction_status = "error"
+            print(f"{prefix} ❌ 오류: {str(e)[:50]}")
+            return False
+        finally:
+            leaf_node.content = ""
     
     def _save_content_file(self, leaf_node: LeafNodeInfo) -> None:
         """Leaf node 콘텐츠를 파일로 저장"""
@@ -294,7 +350,7 @@ class PDFContentExtractor:
                 "parent_path": node.parent_path,
                 "page_range": f"{node.page_range[0]}-{node.page_range[1]}" if node.page_range else "Unknown",
                 "status": node.extraction_status,
-                "content_length": len(node.content)
+                "content_length": node.content_length
             })
         
         # JSON 보고서 저장
@@ -319,7 +375,7 @@ class PDFContentExtractor:
                 f.write(f"  - 경로: `{node.parent_path}`\n")
                 f.write(f"  - 페이지: {node.page_range[0]}-{node.page_range[1]}\n" if node.page_range else "  - 페이지: Unknown\n")
                 f.write(f"  - 상태: {node.extraction_status}\n")
-                f.write(f"  - 콘텐츠 길이: {len(node.content)} 문자\n\n")
+                f.write(f"  - 콘텐츠 길이: {node.content_length} 문자\n\n")
         
         print(f"📄 추출 보고서 생성: {text_report_file}")
 
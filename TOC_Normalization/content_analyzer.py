@@ -11,11 +11,19 @@ PDF 전체 분석을 통해 모든 서로 다른 레벨 간 내용 존재 여부
 import argparse
 import re
 import json
+import sys
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Set
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from multiprocessing import cpu_count
-import pdfplumber
+from multiprocessing import cpu_count, get_all_start_methods, get_context
+
+# 공유 페이지 텍스트 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.pdf_page_engine import ParallelPageExtractor
+from heading_index import HeadingIndex
 
 
 class TOCItem:
@@ -60,12 +68,34 @@ class TOCItem:
         return len(self.number_parts)
 
 
+# 갭 분석 워커가 fork로 상속받는 분석기와 쌍 목록 (페이지 텍스트/헤딩 인덱스를 피클링하지 않음)
+_fork_analyzer: Optional['ContentAnalyzer'] = None
+_fork_pairs: List[Tuple[TOCItem, TOCItem]] = []
+
+# 이 수보다 쌍이 적으면 프로세스 풀 생성 비용이 더 커서 순차 처리
+MIN_PAIRS_FOR_POOL = 64
+
+
+def _check_pair_batch(pair_indices: List[int]) -> List[Tuple[int, Dict]]:
+    """워커 프로세스: 상속받은 분석기로 쌍 묶음의 내용 존재 여부 확인"""
+    analyzer = _fork_analyzer
+    return [
+        (index, analyzer.check_content_between_sections_local((*_fork_pairs[index], analyzer.pdf_pages)))
+        for index in pair_indices
+    ]
+
+
 class ContentAnalyzer:
     """PDF 내용 분석기 - 병렬 처리 지원"""
     
-    def __init__(self):
+    def __init__(self, pdf_workers: Optional[int] = None, gap_workers: Optional[int] = None):
         self.toc_items: List[TOCItem] = []
         self.pdf_pages: List[str] = []
+        self.pdf_workers = pdf_workers
+        self.gap_workers = gap_workers
+        self.children_by_parent: Dict[Tuple, List[TOCItem]] = {}
+        self._heading_index: Optional[HeadingIndex] = None
+        self._indexed_pages: Optional[List[str]] = None
         
     def parse_comprehensive_toc(self, toc_file_path: str) -> None:
         """포괄적 TOC 파싱 - 모든 형태의 섹션 번호 지원"""
@@ -151,71 +181,33 @@ class ContentAnalyzer:
         print(f"PDF 내용 추출 중: {pdf_file_path}")
         
         try:
-            with pdfplumber.open(pdf_file_path) as pdf:
-                self.pdf_pages = []
-                
-                for page_num, page in enumerate(pdf.pages):
-                    page_text = page.extract_text()
-                    if page_text:
-                        self.pdf_pages.append(page_text)
-                    else:
-                        self.pdf_pages.append("")
-                
-                print(f"추출된 페이지 수: {len(self.pdf_pages)}")
+            # 캐시 미스 페이지만 페이지 구간별로 워커 프로세스에서 병렬 추출
+            extractor = ParallelPageExtractor(pdf_file_path, workers=self.pdf_workers)
+            try:
+                self.pdf_pages = extractor.extract_all()
+            finally:
+                extractor.close()
+            
+            print(
+                f"추출된 페이지 수: {len(self.pdf_pages)} "
+                f"(캐시 {extractor.stats['cached_pages']}페이지, 추출 {extractor.stats['extracted_pages']}페이지)"
+            )
                 
         except Exception as e:
             print(f"PDF 추출 오류: {e}")
             raise
     
+    def _get_heading_index(self, pdf_pages: List[str]) -> HeadingIndex:
+        """페이지 목록에 대한 헤딩 인덱스 (같은 페이지 목록이면 1회만 생성)"""
+        if self._heading_index is None or self._indexed_pages is not pdf_pages:
+            self._heading_index = HeadingIndex(pdf_pages)
+            self._indexed_pages = pdf_pages
+            print(f"헤딩 인덱스 생성: 섹션 번호 {len(self._heading_index.entries)}종")
+        return self._heading_index
+    
     def find_section_in_pdf_enhanced(self, section_number: str, title: str) -> Optional[Tuple[int, int]]:
-        """향상된 PDF 섹션 찾기"""
-        patterns = []
-        
-        # 제목과 함께 매칭 (우선순위 높음)
-        if title:
-            title_clean = re.escape(title.strip())
-            patterns.extend([
-                rf'{re.escape(section_number)}\s+{title_clean}',
-                rf'Chapter\s+{re.escape(section_number)}\s*[:\-\s]*{title_clean}',
-                rf'{re.escape(section_number)}\.?\s+{title_clean}',
-                rf'Part\s+{re.escape(section_number)}\s*[—\-]\s*{title_clean}',
-            ])
-        
-        # 번호만으로 매칭 (백업)
-        if '.' not in section_number and section_number.isdigit():
-            # 숫자만인 경우 (1, 2, 3...)
-            patterns.extend([
-                rf'^{re.escape(section_number)}\s+[A-Z]',
-                rf'Chapter\s+{re.escape(section_number)}[^\d]',
-                rf'Part\s+{re.escape(section_number)}[^\d]',
-            ])
-        elif '.' in section_number:
-            # 점이 포함된 경우 (1.1, 1.2.1, A.1 등)
-            patterns.extend([
-                rf'^{re.escape(section_number)}\s+[A-Z]',
-                rf'{re.escape(section_number)}\.?\s+[A-Z]',
-            ])
-        elif re.match(r'^[A-Z]\.\d+', section_number):
-            # Appendix 형태 (A.1, B.2 등)
-            patterns.extend([
-                rf'^{re.escape(section_number)}\s+[A-Z]',
-                rf'{re.escape(section_number)}\.?\s+[A-Z]',
-            ])
-        
-        # 각 페이지에서 검색
-        for page_num, page_text in enumerate(self.pdf_pages):
-            if not page_text:
-                continue
-                
-            lines = page_text.split('\n')
-            for line_idx, line in enumerate(lines):
-                line = line.strip()
-                
-                for pattern in patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        return (page_num, line_idx)
-        
-        return None
+        """향상된 PDF 섹션 찾기 (헤딩 인덱스 조회 + 제목 퍼지 검증, 없으면 번호 형태로 백업 매칭)"""
+        return self._get_heading_index(self.pdf_pages).find(section_number, title)
     
     def check_content_between_sections(self, args_tuple: Tuple) -> Dict:
         """단일 섹션 쌍의 내용 존재 여부 확인 (병렬 처리용)"""
@@ -252,70 +244,95 @@ class ContentAnalyzer:
         if child_page < parent_page or (child_page == parent_page and child_line <= parent_line):
             return result
         
-        # 중간 내용 확인
-        content_lines = []
-        
-        if parent_page == child_page:
-            # 같은 페이지
-            page_lines = pdf_pages[parent_page].split('\n')
-            content_lines = page_lines[parent_line + 1:child_line]
-        else:
-            # 여러 페이지
-            parent_page_lines = pdf_pages[parent_page].split('\n')
-            content_lines.extend(parent_page_lines[parent_line + 1:])
-            
-            for page_idx in range(parent_page + 1, child_page):
-                if page_idx < len(pdf_pages):
-                    content_lines.extend(pdf_pages[page_idx].split('\n'))
-            
-            if child_page < len(pdf_pages):
-                child_page_lines = pdf_pages[child_page].split('\n')
-                content_lines.extend(child_page_lines[:child_line])
-        
-        # 의미 있는 내용 라인 수 계산
-        meaningful_lines = 0
-        for line in content_lines:
-            line = line.strip()
-            # 빈 줄, 페이지 번호, 짧은 라인 제외
-            if line and not re.match(r'^\d+$', line) and len(line) > 15:
-                # 다른 섹션 헤딩이 아닌지 확인
-                if not re.match(r'^(\d+(\.\d+)*|[A-Z]\.\d+(\.\d+)*)\s+', line):
-                    meaningful_lines += 1
+        # 중간 내용 확인 - 의미 있는 내용 라인 수 계산
+        meaningful_lines = self._get_heading_index(pdf_pages).count_meaningful_lines(parent_pos, child_pos)
         
         result['content_lines'] = meaningful_lines
         result['has_content'] = meaningful_lines >= 2  # 2줄 이상의 의미 있는 내용
         
         return result
     
+    def build_toc_tree(self) -> Dict[Tuple, List[TOCItem]]:
+        """
+        섹션 번호로 TOC 트리 구성 (부모 번호 → 직접 자식 목록, TOC 순서 유지)
+        - 직접 자식 = 번호가 한 단계 길고 부모 번호가 접두사인 항목 (is_direct_parent_of와 동일 기준)
+        """
+        self.children_by_parent = {}
+        for item in self.toc_items:
+            if item.number_parts:
+                self.children_by_parent.setdefault(tuple(item.number_parts[:-1]), []).append(item)
+        return self.children_by_parent
+    
+    def get_direct_children(self, item: TOCItem) -> List[TOCItem]:
+        """항목의 직접 자식 목록"""
+        return self.children_by_parent.get(tuple(item.number_parts), [])
+    
     def analyze_all_content_gaps_parallel(self) -> List[Dict]:
         """모든 레벨 간 내용 존재 여부를 병렬로 분석"""
         print("모든 부모-자식 쌍 생성 중...")
         
-        # 모든 직접 부모-자식 쌍 찾기
-        parent_child_pairs = []
-        for parent in self.toc_items:
-            for child in self.toc_items:
-                if parent.is_direct_parent_of(child):
-                    parent_child_pairs.append((parent, child, self.pdf_pages))
+        # TOC 트리에서 모든 직접 부모-자식 쌍 찾기
+        self.build_toc_tree()
+        parent_child_pairs = [
+            (parent, child)
+            for parent in self.toc_items
+            for child in self.get_direct_children(parent)
+        ]
         
         print(f"분석할 부모-자식 쌍 수: {len(parent_child_pairs)}")
         
         if not parent_child_pairs:
             return []
         
-        # 병렬 처리로 내용 존재 여부 확인
-        results = []
-        max_workers = min(cpu_count(), len(parent_child_pairs))
+        # 헤딩 인덱스는 포크 전에 만들어 워커들이 그대로 상속
+        self._get_heading_index(self.pdf_pages)
+        
+        max_workers = min(self.gap_workers or cpu_count(), len(parent_child_pairs))
+        use_pool = (
+            max_workers > 1 and
+            len(parent_child_pairs) >= MIN_PAIRS_FOR_POOL and
+            'fork' in get_all_start_methods()
+        )
+        
+        if not use_pool:
+            print("순차 처리 시작")
+            results = []
+            for i, (parent, child) in enumerate(parent_child_pairs):
+                if i % 10 == 0:
+                    print(f"진행률: {i}/{len(parent_child_pairs)} ({i/len(parent_child_pairs)*100:.1f}%)")
+                results.append(self.check_content_between_sections_local((parent, child, self.pdf_pages)))
+            return results
         
         print(f"병렬 처리 시작 (워커 수: {max_workers})")
-        
-        # 순차 처리로 변경 (PDF 객체 공유 문제 해결)
-        for i, pair in enumerate(parent_child_pairs):
-            if i % 10 == 0:
-                print(f"진행률: {i}/{len(parent_child_pairs)} ({i/len(parent_child_pairs)*100:.1f}%)")
-            
-            result = self.check_content_between_sections_local(pair)
-            results.append(result)
+        return self._analyze_pairs_with_pool(parent_child_pairs, max_workers)
+    
+    def _analyze_pairs_with_pool(self, parent_child_pairs: List[Tuple[TOCItem, TOCItem]], max_workers: int) -> List[Dict]:
+        """
+        fork 프로세스 풀로 쌍 묶음을 나눠 확인
+        - 워커는 포크 시점의 분석기(페이지 텍스트 + 헤딩 인덱스)를 상속, 전달되는 것은 쌍 인덱스뿐
+        - 결과는 원래 쌍 순서대로 반환
+        """
+        global _fork_analyzer, _fork_pairs
+        
+        total = len(parent_child_pairs)
+        batch_size = max(1, total // (max_workers * 4))
+        batches = [list(range(start, min(start + batch_size, total))) for start in range(0, total, batch_size)]
+        results: List[Optional[Dict]] = [None] * total
+        
+        _fork_analyzer, _fork_pairs = self, parent_child_pairs
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context('fork')) as executor:
+                futures = [executor.submit(_check_pair_batch, batch) for batch in batches]
+                done = 0
+                completed_pairs = 0
+                for future in as_completed(futures):
+                    for index, result in future.result():
+                        results[index] = result
+                        completed_pairs += 1
+                    done += 1
+                    print(f"진행률: {completed_pairs}/{total} ({completed_pairs/total*100:.1f}%, 묶음 {done}/{len(batches)})")
+        finally:
+            _fork_analyzer, _fork_pairs = None, []
         
         return results
     
@@ -351,31 +368,8 @@ class ContentAnalyzer:
         if child_page < parent_page or (child_page == parent_page and child_line <= parent_line):
             return result
         
-        # 중간 내용 확인
-        content_lines = []
-        
-        if parent_page == child_page:
-            page_lines = pdf_pages[parent_page].split('\n')
-            content_lines = page_lines[parent_line + 1:child_line]
-        else:
-            parent_page_lines = pdf_pages[parent_page].split('\n')
-            content_lines.extend(parent_page_lines[parent_line + 1:])
-            
-            for page_idx in range(parent_page + 1, child_page):
-                if page_idx < len(pdf_pages):
-                    content_lines.extend(pdf_pages[page_idx].split('\n'))
-            
-            if child_page < len(pdf_pages):
-                child_page_lines = pdf_pages[child_page].split('\n')
-                content_lines.extend(child_page_lines[:child_line])
-        
-        # 의미 있는 내용 라인 수 계산
-        meaningful_lines = 0
-        for line in content_lines:
-            line = line.strip()
-            if line and not re.match(r'^\d+$', line) and len(line) > 15:
-                if not re.match(r'^(\d+(\.\d+)*|[A-Z]\.\d+(\.\d+)*)\s+', line):
-                    meaningful_lines += 1
+        # 중간 내용 확인 - 의미 있는 내용 라인 수 계산
+        meaningful_lines = self._get_heading_index(pdf_pages).count_meaningful_lines(parent_pos, child_pos)
         
         result['content_lines'] = meaningful_lines
         result['has_content'] = meaningful_lines >= 2
@@ -384,47 +378,7 @@ class ContentAnalyzer:
     
     def _find_section_local(self, section_number: str, title: str, pdf_pages: List[str]) -> Optional[Tuple[int, int]]:
         """로컬 섹션 찾기"""
-        patterns = []
-        
-        if title:
-            title_clean = re.escape(title.strip())
-            patterns.extend([
-                rf'{re.escape(section_number)}\s+{title_clean}',
-                rf'Chapter\s+{re.escape(section_number)}\s*[:\-\s]*{title_clean}',
-                rf'{re.escape(section_number)}\.?\s+{title_clean}',
-                rf'Part\s+{re.escape(section_number)}\s*[—\-]\s*{title_clean}',
-            ])
-        
-        if '.' not in section_number and section_number.isdigit():
-            patterns.extend([
-                rf'^{re.escape(section_number)}\s+[A-Z]',
-                rf'Chapter\s+{re.escape(section_number)}[^\d]',
-                rf'Part\s+{re.escape(section_number)}[^\d]',
-            ])
-        elif '.' in section_number:
-            patterns.extend([
-                rf'^{re.escape(section_number)}\s+[A-Z]',
-                rf'{re.escape(section_number)}\.?\s+[A-Z]',
-            ])
-        elif re.match(r'^[A-Z]\.\d+', section_number):
-            patterns.extend([
-                rf'^{re.escape(section_number)}\s+[A-Z]',
-                rf'{re.escape(section_number)}\.?\s+[A-Z]',
-            ])
-        
-        for page_num, page_text in enumerate(pdf_pages):
-            if not page_text:
-                continue
-                
-            lines = page_text.split('\n')
-            for line_idx, line in enumerate(lines):
-                line = line.strip()
-                
-                for pattern in patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        return (page_num, line_idx)
-        
-        return None
+        return self._get_heading_index(pdf_pages).find(section_number, title)
     
     def save_expected_introductions(self, results: List[Dict], output_file: str) -> None:
         """예상 Introduction 항목들을 JSON으로 저장"""
@@ -498,6 +452,8 @@ def main():
     parser.add_argument('--toc', required=True, help='TOC 마크다운 파일 경로')
     parser.add_argument('--pdf', required=True, help='PDF 원본 파일 경로')
     parser.add_argument('--output', required=True, help='예상 결과 JSON 출력 파일 경로')
+    parser.add_argument('--pdf-workers', type=int, default=None, help='PDF 페이지 추출 워커 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--gap-workers', type=int, default=None, help='부모-자식 내용 확인 워커 프로세스 수 (기본: CPU 수)')
     
     args = parser.parse_args()
     
@@ -516,7 +472,7 @@ def main():
     
     # 분석 실행
     try:
-        analyzer = ContentAnalyzer()
+        analyzer = ContentAnalyzer(pdf_workers=args.pdf_workers, gap_workers=args.gap_workers)
         analyzer.analyze_complete(args.toc, args.pdf, args.output)
         return 0
     except Exception as e:
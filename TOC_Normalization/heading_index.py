@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+PDF 헤딩 인덱스
+
+목적:
+1. PDF 페이지 텍스트의 모든 라인을 한 번만 토큰화하여 섹션 번호 후보(1, 1.2, A.1 등)를 추출
+2. 정규화된 섹션 번호 → 등장 위치 목록 딕셔너리로 보관하여 섹션 위치를 O(1)로 조회
+3. 후보 라인의 나머지 텍스트와 TOC 제목을 퍼지 비교하여 제목 검증
+
+특징:
+- content_analyzer.py / toc_normalizer.py 공용 (호출마다 정규식을 만들고 전체 페이지를 훑던 방식 대체)
+- 라인 분할 결과도 보관하여 두 섹션 사이의 의미 있는 라인 수 계산에 재사용
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# 섹션 번호 토큰 (앞뒤가 다른 숫자/문자에 붙어 있지 않은 1, 1.2.3, A.1 형태)
+SECTION_NUMBER_RE = re.compile(r'(?<![\w.])([A-Za-z]\.\d+(?:\.\d+)*|\d+(?:\.\d+)*)\.?(?=[\s:\-—]|$)')
+# 섹션 번호 앞 키워드 (Chapter 3, PART 1)
+KEYWORD_BEFORE_RE = re.compile(r'(chapter|part)\s*$', re.IGNORECASE)
+# 의미 있는 내용 라인 판정용
+PAGE_NUMBER_LINE_RE = re.compile(r'^\d+$')
+HEADING_LINE_RE = re.compile(r'^(\d+(\.\d+)*|[A-Z]\.\d+(\.\d+)*)\s+')
+_NON_ALNUM_RE = re.compile(r'[^0-9a-z]+')
+
+
+class HeadingCandidate(NamedTuple):
+    """섹션 번호가 등장한 라인 위치"""
+    page: int
+    line: int
+    keyword: Optional[str]   # 'chapter' / 'part' / None
+    at_line_start: bool      # 라인 첫 토큰인지 여부
+    rest: str                # 번호 뒤 나머지 텍스트
+
+
+def normalize_section_number(number: str) -> str:
+    """섹션 번호 정규화 (끝의 점 제거, 대문자)"""
+    return number.strip().rstrip('.').upper()
+
+
+def normalize_title(text: str) -> str:
+    """제목 비교용 정규화 (소문자, 영숫자 외 문자는 공백 1개로)"""
+    return _NON_ALNUM_RE.sub(' ', text.lower()).strip()
+
+
+def title_matches(rest: str, title: str, threshold: float = 0.85) -> bool:
+    """
+    후보 라인의 나머지 텍스트가 TOC 제목과 일치하는지 퍼지 비교
+    - 접두 일치, 공백이 사라진 연결 텍스트, 앞부분 유사도 순으로 확인
+    """
+    wanted = normalize_title(title)
+    if not wanted:
+        return False
+    found = normalize_title(rest)
+    if not found:
+        return False
+    if found.startswith(wanted):
+        return True
+    if found.replace(' ', '').startswith(wanted.replace(' ', '')):
+        return True
+    return SequenceMatcher(None, found[:len(wanted)], wanted).ratio() >= threshold
+
+
+class HeadingIndex:
+    """
+    섹션 번호 → 등장 위치 인덱스
+    - build 1회: O(전체 라인 수)
+    - find: 해당 번호의 후보 목록만 검사
+    """
+
+    def __init__(self, pdf_pages: List[str]):
+        self.page_lines: List[List[str]] = []
+        self.entries: Dict[str, List[HeadingCandidate]] = {}
+        self._build(pdf_pages)
+
+    def _build(self, pdf_pages: List[str]) -> None:
+        for page_num, page_text in enumerate(pdf_pages):
+            lines = page_text.split('\n') if page_text else []
+            self.page_lines.append(lines)
+
+            for line_idx, raw_line in enumerate(lines):
+                line = raw_line.strip()
+                if not line:
+                    continue
+                for match in SECTION_NUMBER_RE.finditer(line):
+                    keyword_match = KEYWORD_BEFORE_RE.search(line, 0, match.start())
+                    candidate = HeadingCandidate(
+                        page=page_num,
+                        line=line_idx,
+                        keyword=keyword_match.group(1).lower() if keyword_match else None,
+                        at_line_start=match.start() == 0,
+                        rest=line[match.end():].strip()
+                    )
+                    self.entries.setdefault(normalize_section_number(match.group(1)), []).append(candidate)
+
+    def candidates(self, section_number: str) -> List[HeadingCandidate]:
+        """섹션 번호의 모든 등장 위치 (페이지, 라인 순)"""
+        return self.entries.get(normalize_section_number(section_number), [])
+
+    def find(
+        self,
+        section_number: str,
+        title: Optional[str] = None,
+        min_page: int = 0,
+        keyword: Optional[str] = None,
+        fallback: bool = True,
+        title_check: Callable[[str, str], bool] = title_matches
+    ) -> Optional[Tuple[int, int]]:
+        """
+        섹션 위치 찾기
+
+        Args:
+            section_number: TOC 섹션 번호
+            title: TOC 제목 (있으면 제목이 일치하는 후보 우선)
+            min_page: 검색 시작 페이지 (0 기반, 목차 페이지 제외용)
+            keyword: 'chapter' / 'part' 지정 시 해당 키워드가 앞에 붙은 후보만 사용
+            fallback: 제목 일치 후보가 없을 때 번호 형태만으로 매칭할지 여부
+            title_check: (후보 나머지 텍스트, 제목) -> 일치 여부 (기본 title_matches)
+
+        Returns:
+            (페이지 번호, 라인 번호) 또는 None
+        """
+        candidates = [
+            candidate for candidate in self.candidates(section_number)
+            if candidate.page >= min_page and (keyword is None or candidate.keyword == keyword)
+        ]
+        if not candidates:
+            return None
+
+        if title:
+            for candidate in candidates:
+                if title_check(candidate.rest, title):
+                    return (candidate.page, candidate.line)
+
+        if not fallback:
+            return None
+
+        is_plain_number = section_number.strip().isdigit()
+        for candidate in candidates:
+            starts_with_letter = candidate.rest[:1].isalpha()
+            if is_plain_number:
+                # "3 Title" (라인 시작) 또는 "Chapter 3 ..." / "Part 3 ..."
+                if (candidate.at_line_start and starts_with_letter) or (candidate.keyword and candidate.rest):
+                    return (candidate.page, candidate.line)
+            elif starts_with_letter:
+                # "1.2 Title", "A.1 Title"
+                return (candidate.page, candidate.line)
+        return None
+
+    def lines_between(self, start: Tuple[int, int], end: Tuple[int, int]) -> List[str]:
+        """두 위치 사이의 라인들 (start 라인 다음 ~ end 라인 이전)"""
+        start_page, start_line = start
+        end_page, end_line = end
+        if start_page == end_page:
+            return self.page_lines[start_page][start_line + 1:end_line]
+
+        lines = list(self.page_lines[start_page][start_line + 1:])
+        for page_idx in range(start_page + 1, min(end_page, len(self.page_lines))):
+            lines.extend(self.page_lines[page_idx])
+        if end_page < len(self.page_lines):
+            lines.extend(self.page_lines[end_page][:end_line])
+        return lines
+
+    def count_meaningful_lines(self, start: Tuple[int, int], end: Tuple[int, int], stop_at: Optional[int] = None) -> int:
+        """
+        두 위치 사이의 의미 있는 내용 라인 수
+        - 빈 줄, 페이지 번호, 15자 이하 라인, 섹션 헤딩 라인 제외
+        - stop_at 지정 시 그 수에 도달하면 즉시 반환
+        """
+        meaningful_lines = 0
+        for line in self.lines_between(start, end):
+            line = line.strip()
+            if line and len(line) > 15 and not PAGE_NUMBER_LINE_RE.match(line) and not HEADING_LINE_RE.match(line):
+                meaningful_lines += 1
+                if stop_at is not None and meaningful_lines >= stop_at:
+                    break
+        return meaningful_lines
@@ -13,9 +13,30 @@ TOC 정교화 스크립트
 
 import argparse
 import re
+import sys
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Set
-import pdfplumber
+
+# 공유 페이지 텍스트 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.pdf_page_engine import ParallelPageExtractor
+from heading_index import HeadingIndex, normalize_title, title_matches
+
+PART_TITLE_KEYWORDS = ['flexibility', 'scalability', 'maintainability']
+TOC_PAGE_COUNT = 25  # 본문 검색 시 제외할 앞부분(TOC) 페이지 수
+
+
+def chapter_title_matches(rest: str, title: str) -> bool:
+    """CHAPTER 헤딩 제목 비교 - 제목 일치 외에 첫 단어나 공백/하이픈이 빠진 연결 텍스트도 허용"""
+    if title_matches(rest, title):
+        return True
+    found = normalize_title(rest)
+    first_word = normalize_title(title.split()[0]) if title.split() else ''
+    compact_title = normalize_title(title).replace(' ', '')
+    return bool(first_word and first_word in found) or bool(compact_title and compact_title in found.replace(' ', ''))
 
 
 class TOCItem:
@@ -90,10 +111,14 @@ class TOCItem:
 class TOCNormalizer:
     """TOC 정교화 클래스"""
     
-    def __init__(self):
+    def __init__(self, pdf_workers: Optional[int] = None):
         self.toc_items: List[TOCItem] = []
         self.pdf_text: str = ""
         self.pdf_pages: List[str] = []
+        self.pdf_workers = pdf_workers
+        self._heading_index: Optional[HeadingIndex] = None
+        self._indexed_pages: Optional[List[str]] = None
+        self._section_positions: Dict[Tuple[str, str], Optional[Tuple[int, int]]] = {}
         
     def parse_toc_markdown(self, toc_file_path: str) -> None:
         """향상된 마크다운 TOC 파일 파싱 - 모든 형태의 섹션 번호 지원"""  
@@ -180,12 +205,13 @@ class TOCNormalizer:
         print(f"PDF 파일에서 텍스트 추출 중: {pdf_file_path}")
         
         try:
-            with pdfplumber.open(pdf_file_path) as pdf:
+            # 캐시된 페이지는 레이아웃 분석 생략, 나머지는 워커 프로세스에서 병렬 추출 (페이지 순서대로 수신)
+            extractor = ParallelPageExtractor(pdf_file_path, workers=self.pdf_workers)
+            try:
                 self.pdf_pages = []
                 full_text = []
                 
-                for page_num, page in enumerate(pdf.pages):
-                    page_text = page.extract_text()
+                for page_num, page_text in extractor.iter_pages():
                     if page_text:
                         self.pdf_pages.append(page_text)
                         full_text.append(page_text)
@@ -195,77 +221,47 @@ class TOCNormalizer:
                 self.pdf_text = '\n'.join(full_text)
                 print(f"추출된 페이지 수: {len(self.pdf_pages)}")
                 print(f"총 텍스트 길이: {len(self.pdf_text):,} 문자")
+            finally:
+                extractor.close()
                 
         except Exception as e:
             print(f"PDF 추출 오류: {e}")
             raise
     
+    def _get_heading_index(self) -> HeadingIndex:
+        """현재 페이지 목록에 대한 헤딩 인덱스 (페이지 목록이 바뀔 때만 다시 생성)"""
+        if self._heading_index is None or self._indexed_pages is not self.pdf_pages:
+            self._heading_index = HeadingIndex(self.pdf_pages)
+            self._indexed_pages = self.pdf_pages
+            self._section_positions = {}
+            print(f"헤딩 인덱스 생성: 섹션 번호 {len(self._heading_index.entries)}종")
+        return self._heading_index
+    
     def find_section_in_pdf(self, section_number: str, title: str) -> Optional[Tuple[int, int]]:
-        """향상된 PDF 섹션 찾기 - 실제 책 내용에서 섹션 위치 탐지"""
-        patterns = []
-        
-        # Part 섹션 특별 처리 (실제 책 내용에서)
-        if section_number.isdigit() and title and any(keyword in title.lower() for keyword in ['flexibility', 'scalability', 'maintainability']):
-            patterns.extend([
-                rf'PART\s+{re.escape(section_number)}\s+{re.escape(title)}',
-                rf'PART\s+{re.escape(section_number)}\s+{re.escape(title.title())}',
-                rf'\d+\s+PART\s+{re.escape(section_number)}\s+{re.escape(title)}',
-                rf'\d+\s+PART\s+{re.escape(section_number)}\s+{re.escape(title.title())}',
-            ])
-        
-        # Chapter 섹션 특별 처리 (실제 책 내용에서) 
-        elif section_number.isdigit() and title and not any(keyword in title.lower() for keyword in ['flexibility', 'scalability', 'maintainability']):
-            # Chapter 패턴들 - 띄어쓰기나 연결된 텍스트 처리
-            title_escaped = re.escape(title.replace(' ', '').replace('-', ''))  # 공백과 하이픈 제거
-            title_partial = re.escape(title.split()[0] if title else '')  # 첫 단어만
-            patterns.extend([
-                rf'\d+\s+CHAPTER\s+{re.escape(section_number)}\s+{re.escape(title)}',
-                rf'CHAPTER\s+{re.escape(section_number)}\s+{re.escape(title)}', 
-                rf'\d+\s+CHAPTER\s+{re.escape(section_number)}\s+.*{title_partial}',  # 첫 단어 매칭
-                rf'\d+\s+CHAPTER\s+{re.escape(section_number)}\s+.*{title_escaped}',  # 연결된 텍스트 매칭
-            ])
-            # Chapter는 백업 패턴 사용하지 않음 - 특정 패턴만 사용
-            
-        # 일반 섹션 처리 (. 포함된 경우)
-        elif '.' in section_number:
-            # 점이 포함된 경우 (1.1, 1.2.1, A.1 등)
-            if title:
-                title_clean = re.escape(title.strip())
-                patterns.extend([
-                    rf'{re.escape(section_number)}\.?\s+{title_clean}',
-                    rf'^{re.escape(section_number)}\s+{title_clean}',
-                ])
-            patterns.extend([
-                rf'^{re.escape(section_number)}\s+[A-Z]',
-                rf'{re.escape(section_number)}\.?\s+[A-Z]',
-            ])
-        elif re.match(r'^[A-Z]\.\d+', section_number):
-            # Appendix 형태 (A.1, B.2 등)
-            if title:
-                title_clean = re.escape(title.strip())
-                patterns.extend([
-                    rf'^{re.escape(section_number)}\s+{title_clean}',
-                    rf'{re.escape(section_number)}\.?\s+{title_clean}',
-                ])
-            patterns.extend([
-                rf'^{re.escape(section_number)}\s+[A-Z]',
-                rf'{re.escape(section_number)}\.?\s+[A-Z]',
-            ])
-        
-        # 각 페이지에서 검색 - TOC 페이지들 제외 (페이지 25 이후부터 검색)
-        for page_num, page_text in enumerate(self.pdf_pages):
-            if not page_text or page_num < 25:  # TOC 페이지들 제외
-                continue
-                
-            lines = page_text.split('\n')
-            for line_idx, line in enumerate(lines):
-                line = line.strip()
-                
-                for pattern in patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        return (page_num, line_idx)
+        """향상된 PDF 섹션 찾기 - 실제 책 내용에서 섹션 위치 탐지 (TOC 페이지 이후, 헤딩 인덱스 조회)"""
+        index = self._get_heading_index()
+        cache_key = (section_number, title or '')
+        if cache_key in self._section_positions:
+            return self._section_positions[cache_key]
+        
+        if section_number.isdigit():
+            if not title:
+                position = None
+            elif any(keyword in title.lower() for keyword in PART_TITLE_KEYWORDS):
+                # Part 섹션: "PART 1 Flexibility" (앞에 페이지 번호가 붙을 수 있음)
+                position = index.find(section_number, title, min_page=TOC_PAGE_COUNT, keyword='part', fallback=False)
+            else:
+                # Chapter 섹션: "CHAPTER 1 Title" / 첫 단어 / 연결된 텍스트 - 백업 매칭 사용하지 않음
+                position = index.find(
+                    section_number, title, min_page=TOC_PAGE_COUNT, keyword='chapter',
+                    fallback=False, title_check=chapter_title_matches
+                )
+        else:
+            # 일반 섹션 (1.1, 1.2.1) 및 Appendix 형태 (A.1, B.2)
+            position = index.find(section_number, title, min_page=TOC_PAGE_COUNT)
         
-        return None
+        self._section_positions[cache_key] = position
+        return position
     
     def check_content_between_levels(self, parent_item: TOCItem, child_item: TOCItem) -> bool:
         """서로 다른 레벨의 두 섹션 사이에 실질적인 내용이 있는지 확인"""
@@ -311,41 +307,11 @@ class TOCNormalizer:
             print(f"  자식 섹션이 부모보다 앞에 위치함")
             return False
         
-        # 중간 내용 확인
-        content_lines = []
-        
-        if parent_page == child_page:
-            # 같은 페이지 내에서 확인
-            page_lines = self.pdf_pages[parent_page].split('\n')
-            content_lines = page_lines[parent_line + 1:child_line]
-        else:
-            # 여러 페이지에 걸쳐 확인
-            # 부모 섹션 이후 부분
-            parent_page_lines = self.pdf_pages[parent_page].split('\n')
-            content_lines.extend(parent_page_lines[parent_line + 1:])
-            
-            # 중간 페이지들 전체
-            for page_idx in range(parent_page + 1, child_page):
-                if page_idx < len(self.pdf_pages):
-                    content_lines.extend(self.pdf_pages[page_idx].split('\n'))
-            
-            # 자식 섹션 이전 부분
-            if child_page < len(self.pdf_pages):
-                child_page_lines = self.pdf_pages[child_page].split('\n')
-                content_lines.extend(child_page_lines[:child_line])
-        
-        # 실질적인 내용이 있는지 확인 (더 정확한 기준)
-        meaningful_lines = 0
-        for line in content_lines:
-            line = line.strip()
-            # 빈 줄, 페이지 번호, 짧은 라인 제외
-            if line and not re.match(r'^\d+$', line) and len(line) > 15:
-                # 다른 섹션 헤딩이 아닌지 확인 (Appendix 포함)
-                if not re.match(r'^(\d+(\.\d+)*|[A-Z]\.\d+(\.\d+)*)\s+', line):
-                    meaningful_lines += 1
-                    if meaningful_lines >= 2:  # 2줄 이상의 의미 있는 내용이 있으면 true
-                        print(f"  → 중간 내용 존재함 (의미있는 라인 {meaningful_lines}개)")
-                        return True
+        # 실질적인 내용이 있는지 확인 (2줄 이상의 의미 있는 내용이 있으면 true)
+        meaningful_lines = self._get_heading_index().count_meaningful_lines(parent_pos, child_pos, stop_at=2)
+        if meaningful_lines >= 2:
+            print(f"  → 중간 내용 존재함 (의미있는 라인 {meaningful_lines}개)")
+            return True
         
         print(f"  → 중간 내용 없음 (의미있는 라인 {meaningful_lines}개)")
         return False
@@ -355,12 +321,18 @@ class TOCNormalizer:
         print("Introduction 삽입 위치 분석 중...")
         insertions = []
         
+        # 부모 번호(접두사)별 자식 후보 - 항목마다 전체 목록을 훑지 않음
+        children_by_prefix: Dict[Tuple, List[TOCItem]] = {}
+        for other_item in self.toc_items:
+            children_by_prefix.setdefault(tuple(other_item.number_parts[:-1]), []).append(other_item)
+        top_level_items = children_by_prefix.get((), [])
+        
         for i, item in enumerate(self.toc_items):
-            # 이 항목의 직접 자식들 찾기
-            direct_children = []
-            for other_item in self.toc_items:
-                if item.is_direct_parent_of(other_item):
-                    direct_children.append(other_item)
+            # 이 항목의 직접 자식들 찾기 (Part → Chapter는 최상위 항목 중에서)
+            candidates = children_by_prefix.get(tuple(item.number_parts), [])
+            if len(item.number_parts) == 1 and item.title and any(keyword in item.title.lower() for keyword in PART_TITLE_KEYWORDS):
+                candidates = candidates + top_level_items
+            direct_children = [other_item for other_item in candidates if item.is_direct_parent_of(other_item)]
             
             if direct_children:
                 # 번호 순으로 정렬
@@ -462,6 +434,7 @@ def main():
     parser.add_argument('--toc', required=True, help='TOC 마크다운 파일 경로')
     parser.add_argument('--pdf', required=True, help='PDF 원본 파일 경로')
     parser.add_argument('--output', required=True, help='출력 파일 경로')
+    parser.add_argument('--pdf-workers', type=int, default=None, help='PDF 페이지 추출 워커 프로세스 수 (기본: CPU 수)')
     
     args = parser.parse_args()
     
@@ -480,7 +453,7 @@ def main():
     
     # 정교화 실행
     try:
-        normalizer = TOCNormalizer()
+        normalizer = TOCNormalizer(pdf_workers=args.pdf_workers)
         normalizer.normalize_toc(args.toc, args.pdf, args.output)
         return 0
     except Exception as e:
@@ -4,6 +4,7 @@
 핵심 내용: 유튜브 ID별 폴더 구조에 맞게 수정된 노드 정보 문서 생성 스크립트
 상세 내용: 
     - main() (라인 22-76): 메인 실행 함수, 폴더 구조 적응형 처리
+    - run_stage(context): 단계 인터페이스 - 서버에서 프로세스 내 실행 (StageContext 공유)
     - load_nodes() (라인 79-95): nodes.json 파일 직접 로드 (패턴 매칭 제거)
     - sanitize_title() (라인 98-110): 파일명용 제목 정리 함수
     - create_info_file() (라인 113-146): 개별 노드 정보 파일 생성 함수
@@ -12,13 +13,26 @@
 참조: create_node_info_docs_v2
 """
 
-import json
+import asyncio
 import os
 import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from stage_context import StageContext
+
+
+STAGE_NAME = "node_docs_creation"
+
+DEFAULT_METADATA = {
+    "source": "youtube",
+    "source_type": "youtube", 
+    "source_language": "english",
+    "structure_type": "standalone",
+    "content_processing": "unified"
+}
 
 
 def main():
@@ -35,32 +49,39 @@ def main():
         print(f"❌ 비디오 폴더가 존재하지 않습니다: {video_folder}")
         sys.exit(1)
     
+    result = asyncio.run(run_stage(StageContext(video_folder)))
+    if not result["success"]:
+        sys.exit(1)
+
+
+async def run_stage(context: StageContext) -> Dict[str, Any]:
+    """
+    단계 인터페이스: 노드별 정보 문서 생성 (서버에서 프로세스 내 호출)
+    
+    Args:
+        context: 비디오 폴더 컨텍스트 (nodes가 메모리에 있으면 nodes.json을 다시 읽지 않음)
+        
+    Returns:
+        {"success", "output" | "error", "docs_dir", "files"}
+    """
+    video_folder = context.video_folder
     print("🚀 노드 정보 문서 생성 시작")
     print("=" * 50)
     print(f"📁 처리 폴더: {os.path.abspath(video_folder)}")
     
     # 1. 노드 데이터 로드
-    nodes = load_nodes(video_folder)
+    nodes = load_nodes(context)
     if not nodes:
         print("❌ 노드 데이터가 없습니다.")
-        sys.exit(1)
+        return {"success": False, "error": f"노드 데이터가 없습니다: {video_folder}"}
     
     # 2. 메타데이터 로드 (기본값 설정)
-    metadata_file = os.path.join(video_folder, "metadata.json")
-    metadata = {}
-    if os.path.exists(metadata_file):
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+    metadata = context.load_metadata()
+    if metadata:
         print(f"✅ 메타데이터 로드: {len(metadata)}개 필드")
     else:
         print("ℹ️ 메타데이터 파일이 없어 기본값 사용")
-        metadata = {
-            "source": "youtube",
-            "source_type": "youtube", 
-            "source_language": "english",
-            "structure_type": "standalone",
-            "content_processing": "unified"
-        }
+        metadata = dict(DEFAULT_METADATA)
     
     # 3. 출력 디렉토리는 video_folder 자체
     output_dir = Path(video_folder)
@@ -71,7 +92,7 @@ def main():
     created_files = []
     
     for node in nodes:
-        info_filename = create_info_file(output_dir, node, metadata)
+        info_filename = create_info_file(output_dir, node, metadata, context)
         if info_filename:
             created_files.append(info_filename)
             print(f"   📄 생성: {info_filename}")
@@ -79,23 +100,21 @@ def main():
     print(f"\n✅ 완료: {len(created_files)}개 정보 파일 생성")
     print(f"📂 파일 위치: {output_dir.absolute()}")
     
-
-def load_nodes(video_folder: str) -> List[Dict[str, Any]]:
-    """비디오 폴더에서 nodes.json 파일 직접 로드"""
-    nodes_file = os.path.join(video_folder, "nodes.json")
-    
-    if not os.path.exists(nodes_file):
-        print(f"❌ nodes.json 파일을 찾을 수 없습니다: {nodes_file}")
-        return []
+    return {
+        "success": True,
+        "output": f"{len(created_files)}개 정보 파일 생성",
+        "docs_dir": video_folder,
+        "files": created_files
+    }
     
-    try:
-        with open(nodes_file, 'r', encoding='utf-8') as f:
-            nodes = json.load(f)
-        print(f"✅ {len(nodes)}개 노드 로드 완료: {os.path.basename(nodes_file)}")
-        return nodes
-    except Exception as e:
-        print(f"❌ 노드 파일 로드 실패: {e}")
-        return []
+
+def load_nodes(source) -> List[Dict[str, Any]]:
+    """비디오 폴더(또는 StageContext)에서 nodes.json 로드"""
+    context = source if isinstance(source, StageContext) else StageContext(source)
+    nodes = context.load_nodes()
+    if nodes:
+        print(f"✅ {len(nodes)}개 노드 로드 완료")
+    return nodes
 
 
 def sanitize_title(title: str, max_length: int = 50) -> str:
@@ -111,8 +130,13 @@ def sanitize_title(title: str, max_length: int = 50) -> str:
     return sanitized
 
 
-def create_info_file(output_dir: Path, node: Dict[str, Any], metadata: Dict[str, Any]) -> str:
-    """개별 노드의 정보 파일 생성"""
+def create_info_file(
+    output_dir: Path,
+    node: Dict[str, Any],
+    metadata: Dict[str, Any],
+    context: Optional[StageContext] = None
+) -> str:
+    """개별 노드의 정보 파일 생성 (context가 있으면 생성 내용을 메모리에도 보관)"""
     try:
         # 파일명 생성
         level = str(node.get('level', 0)).zfill(2)
@@ -144,8 +168,11 @@ created_at: {current_time}
 """
         
         # 파일 작성
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if context is not None:
+            context.write_document(str(file_path), content)
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
         
         return filename
         
@@ -3,10 +3,14 @@
 생성 시간: 2025-08-22 14:58:15
 핵심 내용: extraction-system 전용 노드 정보 추출 스크립트
 상세 내용: 
-    - main() (line 25): 메인 실행 함수, extraction 폴더 입력 방식
+    - main() (line 25): 메인 실행 함수, extraction 폴더 입력 방식 (--cache=read|write|off: LLM 응답 캐시)
     - find_node_info_files() (line 50): extraction 폴더에서 *_info.md 파일 찾기
+    - process_all_nodes(): 단일 이벤트 루프에서 전체 노드 동시 처리 (설정/AI 제공자 1회 생성 후 공유)
     - process_single_node() (line 70): 개별 노드 정보 문서 처리
+    - LLM 호출: shared.llm_gateway 공용 게이트웨이 (전역 동시 요청 수 제한 + 토큰 버킷 속도 제한 + SDK 오류 지터 백오프)
+      (extraction_config.yaml의 extraction.concurrency / fallback.retry_delay_base 설정)
     - ExtractionConfig, AIProvider 클래스들: 기존 스크립트와 동일하게 유지
+    - 노드 정보 문서 읽기/갱신: shared.node_document (1회 파싱 + 캐시, 섹션/속성 제자리 갱신)
 상태: active
 참조: ../25-08-21/extract_enhanced_node_content.py
 """
@@ -20,15 +24,29 @@ from typing import Dict, List, Optional
 from pathlib import Path
 import sys
 
+# 공유 노드 문서 파서 / LLM 호출 게이트웨이 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_cache import apply_cache_flag
+from shared.llm_gateway import configure_llm_gateway, get_llm_gateway, message_text
+from shared.node_document import load_node_document, replace_section, set_property
+
+
+# 이보다 짧은 응답은 실패로 보고 재요청
+MIN_RESPONSE_LENGTH = 10
+
 
 def main():
     """메인 실행 함수"""
-    if len(sys.argv) != 2:
-        print("Usage: python extract_enhanced_node_content.py <extraction_folder>")
-        print("Example: python extract_enhanced_node_content.py ./YouTube_250822")
+    args = apply_cache_flag(sys.argv[1:])
+    if len(args) != 1:
+        print("Usage: python extract_enhanced_node_content.py <extraction_folder> [--cache=read|write|off]")
+        print("Example: python extract_enhanced_node_content.py ./YouTube_250822 --cache=read")
         sys.exit(1)
     
-    extraction_folder = sys.argv[1]
+    extraction_folder = args[0]
     
     # 폴더 존재 확인
     if not os.path.exists(extraction_folder):
@@ -50,26 +68,15 @@ def main():
     
     print(f"📄 발견된 노드 정보 문서: {len(info_files)}개")
     
-    # 각 파일 처리
-    for info_file in info_files:
-        print(f"\n📄 처리 중: {os.path.basename(info_file)}")
-        asyncio.run(process_single_node(info_file, config_path))
+    # 단일 이벤트 루프에서 전체 노드 동시 처리
+    asyncio.run(process_all_nodes(info_files, config_path))
 
 
 def is_already_processed(info_file: str) -> bool:
     """노드 정보 문서의 process_status를 확인"""
     try:
-        with open(info_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        lines = content.split('\n')
-        for line in lines:
-            if line.strip().startswith('process_status:'):
-                status = line.split(':', 1)[1].strip().lower()
-                return status == 'true'
-        
         # process_status가 없으면 미처리로 간주
-        return False
+        return load_node_document(info_file).process_status
         
     except Exception as e:
         print(f"⚠️ process_status 확인 실패: {info_file}, {e}")
@@ -94,64 +101,101 @@ def find_node_info_files(extraction_folder: str) -> List[str]:
     return sorted(info_files)
 
 
-async def process_single_node(info_file: str, config_path: str):
-    """개별 노드 정보 문서 처리"""
+async def process_all_nodes(info_files: List[str], config_path: str):
+    """
+    전체 노드를 하나의 이벤트 루프에서 동시 처리
+    - 설정과 AI 제공자는 1회만 생성해 모든 노드가 공유
+    - LLM 호출은 공용 게이트웨이(shared.llm_gateway)의 전역 동시 실행 제한 + 토큰 버킷 + 백오프로 조절
+    """
+    config = ExtractionConfig(config_path)
+    concurrency_config = config.get_concurrency_config()
+    print(f"🔧 설정 로드 완료: {config.get_ai_provider()} 모델 사용")
+    
+    gateway = configure_llm_gateway(
+        max_concurrent=concurrency_config.get('max_concurrent_requests', 4),
+        requests_per_minute=concurrency_config.get('requests_per_minute', 60),
+        burst=concurrency_config.get('burst', 4),
+        backoff_base=config.get_fallback_config().get('retry_delay_base', 1.0)
+    )
+    
+    try:
+        provider = create_ai_provider(config.get_ai_provider(), config)
+    except Exception as e:
+        print(f"❌ AI 모델 생성 실패: {e}")
+        return
+    
+    print(
+        f"⚙️ 동시 처리: 노드 {concurrency_config.get('max_concurrent_nodes', 8)}개, "
+        f"LLM 요청 {gateway.max_concurrent}개, 분당 {gateway.requests_per_minute}회"
+    )
+    
+    node_semaphore = asyncio.Semaphore(max(1, concurrency_config.get('max_concurrent_nodes', 8)))
+    
+    async def run_node(info_file: str):
+        async with node_semaphore:
+            return await process_single_node(info_file, config, provider)
+    
+    start_time = time.time()
+    results = await asyncio.gather(*(run_node(info_file) for info_file in info_files), return_exceptions=True)
+    success_count = sum(1 for result in results if result is True)
+    
+    print(f"\n🏁 전체 노드 처리 완료: {success_count}/{len(info_files)}개 성공 ({time.time() - start_time:.1f}초)")
+    print(f"📈 {gateway.format_summary()}")
+
+
+async def process_single_node(info_file: str, config: "ExtractionConfig", provider: "AIProvider") -> bool:
+    """개별 노드 정보 문서 처리 (공유 설정/AI 제공자 사용, 성공 시 True)"""
+    node_name = os.path.basename(info_file)
     try:
-        # 설정 로드
-        config = ExtractionConfig(config_path)
-        print(f"🔧 설정 로드 완료: {config.get_ai_provider()} 모델 사용")
+        print(f"\n📄 처리 중: {node_name}")
         
         # source_language 감지
         fallback_config = config.get_fallback_config()
         source_language = get_source_language(info_file, fallback_config.get('default_language', 'korean'))
-        print(f"🌍 감지된 source_language: {source_language}")
+        print(f"🌍 [{node_name}] 감지된 source_language: {source_language}")
         
         # 내용 섹션 추출
         content = extract_content_section(info_file)
         if not content:
-            print("❌ 내용 섹션이 비어있거나 추출할 수 없습니다.")
-            return
+            print(f"❌ [{node_name}] 내용 섹션이 비어있거나 추출할 수 없습니다.")
+            return False
         
-        print(f"📄 내용 길이: {len(content)} 문자")
+        print(f"📄 [{node_name}] 내용 길이: {len(content)} 문자")
         
         # 제목 추출
-        title = os.path.basename(info_file).replace('_info.md', '').replace('_', ' ')
-        
-        # AI 모델 생성
-        try:
-            provider = create_ai_provider(config.get_ai_provider(), config)
-        except Exception as e:
-            print(f"❌ AI 모델 생성 실패: {e}")
-            return
+        title = node_name.replace('_info.md', '').replace('_', ' ')
         
         # 추출 실행
         extracted_data = await extract_content_parallel(content, title, provider, source_language, fallback_config)
         
         if not extracted_data:
-            print("❌ 추출된 데이터가 없습니다.")
-            return
+            print(f"❌ [{node_name}] 추출된 데이터가 없습니다.")
+            return False
         
         # 추출 섹션 업데이트
         if update_extraction_section(info_file, extracted_data):
-            print("✅ 추출 섹션 업데이트 완료")
+            print(f"✅ [{node_name}] 추출 섹션 업데이트 완료")
             
             # process_status를 true로 변경
             if update_process_status(info_file, True):
-                print("✅ process_status를 true로 변경 완료")
+                print(f"✅ [{node_name}] process_status를 true로 변경 완료")
             else:
-                print("⚠️ process_status 변경 실패")
+                print(f"⚠️ [{node_name}] process_status 변경 실패")
             
             # 결과 요약
-            print("\n📊 추출 결과:")
+            print(f"\n📊 [{node_name}] 추출 결과:")
             for key, value in extracted_data.items():
                 status = "✅" if not value.startswith("❌") else "❌"
                 preview = value[:100] + "..." if len(value) > 100 else value
                 print(f"  {status} {key}: {preview}")
+            return True
         else:
-            print("❌ 추출 섹션 업데이트 실패")
+            print(f"❌ [{node_name}] 추출 섹션 업데이트 실패")
+            return False
             
     except Exception as e:
-        print(f"❌ 노드 처리 실패: {e}")
+        print(f"❌ [{node_name}] 노드 처리 실패: {e}")
+        return False
 
 
 class ExtractionConfig:
@@ -182,6 +226,12 @@ class ExtractionConfig:
                     'max_attempts': 3,
                     'retry_delay_base': 1.0,
                     'default_language': 'korean'
+                },
+                'concurrency': {
+                    'max_concurrent_nodes': 8,
+                    'max_concurrent_requests': 4,
+                    'requests_per_minute': 60,
+                    'burst': 4
                 }
             }
         }
@@ -191,6 +241,9 @@ class ExtractionConfig:
     
     def get_fallback_config(self) -> dict:
         return self.config['extraction']['fallback']
+    
+    def get_concurrency_config(self) -> dict:
+        return self.config['extraction'].get('concurrency') or {}
 
 
 class AIProvider(ABC):
@@ -208,8 +261,7 @@ class ClaudeProvider(AIProvider):
     def __init__(self, config: dict):
         self.config = config
         try:
-            from claude_code_sdk import query, ClaudeCodeOptions
-            self.query = query
+            from claude_code_sdk import ClaudeCodeOptions
             self.ClaudeCodeOptions = ClaudeCodeOptions
         except ImportError:
             raise ImportError("claude_code_sdk를 찾을 수 없습니다. Claude Code에서 실행해주세요.")
@@ -217,16 +269,18 @@ class ClaudeProvider(AIProvider):
     async def extract_content(self, prompt: str, system_prompt: str) -> str:
         """Claude를 사용한 내용 추출"""
         try:
-            messages = []
-            async for message in self.query(
-                prompt=prompt,
+            # 동시 요청 / 속도 제한 / SDK 오류 재시도는 공용 게이트웨이가 처리
+            messages = await get_llm_gateway().query_messages(
+                prompt,
                 options=self.ClaudeCodeOptions(
                     max_turns=self.config.get('max_turns', 1),
                     system_prompt=f"Follow the given prompt instructions exactly. {system_prompt}",
                     allowed_tools=[]
-                )
-            ):
-                messages.append(message)
+                ),
+                label="claude_extract",
+                # extract_with_fallback이 같은 프롬프트로 재요청하는 짧은 응답은 캐시하지 않음
+                cacheable=lambda messages: len(message_text(messages)) >= MIN_RESPONSE_LENGTH
+            )
             
             if messages:
                 last_message = messages[-1]
@@ -274,15 +328,9 @@ class ClaudeProvider(AIProvider):
 def get_source_language(info_file: str, default_language: str = "korean") -> str:
     """정보 파일에서 source_language 추출"""
     try:
-        with open(info_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        lines = content.split('\n')
-        for line in lines:
-            if line.strip().startswith('source_language:'):
-                lang = line.split(':', 1)[1].strip()
-                if lang in ["korean", "english"]:
-                    return lang
+        lang = load_node_document(info_file).get_property('source_language')
+        if lang in ["korean", "english"]:
+            return lang
         
         return default_language
         
@@ -294,60 +342,40 @@ def get_source_language(info_file: str, default_language: str = "korean") -> str
 def extract_content_section(info_file: str) -> str:
     """정보 파일에서 '# 내용' 섹션 추출"""
     try:
-        with open(info_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        lines = content.split('\n')
-        content_start = -1
-        content_end = len(lines)
-        
-        # '# 내용' 섹션 찾기
-        for i, line in enumerate(lines):
-            if line.strip() == '# 내용':
-                content_start = i + 1
-                break
-        
-        # 다음 구조 섹션 찾기
-        structure_sections = ['# 구성', '# 속성', '# 추출']
-        for i in range(content_start, len(lines)):
-            line = lines[i].strip()
-            if any(line.startswith(section) for section in structure_sections):
-                content_end = i
-                break
-        
-        if content_start == -1:
+        doc = load_node_document(info_file)
+        if not doc.has_section('내용'):
             return ""
         
         # 구분선(---)까지 스킵
-        while content_start < content_end and lines[content_start].strip() == '---':
-            content_start += 1
+        lines = doc.section('내용').split('\n')
+        while lines and lines[0].strip() == '---':
+            lines.pop(0)
         
         # 실제 텍스트가 있는지 확인
-        section_content = '\n'.join(lines[content_start:content_end])
-        has_actual_text = any(line.strip() and not line.strip() == '---' for line in lines[content_start:content_end])
+        has_actual_text = any(line.strip() and not line.strip() == '---' for line in lines)
         
         if not has_actual_text:
             return ""
         
-        return section_content.strip()
+        return '\n'.join(lines).strip()
         
     except Exception as e:
         print(f"❌ 내용 섹션 추출 실패: {e}")
         return ""
 
 
-async def extract_with_fallback(task_func, max_attempts: int, retry_delay: float, task_name: str):
-    """재시도 로직이 포함된 추출 함수"""
+async def extract_with_fallback(task_func, max_attempts: int, task_name: str):
+    """
+    재시도 로직이 포함된 추출 함수
+    - 빈/짧은 응답 재요청 (SDK 오류 백오프와 요청 간격은 LLM 게이트웨이가 처리하므로 추가 대기 없음)
+    """
     for attempt in range(max_attempts):
         try:
             result = await task_func()
-            if result and len(result.strip()) >= 10:
+            if result and len(result.strip()) >= MIN_RESPONSE_LENGTH:
                 return result
         except Exception as e:
             print(f"⚠️ {task_name} 추출 시도 {attempt + 1} 실패: {e}")
-        
-        if attempt < max_attempts - 1:
-            await asyncio.sleep(retry_delay * (2 ** attempt))  # 지수 백오프
     
     return f"❌ {task_name} 추출 실패 (최대 재시도 횟수 초과)"
 
@@ -356,12 +384,11 @@ async def extract_core_and_detailed_sequential(content: str, title: str, provide
     """핵심 내용과 상세 핵심 내용을 순차적으로 추출"""
     result = {}
     max_attempts = fallback_config.get('max_attempts', 3)
-    retry_delay = fallback_config.get('retry_delay_base', 1.0)
     
     # 1단계: 핵심 내용 추출 (Fallback 적용)
     core_content = await extract_with_fallback(
         lambda: _extract_core_content(content, title, provider, source_language),
-        max_attempts, retry_delay, "핵심 내용"
+        max_attempts, "핵심 내용"
     )
     result["핵심 내용"] = core_content
     
@@ -369,7 +396,7 @@ async def extract_core_and_detailed_sequential(content: str, title: str, provide
     if not core_content.startswith("❌"):
         detailed_core = await extract_with_fallback(
             lambda: _extract_detailed_core_content(content, core_content, title, provider, source_language),
-            max_attempts, retry_delay, "상세 핵심 내용"
+            max_attempts, "상세 핵심 내용"
         )
         result["상세 핵심 내용"] = detailed_core
     else:
@@ -384,7 +411,6 @@ async def extract_content_parallel(content: str, title: str, provider: AIProvide
     start_time = time.time()
     
     max_attempts = fallback_config.get('max_attempts', 3)
-    retry_delay = fallback_config.get('retry_delay_base', 1.0)
     
     # 4개 그룹을 병렬로 실행
     tasks = [
@@ -394,19 +420,19 @@ async def extract_content_parallel(content: str, title: str, provider: AIProvide
         # 그룹 2: 상세 내용 (독립)
         extract_with_fallback(
             lambda: _extract_detailed_content(content, title, provider, source_language),
-            max_attempts, retry_delay, "상세 내용"
+            max_attempts, "상세 내용"
         ),
         
         # 그룹 3: 주요 화제 (독립)
         extract_with_fallback(
             lambda: _extract_main_topics(content, title, provider, source_language),
-            max_attempts, retry_delay, "주요 화제"
+            max_attempts, "주요 화제"
         ),
         
         # 그룹 4: 부차 화제 (독립)
         extract_with_fallback(
             lambda: _extract_sub_topics(content, title, provider, source_language),
-            max_attempts, retry_delay, "부차 화제"
+            max_attempts, "부차 화제"
         )
     ]
     
@@ -541,36 +567,8 @@ async def _extract_sub_topics(content: str, title: str, provider: AIProvider, so
 def update_process_status(info_file: str, processed: bool) -> bool:
     """노드 정보 문서의 process_status를 업데이트"""
     try:
-        with open(info_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        lines = content.split('\n')
-        status_updated = False
-        
-        # 기존 process_status 라인 찾아서 업데이트
-        for i, line in enumerate(lines):
-            if line.strip().startswith('process_status:'):
-                lines[i] = f"process_status: {str(processed).lower()}"
-                status_updated = True
-                break
-        
-        # process_status가 없으면 추가
-        if not status_updated:
-            # 메타데이터 섹션(보통 파일 시작 부분)에 추가
-            # 적절한 위치를 찾아서 삽입
-            insert_index = 0
-            for i, line in enumerate(lines):
-                if line.strip().startswith('source_language:') or \
-                   line.strip().startswith('source_type:') or \
-                   line.strip().startswith('structure_type:'):
-                    insert_index = i + 1
-            
-            lines.insert(insert_index, f"process_status: {str(processed).lower()}")
-        
-        # 파일 저장
-        with open(info_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-        
+        # 기존 process_status 라인은 제자리 교체, 없으면 '# 속성' 섹션에 추가
+        set_property(info_file, 'process_status', str(processed).lower())
         return True
         
     except Exception as e:
@@ -581,31 +579,12 @@ def update_process_status(info_file: str, processed: bool) -> bool:
 def update_extraction_section(info_file: str, extracted_data: Dict[str, str]) -> bool:
     """추출 결과를 문서에 삽입"""
     try:
-        with open(info_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        lines = content.split('\n')
-        extraction_start = -1
-        extraction_end = len(lines)
-        
-        # '# 추출' 섹션 찾기
-        for i, line in enumerate(lines):
-            if line.strip() == '# 추출':
-                extraction_start = i
-                break
-        
-        if extraction_start == -1:
+        if not load_node_document(info_file).has_section('추출'):
             print(f"⚠️ '# 추출' 섹션을 찾을 수 없음")
             return False
         
-        # 다음 섹션 찾기
-        for i in range(extraction_start + 1, len(lines)):
-            if lines[i].strip().startswith('# ') and lines[i].strip() != '# 추출':
-                extraction_end = i
-                break
-        
         # 추출 섹션 재구성 (순서 보장)
-        new_extraction_lines = ['# 추출', '---']
+        new_extraction_lines = ['---']
         
         # 정확한 순서로 삽입: 핵심 내용 → 상세 핵심 내용 → 상세 내용 → 주요 화제 → 부차 화제
         extraction_order = ["핵심 내용", "상세 핵심 내용", "상세 내용", "주요 화제", "부차 화제"]
@@ -615,17 +594,8 @@ def update_extraction_section(info_file: str, extracted_data: Dict[str, str]) ->
                 new_extraction_lines.append(extracted_data[key])
                 new_extraction_lines.append("")
         
-        # 파일 재구성
-        new_lines = (
-            lines[:extraction_start] +
-            new_extraction_lines +
-            lines[extraction_end:]
-        )
-        
-        # 파일 저장
-        with open(info_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(new_lines))
-        
+        # '# 추출' 본문만 교체 (앞쪽 섹션은 다시 쓰지 않음)
+        replace_section(info_file, '추출', '\n'.join(new_extraction_lines))
         return True
         
     except Exception as e:
@@ -5,7 +5,9 @@
 상세 내용: 
     - main() (라인 25-62): 메인 실행 함수, 비디오 폴더 단위 처리
     - find_node_info_files() (라인 65-76): 비디오 폴더에서 *_info.md 파일 찾기
+    - run_stage(context): 단계 인터페이스 - 서버에서 프로세스 내 실행 (설정 1회 로드, 언어별 AI 제공자 재사용)
     - process_single_node() (라인 79-130): 개별 노드 정보 문서 처리
+    - apply_extraction_results(): 추출 섹션 텍스트 변환 (파일 입출력 없음)
     - 기타 클래스들 (라인 133-300): AI 추출 로직 및 설정 관리
 상태: active
 주소: extract_enhanced_node_content/fixed
@@ -22,6 +24,11 @@ from typing import Dict, List, Optional
 from pathlib import Path
 import sys
 
+from stage_context import StageContext
+
+
+STAGE_NAME = "node_content_extraction"
+
 
 def main():
     """메인 실행 함수"""
@@ -42,45 +49,75 @@ def main():
     extraction_system_dir = os.path.join(script_dir, '..', 'extraction-system')
     config_path = os.path.join(extraction_system_dir, 'extraction_config.yaml')
     
+    result = asyncio.run(run_stage(StageContext(video_folder, config_path=config_path)))
+    if not result["success"]:
+        sys.exit(1)
+
+
+async def run_stage(context: StageContext) -> Dict:
+    """
+    단계 인터페이스: 노드 정보 문서별 AI 추출 (서버에서 프로세스 내 호출)
+    - 설정은 1회만 로드, AI 제공자는 언어별로 1개만 생성해 재사용
+    - 문서 내용은 6단계가 남긴 메모리 값을 그대로 사용
+    
+    Args:
+        context: 비디오 폴더 컨텍스트
+        
+    Returns:
+        {"success", "output" | "error", "docs_dir"}
+    """
+    video_folder = context.video_folder
     print("🚀 노드 정보 추출 시작")
     print("=" * 50)
     print(f"📁 처리 폴더: {os.path.abspath(video_folder)}")
     
     # 노드 정보 문서 찾기
-    info_files = find_node_info_files(video_folder)
+    info_files = context.info_files()
     if not info_files:
         print("❌ 노드 정보 문서를 찾을 수 없습니다 (*_info.md)")
-        sys.exit(1)
+        return {"success": False, "error": f"노드 정보 문서를 찾을 수 없습니다 (*_info.md): {video_folder}"}
     
     print(f"📄 발견된 노드 정보 문서: {len(info_files)}개")
     
+    # 설정 로드 (컨텍스트 단위 1회)
+    config = context.shared.get('extraction_config')
+    if config is None:
+        config = ExtractionConfig.from_file(context.config_path)
+        context.shared['extraction_config'] = config
+    print(f"🔧 설정 로드 완료: {config.ai_provider} 모델 사용")
+    
     # 각 파일 처리
+    extracted_count = 0
     for info_file in info_files:
         print(f"\n📄 처리 중: {os.path.basename(info_file)}")
-        asyncio.run(process_single_node(info_file, config_path))
+        if await process_node_document(context, info_file, config):
+            extracted_count += 1
+    
+    return {
+        "success": True,
+        "output": f"{extracted_count}/{len(info_files)}개 문서 추출",
+        "docs_dir": video_folder
+    }
 
 
 def find_node_info_files(video_folder: str) -> List[str]:
     """비디오 폴더에서 *_info.md 파일 찾기"""
-    info_files = []
-    
-    for file in os.listdir(video_folder):
-        if file.endswith('_info.md'):
-            info_files.append(os.path.join(video_folder, file))
-    
-    return info_files
+    return StageContext(video_folder).info_files()
 
 
 async def process_single_node(info_file: str, config_path: str):
     """개별 노드 정보 문서 처리"""
+    context = StageContext(os.path.dirname(info_file), config_path=config_path)
+    config = ExtractionConfig.from_file(config_path)
+    print(f"🔧 설정 로드 완료: {config.ai_provider} 모델 사용")
+    await process_node_document(context, info_file, config)
+
+
+async def process_node_document(context: StageContext, info_file: str, config: "ExtractionConfig") -> bool:
+    """컨텍스트의 노드 정보 문서 1건 처리 (성공 시 True)"""
     try:
-        # 설정 로드
-        config = ExtractionConfig.from_file(config_path)
-        print(f"🔧 설정 로드 완료: {config.ai_provider} 모델 사용")
-        
         # 파일 내용 읽기
-        with open(info_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = context.read_document(info_file)
         
         # 언어 감지
         language = detect_language(content)
@@ -90,12 +127,16 @@ async def process_single_node(info_file: str, config_path: str):
         content_section = extract_content_section(content)
         if not content_section:
             print("❌ 내용 섹션이 비어있거나 추출할 수 없습니다.")
-            return
+            return False
         
         print(f"📖 내용 섹션 추출 완료: {len(content_section)} 문자")
         
-        # AI 제공자 초기화
-        ai_provider = AIProviderFactory.create_provider(config, language)
+        # AI 제공자 (언어별 재사용)
+        providers = context.shared.setdefault('ai_providers', {})
+        ai_provider = providers.get(language)
+        if ai_provider is None:
+            ai_provider = AIProviderFactory.create_provider(config, language)
+            providers[language] = ai_provider
         
         # 핵심 정보 추출
         print("🤖 AI를 사용해 핵심 정보 추출 중...")
@@ -111,13 +152,17 @@ async def process_single_node(info_file: str, config_path: str):
         
         # 추출 섹션 업데이트
         if extraction_results:
-            update_extraction_section(info_file, extraction_results)
+            context.write_document(info_file, apply_extraction_results(content, extraction_results))
+            print("✅ 추출 섹션 업데이트 완료")
             print("✅ 노드 정보 추출 성공")
+            return True
         else:
             print("❌ 추출 결과가 없습니다")
+            return False
             
     except Exception as e:
         print(f"❌ 처리 실패: {e}")
+        return False
 
 
 def detect_language(content: str) -> str:
@@ -150,34 +195,42 @@ def extract_content_section(content: str) -> str:
         return ""
 
 
+def apply_extraction_results(content: str, results: Dict[str, str]) -> str:
+    """문서 텍스트의 추출 섹션을 추출 결과로 교체"""
+    # 추출 섹션 찾기 및 교체
+    pattern = r'(# 추출\n---\n)(.*?)(# 내용\n---)'
+    
+    # 추출 결과 포맷팅
+    extraction_content = ""
+    if results.get('core_content'):
+        extraction_content += f"## 핵심 내용\n{results['core_content']}\n\n"
+    
+    if results.get('detailed_core_content'):
+        extraction_content += f"## 상세 핵심 내용\n{results['detailed_core_content']}\n\n"
+        
+    if results.get('main_topics'):
+        extraction_content += f"## 주요 화제\n{results['main_topics']}\n\n"
+        
+    if results.get('sub_topics'):
+        extraction_content += f"## 부차 화제\n{results['sub_topics']}\n\n"
+    
+    # 치환 문자열 이스케이프 문제를 피하기 위해 함수 치환 사용
+    return re.sub(
+        pattern,
+        lambda match: match.group(1) + extraction_content + match.group(3),
+        content,
+        flags=re.DOTALL
+    )
+
+
 def update_extraction_section(info_file: str, results: Dict[str, str]):
     """추출 결과를 파일의 추출 섹션에 업데이트"""
     try:
         with open(info_file, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # 추출 섹션 찾기 및 교체
-        pattern = r'(# 추출\n---\n)(.*?)(# 내용\n---)'
-        
-        # 추출 결과 포맷팅
-        extraction_content = ""
-        if results.get('core_content'):
-            extraction_content += f"## 핵심 내용\n{results['core_content']}\n\n"
-        
-        if results.get('detailed_core_content'):
-            extraction_content += f"## 상세 핵심 내용\n{results['detailed_core_content']}\n\n"
-            
-        if results.get('main_topics'):
-            extraction_content += f"## 주요 화제\n{results['main_topics']}\n\n"
-            
-        if results.get('sub_topics'):
-            extraction_content += f"## 부차 화제\n{results['sub_topics']}\n\n"
-        
-        replacement = rf'\1{extraction_content}\3'
-        updated_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-        
         with open(info_file, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+            f.write(apply_extraction_results(content, results))
         
         print("✅ 추출 섹션 업데이트 완료")
         
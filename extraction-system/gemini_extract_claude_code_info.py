@@ -5,6 +5,7 @@
 상세 내용: 
     - extract_content_section() (line 35): 노드 정보 문서에서 '# 내용' 섹션 추출
     - GeminiProvider (line 60): Gemini 2.0 Flash 모델 API 구현체  
+      (shared.llm_gateway 경유, --cache=read|write|off: 모델 + 시스템 지시사항 + 프롬프트 기준 LLM 응답 캐시)
     - extract_claude_code_info() (line 120): Claude Code 관련 5가지 정보 추출
     - save_extracted_info() (line 200): 추출 결과를 마크다운 파일로 저장
     - main() (line 240): 메인 실행 함수
@@ -13,6 +14,7 @@
 """
 
 import os
+import sys
 import asyncio
 from datetime import datetime
 from pathlib import Path
@@ -27,6 +29,14 @@ except ImportError:
     print("⚠️ google-generativeai 패키지가 설치되지 않았습니다.")
     print("설치 명령어: pip install google-generativeai")
 
+# 공유 LLM 호출 게이트웨이 / 응답 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_cache import apply_cache_flag, make_cache_key
+from shared.llm_gateway import get_llm_gateway
+
 
 def extract_content_section(info_file: str) -> str:
     """노드 정보 문서에서 '# 내용' 섹션 추출"""
@@ -91,7 +101,8 @@ class GeminiProvider:
             genai.configure(api_key=api_key)
         
         # Gemini 2.5 Flash 모델 설정
-        self.model = genai.GenerativeModel('models/gemini-2.5-flash')
+        self.model_name = 'models/gemini-2.5-flash'
+        self.model = genai.GenerativeModel(self.model_name)
         print("✅ Gemini 2.5 Flash 모델 초기화 완료")
     
     async def generate_content(self, prompt: str, system_instruction: str = "") -> str:
@@ -109,16 +120,23 @@ class GeminiProvider:
             # 시스템 지시사항이 있으면 프롬프트 앞에 추가
             full_prompt = f"{system_instruction}\n\n{prompt}" if system_instruction else prompt
             
-            # 비동기 생성 (실제로는 동기 호출이지만 asyncio와 호환되도록 처리)
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, 
-                lambda: self.model.generate_content(full_prompt)
-            )
-            
-            if response and response.text:
+            async def generate() -> str:
+                # 비동기 생성 (실제로는 동기 호출이지만 asyncio와 호환되도록 처리)
+                response = await asyncio.get_event_loop().run_in_executor(
+                    None, 
+                    lambda: self.model.generate_content(full_prompt)
+                )
+                if not (response and response.text):
+                    # 빈 응답은 캐시에 저장되지 않도록 예외로 처리
+                    raise ValueError("Gemini API에서 응답을 생성하지 못했습니다")
                 return response.text.strip()
-            else:
-                return "❌ Gemini API에서 응답을 생성하지 못했습니다"
+            
+            # 공용 게이트웨이 경유 (모델 + 시스템 지시사항 + 프롬프트 기준 응답 캐시)
+            return await get_llm_gateway().run(
+                generate,
+                label="gemini_generate",
+                cache_key=make_cache_key(self.model_name, system_instruction, prompt, {"provider": "gemini"})
+            )
                 
         except Exception as e:
             print(f"❌ Gemini API 호출 실패: {e}")
@@ -345,4 +363,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # --cache=read|write|off: LLM 응답 캐시 (재실행 시 같은 프롬프트 재사용)
+    apply_cache_flag(sys.argv[1:])
     asyncio.run(main())
\ No newline at end of file
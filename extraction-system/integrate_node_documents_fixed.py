@@ -4,6 +4,8 @@
 핵심 내용: 유튜브 ID별 폴더 구조에 맞게 수정된 노드 문서 통합 스크립트
 상세 내용: 
     - main() (라인 22-88): 메인 실행 함수, content.md 직접 로드
+    - run_stage(context): 단계 인터페이스 - 서버에서 프로세스 내 실행, 문서당 1회 저장
+    - apply_metadata() / apply_content(): 문서 텍스트 변환 (파일 입출력 없음)
     - integrate_metadata() (라인 91-112): 메타데이터 속성 섹션 통합
     - integrate_content() (라인 115-140): 내용 섹션 통합 함수
 상태: active
@@ -11,13 +13,17 @@
 참조: integrate_node_documents_v2
 """
 
-import json
+import asyncio
 import os
 import re
 import sys
-from pathlib import Path
 from typing import Dict, Any
 
+from stage_context import StageContext
+
+
+STAGE_NAME = "node_docs_integration"
+
 
 def main():
     """메인 실행 함수"""
@@ -33,37 +39,45 @@ def main():
         print(f"❌ 비디오 폴더가 존재하지 않습니다: {video_folder}")
         sys.exit(1)
     
+    result = asyncio.run(run_stage(StageContext(video_folder)))
+    if not result["success"]:
+        sys.exit(1)
+
+
+async def run_stage(context: StageContext) -> Dict[str, Any]:
+    """
+    단계 인터페이스: 메타데이터/내용을 노드 정보 문서에 통합 (서버에서 프로세스 내 호출)
+    - 문서별로 메모리에서 두 섹션을 모두 반영한 뒤 1회만 저장
+    
+    Args:
+        context: 비디오 폴더 컨텍스트 (5단계에서 만든 문서 내용을 그대로 사용)
+        
+    Returns:
+        {"success", "output" | "error", "docs_dir"}
+    """
+    video_folder = context.video_folder
     print("🚀 노드 정보 문서 통합 시작")
     print("=" * 50)
     print(f"📁 처리 폴더: {os.path.abspath(video_folder)}")
     
     # 1. 메타데이터 로드
-    metadata = None
-    metadata_file = os.path.join(video_folder, "metadata.json")
-    if os.path.exists(metadata_file):
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+    metadata = context.load_metadata()
+    if metadata:
         print(f"✅ 메타데이터 로드 완료: {len(metadata)}개 필드")
     
-    # 2. content.md 파일 직접 로드
-    content = None
-    content_file = os.path.join(video_folder, "content.md")
-    if os.path.exists(content_file):
-        with open(content_file, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
+    # 2. content.md 로드
+    content = context.load_content()
+    if content is not None:
         print(f"📖 내용 로드 완료: {len(content)} 문자")
     else:
         print("ℹ️ content.md 파일이 없음")
     
     # 3. 노드 정보 문서 파일 찾기
-    info_files = []
-    for file in os.listdir(video_folder):
-        if file.endswith('_info.md'):
-            info_files.append(os.path.join(video_folder, file))
+    info_files = context.info_files()
     
     if not info_files:
         print("❌ 노드 정보 문서를 찾을 수 없습니다 (*_info.md)")
-        sys.exit(1)
+        return {"success": False, "error": f"노드 정보 문서를 찾을 수 없습니다 (*_info.md): {video_folder}"}
     
     print(f"📁 발견된 노드 정보 문서: {len(info_files)}개")
     
@@ -73,25 +87,32 @@ def main():
         print(f"\n📄 처리 중: {os.path.basename(info_file)}")
         success = True
         
+        try:
+            document = context.read_document(info_file)
+        except Exception as e:
+            print(f"   ⚠️ 문서 읽기 실패: {e}")
+            continue
+        
         # 1. 메타데이터 통합
-        if metadata and integrate_metadata(info_file, metadata):
+        if metadata:
+            document = apply_metadata(document, metadata)
             print(f"   ✅ 메타데이터 통합 완료")
-        elif metadata:
-            print(f"   ⚠️ 메타데이터 통합 실패")
-            success = False
         
         # 2. 내용 통합 (level 0 파일만)
         if '_lev0_' in os.path.basename(info_file) and content:
-            if integrate_content(info_file, content):
-                print(f"   ✅ 내용 통합 완료")
-            else:
-                print(f"   ⚠️ 내용 통합 실패")
-                success = False
+            document = apply_content(document, info_file, content)
+            print(f"   ✅ 내용 통합 완료")
         elif '_lev0_' in os.path.basename(info_file):
             print(f"   ℹ️ 내용 파일이 없음")
         else:
             print(f"   ℹ️ level 0이 아니므로 내용 통합 건너뜀")
         
+        try:
+            context.write_document(info_file, document)
+        except Exception as e:
+            print(f"   ⚠️ 문서 저장 실패: {e}")
+            success = False
+        
         # 3. process_status는 false로 유지 (나중에 다른 단계에서 처리)
         if success:
             print(f"   ✅ 노드 문서 통합 완료 (process_status: false 유지)")
@@ -99,6 +120,59 @@ def main():
     
     print(f"\n✅ 최종 노드 문서 통합 완료: {processed_count}개 파일 처리됨")
     print(f"📂 결과 위치: {os.path.abspath(video_folder)}")
+    
+    return {
+        "success": True,
+        "output": f"{processed_count}개 파일 통합",
+        "docs_dir": video_folder
+    }
+
+
+def apply_metadata(content: str, metadata: Dict) -> str:
+    """문서 텍스트의 속성 섹션에 메타데이터 반영"""
+    lines = content.split('\n')
+    in_properties = False
+    new_lines = []
+    
+    for line in lines:
+        if line.strip() == '# 속성':
+            new_lines.append(line)
+            in_properties = True
+        elif line.strip() == '---' and in_properties:
+            new_lines.append(line)
+            # 메타데이터 추가
+            for key, value in metadata.items():
+                if key not in ['created_at']:  # created_at은 기존 값 유지
+                    new_lines.append(f"{key}: {value}")
+            in_properties = False
+        elif not in_properties:
+            new_lines.append(line)
+        # in_properties일 때는 기존 속성 라인들을 건너뜀 (메타데이터로 대체)
+        elif line.startswith('process_status:') or line.startswith('created_at:'):
+            new_lines.append(line)  # 이 두 필드는 유지
+    
+    return '\n'.join(new_lines)
+
+
+def apply_content(doc_content: str, info_file: str, content: str) -> str:
+    """문서 텍스트의 내용 섹션을 content로 교체"""
+    # 내용 섹션 찾기 및 교체
+    pattern = r'(# 내용\n---\n)(.*?)(# 구성\n---)'
+    
+    # 제목 추가 (파일명에서 추출)
+    filename = os.path.basename(info_file)
+    title_match = re.search(r'_lev\d+_(.+?)_info\.md', filename)
+    title = title_match.group(1).replace('_', ' ') if title_match else "Content"
+    
+    new_content_section = f"# {title}\n\n{content}\n\n"
+    
+    # 치환 문자열 이스케이프 문제를 피하기 위해 함수 치환 사용
+    return re.sub(
+        pattern,
+        lambda match: match.group(1) + new_content_section + match.group(3),
+        doc_content,
+        flags=re.DOTALL
+    )
 
 
 def integrate_metadata(info_file: str, metadata: Dict) -> bool:
@@ -107,30 +181,8 @@ def integrate_metadata(info_file: str, metadata: Dict) -> bool:
         with open(info_file, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # 속성 섹션 업데이트
-        lines = content.split('\n')
-        in_properties = False
-        new_lines = []
-        
-        for line in lines:
-            if line.strip() == '# 속성':
-                new_lines.append(line)
-                in_properties = True
-            elif line.strip() == '---' and in_properties:
-                new_lines.append(line)
-                # 메타데이터 추가
-                for key, value in metadata.items():
-                    if key not in ['created_at']:  # created_at은 기존 값 유지
-                        new_lines.append(f"{key}: {value}")
-                in_properties = False
-            elif not in_properties:
-                new_lines.append(line)
-            # in_properties일 때는 기존 속성 라인들을 건너뜀 (메타데이터로 대체)
-            elif line.startswith('process_status:') or line.startswith('created_at:'):
-                new_lines.append(line)  # 이 두 필드는 유지
-        
         with open(info_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(new_lines))
+            f.write(apply_metadata(content, metadata))
         
         return True
     except Exception as e:
@@ -144,21 +196,8 @@ def integrate_content(info_file: str, content: str) -> bool:
         with open(info_file, 'r', encoding='utf-8') as f:
             doc_content = f.read()
         
-        # 내용 섹션 찾기 및 교체
-        pattern = r'(# 내용\n---\n)(.*?)(# 구성\n---)'
-        
-        # 제목 추가 (파일명에서 추출)
-        filename = os.path.basename(info_file)
-        title_match = re.search(r'_lev\d+_(.+?)_info\.md', filename)
-        title = title_match.group(1).replace('_', ' ') if title_match else "Content"
-        
-        new_content_section = f"# {title}\n\n{content}\n\n"
-        
-        replacement = rf'\1{new_content_section}\3'
-        updated_content = re.sub(pattern, replacement, doc_content, flags=re.DOTALL)
-        
         with open(info_file, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+            f.write(apply_content(doc_content, info_file, content))
         
         return True
     except Exception as e:
@@ -0,0 +1,231 @@
+# 생성 시간: 2026-10-18 11:05 KST
+# 핵심 내용: 파이프라인 백그라운드 작업 큐 - 제한된 워커 풀에서 추출 파이프라인 실행
+# 상세 내용:
+#   - PipelineJob: 작업 상태, 단계별 시작/종료 시각 및 소요 시간 기록
+#   - JobManager: asyncio.Queue 기반 작업 큐 + 동시 실행 파이프라인 수 제한 워커 풀
+#   - JobManager.submit: 작업 등록 후 즉시 job_id 반환
+#   - JobManager.wait_for_update: 작업 상태 변경 대기 (SSE 진행 상황 스트리밍용)
+#   - JobManager.folder_lock: 같은 추출 폴더를 다루는 단계 직렬화용 잠금
+# 상태: active
+
+import asyncio
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class PipelineJob:
+    """백그라운드 파이프라인 작업 1건의 상태와 단계별 진행 기록"""
+
+    def __init__(self, kind: str, params: Dict[str, Any]):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.status = JOB_QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.stages: List[Dict[str, Any]] = []
+        self.result: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.version = 0
+        self._changed = asyncio.Event()
+
+    def _touch(self):
+        """상태 변경 알림 (SSE 대기자 깨우기)"""
+        self.version += 1
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def start_stage(self, name: str, label: str = ""):
+        """단계 시작 기록"""
+        self.stages.append({
+            "name": name,
+            "label": label or name,
+            "status": JOB_RUNNING,
+            "started_at": time.time(),
+            "finished_at": None,
+            "duration": None,
+            "error": None
+        })
+        self._touch()
+
+    def finish_stage(self, success: bool, error: Optional[str] = None):
+        """현재 진행 중인 단계 종료 기록"""
+        if not self.stages or self.stages[-1]["status"] != JOB_RUNNING:
+            return
+        stage = self.stages[-1]
+        stage["finished_at"] = time.time()
+        stage["duration"] = round(stage["finished_at"] - stage["started_at"], 3)
+        stage["status"] = JOB_COMPLETED if success else JOB_FAILED
+        stage["error"] = error
+        self._touch()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 딕셔너리 변환"""
+        now = time.time()
+        if self.started_at is None:
+            elapsed = None
+        else:
+            elapsed = round((self.finished_at or now) - self.started_at, 3)
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed": elapsed,
+            "current_stage": self.stages[-1]["name"] if self.status == JOB_RUNNING and self.stages else None,
+            "stages": [dict(stage) for stage in self.stages],
+            "result": self.result,
+            "error": self.error
+        }
+
+
+JobRunner = Callable[[PipelineJob], Awaitable[Dict[str, Any]]]
+
+
+class JobManager:
+    """
+    제한된 워커 풀로 파이프라인 작업을 실행하는 작업 관리자
+    - concurrency: 동시에 실행되는 파이프라인 수 (워커 수)
+    - max_history: 메모리에 보관할 최대 작업 수 (오래된 완료 작업부터 제거)
+    """
+
+    def __init__(self, concurrency: int = 2, max_history: int = 200):
+        self.concurrency = max(1, concurrency)
+        self.max_history = max_history
+        self._jobs: "OrderedDict[str, PipelineJob]" = OrderedDict()
+        self._runners: Dict[str, JobRunner] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._folder_locks: Dict[str, asyncio.Lock] = {}
+
+    async def start(self):
+        """워커 풀 시작 (서버 startup 시 호출)"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker(index)) for index in range(self.concurrency)
+        ]
+        print(f"⚙️ 파이프라인 워커 {self.concurrency}개 시작")
+
+    async def stop(self):
+        """워커 풀 종료 (서버 shutdown 시 호출)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, kind: str, runner: JobRunner, params: Dict[str, Any]) -> PipelineJob:
+        """
+        작업 등록
+
+        Args:
+            kind: 작업 종류 (예: youtube_pipeline)
+            runner: 작업을 받아 결과 딕셔너리를 반환하는 코루틴 함수
+            params: 작업 입력값 (상태 조회 응답에 포함)
+
+        Returns:
+            등록된 작업 (status: queued)
+        """
+        if self._queue is None:
+            raise RuntimeError("JobManager가 시작되지 않았습니다. start()를 먼저 호출하세요.")
+
+        job = PipelineJob(kind, params)
+        self._jobs[job.job_id] = job
+        self._runners[job.job_id] = runner
+        self._trim_history()
+        self._queue.put_nowait(job)
+        print(f"📥 작업 등록: {job.job_id} ({kind}, 대기 {self._queue.qsize()}건)")
+        return job
+
+    def get(self, job_id: str) -> Optional[PipelineJob]:
+        """작업 조회"""
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """전체 작업 요약 목록 (최신순)"""
+        return [
+            {key: value for key, value in job.to_dict().items() if key not in ("result", "params")}
+            for job in reversed(self._jobs.values())
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """워커 풀 상태"""
+        counts = {JOB_QUEUED: 0, JOB_RUNNING: 0, JOB_COMPLETED: 0, JOB_FAILED: 0}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {"concurrency": self.concurrency, "jobs": counts}
+
+    async def wait_for_update(self, job: PipelineJob, last_version: int, timeout: float = 15.0) -> bool:
+        """
+        작업 상태가 last_version 이후로 바뀔 때까지 대기
+
+        Returns:
+            변경되었으면 True, timeout이면 False
+        """
+        if job.version != last_version:
+            return True
+        try:
+            await asyncio.wait_for(job._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def folder_lock(self, folder_path: str) -> asyncio.Lock:
+        """
+        추출 폴더별 잠금 반환
+        - 5~7단계 스크립트는 폴더 전체를 처리하므로 같은 폴더의 작업은 순서대로 실행
+        """
+        return self._folder_locks.setdefault(folder_path, asyncio.Lock())
+
+    async def _worker(self, index: int):
+        while True:
+            job = await self._queue.get()
+            runner = self._runners.pop(job.job_id, None)
+            try:
+                job.status = JOB_RUNNING
+                job.started_at = time.time()
+                job._touch()
+                print(f"▶️ [worker-{index}] 작업 시작: {job.job_id}")
+
+                job.result = await runner(job)
+                job.status = JOB_COMPLETED
+            except asyncio.CancelledError:
+                job.status = JOB_FAILED
+                job.error = "서버 종료로 작업이 취소되었습니다."
+                raise
+            except Exception as e:
+                print(f"❌ [worker-{index}] 작업 오류: {job.job_id} - {str(e)}")
+                traceback.print_exc()
+                job.finish_stage(False, str(e))
+                job.status = JOB_FAILED
+                job.error = str(e)
+            finally:
+                job.finished_at = time.time()
+                job._touch()
+                self._queue.task_done()
+
+            print(f"⏹️ [worker-{index}] 작업 종료: {job.job_id} ({job.status}, {job.finished_at - job.started_at:.1f}초)")
+
+    def _trim_history(self):
+        """보관 한도 초과 시 오래된 종료 작업 제거"""
+        if len(self._jobs) <= self.max_history:
+            return
+        for job_id in list(self._jobs.keys()):
+            if len(self._jobs) <= self.max_history:
+                break
+            if self._jobs[job_id].status in (JOB_COMPLETED, JOB_FAILED):
+                del self._jobs[job_id]
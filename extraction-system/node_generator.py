@@ -18,6 +18,13 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Any
 
+# 공유 마크다운 헤딩 토크나이저 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.markdown_headings import first_heading, iter_headings
+
 
 def main():
     """메인 실행 함수"""
@@ -117,49 +124,28 @@ def extract_headers_by_type(content: str, metadata: Dict[str, Any]) -> List[Dict
 def extract_all_headers(content: str) -> List[Dict[str, Any]]:
     """모든 헤더 추출"""
     nodes = []
-    node_id = 0
     
-    lines = content.split('\n')
-    
-    for line in lines:
-        if line.strip().startswith('#'):
-            # 헤더 레벨과 텍스트 추출
-            match = re.match(r'^(#+)\s*(.+)', line.strip())
-            if match:
-                header_level = len(match.group(1))  # # 개수
-                header_text = match.group(2).strip()
-                cleaned_title = clean_title(header_text)
-                
-                node = {
-                    "id": node_id,
-                    "level": header_level - 1,  # 헤더 레벨 - 1
-                    "title": cleaned_title
-                }
-                nodes.append(node)
-                node_id += 1
+    # '#' 개수 제한 없음, '#' 뒤 공백 선택 (문서 1회 스캔)
+    for node_id, heading in enumerate(iter_headings(content, max_hashes=None, require_space=False)):
+        nodes.append({
+            "id": node_id,
+            "level": heading.level,  # 헤더 레벨 - 1
+            "title": clean_title(heading.title)
+        })
     
     return nodes
 
 
 def extract_first_header_only(content: str) -> List[Dict[str, Any]]:
     """첫 번째 헤더만 추출 (standalone + unified 조건)"""
-    lines = content.split('\n')
-    
-    for line in lines:
-        if line.strip().startswith('#'):
-            # 헤더 레벨과 텍스트 추출
-            match = re.match(r'^(#+)\s*(.+)', line.strip())
-            if match:
-                header_level = len(match.group(1))  # # 개수
-                header_text = match.group(2).strip()
-                cleaned_title = clean_title(header_text)
-                
-                node = {
-                    "id": 0,
-                    "level": header_level - 1,  # 헤더 레벨 - 1
-                    "title": cleaned_title
-                }
-                return [node]  # 첫 번째 헤더만 반환
+    heading = first_heading(content, max_hashes=None, require_space=False)
+    if heading:
+        node = {
+            "id": 0,
+            "level": heading.level,  # 헤더 레벨 - 1
+            "title": clean_title(heading.title)
+        }
+        return [node]  # 첫 번째 헤더만 반환
     
     return []  # 헤더가 없는 경우
 
@@ -3,29 +3,52 @@
 # 상세 내용:
 #   - app = FastAPI(): FastAPI 인스턴스 생성
 #   - /: HTML 페이지 서빙 엔드포인트
-#   - /upload: 파일 + 텍스트 업로드 처리 엔드포인트
-#   - /youtube: YouTube URL 스크립트 추출 엔드포인트
+#   - /upload: 파일 + 텍스트 업로드 처리 엔드포인트 (YouTube URL은 작업 등록 후 job_id 즉시 반환)
+#   - /jobs, /jobs/{job_id}: 작업 목록 / 상태 및 단계별 소요 시간 조회
+#   - /jobs/{job_id}/events: 작업 진행 상황 SSE 스트림
+#   - run_youtube_pipeline: 7단계 파이프라인 (JobManager 워커 풀에서 실행, PIPELINE_CONCURRENCY로 동시 실행 수 설정)
+#   - run_node_doc_stage: 5~7단계 모듈의 run_stage를 프로세스 내 실행 (StageContext로 노드/문서 내용 공유)
 #   - uploads 디렉토리 자동 생성 로직
 #   - 터미널 로깅 기능
 # 상태: active
 
 import os
 import re
+import json
 import asyncio
 from pathlib import Path
-from fastapi import FastAPI, File, UploadFile, Form
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi.responses import HTMLResponse, StreamingResponse
 from typing import Union
 from youtube_extractor import process_youtube_url
 from metadata_manager import create_metadata_json, get_existing_folder
 from transcript_improver import improve_transcript_with_claude, extract_transcript_content, extract_first_last_sentences
 from node_generator import load_metadata, extract_headers_by_type
+from job_manager import JobManager, PipelineJob, JOB_COMPLETED, JOB_FAILED
+from stage_context import StageContext
+import create_node_info_docs_fixed as create_node_info_docs_stage
+import integrate_node_documents_fixed as integrate_node_docs_stage
+import extract_enhanced_node_content_fixed as extract_enhanced_content_stage
 
 app = FastAPI()
 
 # uploads 디렉토리 생성
 os.makedirs("uploads", exist_ok=True)
 
+# 동시 실행 파이프라인 수 (환경변수 PIPELINE_CONCURRENCY, 기본 2)
+PIPELINE_CONCURRENCY = int(os.getenv("PIPELINE_CONCURRENCY", "2"))
+job_manager = JobManager(concurrency=PIPELINE_CONCURRENCY)
+
+
+@app.on_event("startup")
+async def start_job_workers():
+    await job_manager.start()
+
+
+@app.on_event("shutdown")
+async def stop_job_workers():
+    await job_manager.stop()
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
     with open("index.html", "r", encoding="utf-8") as f:
@@ -104,7 +127,6 @@ async def generate_nodes(metadata_file_path, script_file_path):
         script_path = Path(script_file_path)
         nodes_file = script_path.parent / "nodes.json"
         
-        import json
         with open(nodes_file, 'w', encoding='utf-8') as f:
             json.dump(nodes, f, ensure_ascii=False, indent=2)
         
@@ -113,7 +135,8 @@ async def generate_nodes(metadata_file_path, script_file_path):
             "success": True,
             "nodes_file": str(nodes_file),
             "filename": nodes_file.name,
-            "node_count": len(nodes)
+            "node_count": len(nodes),
+            "nodes": nodes
         }
         
     except Exception as e:
@@ -121,100 +144,137 @@ async def generate_nodes(metadata_file_path, script_file_path):
         return {"success": False, "error": str(e)}
 
 
-async def create_node_info_docs(extraction_folder):
-    """노드 정보 문서 생성 함수"""
-    try:
-        print(f"📄 5단계: 노드 정보 문서 생성 시작...")
-        
-        # 스크립트 실행 (이미 만든 스크립트 활용)
-        import subprocess
-        import sys
-        
-        script_path = os.path.join(os.path.dirname(__file__), 'create_node_info_docs_fixed.py')
-        
-        result = subprocess.run([
-            sys.executable, script_path, extraction_folder
-        ], capture_output=True, text=True, encoding='utf-8')
-        
-        if result.returncode == 0:
-            print(f"✅ 노드 정보 문서 생성 성공")
-            return {
-                "success": True,
-                "output": result.stdout,
-                "docs_dir": os.path.join(extraction_folder, "node_info_docs")
-            }
-        else:
-            print(f"❌ 노드 정보 문서 생성 실패: {result.stderr}")
-            return {"success": False, "error": result.stderr}
-        
-    except Exception as e:
-        print(f"❌ 노드 정보 문서 생성 오류: {str(e)}")
-        return {"success": False, "error": str(e)}
+# 5~7단계: (결과 키, 단계 모듈, 표시 이름, 실패 시 결과 타입)
+NODE_DOC_STAGES = [
+    ("node_docs_creation", create_node_info_docs_stage, "5단계: 노드 정보 문서 생성", "pipeline_partial_docs"),
+    ("node_docs_integration", integrate_node_docs_stage, "6단계: 노드 문서 통합", "pipeline_partial_integration"),
+    ("node_content_extraction", extract_enhanced_content_stage, "7단계: 노드 정보 추출", "pipeline_partial_extraction"),
+]
 
 
-async def integrate_node_docs(extraction_folder):
-    """노드 문서 통합 함수"""
+async def run_node_doc_stage(stage_module, context: StageContext, label):
+    """
+    단계 모듈의 run_stage를 프로세스 내에서 실행
+    - 인터프리터 재기동, SDK/yaml 재임포트 없이 같은 StageContext(노드, 문서 내용)를 이어서 사용
+    """
     try:
-        print(f"🔗 6단계: 노드 문서 통합 시작...")
-        
-        # 스크립트 실행 (이미 만든 스크립트 활용)
-        import subprocess
-        import sys
+        print(f"▶️ {label} 시작...")
+        stage_result = await stage_module.run_stage(context)
         
-        script_path = os.path.join(os.path.dirname(__file__), 'integrate_node_documents_fixed.py')
-        
-        result = subprocess.run([
-            sys.executable, script_path, extraction_folder
-        ], capture_output=True, text=True, encoding='utf-8')
-        
-        if result.returncode == 0:
-            print(f"✅ 노드 문서 통합 성공")
-            return {
-                "success": True,
-                "output": result.stdout,
-                "docs_dir": extraction_folder
-            }
-        else:
-            print(f"❌ 노드 문서 통합 실패: {result.stderr}")
-            return {"success": False, "error": result.stderr}
-        
-    except Exception as e:
-        print(f"❌ 노드 문서 통합 오류: {str(e)}")
-        return {"success": False, "error": str(e)}
-
-
-async def extract_enhanced_content(extraction_folder):
-    """노드 정보 추출 함수"""
-    try:
-        print(f"📊 7단계: 노드 정보 추출 시작...")
-        
-        # 스크립트 실행 (extraction-system 폴더의 스크립트 사용)
-        import subprocess
-        import sys
-        
-        script_path = os.path.join(os.path.dirname(__file__), 'extract_enhanced_node_content_fixed.py')
-        
-        result = subprocess.run([
-            sys.executable, script_path, extraction_folder
-        ], capture_output=True, text=True, encoding='utf-8')
-        
-        if result.returncode == 0:
-            print(f"✅ 노드 정보 추출 성공")
-            return {
-                "success": True,
-                "output": result.stdout,
-                "docs_dir": extraction_folder
-            }
+        if stage_result["success"]:
+            print(f"✅ {label} 성공")
         else:
-            print(f"❌ 노드 정보 추출 실패: {result.stderr}")
-            return {"success": False, "error": result.stderr}
+            print(f"❌ {label} 실패: {stage_result['error']}")
+        return stage_result
         
     except Exception as e:
-        print(f"❌ 노드 정보 추출 오류: {str(e)}")
+        print(f"❌ {label} 오류: {str(e)}")
         return {"success": False, "error": str(e)}
 
 
-
+async def run_youtube_pipeline(job: PipelineJob):
+    """
+    YouTube 7단계 파이프라인 (워커 풀에서 실행)
+    - 단계별 시작/종료 시각을 job에 기록
+    - 실패한 단계에서 중단하고 해당 단계까지의 결과와 pipeline_partial_* 타입 반환
+    """
+    youtube_url = job.params["youtube_url"]
+    metadata_info = job.params["metadata_info"]
+    result = {}
+    
+    # 1단계: 메타정보 JSON 파일 생성
+    job.start_stage("json_creation", "1단계: 메타정보 JSON 생성")
+    json_result = await asyncio.to_thread(create_metadata_json, metadata_info, youtube_url)
+    
+    if not json_result["success"]:
+        print(f"❌ 메타정보 JSON 생성 실패: {json_result['error']}")
+        job.finish_stage(False, json_result['error'])
+        result["json_creation"] = {
+            "success": False,
+            "error": json_result['error']
+        }
+        result["type"] = "youtube_metadata_error"
+        return result
+    
+    print(f"📄 메타정보 JSON 생성 성공:")
+    print(f"  - 폴더: {json_result['folder_path']}")
+    print(f"  - JSON 파일: {json_result['json_path']}")
+    job.finish_stage(True)
+    result["json_creation"] = {
+        "success": True,
+        "folder_path": json_result['folder_path'],
+        "json_path": json_result['json_path']
+    }
+    
+    # 2단계: 생성된 폴더에 스크립트 추출
+    print(f"🎥 YouTube 스크립트 추출 시작...")
+    job.start_stage("youtube_extraction", "2단계: YouTube 스크립트 추출")
+    youtube_result = await asyncio.to_thread(
+        process_youtube_url, youtube_url, ".", json_result['folder_path'], json_result['metadata']
+    )
+    result["youtube_extraction"] = youtube_result
+    
+    if not youtube_result["success"]:
+        print(f"❌ YouTube 스크립트 추출 실패: {youtube_result['message']}")
+        job.finish_stage(False, youtube_result['message'])
+        result["type"] = "youtube_partial"
+        return result
+    
+    print(f"✅ YouTube 스크립트 추출 성공:")
+    print(f"  - 제목: {youtube_result['video_info']['title']}")
+    print(f"  - 언어: {youtube_result['video_info']['language']}")
+    print(f"  - 파일: {youtube_result['file_info']['full_path']}")
+    job.finish_stage(True)
+    
+    # 3단계: 스크립트 개선
+    print(f"✨ 3단계: 스크립트 개선 시작...")
+    job.start_stage("transcript_improvement", "3단계: 스크립트 개선")
+    transcript_result = await improve_transcript(youtube_result['file_info']['full_path'])
+    result["transcript_improvement"] = transcript_result
+    
+    if not transcript_result["success"]:
+        print(f"❌ 스크립트 개선 실패: {transcript_result['error']}")
+        job.finish_stage(False, transcript_result['error'])
+        result["type"] = "pipeline_partial_transcript"
+        return result
+    
+    print(f"✅ 스크립트 개선 성공: {transcript_result['filename']}")
+    job.finish_stage(True)
+    
+    # 4단계: 노드 생성
+    print(f"🌐 4단계: 노드 생성 시작...")
+    job.start_stage("node_generation", "4단계: 노드 생성")
+    nodes_result = await generate_nodes(json_result['json_path'], youtube_result['file_info']['full_path'])
+    nodes = nodes_result.pop("nodes", None)
+    result["node_generation"] = nodes_result
+    
+    if not nodes_result["success"]:
+        print(f"❌ 노드 생성 실패: {nodes_result['error']}")
+        job.finish_stage(False, nodes_result['error'])
+        result["type"] = "pipeline_partial_nodes"
+        return result
+    
+    print(f"✅ 노드 생성 성공: {nodes_result['filename']} ({nodes_result['node_count']}개 노드)")
+    job.finish_stage(True)
+    
+    # 5~7단계: 비디오 폴더 컨텍스트를 공유하며 프로세스 내 실행 (같은 폴더의 작업끼리는 순서대로)
+    video_folder = youtube_result['file_info']['video_folder_path']
+    context = StageContext(video_folder, nodes=nodes)
+    async with job_manager.folder_lock(os.path.abspath(video_folder)):
+        for result_key, stage_module, label, partial_type in NODE_DOC_STAGES:
+            job.start_stage(result_key, label)
+            stage_result = await run_node_doc_stage(stage_module, context, label)
+            result[result_key] = stage_result
+            
+            if not stage_result["success"]:
+                job.finish_stage(False, stage_result['error'])
+                result["type"] = partial_type
+                return result
+            job.finish_stage(True)
+    
+    print(f"✅ 전체 파이프라인 완료! (7단계)")
+    result["type"] = "pipeline_complete_full_enhanced"
+    return result
 
 
 @app.post("/upload")
@@ -265,149 +325,16 @@ async def upload_file(
                 "content_processing": content_processing or "unified"
             }
             
-            # 1단계: 메타정보 JSON 파일 생성
-            json_result = create_metadata_json(metadata_info, text_data.strip())
-            
-            if json_result["success"]:
-                print(f"📄 메타정보 JSON 생성 성공:")
-                print(f"  - 폴더: {json_result['folder_path']}")
-                print(f"  - JSON 파일: {json_result['json_path']}")
-                
-                # 2단계: 생성된 폴더에 스크립트 추출
-                print(f"🎥 YouTube 스크립트 추출 시작...")
-                youtube_result = process_youtube_url(text_data.strip(), ".", json_result['folder_path'], json_result['metadata'])
-                
-                if youtube_result["success"]:
-                    print(f"✅ YouTube 스크립트 추출 성공:")
-                    print(f"  - 제목: {youtube_result['video_info']['title']}")
-                    print(f"  - 언어: {youtube_result['video_info']['language']}")
-                    print(f"  - 파일: {youtube_result['file_info']['full_path']}")
-                    
-                    # 3단계: 스크립트 개선
-                    print(f"✨ 3단계: 스크립트 개선 시작...")
-                    transcript_result = await improve_transcript(youtube_result['file_info']['full_path'])
-                    
-                    if transcript_result["success"]:
-                        print(f"✅ 스크립트 개선 성공: {transcript_result['filename']}")
-                        
-                        # 4단계: 노드 생성
-                        print(f"🌐 4단계: 노드 생성 시작...")
-                        nodes_result = await generate_nodes(json_result['json_path'], youtube_result['file_info']['full_path'])
-                        
-                        if nodes_result["success"]:
-                            print(f"✅ 노드 생성 성공: {nodes_result['filename']} ({nodes_result['node_count']}개 노드)")
-                            
-                            # 5단계: 노드 정보 문서 생성
-                            print(f"📄 5단계: 노드 정보 문서 생성 시작...")
-                            docs_result = await create_node_info_docs(json_result['folder_path'])
-                            
-                            if docs_result["success"]:
-                                print(f"✅ 노드 정보 문서 생성 성공")
-                                
-                                # 6단계: 노드 문서 통합
-                                print(f"🔗 6단계: 노드 문서 통합 시작...")
-                                integration_result = await integrate_node_docs(json_result['folder_path'])
-                                
-                                if integration_result["success"]:
-                                    print(f"✅ 노드 문서 통합 성공!")
-                                    
-                                    # 7단계: 노드 정보 추출
-                                    print(f"📊 7단계: 노드 정보 추출 시작...")
-                                    extraction_result = await extract_enhanced_content(json_result['folder_path'])
-                                    
-                                    if extraction_result["success"]:
-                                        print(f"✅ 전체 파이프라인 완료! (7단계)")
-                                        
-                                        result["json_creation"] = {
-                                            "success": True,
-                                            "folder_path": json_result['folder_path'],
-                                            "json_path": json_result['json_path']
-                                        }
-                                        result["youtube_extraction"] = youtube_result
-                                        result["transcript_improvement"] = transcript_result
-                                        result["node_generation"] = nodes_result
-                                        result["node_docs_creation"] = docs_result
-                                        result["node_docs_integration"] = integration_result
-                                        result["node_content_extraction"] = extraction_result
-                                        result["type"] = "pipeline_complete_full_enhanced"
-                                    else:
-                                        print(f"❌ 노드 정보 추출 실패: {extraction_result['error']}")
-                                        result["json_creation"] = {
-                                            "success": True,
-                                            "folder_path": json_result['folder_path'],
-                                            "json_path": json_result['json_path']
-                                        }
-                                        result["youtube_extraction"] = youtube_result
-                                        result["transcript_improvement"] = transcript_result
-                                        result["node_generation"] = nodes_result
-                                        result["node_docs_creation"] = docs_result
-                                        result["node_docs_integration"] = integration_result
-                                        result["node_content_extraction"] = extraction_result
-                                        result["type"] = "pipeline_partial_extraction"
-                                else:
-                                    print(f"❌ 노드 문서 통합 실패: {integration_result['error']}")
-                                    result["json_creation"] = {
-                                        "success": True,
-                                        "folder_path": json_result['folder_path'],
-                                        "json_path": json_result['json_path']
-                                    }
-                                    result["youtube_extraction"] = youtube_result
-                                    result["transcript_improvement"] = transcript_result
-                                    result["node_generation"] = nodes_result
-                                    result["node_docs_creation"] = docs_result
-                                    result["node_docs_integration"] = integration_result
-                                    result["type"] = "pipeline_partial_integration"
-                            else:
-                                print(f"❌ 노드 정보 문서 생성 실패: {docs_result['error']}")
-                                result["json_creation"] = {
-                                    "success": True,
-                                    "folder_path": json_result['folder_path'],
-                                    "json_path": json_result['json_path']
-                                }
-                                result["youtube_extraction"] = youtube_result
-                                result["transcript_improvement"] = transcript_result
-                                result["node_generation"] = nodes_result
-                                result["node_docs_creation"] = docs_result
-                                result["type"] = "pipeline_partial_docs"
-                        else:
-                            print(f"❌ 노드 생성 실패: {nodes_result['error']}")
-                            result["json_creation"] = {
-                                "success": True,
-                                "folder_path": json_result['folder_path'],
-                                "json_path": json_result['json_path']
-                            }
-                            result["youtube_extraction"] = youtube_result
-                            result["transcript_improvement"] = transcript_result
-                            result["node_generation"] = nodes_result
-                            result["type"] = "pipeline_partial_nodes"
-                    else:
-                        print(f"❌ 스크립트 개선 실패: {transcript_result['error']}")
-                        result["json_creation"] = {
-                            "success": True,
-                            "folder_path": json_result['folder_path'],
-                            "json_path": json_result['json_path']
-                        }
-                        result["youtube_extraction"] = youtube_result
-                        result["transcript_improvement"] = transcript_result
-                        result["type"] = "pipeline_partial_transcript"
-                    
-                else:
-                    print(f"❌ YouTube 스크립트 추출 실패: {youtube_result['message']}")
-                    result["json_creation"] = {
-                        "success": True,
-                        "folder_path": json_result['folder_path'],
-                        "json_path": json_result['json_path']
-                    }
-                    result["youtube_extraction"] = youtube_result
-                    result["type"] = "youtube_partial"
-                
-            else:
-                print(f"❌ 메타정보 JSON 생성 실패: {json_result['error']}")
-                result["json_creation"] = {
-                    "success": False,
-                    "error": json_result['error']
-                }
-                result["type"] = "youtube_metadata_error"
+            # 파이프라인은 백그라운드 워커 풀에서 실행, 즉시 작업 ID 반환
+            job = job_manager.submit(
+                "youtube_pipeline",
+                run_youtube_pipeline,
+                {"youtube_url": text_data.strip(), "metadata_info": metadata_info}
+            )
+            result["type"] = "pipeline_queued"
+            result["job_id"] = job.job_id
+            result["status_url"] = f"/jobs/{job.job_id}"
+            result["events_url"] = f"/jobs/{job.job_id}/events"
         else:
             # 일반 텍스트 처리
             print(f"📝 텍스트 데이터 수신: {text_data}")
@@ -421,6 +348,43 @@ async def upload_file(
     
     return result
 
+
+@app.get("/jobs")
+async def list_jobs():
+    """작업 목록 및 워커 풀 상태"""
+    return {"stats": job_manager.get_stats(), "jobs": job_manager.list_jobs()}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """작업 상태 및 단계별 소요 시간 조회"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return job.to_dict()
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """작업 진행 상황 SSE 스트림 (상태 변경 시마다 전송, 종료 시 스트림 닫힘)"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    
+    async def event_stream():
+        last_version = -1
+        while True:
+            if await job_manager.wait_for_update(job, last_version):
+                last_version = job.version
+                yield f"data: {json.dumps(job.to_dict(), ensure_ascii=False)}\n\n"
+                if job.status in (JOB_COMPLETED, JOB_FAILED):
+                    return
+            else:
+                # 연결 유지용 주석 이벤트
+                yield ": keep-alive\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
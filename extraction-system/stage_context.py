@@ -0,0 +1,107 @@
+"""
+생성 시간: 2026-10-18 11:40:00 KST
+핵심 내용: 노드 문서 파이프라인 단계(5~7단계) 공용 실행 컨텍스트
+상세 내용:
+    - StageContext: 비디오 폴더 단위로 메타데이터, 노드, content.md, 노드 정보 문서를 메모리에 보관
+    - load_metadata / load_nodes / load_content: 디스크에서 최초 1회만 읽고 이후 메모리 값 사용
+    - info_files / read_document / write_document: 노드 정보 문서(*_info.md) 목록 및 내용 캐시
+    - 단계 인터페이스: 각 단계 모듈은 STAGE_NAME과 async run_stage(context) -> Dict 를 제공
+      (반환값: success, output 또는 error, docs_dir)
+상태: active
+주소: stage_context
+참조: create_node_info_docs_fixed, integrate_node_documents_fixed, extract_enhanced_node_content_fixed
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+
+_UNSET = object()
+
+
+class StageContext:
+    """
+    단계 간에 전달되는 비디오 폴더 처리 상태
+    - 서버에서는 1개 파이프라인 동안 같은 컨텍스트를 5~7단계에 넘겨 재파싱을 피함
+    - CLI 실행 시에는 단계마다 새 컨텍스트를 만들어 디스크에서 로드
+    """
+
+    def __init__(
+        self,
+        video_folder: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        nodes: Optional[List[Dict[str, Any]]] = None,
+        content: Optional[str] = None,
+        config_path: Optional[str] = None
+    ):
+        self.video_folder = video_folder
+        self.config_path = config_path or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'extraction_config.yaml'
+        )
+        self._metadata = metadata if metadata is not None else _UNSET
+        self._nodes = nodes if nodes is not None else _UNSET
+        self._content = content if content is not None else _UNSET
+        self._documents: Dict[str, str] = {}
+        self._info_files: Optional[List[str]] = None
+        self.shared: Dict[str, Any] = {}  # 단계별 재사용 객체 (설정, AI 제공자 등)
+
+    def load_metadata(self) -> Optional[Dict[str, Any]]:
+        """metadata.json 로드 (없으면 None)"""
+        if self._metadata is _UNSET:
+            metadata_file = os.path.join(self.video_folder, "metadata.json")
+            self._metadata = None
+            if os.path.exists(metadata_file):
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    self._metadata = json.load(f)
+        return self._metadata
+
+    def load_nodes(self) -> List[Dict[str, Any]]:
+        """nodes.json 로드 (없거나 읽기 실패 시 빈 리스트)"""
+        if self._nodes is _UNSET:
+            nodes_file = os.path.join(self.video_folder, "nodes.json")
+            if not os.path.exists(nodes_file):
+                print(f"❌ nodes.json 파일을 찾을 수 없습니다: {nodes_file}")
+                return []
+            try:
+                with open(nodes_file, 'r', encoding='utf-8') as f:
+                    self._nodes = json.load(f)
+            except Exception as e:
+                print(f"❌ 노드 파일 로드 실패: {e}")
+                return []
+        return self._nodes
+
+    def load_content(self) -> Optional[str]:
+        """content.md 로드 (없으면 None)"""
+        if self._content is _UNSET:
+            content_file = os.path.join(self.video_folder, "content.md")
+            self._content = None
+            if os.path.exists(content_file):
+                with open(content_file, 'r', encoding='utf-8') as f:
+                    self._content = f.read().strip()
+        return self._content
+
+    def info_files(self) -> List[str]:
+        """노드 정보 문서(*_info.md) 경로 목록"""
+        if self._info_files is None:
+            self._info_files = [
+                os.path.join(self.video_folder, file)
+                for file in os.listdir(self.video_folder)
+                if file.endswith('_info.md')
+            ]
+        return self._info_files
+
+    def read_document(self, path: str) -> str:
+        """노드 정보 문서 내용 (메모리에 없을 때만 디스크에서 읽음)"""
+        if path not in self._documents:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._documents[path] = f.read()
+        return self._documents[path]
+
+    def write_document(self, path: str, text: str):
+        """노드 정보 문서 저장 (디스크 + 메모리)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        self._documents[path] = text
+        if self._info_files is not None and path not in self._info_files:
+            self._info_files.append(path)
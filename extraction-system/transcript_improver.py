@@ -6,6 +6,7 @@
     - extract_first_last_sentences(transcript_content): 첫/마지막 문장 추출 및 필러 워드 제거 (97-139)
     - check_content_coverage(original_sentences, improved_content): 내용 누락 검사 (142-168)
     - improve_transcript_with_claude(transcript_content, retry_count): Claude SDK 호출 (fallback 포함) (171-248)
+      (shared.llm_gateway 경유: 전역 동시 요청 제한 + 속도 제한 + SDK 오류 백오프, 내용 누락 재시도는 캐시를 읽지 않음)
     - combine_with_metadata(metadata, improved_content): 메타데이터와 구조화 대본 결합 (282-342)
     - save_improved_transcript(content, output_file): 파일 저장 (345-362)
     - main(): 메인 실행 함수 (365-442)
@@ -21,9 +22,16 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Tuple, Set
 
-from claude_code_sdk import query, ClaudeCodeOptions, AssistantMessage, TextBlock
+from claude_code_sdk import ClaudeCodeOptions, AssistantMessage, TextBlock
 from claude_code_sdk import CLINotFoundError, ProcessError, CLIJSONDecodeError
 
+# 공유 LLM 호출 게이트웨이 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.llm_gateway import get_llm_gateway, message_text
+
 
 def extract_transcript_content(file_path: str) -> str:
     """
@@ -192,9 +200,16 @@ async def improve_transcript_with_claude(transcript_content: str, original_first
 
 Return ONLY the structured transcript content. Do not add any introductory text, explanations, or commentary."""
 
-            # Claude Code SDK 호출
+            # Claude Code SDK 호출 (공용 게이트웨이 경유, 내용 누락 응답은 캐시하지 않고 재시도 시 새로 호출)
             response_content = ""
-            async for message in query(prompt=user_prompt, options=options):
+            messages = await get_llm_gateway().query_messages(
+                user_prompt,
+                options=options,
+                label="improve_transcript_with_claude",
+                cacheable=lambda msgs: check_content_coverage(original_first_words, original_last_words, message_text(msgs)),
+                bypass_cache=attempt > 0
+            )
+            for message in messages:
                 if isinstance(message, AssistantMessage):
                     for block in message.content:
                         if isinstance(block, TextBlock):
@@ -3,12 +3,27 @@
 실제 PDF 검색을 통한 정확한 페이지 정보로 목차 업데이트
 """
 
-import pdfplumber
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import json
 
+# 공유 페이지 텍스트 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.page_text_store import CachedPDFText
+
+# 섹션 제목 라인은 보통 짧고 독립적임
+MAX_HEADING_LINE_LENGTH = 120
+_LEADING_SECTION_NUMBER = re.compile(r'^\d+(?:\.\d+)*\.?\s+')
+
+def _normalize_text(text: str) -> str:
+    """비교용 정규화 (소문자, 연속 공백을 공백 1개로)"""
+    return ' '.join(text.lower().split())
+
 class AccurateTOCPageMapper:
     def __init__(self, pdf_path: str, toc_path: str, chapter_mapping_path: str):
         self.pdf_path = pdf_path
@@ -51,66 +66,76 @@ class AccurateTOCPageMapper:
         return mappings
     
     def find_section_in_pdf(self, section_title: str, chapter_range: Tuple[int, int]) -> Optional[int]:
-        """PDF에서 특정 섹션의 정확한 페이지 찾기"""
-        start_page, end_page = chapter_range
-        patterns = self._generate_section_patterns(section_title)
+        """PDF에서 특정 섹션의 정확한 페이지 찾기 (단일 섹션, 여러 섹션은 find_sections_in_pdf 사용)"""
+        return self.find_sections_in_pdf([(section_title, chapter_range)]).get(section_title)
+    
+    def find_sections_in_pdf(self, sections: List[Tuple[str, Tuple[int, int]]]) -> Dict[str, Optional[int]]:
+        """
+        여러 섹션의 페이지를 한 번에 찾기
+        - PDF는 1회만 열고, 각 페이지 텍스트는 1회만 읽어 정규화
+        - 챕터 범위별로 "정규화된 헤딩 라인 → 첫 페이지" 역색인을 만들어 섹션 제목을 바로 조회
+        - 헤딩 라인으로 찾지 못한 섹션은 범위 내 페이지 본문에서 제목 포함 여부로 검색
+        
+        Args:
+            sections: [(섹션 제목, (챕터 시작 페이지, 챕터 끝 페이지))] - 페이지는 1부터 시작
+        
+        Returns:
+            {섹션 제목: 페이지 번호 또는 None}
+        """
+        found: Dict[str, Optional[int]] = {title: None for title, _ in sections}
+        
+        # 같은 챕터 범위의 섹션끼리 묶어 범위당 역색인 1개만 생성
+        sections_by_range: Dict[Tuple[int, int], List[str]] = {}
+        for title, chapter_range in sections:
+            sections_by_range.setdefault(tuple(chapter_range), []).append(title)
         
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                for page_num in range(start_page - 1, min(end_page, len(pdf.pages))):
-                    page = pdf.pages[page_num]
-                    text = page.extract_text()
+            with CachedPDFText(self.pdf_path) as pdf:
+                normalized_pages: Dict[int, str] = {}
+                
+                for (start_page, end_page), titles in sections_by_range.items():
+                    page_range = range(start_page - 1, min(end_page, pdf.page_count))
+                    heading_index: Dict[str, int] = {}
                     
-                    if text:
-                        # 각 패턴에 대해 매칭 시도
-                        for pattern in patterns:
-                            if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
-                                # 실제 섹션 헤더인지 검증
-                                lines = text.split('\n')
-                                for line in lines:
-                                    if re.search(pattern, line, re.IGNORECASE):
-                                        stripped_line = line.strip()
-                                        # 섹션 제목 라인은 보통 짧고 독립적임
-                                        if len(stripped_line) < 120:
-                                            return page_num + 1
-                                return page_num + 1
+                    for page_num in page_range:
+                        text = pdf.page_text(page_num)
+                        normalized_pages[page_num] = _normalize_text(text)
+                        for line in text.split('\n'):
+                            stripped_line = line.strip()
+                            if not stripped_line or len(stripped_line) >= MAX_HEADING_LINE_LENGTH:
+                                continue
+                            heading = _normalize_text(stripped_line)
+                            heading_index.setdefault(heading, page_num + 1)
+                            # 번호 없이 제목만 있는 헤딩 라인으로도 조회 가능하도록
+                            heading_index.setdefault(_LEADING_SECTION_NUMBER.sub('', heading), page_num + 1)
+                    
+                    for title in titles:
+                        found[title] = self._resolve_section_page(title, heading_index, page_range, normalized_pages)
         except Exception as e:
-            print(f"PDF 검색 중 오류 ({section_title}): {e}")
-            return None
+            print(f"PDF 검색 중 오류: {e}")
         
+        return found
+    
+    def _resolve_section_page(
+        self,
+        section_title: str,
+        heading_index: Dict[str, int],
+        page_range: range,
+        normalized_pages: Dict[int, str]
+    ) -> Optional[int]:
+        """역색인 조회 후, 없으면 페이지 본문에서 제목(번호 없이) 포함 여부로 첫 페이지 검색"""
+        normalized_title = _normalize_text(section_title)
+        title_only = _LEADING_SECTION_NUMBER.sub('', normalized_title)
+        
+        for key in (normalized_title, title_only):
+            if key in heading_index:
+                return heading_index[key]
+        
+        for page_num in page_range:
+            if title_only and title_only in normalized_pages[page_num]:
+                return page_num + 1
         return None
         
-    def _generate_section_patterns(self, section_title: str) -> List[str]:
-        """섹션 제목에 대한 다양한 검색 패턴 생성"""
-        patterns = []
-        
-        # 번호가 있는 경우 처리
-        if re.match(r'^\d+', section_title):
-            match = re.match(r'^(\d+(?:\.\d+)*)\s+(.+)', section_title)
-            if match:
-                number_part = match.group(1)
-                title_part = match.group(2)
-                
-                escaped_number = re.escape(number_part)
-                escaped_title = re.escape(title_part)
-                
-                patterns.extend([
-                    f"{escaped_number}\\s+{escaped_title}",
-                    f"{escaped_number}\\.?\\s+{escaped_title}",
-                    escaped_title  # 번호 없이 제목만
-                ])
-        else:
-            # 번호가 없는 경우
-            escaped_title = re.escape(section_title)
-            patterns.append(escaped_title)
-        
-        # 공백을 유연하게 처리
-        for i, pattern in enumerate(patterns[:]):
-            flexible = re.sub(r'\\?\s+', r'\\s+', pattern)
-            patterns.append(flexible)
-            
-        return list(set(patterns))
-    
     def collect_leaf_sections(self) -> List[Dict]:
         """TOC에서 LEAF 노드들 수집"""
         print("LEAF 섹션들 수집 중...")
@@ -168,25 +193,25 @@ class AccurateTOCPageMapper:
         
         print(f"우선 검증할 섹션: {len(priority_sections)}개")
         
-        verified_pages = {}
-        for i, section in enumerate(priority_sections[:30]):  # 처음 30개만 검증
-            title = section['title']
+        # 처음 30개만 검증 - 챕터 범위와 함께 모아 한 번에 검색
+        batch = []
+        for section in priority_sections[:30]:
             chapter = section['chapter']
-            
             if chapter in self.chapter_pages:
                 chapter_info = self.chapter_pages[chapter]
-                start_page = chapter_info['start_page']
-                end_page = chapter_info['end_page']
-                
-                print(f"  [{i+1}/{len(priority_sections[:30])}] {title} 검증 중...")
-                
-                found_page = self.find_section_in_pdf(title, (start_page, end_page))
-                
-                if found_page:
-                    verified_pages[title] = found_page
-                    print(f"    → 페이지 {found_page}에서 발견")
-                else:
-                    print(f"    → 찾을 수 없음")
+                batch.append((section['title'], (chapter_info['start_page'], chapter_info['end_page'])))
+        
+        found_pages = self.find_sections_in_pdf(batch)
+        
+        verified_pages = {}
+        for i, (title, _) in enumerate(batch):
+            found_page = found_pages.get(title)
+            print(f"  [{i+1}/{len(batch)}] {title} 검증")
+            if found_page:
+                verified_pages[title] = found_page
+                print(f"    → 페이지 {found_page}에서 발견")
+            else:
+                print(f"    → 찾을 수 없음")
         
         return verified_pages
     
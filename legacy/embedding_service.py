@@ -4,9 +4,14 @@ Handles text embedding generation using sentence-transformers
 """
 
 import logging
+import os
+import sys
 from typing import List, Dict, Any
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+# Shared process-wide model service (repository root / shared)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.embedding_service import get_embedding_service
 
 logger = logging.getLogger(__name__)
 
@@ -30,10 +35,9 @@ class EmbeddingService:
         """Lazy load the embedding model"""
         if self._model is None:
             logger.info(f"Loading embedding model: {self.model_name}")
-            self._model = SentenceTransformer(self.model_name)
-            # Get embedding dimension by encoding a test string
-            test_embedding = self._model.encode(["test"])
-            self._embedding_dimension = test_embedding.shape[1]
+            # Model instance is shared with every other user in this process
+            self._model = get_embedding_service(self.model_name).model
+            self._embedding_dimension = self._model.get_sentence_embedding_dimension()
             logger.info(f"Model loaded successfully. Embedding dimension: {self._embedding_dimension}")
     
     @property
@@ -3,11 +3,16 @@ KURE 기반 임베딩 시스템을 위한 임베딩 서비스 모듈
 sentence-transformers 모델을 사용하여 텍스트 임베딩 생성
 """
 
-from sentence_transformers import SentenceTransformer
 import numpy as np
+import os
+import sys
 from typing import List, Union
 import logging
 
+# 저장소 루트의 공유 임베딩 서비스 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.embedding_service import get_embedding_service as get_shared_embedding_service
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -26,14 +31,17 @@ class EmbeddingServiceV2:
         """
         self.model_name = model_name
         self.model = None
+        self.service = get_shared_embedding_service(model_name)
         self._load_model()
     
     def _load_model(self):
         """모델 로딩"""
         try:
-            logger.info(f"임베딩 모델 로딩 중: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
-            logger.info("모델 로딩 완료")
+            # 임베딩 데몬이 실행 중이면 로컬 모델 로드 생략 (CLI 콜드 스타트 제거)
+            if self.service.uses_daemon():
+                logger.info("임베딩 데몬 사용, 로컬 모델 로딩 생략")
+                return
+            self.model = self.service.model
         except Exception as e:
             logger.error(f"모델 로딩 실패: {e}")
             raise
@@ -52,8 +60,7 @@ class EmbeddingServiceV2:
             raise ValueError("빈 텍스트는 임베딩을 생성할 수 없습니다")
         
         try:
-            embedding = self.model.encode(text.strip())
-            return embedding.tolist()
+            return self.service.encode(text.strip())
         except Exception as e:
             logger.error(f"임베딩 생성 실패: {e}")
             raise
@@ -79,8 +86,7 @@ class EmbeddingServiceV2:
         
         try:
             logger.info(f"배치 임베딩 생성 중: {len(valid_texts)}개 텍스트")
-            embeddings = self.model.encode(valid_texts)
-            return [embedding.tolist() for embedding in embeddings]
+            return self.service.encode(valid_texts)
         except Exception as e:
             logger.error(f"배치 임베딩 생성 실패: {e}")
             raise
@@ -94,8 +100,8 @@ class EmbeddingServiceV2:
         """
         return {
             "model_name": self.model_name,
-            "dimension": self.model.get_sentence_embedding_dimension(),
-            "max_seq_length": self.model.max_seq_length
+            "dimension": self.service.get_dimension(),
+            "max_seq_length": self.service.model.max_seq_length
         }
 
 # 전역 임베딩 서비스 인스턴스
@@ -3,12 +3,19 @@
 Final Leaf Extractor - 실제 챕터 내용을 기반으로 한 정확한 리프 노드 추출
 """
 
-import pdfplumber
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# 공유 페이지 텍스트 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.page_text_store import CachedPDFText
+
 class FinalLeafExtractor:
     def __init__(self, pdf_path: str, toc_path: str):
         self.pdf_path = Path(pdf_path)
@@ -41,8 +48,8 @@ class FinalLeafExtractor:
         """PDF와 목차 데이터를 로드합니다."""
         try:
             # PDF 로드
-            self.pdf_doc = pdfplumber.open(str(self.pdf_path))
-            self.total_pages = len(self.pdf_doc.pages)
+            self.pdf_doc = CachedPDFText(str(self.pdf_path))
+            self.total_pages = self.pdf_doc.page_count
             print(f"PDF 로드 완료: {self.total_pages}페이지")
             
             # TOC 파싱
@@ -59,9 +66,7 @@ class FinalLeafExtractor:
             return ""
         
         try:
-            page = self.pdf_doc.pages[page_num]
-            text = page.extract_text()
-            return text if text else ""
+            return self.pdf_doc.page_text(page_num)
         except Exception as e:
             print(f"페이지 {page_num + 1} 텍스트 추출 실패: {e}")
             return ""
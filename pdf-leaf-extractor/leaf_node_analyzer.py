@@ -3,12 +3,19 @@
 PDF Leaf Node Analyzer - Data-Oriented Programming 책의 리프 노드 추출 및 분석
 """
 
-import pdfplumber
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# 공유 페이지 텍스트 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.page_text_store import CachedPDFText
+
 class LeafNodeAnalyzer:
     def __init__(self, pdf_path: str, toc_path: str):
         self.pdf_path = Path(pdf_path)
@@ -22,8 +29,8 @@ class LeafNodeAnalyzer:
     def load_pdf(self):
         """PDF 파일을 로드합니다."""
         try:
-            self.pdf_doc = pdfplumber.open(str(self.pdf_path))
-            self.total_pages = len(self.pdf_doc.pages)
+            self.pdf_doc = CachedPDFText(str(self.pdf_path))
+            self.total_pages = self.pdf_doc.page_count
             print(f"PDF 로드 완료: {self.total_pages}페이지")
             return True
         except Exception as e:
@@ -36,9 +43,7 @@ class LeafNodeAnalyzer:
             return ""
         
         try:
-            page = self.pdf_doc.pages[page_num]
-            text = page.extract_text()
-            return text if text else ""
+            return self.pdf_doc.page_text(page_num)
         except Exception as e:
             print(f"페이지 {page_num + 1} 텍스트 추출 실패: {e}")
             return ""
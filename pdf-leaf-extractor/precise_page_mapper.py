@@ -3,12 +3,19 @@
 Precise Page Mapper - PDF의 실제 챕터 페이지와 리프 노드 매핑
 """
 
-import pdfplumber
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# 공유 페이지 텍스트 캐시 (저장소 루트의 shared 패키지)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.page_text_store import CachedPDFText
+
 class PrecisePageMapper:
     def __init__(self, pdf_path: str, analysis_file: str):
         self.pdf_path = Path(pdf_path)
@@ -23,8 +30,8 @@ class PrecisePageMapper:
         """PDF와 분석 데이터를 로드합니다."""
         try:
             # PDF 로드
-            self.pdf_doc = pdfplumber.open(str(self.pdf_path))
-            self.total_pages = len(self.pdf_doc.pages)
+            self.pdf_doc = CachedPDFText(str(self.pdf_path))
+            self.total_pages = self.pdf_doc.page_count
             print(f"PDF 로드 완료: {self.total_pages}페이지")
             
             # 분석 데이터 로드
@@ -43,9 +50,7 @@ class PrecisePageMapper:
             return ""
         
         try:
-            page = self.pdf_doc.pages[page_num]
-            text = page.extract_text()
-            return text if text else ""
+            return self.pdf_doc.page_text(page_num)
         except Exception as e:
             print(f"페이지 {page_num + 1} 텍스트 추출 실패: {e}")
             return ""
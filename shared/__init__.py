@@ -0,0 +1 @@
+# shared 패키지: 여러 작업 폴더(날짜별 디렉토리, legacy 등)에서 공용으로 사용하는 서비스
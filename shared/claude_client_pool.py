@@ -0,0 +1,268 @@
+"""
+생성 시간: 2026-10-18 18:40:26
+핵심 내용: ClaudeSDKClient 웜 세션 풀 (연결된 클라이언트 N개를 유지하고 요청마다 임대)
+상세 내용:
+    - ClaudeClientPool 클래스: 요청마다 CLI 서브프로세스 생성 + 핸드셰이크를 하지 않도록 연결된 클라이언트 재사용
+      * lease 메서드: async with pool.lease() as client — 기존 async with ClaudeSDKClient() as client 대체
+        (임대 중에는 client.query → client.receive_response를 ResultMessage까지 모두 읽어야 함)
+      * 반납 시 백그라운드에서 "/clear"로 대화 상태 초기화 후 유휴 목록에 반환
+        (초기화 실패/시간 초과, 임대 중 예외, max_uses 도달 시 폐기하고 새 클라이언트를 미리 연결)
+      * discard 메서드: 임대 안에서 오류를 직접 처리한 경우 반납 시 재사용하지 않고 교체하도록 표시
+      * start 메서드: 클라이언트 size개 미리 연결 (호출하지 않으면 첫 임대 시 연결)
+      * ensure_capacity 메서드: 동시 임대 상한을 늘림 (줄이지는 않음)
+    - 클라이언트마다 소유 태스크 1개가 connect / disconnect를 모두 수행
+      (SDK가 connect에서 anyio 태스크 그룹에 진입하므로 같은 태스크에서 종료해야 함, 이벤트 루프 종료 시에도 정리됨)
+    - get_claude_client_pool / close_claude_client_pool 함수: 이벤트 루프 + 옵션별 공용 풀
+      (CLAUDE_CLIENT_POOL_SIZE, CLAUDE_CLIENT_MAX_USES 환경변수 기본값)
+상태:
+주소: shared/claude_client_pool
+참조: 25-08-23/interactive_learning_system, 25-08-23/document_based_qa_system_v4, 25-08-23/conversation_module,
+      25-08-23/knowledge_gap_analyzer_v2, 25-08-24/document_query_processor
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from shared.llm_cache import options_fingerprint
+
+try:
+    from claude_code_sdk import ClaudeSDKClient
+    CLAUDE_SDK_AVAILABLE = True
+except ImportError:
+    ClaudeSDKClient = None
+    CLAUDE_SDK_AVAILABLE = False
+
+POOL_SIZE_ENV = "CLAUDE_CLIENT_POOL_SIZE"
+MAX_USES_ENV = "CLAUDE_CLIENT_MAX_USES"
+
+RESET_PROMPT = "/clear"
+
+
+class _PooledClient:
+    """풀 안의 클라이언트 1개 (소유 태스크가 연결 수명을 관리)"""
+
+    def __init__(self):
+        self.client = None
+        self.uses = 0
+        self.healthy = True
+        self.task: Optional[asyncio.Task] = None
+        self.ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.closing = asyncio.Event()
+        # 연결 대기가 먼저 끝난 경우에도 예외 미회수 경고가 나지 않도록 결과 소비
+        self.ready.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+
+class ClaudeClientPool:
+    """연결된 ClaudeSDKClient를 재사용하는 임대 풀"""
+
+    def __init__(self, size: int = 2, options: Any = None, max_uses: int = 20,
+                 connect_timeout: float = 60.0, reset_timeout: float = 15.0):
+        """
+        Args:
+            size: 유지할 클라이언트 수 (동시 임대 수 상한)
+            options: ClaudeCodeOptions (None이면 SDK 기본값)
+            max_uses: 클라이언트 1개의 최대 임대 횟수 (도달 시 폐기 후 새로 연결)
+            connect_timeout: 연결 제한 시간 (초)
+            reset_timeout: 반납 후 대화 초기화 제한 시간 (초, 초과 시 폐기)
+        """
+        if not CLAUDE_SDK_AVAILABLE:
+            raise ImportError("claude_code_sdk를 찾을 수 없습니다. Claude Code에서 실행해주세요.")
+        self.size = max(1, size)
+        self.options = options
+        self.max_uses = max(1, max_uses)
+        self.connect_timeout = connect_timeout
+        self.reset_timeout = reset_timeout
+
+        self._idle: deque = deque()
+        self._leased: Dict[int, _PooledClient] = {}
+        self._slots = asyncio.Semaphore(self.size)
+        self._live = 0
+        self._background = set()
+        self._closed = False
+        self.stats = {"leases": 0, "connected": 0, "retired": 0, "reset_failures": 0, "lease_wait": 0.0}
+
+    async def start(self):
+        """남은 슬롯만큼 클라이언트를 미리 연결"""
+        missing = self.size - self._live
+        results = await asyncio.gather(*(self._spawn() for _ in range(missing)), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                print(f"⚠️ Claude 클라이언트 미리 연결 실패: {result}")
+            else:
+                self._idle.append(result)
+
+    def ensure_capacity(self, size: int):
+        """동시 임대 상한을 최소 size로 늘림 (늘어난 슬롯은 첫 임대 시 연결)"""
+        for _ in range(size - self.size):
+            self._slots.release()
+        self.size = max(self.size, size)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Any]:
+        """
+        연결된 클라이언트 임대 (유휴 클라이언트가 없으면 새로 연결)
+
+        Raises:
+            RuntimeError: 닫힌 풀에서 임대하려는 경우
+            CLINotFoundError / CLIConnectionError 등: 연결 실패
+        """
+        if self._closed:
+            raise RuntimeError("닫힌 Claude 클라이언트 풀입니다")
+
+        queued_at = time.monotonic()
+        await self._slots.acquire()
+        try:
+            pooled = self._idle.popleft() if self._idle else await self._spawn()
+        except BaseException:
+            self._slots.release()
+            raise
+        self.stats["leases"] += 1
+        self.stats["lease_wait"] += time.monotonic() - queued_at
+        pooled.uses += 1
+        self._leased[id(pooled.client)] = pooled
+
+        succeeded = False
+        try:
+            yield pooled.client
+            succeeded = pooled.healthy
+        finally:
+            self._leased.pop(id(pooled.client), None)
+            # 초기화/교체는 백그라운드에서 (호출자는 바로 다음 작업 진행)
+            task = asyncio.get_running_loop().create_task(self._return(pooled, succeeded))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    def discard(self, client: Any):
+        """
+        임대 중인 클라이언트를 반납 시 폐기하도록 표시
+        (응답을 끝까지 읽지 못한 채 오류를 잡아 처리한 경우, 남은 메시지가 다음 임대로 넘어가지 않도록)
+        """
+        pooled = self._leased.get(id(client))
+        if pooled is not None:
+            pooled.healthy = False
+
+    async def _return(self, pooled: _PooledClient, succeeded: bool):
+        """반납: 초기화 성공 시 재사용, 아니면 폐기 후 빈 슬롯을 새 클라이언트로 채움 (완료 후 슬롯 반환)"""
+        try:
+            if succeeded and pooled.uses < self.max_uses and not self._closed and await self._reset(pooled):
+                self._idle.append(pooled)
+                return
+
+            await self._retire(pooled)
+            if not self._closed:
+                try:
+                    self._idle.append(await self._spawn())
+                except Exception as e:
+                    print(f"⚠️ Claude 클라이언트 교체 연결 실패 (다음 임대 시 재시도): {e}")
+        finally:
+            self._slots.release()
+
+    async def _reset(self, pooled: _PooledClient) -> bool:
+        """대화 상태 초기화 ("/clear" 후 ResultMessage까지 읽음), 실패 시 False"""
+        async def clear():
+            await pooled.client.query(RESET_PROMPT)
+            async for _ in pooled.client.receive_response():
+                pass
+
+        try:
+            await asyncio.wait_for(clear(), self.reset_timeout)
+            return True
+        except Exception as e:
+            self.stats["reset_failures"] += 1
+            print(f"⚠️ Claude 클라이언트 초기화 실패, 교체: {type(e).__name__}")
+            return False
+
+    async def _spawn(self) -> _PooledClient:
+        """소유 태스크에서 새 클라이언트 연결 (연결될 때까지 대기)"""
+        pooled = _PooledClient()
+        pooled.task = asyncio.get_running_loop().create_task(self._own(pooled))
+        self._live += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(pooled.ready), self.connect_timeout)
+        except BaseException:
+            await self._retire(pooled, count=False)
+            raise
+        self.stats["connected"] += 1
+        return pooled
+
+    async def _own(self, pooled: _PooledClient):
+        """클라이언트 1개의 연결 ~ 종료 (connect / disconnect를 같은 태스크에서 수행)"""
+        client = ClaudeSDKClient(options=self.options) if self.options is not None else ClaudeSDKClient()
+        try:
+            try:
+                await client.connect()
+            except BaseException as e:
+                if not pooled.ready.done():
+                    pooled.ready.set_exception(e)
+                raise
+            pooled.client = client
+            if not pooled.ready.done():
+                pooled.ready.set_result(client)
+            await pooled.closing.wait()
+        finally:
+            with suppress(Exception):
+                await client.disconnect()
+
+    async def _retire(self, pooled: _PooledClient, count: bool = True):
+        """클라이언트 종료 (소유 태스크가 disconnect 후 끝날 때까지 대기)"""
+        pooled.closing.set()
+        with suppress(BaseException):
+            await pooled.task
+        self._live -= 1
+        if count:
+            self.stats["retired"] += 1
+
+    async def close(self):
+        """진행 중인 반납 처리를 기다린 뒤 모든 유휴 클라이언트 종료 (임대 중인 클라이언트는 반납 시 종료)"""
+        self._closed = True
+        if self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+        while self._idle:
+            await self._retire(self._idle.popleft())
+
+    def summary(self) -> Dict[str, Any]:
+        summary = dict(self.stats)
+        summary.update({"size": self.size, "live": self._live, "idle": len(self._idle)})
+        return summary
+
+
+_pools: Dict[Tuple[int, str], ClaudeClientPool] = {}
+
+
+def _pool_key(options: Any) -> Tuple[int, str]:
+    loop = asyncio.get_running_loop()
+    return id(loop), json.dumps(options_fingerprint(options), sort_keys=True, ensure_ascii=False, default=str)
+
+
+def get_claude_client_pool(options: Any = None, min_size: int = 0) -> ClaudeClientPool:
+    """
+    현재 이벤트 루프 + 옵션별 공용 풀 (이벤트 루프 안에서만 호출)
+    - min_size: 동시 임대 상한 최소값 (기존 풀이 더 작으면 늘림)
+    - 이전 이벤트 루프의 풀은 버림 (그 루프가 끝날 때 소유 태스크가 정리됨)
+    """
+    key = _pool_key(options)
+    for stale_key in [k for k in _pools if k[0] != key[0]]:
+        del _pools[stale_key]
+    pool = _pools.get(key)
+    if pool is None or pool._closed:
+        pool = ClaudeClientPool(
+            size=int(os.getenv(POOL_SIZE_ENV, "2")),
+            options=options,
+            max_uses=int(os.getenv(MAX_USES_ENV, "20"))
+        )
+        _pools[key] = pool
+    if min_size:
+        pool.ensure_capacity(min_size)
+    return pool
+
+
+async def close_claude_client_pool():
+    """현재 이벤트 루프의 공용 풀 모두 종료"""
+    loop_id = id(asyncio.get_running_loop())
+    for key in [k for k in _pools if k[0] == loop_id]:
+        await _pools.pop(key).close()
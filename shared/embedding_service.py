@@ -0,0 +1,364 @@
+"""
+생성 시간: 2026-10-18 11:05:13
+핵심 내용: 프로세스 전역 공유 임베딩 모델 서비스 (모델 1회 로드, 비동기 마이크로 배칭, 선택적 Unix 소켓 데몬)
+상세 내용:
+    - EmbeddingModelService 클래스: 모델 1회 로드 및 동기/비동기 인코딩
+    - encode 메서드: 동기 배치 인코딩 (데몬 사용 가능 시 데몬으로 위임)
+    - encode_async 메서드: 동시 요청을 마이크로 배치로 묶어 스레드 풀에서 인코딩 (이벤트 루프 비차단)
+    - get_embedding_service 함수: 모델명별 싱글톤 서비스 반환
+    - EmbeddingDaemonClient 클래스: Unix 소켓 데몬 클라이언트
+    - serve_daemon 함수: 모델을 상주시키는 Unix 소켓 데몬 (짧게 실행되는 CLI의 콜드 스타트 제거)
+    - main 함수: python -m shared.embedding_service --serve
+상태:
+주소: shared/embedding_service
+참조:
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "paraphrase-multilingual-MiniLM-L12-v2"
+
+# 데몬 소켓 경로 환경변수 (설정되어 있고 소켓이 열려 있으면 데몬 사용)
+DAEMON_SOCKET_ENV = "EMBEDDING_DAEMON_SOCKET"
+DEFAULT_DAEMON_SOCKET = "/tmp/knowledge_sherpa_embedding.sock"
+
+# 데몬 요청/응답 한 줄 최대 크기 (asyncio 기본 64 KiB로는 큰 배치 요청에서 LimitOverrunError)
+DAEMON_STREAM_LIMIT = 64 * 1024 * 1024
+
+def normalize_model_name(model_name: Optional[str]) -> str:
+    """'sentence-transformers/' 접두사 유무와 관계없이 같은 모델로 취급"""
+    model_name = model_name or DEFAULT_MODEL_NAME
+    prefix = "sentence-transformers/"
+    if model_name.startswith(prefix):
+        model_name = model_name[len(prefix):]
+    return model_name
+
+class EmbeddingDaemonClient:
+    """
+    임베딩 데몬 Unix 소켓 클라이언트
+    - 요청/응답: 줄 단위 JSON
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 60.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def is_available(self) -> bool:
+        """데몬 소켓 연결 가능 여부"""
+        if not os.path.exists(self.socket_path):
+            return False
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(1.0)
+                sock.connect(self.socket_path)
+            return True
+        except OSError:
+            return False
+
+    def encode(self, texts: List[str], model_name: str) -> List[List[float]]:
+        """데몬에 인코딩 요청"""
+        request = json.dumps({"model": model_name, "texts": texts}, ensure_ascii=False) + "\n"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(request.encode('utf-8'))
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        response = json.loads(b"".join(chunks).decode('utf-8'))
+        if 'error' in response:
+            raise RuntimeError(f"임베딩 데몬 오류: {response['error']}")
+        return response['embeddings']
+
+class EmbeddingModelService:
+    """
+    공유 임베딩 모델 서비스
+    - 모델은 프로세스당 1회만 로드
+    - encode_async: 동시에 들어온 요청을 마이크로 배치로 묶어 스레드 풀에서 실행
+    - 데몬 소켓이 설정되어 있으면 로컬 모델 대신 데몬 사용
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        max_batch_size: int = 64,
+        batch_window: float = 0.005,
+        max_workers: int = 1,
+        daemon_socket: Optional[str] = None
+    ):
+        """
+        Args:
+            model_name: sentence-transformers 모델명
+            max_batch_size: 마이크로 배치 최대 텍스트 수
+            batch_window: 배치 수집 대기 시간(초)
+            max_workers: 인코딩 스레드 수
+            daemon_socket: 임베딩 데몬 소켓 경로 (None이면 EMBEDDING_DAEMON_SOCKET 환경변수, ""이면 데몬 미사용)
+        """
+        self.model_name = normalize_model_name(model_name)
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="embedding")
+
+        if daemon_socket is None:
+            daemon_socket = os.getenv(DAEMON_SOCKET_ENV)
+        self._daemon = EmbeddingDaemonClient(daemon_socket) if daemon_socket else None
+        self._use_daemon: Optional[bool] = None
+
+        # 마이크로 배칭 상태 (이벤트 루프별)
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch_task: Optional[asyncio.Task] = None
+
+        self.stats = {'encode_calls': 0, 'texts_encoded': 0, 'batches': 0}
+
+    @property
+    def model(self):
+        """로드된 SentenceTransformer 모델 (최초 접근 시 로드)"""
+        if self._model is None:
+            self.load()
+        return self._model
+
+    def load(self):
+        """모델 로드 (이미 로드되었으면 무시)"""
+        if self._model is not None:
+            return
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("sentence-transformers가 설치되지 않았습니다. uv add sentence-transformers")
+        with self._load_lock:
+            if self._model is None:
+                logger.info(f"공유 임베딩 모델 로드 중: {self.model_name}")
+                self._model = SentenceTransformer(self.model_name)
+                logger.info("공유 임베딩 모델 로드 완료")
+
+    def uses_daemon(self) -> bool:
+        """임베딩 데몬 사용 여부 (최초 호출 시 소켓 연결 확인)"""
+        if self._daemon is None:
+            return False
+        if self._use_daemon is None:
+            self._use_daemon = self._daemon.is_available()
+            if self._use_daemon:
+                logger.info(f"임베딩 데몬 사용: {self._daemon.socket_path}")
+        return self._use_daemon
+
+    def encode(self, texts: Union[str, List[str]], batch_size: int = 32) -> Union[List[float], List[List[float]]]:
+        """
+        동기 인코딩
+
+        Args:
+            texts: 단일 텍스트 또는 텍스트 리스트
+            batch_size: 모델 내부 배치 크기
+
+        Returns:
+            단일 텍스트면 벡터, 리스트면 벡터 리스트
+        """
+        single = isinstance(texts, str)
+        text_list = [texts] if single else list(texts)
+        if not text_list:
+            return []
+
+        self.stats['encode_calls'] += 1
+        self.stats['texts_encoded'] += len(text_list)
+
+        embeddings = None
+        if self.uses_daemon():
+            try:
+                embeddings = self._daemon.encode(text_list, self.model_name)
+            except RuntimeError as e:
+                # 데몬이 요청을 처리하지 못함 (데몬은 정상) → 이번 요청만 로컬 모델 사용
+                logger.warning(f"임베딩 데몬 요청 실패, 이번 요청만 로컬 모델 사용: {e}")
+            except Exception as e:
+                logger.warning(f"임베딩 데몬 호출 실패, 로컬 모델 사용: {e}")
+                self._use_daemon = False
+
+        if embeddings is None:
+            vectors = self.model.encode(text_list, batch_size=batch_size)
+            embeddings = [vector.tolist() if hasattr(vector, 'tolist') else list(vector) for vector in vectors]
+
+        return embeddings[0] if single else embeddings
+
+    async def encode_async(self, texts: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
+        """
+        비동기 인코딩 (이벤트 루프 비차단)
+        - 같은 시점에 들어온 요청들을 하나의 배치로 묶어 스레드 풀에서 인코딩
+
+        Args:
+            texts: 단일 텍스트 또는 텍스트 리스트
+
+        Returns:
+            단일 텍스트면 벡터, 리스트면 벡터 리스트
+        """
+        single = isinstance(texts, str)
+        text_list = [texts] if single else list(texts)
+        if not text_list:
+            return []
+
+        loop = asyncio.get_running_loop()
+        self._ensure_batcher(loop)
+
+        future = loop.create_future()
+        await self._queue.put((text_list, future))
+        embeddings = await future
+
+        return embeddings[0] if single else embeddings
+
+    def _ensure_batcher(self, loop: asyncio.AbstractEventLoop):
+        """현재 이벤트 루프용 배치 작업 시작 (asyncio.run 반복 호출 대응)"""
+        if self._batch_loop is loop and self._batch_task is not None and not self._batch_task.done():
+            return
+        self._batch_loop = loop
+        self._queue = asyncio.Queue()
+        self._batch_task = loop.create_task(self._batch_worker(self._queue))
+
+    async def _batch_worker(self, queue: asyncio.Queue):
+        """대기 중인 요청을 모아 한 번에 인코딩"""
+        loop = asyncio.get_running_loop()
+        while True:
+            requests = [await queue.get()]
+            total = len(requests[0][0])
+
+            # 배치 윈도우 동안 추가 요청 수집
+            deadline = loop.time() + self.batch_window
+            while total < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                requests.append(request)
+                total += len(request[0])
+
+            batch = [text for text_list, _ in requests for text in text_list]
+            self.stats['batches'] += 1
+
+            try:
+                embeddings = await loop.run_in_executor(self._executor, self.encode, batch)
+            except Exception as e:
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for text_list, future in requests:
+                if not future.done():
+                    future.set_result(embeddings[offset:offset + len(text_list)])
+                offset += len(text_list)
+
+    def get_dimension(self) -> int:
+        """임베딩 차원"""
+        return self.model.get_sentence_embedding_dimension()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """서비스 통계"""
+        return {
+            'model_name': self.model_name,
+            'model_loaded': self._model is not None,
+            'daemon': self._use_daemon,
+            **self.stats
+        }
+
+# 모델명별 전역 서비스 인스턴스
+_services: Dict[str, EmbeddingModelService] = {}
+_services_lock = threading.Lock()
+
+def get_embedding_service(model_name: Optional[str] = None, **kwargs) -> EmbeddingModelService:
+    """
+    모델명별 공유 임베딩 서비스 반환 (싱글톤)
+
+    Args:
+        model_name: 모델명 (None이면 기본 모델)
+        **kwargs: 최초 생성 시 EmbeddingModelService 옵션
+
+    Returns:
+        EmbeddingModelService 인스턴스
+    """
+    name = normalize_model_name(model_name)
+    with _services_lock:
+        if name not in _services:
+            _services[name] = EmbeddingModelService(name, **kwargs)
+        return _services[name]
+
+async def _handle_daemon_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """데몬 요청 처리: {"model": ..., "texts": [...]} → {"embeddings": [...]}"""
+    try:
+        line = await reader.readline()
+        request = json.loads(line.decode('utf-8'))
+        service = get_embedding_service(request.get('model'), daemon_socket="")
+        embeddings = await service.encode_async(request['texts'])
+        response = {"embeddings": embeddings}
+    except Exception as e:
+        response = {"error": str(e)}
+    writer.write((json.dumps(response) + "\n").encode('utf-8'))
+    await writer.drain()
+    writer.close()
+
+async def serve_daemon(socket_path: str = DEFAULT_DAEMON_SOCKET, model_names: Optional[List[str]] = None):
+    """
+    임베딩 데몬 실행 (모델 상주)
+
+    Args:
+        socket_path: Unix 소켓 경로
+        model_names: 미리 로드할 모델명 리스트
+    """
+    for model_name in model_names or [DEFAULT_MODEL_NAME]:
+        get_embedding_service(model_name, daemon_socket="").load()
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    server = await asyncio.start_unix_server(_handle_daemon_client, path=socket_path, limit=DAEMON_STREAM_LIMIT)
+    logger.info(f"임베딩 데몬 시작: {socket_path}")
+    print(f"✅ 임베딩 데몬 실행 중: {socket_path} (EMBEDDING_DAEMON_SOCKET={socket_path} 설정 후 사용)")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+def main():
+    """커맨드라인 인터페이스"""
+    parser = argparse.ArgumentParser(description="공유 임베딩 모델 데몬")
+    parser.add_argument("--serve", action="store_true", help="Unix 소켓 데몬 실행")
+    parser.add_argument("--socket", default=os.getenv(DAEMON_SOCKET_ENV, DEFAULT_DAEMON_SOCKET), help="소켓 경로")
+    parser.add_argument("--model", action="append", help="미리 로드할 모델명 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.serve:
+        try:
+            asyncio.run(serve_daemon(args.socket, args.model))
+        except KeyboardInterrupt:
+            print("\n임베딩 데몬 종료")
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+생성 시간: 2026-10-18 17:31:05
+핵심 내용: 내용 주소 기반 LLM 응답 디스크 캐시 (SQLite 단일 파일, 크기 기반 LRU 제거, --cache=read|write|off)
+상세 내용:
+    - make_cache_key 함수: (모델, 시스템 프롬프트, 사용자 프롬프트, 옵션)의 정규화 JSON sha256
+    - options_fingerprint 함수: ClaudeCodeOptions 등 옵션 객체 → 키용 딕셔너리 (콜백/stderr 등 비의미 필드 제외)
+    - LLMResponseCache 클래스: responses 테이블 (key, value(pickle), size, created_at, accessed_at)
+      * get / put: 스레드 안전 (연결 1개 + 잠금), 손상 항목은 삭제 후 미스 처리
+      * 총 크기가 max_bytes를 넘으면 마지막 접근이 오래된 항목부터 90%까지 제거
+    - 모드: read (적중 시 재사용 + 미스 저장), write (항상 새로 호출 후 덮어쓰기), off (캐시 미사용)
+    - get_llm_cache / configure_llm_cache 함수: 프로세스 공용 캐시 (LLM_CACHE, LLM_CACHE_PATH, LLM_CACHE_MAX_MB 환경변수 기본값)
+    - apply_cache_flag 함수: sys.argv 기반 스크립트용 --cache=MODE / --cache MODE 인자 처리
+    - 캐시 값은 로컬 파일에만 저장되는 pickle (신뢰할 수 없는 캐시 파일은 사용하지 말 것)
+상태:
+주소: shared/llm_cache
+참조: shared/llm_gateway (LLMGateway.run의 cache_key)
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CACHE_MODES = ("read", "write", "off")
+CACHE_MODE_ENV = "LLM_CACHE"
+CACHE_PATH_ENV = "LLM_CACHE_PATH"
+CACHE_MAX_MB_ENV = "LLM_CACHE_MAX_MB"
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "llm_response_cache" / "responses.sqlite3"
+DEFAULT_MAX_MB = 512
+EVICT_TARGET_RATIO = 0.9
+
+# 응답 내용과 무관한 옵션 필드 (디버그 출력 대상 등)
+_IGNORED_OPTION_FIELDS = ("debug_stderr", "stderr")
+
+
+def options_fingerprint(options: Any) -> Dict[str, Any]:
+    """옵션 객체를 캐시 키용 딕셔너리로 변환 (호출 가능 객체 / 비의미 필드 제외)"""
+    if options is None:
+        return {}
+    if dataclasses.is_dataclass(options):
+        items = {field.name: getattr(options, field.name) for field in dataclasses.fields(options)}
+    elif isinstance(options, dict):
+        items = dict(options)
+    else:
+        items = dict(vars(options))
+    return {key: value for key, value in items.items()
+            if key not in _IGNORED_OPTION_FIELDS and not callable(value)}
+
+
+def make_cache_key(model: Optional[str], system_prompt: Optional[str], prompt: str,
+                   options: Optional[Dict[str, Any]] = None) -> str:
+    """(모델, 시스템 프롬프트, 사용자 프롬프트, 옵션)의 sha256 키"""
+    payload = json.dumps([model, system_prompt, prompt, options or {}],
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite 단일 파일 LLM 응답 캐시"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024, mode: str = "read"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"알 수 없는 캐시 모드: {mode} (read|write|off)")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+            conn.commit()
+            self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없거나 손상되었으면 None)"""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            try:
+                value = pickle.loads(row[0])
+            except Exception:
+                self._delete(conn, key)
+                conn.commit()
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any):
+        """캐시 저장 (같은 키는 덮어쓰기, 저장 후 크기 초과 시 오래된 항목 제거)"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            self._delete(conn, key)
+            conn.execute(
+                "INSERT INTO responses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(blob), len(blob), now, now)
+            )
+            self._total_bytes += len(blob)
+            if self._total_bytes > self.max_bytes:
+                self._evict(conn, int(self.max_bytes * EVICT_TARGET_RATIO))
+            conn.commit()
+
+    def _delete(self, conn: sqlite3.Connection, key: str):
+        row = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= row[0]
+
+    def _evict(self, conn: sqlite3.Connection, target_bytes: int):
+        """마지막 접근이 오래된 항목부터 target_bytes 이하가 될 때까지 제거"""
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if self._total_bytes <= target_bytes:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connection()
+            entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"mode": self.mode, "hits": self.hits, "misses": self.misses,
+                "entries": entries, "bytes": self._total_bytes, "path": str(self.path)}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_mode: Optional[str] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """프로세스 공용 캐시 (모드가 off면 None)"""
+    global _cache, _cache_mode
+    with _cache_lock:
+        if _cache_mode is None:
+            _cache_mode = os.getenv(CACHE_MODE_ENV, "off")
+            if _cache_mode not in CACHE_MODES:
+                print(f"⚠️ 알 수 없는 {CACHE_MODE_ENV} 값: {_cache_mode}, 캐시 미사용")
+                _cache_mode = "off"
+        if _cache_mode == "off":
+            return None
+        if _cache is None:
+            _cache = LLMResponseCache(
+                path=os.getenv(CACHE_PATH_ENV) or DEFAULT_CACHE_PATH,
+                max_bytes=int(float(os.getenv(CACHE_MAX_MB_ENV, DEFAULT_MAX_MB)) * 1024 * 1024),
+                mode=_cache_mode
+            )
+        return _cache
+
+
+def configure_llm_cache(mode: Optional[str] = None, path=None, max_mb: Optional[float] = None) -> Optional[LLMResponseCache]:
+    """
+    공용 캐시 설정 변경 (지정하지 않은 값은 환경변수 / 기본값)
+
+    Raises:
+        ValueError: 알 수 없는 모드
+    """
+    global _cache, _cache_mode
+    if mode is not None and mode not in CACHE_MODES:
+        raise ValueError(f"알 수 없는 캐시 모드: {mode} (read|write|off)")
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+        _cache_mode = mode or os.getenv(CACHE_MODE_ENV, "off")
+        if path is not None:
+            os.environ[CACHE_PATH_ENV] = str(path)
+        if max_mb is not None:
+            os.environ[CACHE_MAX_MB_ENV] = str(max_mb)
+    return get_llm_cache()
+
+
+def apply_cache_flag(argv: List[str]) -> List[str]:
+    """
+    인자 목록에서 --cache=MODE / --cache MODE를 꺼내 공용 캐시에 적용하고 나머지 인자 반환
+
+    Raises:
+        SystemExit: 모드가 없거나 알 수 없는 경우
+    """
+    remaining = []
+    mode = None
+    args = iter(argv)
+    for arg in args:
+        if arg.startswith("--cache="):
+            mode = arg.split("=", 1)[1]
+        elif arg == "--cache":
+            mode = next(args, "")
+        else:
+            remaining.append(arg)
+
+    if mode is not None:
+        if mode not in CACHE_MODES:
+            print(f"❌ --cache 값은 read|write|off 중 하나여야 합니다: {mode!r}")
+            raise SystemExit(1)
+        cache = configure_llm_cache(mode)
+        if cache is not None:
+            print(f"💾 LLM 응답 캐시: {mode} ({cache.path})")
+    return remaining
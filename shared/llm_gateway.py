@@ -0,0 +1,388 @@
+"""
+생성 시간: 2026-10-18 16:58:40
+핵심 내용: 프로세스 공용 LLM 호출 게이트웨이 (전역 동시 요청 제한 + 토큰 버킷 속도 제한 + 지터 지수 백오프 + 호출별 지표)
+상세 내용:
+    - TokenBucket 클래스: 초당 보충량 / 최대 누적량 기반 요청 속도 제한 (재시도 가능 오류 발생 시 버킷을 비워 전체 속도 완화)
+    - LLMGateway 클래스: 모든 LLM 호출이 거치는 단일 관문
+      * run 메서드: 임의의 비동기 호출을 슬롯 + 토큰 획득 후 실행, 재시도 가능 오류는 full jitter 지수 백오프로 재시도
+      * query_messages 메서드: claude_code_sdk query() 메시지 수집 (ResultMessage.is_error도 재시도 대상)
+      * 재시도 대상: ProcessError, CLIJSONDecodeError, CLIConnectionError (CLINotFoundError 제외), LLMResultError
+      * 지표: 호출별 라벨 / 대기 / 지연 / 시도 횟수 / 비용(total_cost_usd) / 토큰 사용량, summary / format_summary 집계
+        (캐시 적중은 cache_hits로만 집계, 호출 수 / 지연 통계에서 제외)
+    - percentile 함수: 최근접 순위(nearest-rank) 백분위수
+    - get_llm_gateway / configure_llm_gateway 함수: 프로세스 싱글톤 (LLM_MAX_CONCURRENT, LLM_REQUESTS_PER_MINUTE, LLM_BURST 환경변수 기본값)
+    - 동기화 객체는 실행 중인 이벤트 루프별로 생성 (asyncio.run을 여러 번 호출하는 스크립트 대응)
+    - cache_key를 주면 shared.llm_cache 응답 캐시 사용 (read 모드 적중 시 슬롯/토큰 없이 즉시 반환, 성공 결과만 저장)
+      * cacheable: 결과 저장 여부 판정 (빈 응답 / 형식 오류 응답이 재실행마다 재생되지 않도록)
+      * bypass_cache: 캐시 조회 생략 후 새로 호출, 유효한 결과로 기존 항목 덮어쓰기 (같은 프롬프트 재시도 경로용)
+      query_messages는 (모델, 시스템 프롬프트, 프롬프트, 옵션)으로 키 생성 (resume / continue_conversation 대화는 제외),
+      텍스트 블록이 없는 응답은 저장하지 않음
+상태:
+주소: shared/llm_gateway
+참조: extraction-system/extract_enhanced_node_content (TokenBucket, RateLimitedProvider 일반화)
+"""
+
+import asyncio
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, TypeVar
+
+from shared.llm_cache import get_llm_cache, make_cache_key, options_fingerprint
+
+try:
+    from claude_code_sdk import query as sdk_query
+    from claude_code_sdk import CLIConnectionError, CLIJSONDecodeError, CLINotFoundError, ProcessError
+    CLAUDE_SDK_AVAILABLE = True
+except ImportError:
+    sdk_query = None
+    CLIConnectionError = CLIJSONDecodeError = CLINotFoundError = ProcessError = None
+    CLAUDE_SDK_AVAILABLE = False
+
+T = TypeVar("T")
+
+MAX_CONCURRENT_ENV = "LLM_MAX_CONCURRENT"
+REQUESTS_PER_MINUTE_ENV = "LLM_REQUESTS_PER_MINUTE"
+BURST_ENV = "LLM_BURST"
+
+
+class LLMResultError(Exception):
+    """응답은 받았지만 결과가 오류인 경우 (ResultMessage.is_error)"""
+
+
+RETRYABLE_ERRORS = tuple(
+    error for error in (ProcessError, CLIJSONDecodeError, CLIConnectionError) if error is not None
+) + (LLMResultError,)
+NON_RETRYABLE_ERRORS = tuple(error for error in (CLINotFoundError,) if error is not None)
+
+
+class TokenBucket:
+    """
+    토큰 버킷 요청 속도 제한
+    - rate: 초당 토큰 보충량, capacity: 최대 누적 토큰 (순간 허용량)
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """토큰 1개 획득 (부족하면 보충될 때까지 대기), 대기 시간(초) 반환"""
+        started_at = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return now - started_at
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def drain(self):
+        """남은 토큰 제거 (상류 오류 시 모든 호출자의 다음 요청을 늦춤)"""
+        self.tokens = 0.0
+        self.updated_at = time.monotonic()
+
+
+class CallMetric(NamedTuple):
+    """LLM 호출 1건 지표"""
+    label: str
+    wait: float             # 슬롯 + 토큰 대기 누적 (초)
+    latency: float          # 호출 실행 시간 누적 (초, 백오프 제외)
+    attempts: int
+    success: bool
+    cost_usd: float
+    input_tokens: int
+    output_tokens: int
+    error: str
+    cached: bool = False
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """정렬된 값의 최근접 순위 백분위수 (예: fraction=0.95 → p95, 빈 목록이면 0.0)"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(len(sorted_values) - 1, max(0, rank - 1))]
+
+
+class LLMGateway:
+    """모든 LLM 호출이 거치는 프로세스 공용 게이트웨이"""
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        requests_per_minute: float = 60,
+        burst: int = 4,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        history_size: int = 1000
+    ):
+        """
+        Args:
+            max_concurrent: 동시에 진행 중인 호출 수 상한
+            requests_per_minute: 토큰 버킷 보충 속도 (0이면 속도 제한 없음)
+            burst: 토큰 버킷 최대 누적량 (순간 허용 요청 수)
+            max_retries: 재시도 가능 오류의 최대 재시도 횟수
+            backoff_base / backoff_max: 백오프 상한 = min(backoff_max, backoff_base * 2^시도)
+            history_size: 보관할 최근 호출 지표 수
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.calls = deque(maxlen=history_size)
+        self.totals = {"calls": 0, "failures": 0, "retries": 0, "cache_hits": 0, "wait": 0.0, "latency": 0.0,
+                       "cost_usd": 0.0, "input_tokens": 0, "output_tokens": 0}
+        self.in_flight = 0
+
+        self._loop = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._bucket: Optional[TokenBucket] = None
+
+    def _primitives(self):
+        """실행 중인 이벤트 루프용 세마포어 / 토큰 버킷 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._bucket = (TokenBucket(rate=self.requests_per_minute / 60.0, capacity=self.burst)
+                            if self.requests_per_minute else None)
+        return self._semaphore, self._bucket
+
+    def backoff_delay(self, attempt: int) -> float:
+        """full jitter 지수 백오프: 0 ~ min(backoff_max, backoff_base * 2^attempt) 균등 분포"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def run(self, call: Callable[[], Awaitable[T]], label: str = "llm",
+                  on_result: Optional[Callable[[T], Dict[str, Any]]] = None,
+                  cache_key: Optional[str] = None,
+                  cacheable: Optional[Callable[[T], bool]] = None,
+                  bypass_cache: bool = False) -> T:
+        """
+        호출 실행 (슬롯 + 토큰 획득 → 실행 → 재시도 가능 오류면 슬롯 반납 후 백오프)
+
+        Args:
+            call: 매 시도마다 새 코루틴을 만드는 함수
+            label: 지표 라벨
+            on_result: 결과에서 비용/토큰 지표를 뽑는 함수 (cost_usd, input_tokens, output_tokens)
+            cache_key: 응답 캐시 키 (None이면 캐시 미사용, 결과는 pickle 가능해야 함)
+            cacheable: 결과를 캐시에 저장할지 판정하는 함수 (None이면 성공 결과 모두 저장)
+            bypass_cache: True면 캐시를 읽지 않고 새로 호출 (저장 가능한 결과면 기존 항목 덮어쓰기)
+
+        Raises:
+            마지막 시도의 예외 (재시도 불가 오류는 즉시)
+        """
+        cache = get_llm_cache() if cache_key else None
+        if cache is not None and cache.mode == "read" and not bypass_cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self._record(label, 0.0, 0.0, 0, True, {}, "", cached=True)
+                return cached
+
+        semaphore, bucket = self._primitives()
+        wait = latency = 0.0
+        attempt = 0
+        last_error: Optional[BaseException] = None
+
+        while True:
+            queued_at = time.monotonic()
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+                started_at = time.monotonic()
+                wait += started_at - queued_at
+                self.in_flight += 1
+                try:
+                    result = await call()
+                    latency += time.monotonic() - started_at
+                    usage = on_result(result) if on_result else {}
+                    self._record(label, wait, latency, attempt + 1, True, usage, "")
+                    if cache is not None and (cacheable is None or cacheable(result)):
+                        try:
+                            cache.put(cache_key, result)
+                        except Exception as e:
+                            print(f"⚠️ LLM 응답 캐시 저장 실패 [{label}]: {e}")
+                    return result
+                except NON_RETRYABLE_ERRORS as e:
+                    latency += time.monotonic() - started_at
+                    self._record(label, wait, latency, attempt + 1, False, {}, repr(e))
+                    raise
+                except RETRYABLE_ERRORS as e:
+                    latency += time.monotonic() - started_at
+                    last_error = e
+                    if bucket is not None:
+                        bucket.drain()
+                except BaseException as e:
+                    latency += time.monotonic() - started_at
+                    self._record(label, wait, latency, attempt + 1, False, {}, repr(e))
+                    raise
+                finally:
+                    self.in_flight -= 1
+
+            if attempt >= self.max_retries:
+                self._record(label, wait, latency, attempt + 1, False, {}, repr(last_error))
+                raise last_error
+            delay = self.backoff_delay(attempt)
+            print(f"⚠️ LLM 호출 재시도 예정 [{label}] {attempt + 1}/{self.max_retries}: "
+                  f"{type(last_error).__name__}, {delay:.1f}초 후")
+            self.totals["retries"] += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def query_messages(self, prompt: str, options: Any = None, label: str = "llm",
+                             cacheable: Optional[Callable[[List[Any]], bool]] = None,
+                             bypass_cache: bool = False) -> List[Any]:
+        """
+        claude_code_sdk query() 실행 후 메시지 목록 반환
+
+        Args:
+            cacheable: 캐시 저장 조건 추가 판정 (텍스트가 없는 응답은 항상 저장하지 않음)
+            bypass_cache: 캐시 조회 없이 새로 호출 (재시도 경로)
+
+        Raises:
+            ImportError: claude_code_sdk가 없는 경우
+            LLMResultError: 재시도 후에도 ResultMessage.is_error인 경우
+        """
+        if not CLAUDE_SDK_AVAILABLE:
+            raise ImportError("claude_code_sdk를 찾을 수 없습니다. Claude Code에서 실행해주세요.")
+
+        async def collect() -> List[Any]:
+            messages = []
+            async for message in sdk_query(prompt=prompt, options=options):
+                messages.append(message)
+            result = _result_message(messages)
+            if result is not None and getattr(result, "is_error", False):
+                raise LLMResultError(f"{getattr(result, 'subtype', 'error')} (session: {getattr(result, 'session_id', '?')})")
+            return messages
+
+        def should_cache(messages: List[Any]) -> bool:
+            return message_text(messages) != "" and (cacheable is None or cacheable(messages))
+
+        return await self.run(collect, label, on_result=_usage_from_messages, cache_key=_query_cache_key(prompt, options),
+                              cacheable=should_cache, bypass_cache=bypass_cache)
+
+    def _record(self, label: str, wait: float, latency: float, attempts: int, success: bool,
+                usage: Dict[str, Any], error: str, cached: bool = False):
+        metric = CallMetric(
+            label, wait, latency, attempts, success,
+            float(usage.get("cost_usd") or 0.0),
+            int(usage.get("input_tokens") or 0),
+            int(usage.get("output_tokens") or 0),
+            error,
+            cached
+        )
+        self.calls.append(metric)
+        if cached:
+            # 캐시 적중은 실제 호출이 아니므로 호출 수 / 지연 / 비용 집계에서 제외
+            self.totals["cache_hits"] += 1
+            return
+        self.totals["calls"] += 1
+        self.totals["failures"] += 0 if success else 1
+        self.totals["wait"] += wait
+        self.totals["latency"] += latency
+        self.totals["cost_usd"] += metric.cost_usd
+        self.totals["input_tokens"] += metric.input_tokens
+        self.totals["output_tokens"] += metric.output_tokens
+
+    def summary(self) -> Dict[str, Any]:
+        """누적 지표 + 최근 호출 지연 분포 (캐시 적중 제외)"""
+        latencies = sorted(metric.latency for metric in self.calls if not metric.cached)
+        summary = dict(self.totals)
+        summary["avg_latency"] = self.totals["latency"] / self.totals["calls"] if self.totals["calls"] else 0.0
+        summary["p95_latency"] = percentile(latencies, 0.95)
+        return summary
+
+    def format_summary(self) -> str:
+        summary = self.summary()
+        return (f"LLM 호출 {summary['calls']}회 (실패 {summary['failures']}, 재시도 {summary['retries']}, "
+                f"캐시 적중 {summary['cache_hits']}), "
+                f"평균 {summary['avg_latency']:.1f}초 / p95 {summary['p95_latency']:.1f}초, "
+                f"대기 누적 {summary['wait']:.1f}초, 비용 ${summary['cost_usd']:.4f}")
+
+
+def _query_cache_key(prompt: str, options: Any) -> Optional[str]:
+    """query() 호출의 캐시 키 (이전 대화를 이어가는 호출은 캐시하지 않음)"""
+    if options is not None and (getattr(options, "resume", None) or getattr(options, "continue_conversation", False)):
+        return None
+    fingerprint = options_fingerprint(options)
+    return make_cache_key(fingerprint.pop("model", None), fingerprint.pop("system_prompt", None), prompt, fingerprint)
+
+
+def message_text(messages: List[Any]) -> str:
+    """query() 메시지들의 텍스트 블록을 이어 붙인 응답 본문 (앞뒤 공백 제거)"""
+    parts = []
+    for message in messages:
+        for block in getattr(message, "content", None) or []:
+            text = getattr(block, "text", None)
+            if isinstance(text, str):
+                parts.append(text)
+    return "".join(parts).strip()
+
+
+def _result_message(messages: List[Any]) -> Optional[Any]:
+    for message in reversed(messages):
+        if type(message).__name__ == "ResultMessage":
+            return message
+    return None
+
+
+def _usage_from_messages(messages: List[Any]) -> Dict[str, Any]:
+    """ResultMessage의 비용 / 토큰 사용량"""
+    result = _result_message(messages)
+    if result is None:
+        return {}
+    usage = getattr(result, "usage", None) or {}
+    return {
+        "cost_usd": getattr(result, "total_cost_usd", None) or 0.0,
+        # 프롬프트 캐시 생성/적중 토큰도 입력 토큰에 포함 (요청에 실린 전체 입력량)
+        "input_tokens": sum(usage.get(key) or 0 for key in
+                            ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")),
+        "output_tokens": usage.get("output_tokens", 0)
+    }
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """프로세스 공용 게이트웨이 (처음 호출 시 환경변수 기본값으로 생성)"""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = LLMGateway(
+                max_concurrent=int(os.getenv(MAX_CONCURRENT_ENV, "4")),
+                requests_per_minute=float(os.getenv(REQUESTS_PER_MINUTE_ENV, "60")),
+                burst=int(os.getenv(BURST_ENV, "4"))
+            )
+        return _gateway
+
+
+def configure_llm_gateway(**settings) -> LLMGateway:
+    """
+    공용 게이트웨이 설정 변경 (max_concurrent, requests_per_minute, burst, max_retries, backoff_base, backoff_max)
+    - 다음 호출부터 새 설정의 세마포어 / 토큰 버킷 사용
+    """
+    gateway = get_llm_gateway()
+    for key, value in settings.items():
+        if value is None:
+            continue
+        if not hasattr(gateway, key):
+            raise ValueError(f"알 수 없는 게이트웨이 설정: {key}")
+        setattr(gateway, key, max(1, value) if key == "max_concurrent" else value)
+    gateway._loop = None
+    return gateway
@@ -0,0 +1,122 @@
+"""
+생성 시간: 2026-10-18 15:48:02
+핵심 내용: 마크다운 헤딩 단일 패스 토크나이저 + 스택 기반 계층 구성 (헤더 기반 노드 생성 스크립트 공용)
+상세 내용:
+    - iter_headings 함수: 문서를 1회 훑으며 헤딩 라인을 (level, title, start, end) 스팬으로 yield
+      (level = '#' 개수 - 1, start/end = 헤딩 라인 시작/끝 오프셋)
+    - heading_sections 함수: 각 헤딩의 섹션 범위 계산 (다음 같은/상위 레벨 헤딩 직전까지, 스택으로 O(n))
+    - build_hierarchy 함수: 노드 목록에 parent_id / children_ids 설정 (가장 가까운 이전 상위 레벨 노드, 스택으로 O(n))
+    - first_heading 함수: 첫 번째 헤딩만 필요한 경우 (해당 헤딩에서 즉시 중단)
+상태:
+주소: shared/markdown_headings
+참조: 25-08-18/post_node_enhancer, 25-08-13/header_to_json_converter, extraction-system/node_generator, 25-08-19/md_to_json
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+
+class HeadingSpan(NamedTuple):
+    """헤딩 라인 1개"""
+    level: int      # '#' 개수 - 1 (# = 0, ## = 1, ...)
+    title: str
+    start: int      # 헤딩 라인 시작 오프셋
+    end: int        # 헤딩 라인 끝 오프셋 (줄바꿈 제외)
+
+
+class HeadingSection(NamedTuple):
+    """헤딩과 그 섹션 범위"""
+    heading: HeadingSpan
+    content_start: int  # 헤딩 라인 다음 위치
+    content_end: int    # 다음 같은/상위 레벨 헤딩 시작 (없으면 문서 끝)
+
+
+@lru_cache(maxsize=None)
+def _heading_pattern(max_hashes: Optional[int], require_space: bool) -> "re.Pattern":
+    hashes = f"#{{1,{max_hashes}}}" if max_hashes else "#+"
+    spacing = r"\s+" if require_space else r"\s*"
+    return re.compile(rf"(?P<hashes>{hashes}){spacing}(?P<title>.+)")
+
+
+def iter_headings(
+    text: str,
+    max_hashes: Optional[int] = 6,
+    require_space: bool = True,
+    allow_indent: bool = True
+) -> Iterator[HeadingSpan]:
+    """
+    헤딩 라인 스트리밍 (문서 1회 스캔)
+
+    Args:
+        text: 마크다운 텍스트
+        max_hashes: 허용하는 최대 '#' 개수 (None이면 제한 없음)
+        require_space: '#' 뒤 공백 필수 여부 (False면 "#Title"도 헤딩)
+        allow_indent: 앞쪽 공백이 있는 라인도 헤딩으로 볼지 여부
+
+    Yields:
+        HeadingSpan (문서 순서)
+    """
+    pattern = _heading_pattern(max_hashes, require_space)
+    offset = 0
+    for raw_line in text.split("\n"):
+        line_start = offset
+        offset += len(raw_line) + 1
+        line = raw_line.rstrip("\r")
+
+        body = line.strip() if allow_indent else line.rstrip()
+        if not body.startswith("#"):
+            continue
+        match = pattern.fullmatch(body)
+        if not match:
+            continue
+        title = match.group("title").strip()
+        if not title:
+            continue
+        yield HeadingSpan(len(match.group("hashes")) - 1, title, line_start, line_start + len(line))
+
+
+def first_heading(text: str, **options) -> Optional[HeadingSpan]:
+    """첫 번째 헤딩 (없으면 None)"""
+    return next(iter_headings(text, **options), None)
+
+
+def heading_sections(text: str, headings: Optional[List[HeadingSpan]] = None, **options) -> List[HeadingSection]:
+    """
+    각 헤딩의 섹션 범위 (문서 순서)
+    - 섹션은 다음 같은 레벨 이상(레벨 값이 같거나 작은) 헤딩 직전에서 끝남
+    - 열린 섹션을 스택으로 관리하여 헤딩 수에 선형
+    """
+    headings = list(iter_headings(text, **options)) if headings is None else headings
+    content_ends = [len(text)] * len(headings)
+    open_indices: List[int] = []
+    for index, heading in enumerate(headings):
+        while open_indices and headings[open_indices[-1]].level >= heading.level:
+            content_ends[open_indices.pop()] = heading.start
+        open_indices.append(index)
+
+    sections = []
+    for heading, content_end in zip(headings, content_ends):
+        content_start = min(heading.end + 1, len(text))
+        sections.append(HeadingSection(heading, content_start, max(content_start, content_end)))
+    return sections
+
+
+def build_hierarchy(nodes: List[Dict[str, Any]], level_key: str = "level", id_key: str = "id") -> List[Dict[str, Any]]:
+    """
+    노드 목록(문서 순서)에 parent_id / children_ids 설정
+    - 부모 = 자신보다 레벨이 낮은 가장 가까운 이전 노드
+    - 스택에는 레벨이 증가하는 조상 후보만 남으므로 노드마다 뒤로 훑지 않음
+    """
+    stack: List[Dict[str, Any]] = []
+    for node in nodes:
+        node["parent_id"] = None
+        node["children_ids"] = []
+        level = node.get(level_key, 0)
+        while stack and stack[-1].get(level_key, 0) >= level:
+            stack.pop()
+        if stack:
+            node["parent_id"] = stack[-1][id_key]
+            stack[-1]["children_ids"].append(node[id_key])
+        stack.append(node)
+    return nodes
@@ -0,0 +1,272 @@
+"""
+생성 시간: 2026-10-18 16:21:37
+핵심 내용: 노드 정보 문서(*_info.md) 단일 패스 파서 + 프로세스 공용 캐시 + 섹션 단위 제자리 갱신
+상세 내용:
+    - 문서 구조: # 속성 (key: value) / # 추출 (## 핵심 내용, ## 상세 핵심 내용, ...) / # 내용 / # 구성 (자식 문서 파일명)
+    - NodeDocument 클래스: 문서를 1회 훑으며 섹션 / 추출 하위 섹션 / 속성의 문자 오프셋 맵 생성
+      (섹션 경계는 구조 헤더 라인만 인정 → 내용 섹션 안의 "# 제목" 같은 마크다운 헤더는 본문으로 유지)
+    - section / subsection / get_property / process_status / composition_files: 오프셋 맵 기반 조회 (문자열 누적 없음)
+    - load_node_document 함수: (경로, mtime, 크기) 기준 프로세스 공용 캐시 (같은 실행 내 재읽기 제거)
+    - replace_section / set_property 함수: 바뀐 바이트 범위부터만 파일에 덮어쓰기 (길이가 같으면 해당 범위만, 내용이 같으면 쓰기 생략)
+      후 캐시를 새 내용으로 갱신
+상태:
+주소: shared/node_document
+참조: 25-08-15/neon_db_v2, 25-08-18/node_document_processor, extraction-system/extract_enhanced_node_content,
+      25-08-14/modules/dialectical_synthesis_processor_v7, 25-08-14/modules/parent_node_processor
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+SECTION_NAMES = ("속성", "추출", "내용", "구성")
+EXTRACTION_SUBSECTIONS = ("핵심 내용", "상세 핵심 내용", "상세 내용", "주요 화제", "부차 화제")
+PROPERTY_SECTION = "속성"
+EXTRACTION_SECTION = "추출"
+
+_PROPERTY_LINE_RE = re.compile(r"([A-Za-z_][\w\-]*)\s*:(.*)")
+
+CACHE_MAX_DOCUMENTS = 1024
+
+
+class SectionSpan(NamedTuple):
+    """섹션 1개의 위치 (문자 오프셋)"""
+    name: str
+    header_start: int   # 헤더 라인 시작
+    start: int          # 본문 시작 (헤더 다음 줄)
+    end: int            # 본문 끝 (다음 섹션 헤더 라인 시작, 없으면 문서 끝)
+
+
+class PropertySpan(NamedTuple):
+    """속성 라인 1개 (key: value)"""
+    value: str
+    start: int          # 라인 시작
+    end: int            # 라인 끝 (줄바꿈 제외)
+
+
+class NodeDocument:
+    """노드 정보 문서 1개의 섹션 오프셋 맵 (읽기 전용)"""
+
+    def __init__(self, text: str, path: Optional[str] = None):
+        self.text = text
+        self.path = path
+        self.sections: Dict[str, SectionSpan] = {}
+        self.subsections: Dict[str, SectionSpan] = {}
+        self.properties: Dict[str, PropertySpan] = {}
+        self._parse()
+
+    def _parse(self):
+        text = self.text
+        length = len(text)
+        current: Optional[Tuple[str, int, int]] = None
+        current_sub: Optional[Tuple[str, int, int]] = None
+
+        def close(opened, end, target):
+            if opened is not None:
+                name, header_start, start = opened
+                target.setdefault(name, SectionSpan(name, header_start, start, max(start, end)))
+
+        position = 0
+        while True:
+            newline = text.find("\n", position)
+            line_end = length if newline == -1 else newline
+            next_position = min(line_end + 1, length)
+            stripped = text[position:line_end].strip()
+
+            if stripped.startswith("# ") and stripped[2:].strip() in SECTION_NAMES:
+                close(current_sub, position, self.subsections)
+                close(current, position, self.sections)
+                current_sub = None
+                current = (stripped[2:].strip(), position, next_position)
+            elif (current is not None and current[0] == EXTRACTION_SECTION
+                  and stripped.startswith("## ") and stripped[3:].strip() in EXTRACTION_SUBSECTIONS):
+                close(current_sub, position, self.subsections)
+                current_sub = (stripped[3:].strip(), position, next_position)
+            elif current is None or current[0] == PROPERTY_SECTION:
+                # 속성: '# 속성' 섹션 + 첫 섹션 헤더 이전 줄 (헤더 위에 추가된 속성 라인 포함)
+                match = _PROPERTY_LINE_RE.fullmatch(stripped)
+                if match:
+                    raw_line = text[position:line_end].rstrip("\r")
+                    self.properties.setdefault(
+                        match.group(1),
+                        PropertySpan(match.group(2).strip(), position, position + len(raw_line))
+                    )
+
+            if newline == -1:
+                break
+            position = next_position
+
+        close(current_sub, length, self.subsections)
+        close(current, length, self.sections)
+
+    def has_section(self, name: str) -> bool:
+        return name in self.sections
+
+    def section(self, name: str) -> str:
+        """섹션 본문 (앞뒤 공백 제거, 없으면 빈 문자열)"""
+        span = self.sections.get(name)
+        return self.text[span.start:span.end].strip() if span else ""
+
+    def subsection(self, name: str) -> str:
+        """'# 추출' 아래 하위 섹션 본문 (앞뒤 공백 제거, 없으면 빈 문자열)"""
+        span = self.subsections.get(name)
+        return self.text[span.start:span.end].strip() if span else ""
+
+    def extraction_preamble(self) -> str:
+        """'# 추출' 헤더와 첫 하위 섹션 사이의 본문"""
+        span = self.sections.get(EXTRACTION_SECTION)
+        if not span:
+            return ""
+        end = min((sub.header_start for sub in self.subsections.values()), default=span.end)
+        return self.text[span.start:end].strip()
+
+    def get_property(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        prop = self.properties.get(key)
+        return prop.value if prop else default
+
+    @property
+    def process_status(self) -> bool:
+        return (self.get_property("process_status") or "").lower() == "true"
+
+    def composition_files(self) -> List[str]:
+        """'# 구성' 섹션의 자식 문서 파일명 목록"""
+        files = []
+        for line in self.section("구성").split("\n"):
+            line = line.strip()
+            if line and not line.startswith("#") and line.endswith(".md"):
+                files.append(line)
+        return files
+
+
+def section_lines(text: str, skip_markers: Tuple[str, ...] = ("---",), skip_prefixes: Tuple[str, ...] = ()) -> str:
+    """섹션 본문에서 구분선 등 표시용 라인 제거 (앞뒤 공백 제거)"""
+    kept = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped in skip_markers or (skip_prefixes and stripped.startswith(skip_prefixes)):
+            continue
+        kept.append(line)
+    return "\n".join(kept).strip()
+
+
+# ==================== 프로세스 공용 캐시 ====================
+
+_cache: "OrderedDict[str, Tuple[int, int, NodeDocument]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _remember(path: str, document: NodeDocument, stat: Optional[os.stat_result] = None):
+    stat = stat or os.stat(path)
+    with _cache_lock:
+        _cache[path] = (stat.st_mtime_ns, stat.st_size, document)
+        _cache.move_to_end(path)
+        while len(_cache) > CACHE_MAX_DOCUMENTS:
+            _cache.popitem(last=False)
+
+
+def load_node_document(file_path) -> NodeDocument:
+    """
+    노드 정보 문서 로드 ((경로, mtime, 크기)가 같으면 캐시 재사용)
+
+    Raises:
+        FileNotFoundError / OSError: 파일을 읽을 수 없는 경우
+    """
+    path = os.path.abspath(str(file_path))
+    stat = os.stat(path)
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _cache.move_to_end(path)
+            return cached[2]
+
+    # 바이트 그대로 디코드 (줄바꿈 변환 없음 → 문자 오프셋과 파일 바이트 위치가 일치)
+    # 읽기 전 stat으로 등록 → 읽는 도중 파일이 바뀌었으면 다음 조회에서 다시 읽음
+    with open(path, "rb") as f:
+        document = NodeDocument(f.read().decode("utf-8"), path)
+    _remember(path, document, stat)
+    return document
+
+
+def clear_node_document_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+def _rewrite_range(document: NodeDocument, start: int, end: int, replacement: str) -> NodeDocument:
+    """문서의 [start, end) 문자 범위를 교체하고 바뀐 바이트 위치부터만 파일에 기록"""
+    text = document.text
+    if text[start:end] == replacement:
+        return document
+
+    byte_start = len(text[:start].encode("utf-8"))
+    old_bytes = text[start:end].encode("utf-8")
+    new_bytes = replacement.encode("utf-8")
+
+    with open(document.path, "r+b") as f:
+        f.seek(byte_start)
+        if len(new_bytes) == len(old_bytes):
+            f.write(new_bytes)
+        else:
+            # 길이가 바뀌면 교체 범위 + 뒤쪽만 다시 기록 (앞부분은 그대로)
+            f.write(new_bytes + text[end:].encode("utf-8"))
+            f.truncate()
+
+    updated = NodeDocument(text[:start] + replacement + text[end:], document.path)
+    _remember(document.path, updated)
+    return updated
+
+
+def replace_section(file_path, name: str, body: str) -> NodeDocument:
+    """
+    섹션 본문 교체 (헤더 라인은 유지, 섹션이 없으면 문서 끝에 추가)
+
+    Args:
+        file_path: 노드 정보 문서 경로
+        name: 섹션 이름 (예: "추출")
+        body: 새 본문 (헤더 바로 다음 줄부터 들어갈 내용, 끝 줄바꿈은 정규화)
+
+    Returns:
+        갱신된 NodeDocument
+    """
+    document = load_node_document(file_path)
+    span = document.sections.get(name)
+    body = body.rstrip("\n") + "\n"
+
+    if span is None:
+        text = document.text
+        separator = "" if not text or text.endswith("\n\n") else ("\n" if text.endswith("\n") else "\n\n")
+        return _rewrite_range(document, len(text), len(text), f"{separator}# {name}\n{body}")
+
+    # 헤더가 마지막 줄(줄바꿈 없음)이면 줄바꿈부터, 뒤에 다른 섹션이 있으면 빈 줄 1개로 구분
+    if span.start == len(document.text) and not document.text.endswith("\n"):
+        body = "\n" + body
+    if span.end < len(document.text):
+        body += "\n"
+    return _rewrite_range(document, span.start, span.end, body)
+
+
+def set_property(file_path, key: str, value: str) -> NodeDocument:
+    """
+    속성 값 설정 (기존 라인은 제자리 교체, 없으면 '# 속성' 섹션 끝 / 문서 앞에 추가)
+
+    Returns:
+        갱신된 NodeDocument
+    """
+    document = load_node_document(file_path)
+    line = f"{key}: {value}"
+    prop = document.properties.get(key)
+    if prop is not None:
+        return _rewrite_range(document, prop.start, prop.end, line)
+
+    span = document.sections.get(PROPERTY_SECTION)
+    if span is None:
+        return _rewrite_range(document, 0, 0, f"# {PROPERTY_SECTION}\n{line}\n\n")
+
+    # 마지막 속성 라인 다음 (속성이 없으면 헤더 바로 다음)
+    in_section = [p for p in document.properties.values() if span.start <= p.start < span.end]
+    if in_section:
+        insert_at = max(p.end for p in in_section)
+        return _rewrite_range(document, insert_at, insert_at, f"\n{line}")
+    return _rewrite_range(document, span.start, span.start, f"{line}\n")
@@ -0,0 +1,311 @@
+"""
+생성 시간: 2026-10-18 12:20:41
+핵심 내용: PDF 페이지 텍스트 영구 캐시 (pdfplumber 기반 추출기 공용)
+상세 내용:
+    - PageTextStore 클래스: (PDF 내용 해시, 추출 설정)별 단일 캐시 파일
+      (헤더 + 고정 크기 오프셋 테이블 + UTF-8 blob, mmap으로 읽기)
+    - get / put_many 메서드: 페이지 텍스트 조회 및 저장 (저장 시 파일 잠금)
+    - CachedPDFText 클래스: 캐시를 먼저 조회하고 미스일 때만 pdfplumber로 추출하는 read-through 래퍼
+    - page_text / iter_pages / all_pages 메서드: 페이지 단위 / 범위 / 전체 텍스트
+    - pdf_content_hash 함수: PDF 내용 sha256 (경로, mtime, 크기별 프로세스 내 메모)
+    - 저장 위치: PAGE_TEXT_STORE_DIR 환경변수, 기본 ~/.cache/knowledge_sherpa/page_text
+상태:
+주소: shared/page_text_store
+참조:
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+STORE_DIR_ENV = "PAGE_TEXT_STORE_DIR"
+DEFAULT_STORE_DIR = Path.home() / ".cache" / "knowledge_sherpa" / "page_text"
+
+# 파일 형식: 헤더(magic, version, page_count) + 페이지별 (offset, length, present) + blob
+_MAGIC = b"PTS1"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+_ENTRY = struct.Struct("<QIB3x")
+
+_hash_memo: Dict[Tuple[str, float, int], str] = {}
+_hash_lock = threading.Lock()
+
+def pdf_content_hash(pdf_path: str) -> str:
+    """
+    PDF 파일 내용 sha256 (파일명/위치가 바뀌어도 같은 캐시 사용)
+
+    Args:
+        pdf_path: PDF 경로
+
+    Returns:
+        16진수 해시 문자열
+    """
+    path = os.path.abspath(pdf_path)
+    stat = os.stat(path)
+    memo_key = (path, stat.st_mtime, stat.st_size)
+    with _hash_lock:
+        if memo_key in _hash_memo:
+            return _hash_memo[memo_key]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    content_hash = digest.hexdigest()
+
+    with _hash_lock:
+        _hash_memo[memo_key] = content_hash
+    return content_hash
+
+def settings_key(settings: Optional[Dict[str, Any]]) -> str:
+    """extract_text 설정을 캐시 키 문자열로 변환"""
+    canonical = json.dumps(settings or {}, sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+
+class PageTextStore:
+    """
+    PDF 1개 + 추출 설정 1개에 대한 페이지 텍스트 캐시 파일
+    - 읽기: mmap으로 오프셋 테이블과 blob을 직접 조회 (파일 전체를 메모리에 올리지 않음)
+    - 쓰기: blob 끝에 UTF-8 텍스트를 추가하고 테이블 항목 갱신 (fcntl 배타 잠금)
+    - 다른 프로세스가 추가한 페이지는 파일 크기 변화 감지 시 다시 매핑해 반영
+    """
+
+    def __init__(self, content_hash: str, page_count: int, settings: Optional[Dict[str, Any]] = None, store_dir: Optional[str] = None):
+        """
+        Args:
+            content_hash: PDF 내용 해시 (pdf_content_hash)
+            page_count: PDF 페이지 수
+            settings: page.extract_text() 인자 (캐시 키에 포함)
+            store_dir: 캐시 디렉토리 (None이면 PAGE_TEXT_STORE_DIR 또는 기본 경로)
+        """
+        self.page_count = page_count
+        self.settings = settings or {}
+        base_dir = Path(store_dir or os.getenv(STORE_DIR_ENV) or DEFAULT_STORE_DIR)
+        base_dir.mkdir(parents=True, exist_ok=True)
+        self.path = base_dir / f"{content_hash[:32]}-{settings_key(self.settings)}.pts"
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+        self._create_if_missing()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def open_existing(cls, content_hash: str, settings: Optional[Dict[str, Any]] = None, store_dir: Optional[str] = None) -> Optional["PageTextStore"]:
+        """
+        이미 만들어진 캐시 파일 열기 (페이지 수를 헤더에서 읽음, 없으면 None)
+        - 모든 페이지가 캐시되어 있으면 PDF를 열지 않고 처리 가능
+        """
+        base_dir = Path(store_dir or os.getenv(STORE_DIR_ENV) or DEFAULT_STORE_DIR)
+        path = base_dir / f"{content_hash[:32]}-{settings_key(settings)}.pts"
+        try:
+            with open(path, "rb") as f:
+                magic, version, page_count = _HEADER.unpack(f.read(_HEADER.size))
+        except (OSError, struct.error):
+            return None
+        if magic != _MAGIC or version != _VERSION:
+            return None
+        return cls(content_hash, page_count, settings, str(base_dir))
+
+    def _create_if_missing(self):
+        if self.path.exists():
+            return
+        tmp_path = self.path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, self.page_count))
+            f.write(b"\0" * (_ENTRY.size * self.page_count))
+        # 동시에 만들어도 한쪽 파일만 남도록 원자적 교체
+        os.replace(tmp_path, self.path)
+
+    def _ensure_mapped(self, refresh: bool = False):
+        if self._mmap is not None and not refresh:
+            return
+        size = self.path.stat().st_size
+        if self._mmap is not None and size == self._mapped_size:
+            return
+        if self._mmap is not None:
+            self._mmap.close()
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped_size = size
+
+    def _read_entry(self, page_index: int) -> Tuple[int, int, int]:
+        start = _HEADER.size + page_index * _ENTRY.size
+        return _ENTRY.unpack_from(self._mmap, start)
+
+    def get(self, page_index: int) -> Optional[str]:
+        """
+        캐시된 페이지 텍스트 조회
+
+        Args:
+            page_index: 0부터 시작하는 페이지 번호
+
+        Returns:
+            페이지 텍스트 (캐시에 없으면 None)
+        """
+        if not 0 <= page_index < self.page_count:
+            return None
+        with self._lock:
+            self._ensure_mapped()
+            offset, length, present = self._read_entry(page_index)
+            if not present:
+                # 다른 프로세스가 그 사이 추가했을 수 있으므로 크기 변화 시 재매핑 후 재확인
+                self._ensure_mapped(refresh=True)
+                offset, length, present = self._read_entry(page_index)
+            if not present:
+                self.stats["misses"] += 1
+                return None
+            if offset + length > self._mapped_size:
+                # 테이블은 공유 매핑으로 보이지만 blob이 매핑 범위 밖이면 재매핑
+                self._ensure_mapped(refresh=True)
+            self.stats["hits"] += 1
+            return self._mmap[offset:offset + length].decode("utf-8")
+
+    def put(self, page_index: int, text: str):
+        """페이지 텍스트 1개 저장"""
+        self.put_many({page_index: text})
+
+    def put_many(self, pages: Dict[int, str]):
+        """
+        여러 페이지 텍스트를 한 번의 잠금으로 저장
+
+        Args:
+            pages: {페이지 번호: 텍스트}
+        """
+        pages = {index: text for index, text in pages.items() if 0 <= index < self.page_count}
+        if not pages:
+            return
+        with self._lock, open(self.path, "r+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0, os.SEEK_END)
+                entries = []
+                for index, text in sorted(pages.items()):
+                    data = (text or "").encode("utf-8")
+                    entries.append((index, f.tell(), len(data)))
+                    f.write(data)
+                for index, offset, length in entries:
+                    f.seek(_HEADER.size + index * _ENTRY.size)
+                    f.write(_ENTRY.pack(offset, length, 1))
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            self._ensure_mapped(refresh=True)
+
+    def missing_pages(self, start: int = 0, end: Optional[int] = None) -> List[int]:
+        """[start, end) 범위에서 캐시되지 않은 페이지 번호 목록"""
+        end = self.page_count if end is None else min(end, self.page_count)
+        with self._lock:
+            self._ensure_mapped(refresh=True)
+            return [index for index in range(max(0, start), end) if not self._read_entry(index)[2]]
+
+    def close(self):
+        """mmap 해제"""
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+
+class CachedPDFText:
+    """
+    페이지 텍스트 read-through 래퍼
+    - 캐시 히트: PDF를 열지 않고 저장된 텍스트 반환
+    - 캐시 미스: pdfplumber로 해당 페이지만 추출 후 저장
+    - 컨텍스트 매니저로 사용 (with CachedPDFText(path) as pdf_text: ...)
+    """
+
+    def __init__(self, pdf_path: str, settings: Optional[Dict[str, Any]] = None, store_dir: Optional[str] = None):
+        """
+        Args:
+            pdf_path: PDF 경로
+            settings: page.extract_text() 인자 (예: {"layout": True})
+            store_dir: 캐시 디렉토리
+        """
+        self.pdf_path = str(pdf_path)
+        self.settings = settings or {}
+        self.content_hash = pdf_content_hash(self.pdf_path)
+        self._pdf = None
+        self.store = PageTextStore.open_existing(self.content_hash, self.settings, store_dir)
+        if self.store is None:
+            self.store = PageTextStore(self.content_hash, len(self._open_pdf().pages), self.settings, store_dir)
+
+    def _open_pdf(self):
+        if self._pdf is None:
+            import pdfplumber
+            self._pdf = pdfplumber.open(self.pdf_path)
+        return self._pdf
+
+    def __len__(self) -> int:
+        return self.store.page_count
+
+    @property
+    def page_count(self) -> int:
+        return self.store.page_count
+
+    def page_text(self, page_index: int) -> str:
+        """
+        페이지 텍스트 (extract_text()가 None이면 빈 문자열)
+
+        Args:
+            page_index: 0부터 시작하는 페이지 번호
+        """
+        text = self.store.get(page_index)
+        if text is None:
+            text = self._extract(page_index)
+            self.store.put(page_index, text)
+        return text
+
+    def _extract(self, page_index: int) -> str:
+        return self._open_pdf().pages[page_index].extract_text(**self.settings) or ""
+
+    def iter_pages(self, start: int = 0, end: Optional[int] = None, flush_every: int = 32) -> Iterator[Tuple[int, str]]:
+        """
+        [start, end) 범위 페이지를 (페이지 번호, 텍스트)로 순서대로 반환
+        - 미스 페이지는 flush_every개씩 모아 한 번에 저장
+        """
+        end = self.page_count if end is None else min(end, self.page_count)
+        pending: Dict[int, str] = {}
+        try:
+            for page_index in range(max(0, start), end):
+                text = self.store.get(page_index)
+                if text is None:
+                    text = self._extract(page_index)
+                    pending[page_index] = text
+                    if len(pending) >= flush_every:
+                        self.store.put_many(pending)
+                        pending = {}
+                yield page_index, text
+        finally:
+            self.store.put_many(pending)
+
+    def all_pages(self) -> List[str]:
+        """전체 페이지 텍스트 리스트"""
+        return [text for _, text in self.iter_pages()]
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 hit/miss 통계"""
+        return dict(self.store.stats)
+
+    def close(self):
+        """PDF 핸들과 mmap 해제"""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        self.store.close()
+
+    def __enter__(self) -> "CachedPDFText":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
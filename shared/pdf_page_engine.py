@@ -0,0 +1,194 @@
+"""
+생성 시간: 2026-10-18 13:02:17
+핵심 내용: 멀티 프로세스 PDF 페이지 텍스트 추출 엔진 (페이지 순서 보장 스트리밍)
+상세 내용:
+    - ParallelPageExtractor 클래스: 페이지 범위를 청크로 나눠 프로세스 풀 워커에서 추출
+    - iter_pages 메서드: (페이지 번호, 텍스트)를 페이지 순서대로 yield (앞 청크가 끝나는 즉시 소비 가능)
+    - extract_all / extract_pages 메서드: 전체 / 선택 페이지 일괄 추출
+    - 페이지 텍스트 캐시(page_text_store)와 연동: 캐시된 페이지는 워커로 보내지 않고, 추출 결과는 캐시에 저장
+    - _extract_chunk 함수: 워커 프로세스에서 pdfplumber 핸들을 재사용하며 청크 추출
+    - _extract_local 메서드: 현재 프로세스 추출은 추출기 소유 핸들 사용 (close()에서 해제)
+상태:
+주소: shared/pdf_page_engine
+참조: shared/page_text_store
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .page_text_store import PageTextStore, pdf_content_hash
+
+# 워커 프로세스별 열린 PDF (경로 → pdfplumber 문서), 청크마다 다시 열지 않음 (워커 종료 시 해제)
+_worker_documents: Dict[str, Any] = {}
+
+def _extract_chunk(pdf_path: str, page_indices: List[int], settings: Dict[str, Any]) -> List[Tuple[int, str]]:
+    """
+    워커 프로세스: 페이지 묶음 텍스트 추출 (현재 프로세스 추출은 ParallelPageExtractor._extract_local)
+
+    Returns:
+        [(페이지 번호, 텍스트)]
+    """
+    pdf = _worker_documents.get(pdf_path)
+    if pdf is None:
+        import pdfplumber
+        pdf = pdfplumber.open(pdf_path)
+        _worker_documents[pdf_path] = pdf
+    return [(index, pdf.pages[index].extract_text(**settings) or "") for index in page_indices]
+
+def _split_chunks(page_indices: List[int], chunk_size: int) -> List[List[int]]:
+    """정렬된 페이지 번호를 연속 구간 기준 chunk_size 단위로 분할"""
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    for index in page_indices:
+        if current and (len(current) >= chunk_size or index != current[-1] + 1):
+            chunks.append(current)
+            current = []
+        current.append(index)
+    if current:
+        chunks.append(current)
+    return chunks
+
+class ParallelPageExtractor:
+    """
+    병렬 페이지 텍스트 추출기
+    - 청크 단위로 프로세스 풀에 제출하고, 결과는 제출 순서(=페이지 순서)대로 반환
+    - workers=1이거나 추출할 페이지가 한 청크 이하이면 현재 프로세스에서 추출
+    """
+
+    def __init__(
+        self,
+        pdf_path: str,
+        settings: Optional[Dict[str, Any]] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 8,
+        use_store: bool = True,
+        store_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            pdf_path: PDF 경로
+            settings: page.extract_text() 인자
+            workers: 워커 프로세스 수 (None이면 CPU 수)
+            chunk_size: 워커 1회 작업당 페이지 수
+            use_store: 페이지 텍스트 캐시 사용 여부
+            store_dir: 캐시 디렉토리 (None이면 기본 경로)
+        """
+        self.pdf_path = os.path.abspath(str(pdf_path))
+        self.settings = settings or {}
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self.store: Optional[PageTextStore] = None
+        self._page_count: Optional[int] = None
+        self._pdf = None
+
+        if use_store:
+            content_hash = pdf_content_hash(self.pdf_path)
+            self.store = PageTextStore.open_existing(content_hash, self.settings, store_dir)
+            if self.store is None:
+                self.store = PageTextStore(content_hash, self.page_count, self.settings, store_dir)
+
+        self.stats = {"cached_pages": 0, "extracted_pages": 0, "chunks": 0}
+
+    @property
+    def page_count(self) -> int:
+        """PDF 페이지 수 (캐시 헤더 우선)"""
+        if self._page_count is None:
+            if self.store is not None:
+                self._page_count = self.store.page_count
+            else:
+                import pdfplumber
+                with pdfplumber.open(self.pdf_path) as pdf:
+                    self._page_count = len(pdf.pages)
+        return self._page_count
+
+    def iter_pages(self, page_indices: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        페이지 텍스트를 페이지 순서대로 스트리밍
+
+        Args:
+            page_indices: 추출할 0 기반 페이지 번호들 (None이면 전체)
+
+        Yields:
+            (페이지 번호, 텍스트)
+        """
+        if page_indices is None:
+            indices = list(range(self.page_count))
+        else:
+            indices = sorted({index for index in page_indices if 0 <= index < self.page_count})
+
+        # 캐시 여부만 먼저 확인하고, 캐시된 텍스트는 순서가 올 때 읽음 (전체를 메모리에 올리지 않음)
+        if self.store is not None:
+            missing_set = set(self.store.missing_pages())
+            missing = [index for index in indices if index in missing_set]
+        else:
+            missing = list(indices)
+        cached = set(indices).difference(missing)
+
+        chunks = _split_chunks(missing, self.chunk_size)
+        self.stats["chunks"] += len(chunks)
+
+        if self.workers == 1 or len(chunks) <= 1:
+            results = (self._extract_local(chunk) for chunk in chunks)
+            yield from self._merge_in_order(indices, cached, results)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks))) as executor:
+            futures: List[Future] = [
+                executor.submit(_extract_chunk, self.pdf_path, chunk, self.settings)
+                for chunk in chunks
+            ]
+            try:
+                yield from self._merge_in_order(indices, cached, (future.result() for future in futures))
+            finally:
+                # 소비자가 중간에 멈추면 남은 청크 취소
+                for future in futures:
+                    future.cancel()
+
+    def _merge_in_order(
+        self,
+        indices: List[int],
+        cached: Set[int],
+        chunk_results: Iterator[List[Tuple[int, str]]]
+    ) -> Iterator[Tuple[int, str]]:
+        """캐시된 페이지와 청크 결과(페이지 순서)를 합쳐 순서대로 yield"""
+        extracted: Dict[int, str] = {}
+        for index in indices:
+            if index in cached:
+                text = self.store.get(index)
+                if text is None:
+                    # 캐시 파일이 그 사이 교체된 경우 현재 프로세스에서 직접 추출
+                    text = self._extract_local([index])[0][1]
+                self.stats["cached_pages"] += 1
+                yield index, text
+                continue
+            while index not in extracted:
+                chunk = next(chunk_results)
+                extracted.update(chunk)
+                self.stats["extracted_pages"] += len(chunk)
+                if self.store is not None:
+                    self.store.put_many(dict(chunk))
+            yield index, extracted.pop(index)
+
+    def _extract_local(self, page_indices: List[int]) -> List[Tuple[int, str]]:
+        """현재 프로세스에서 페이지 묶음 추출 (추출기 소유 pdfplumber 핸들 재사용)"""
+        if self._pdf is None:
+            import pdfplumber
+            self._pdf = pdfplumber.open(self.pdf_path)
+        return [(index, self._pdf.pages[index].extract_text(**self.settings) or "") for index in page_indices]
+
+    def extract_all(self) -> List[str]:
+        """전체 페이지 텍스트 리스트"""
+        return [text for _, text in self.iter_pages()]
+
+    def extract_pages(self, page_indices: Iterable[int]) -> Dict[int, str]:
+        """선택 페이지 텍스트 {페이지 번호: 텍스트}"""
+        return dict(self.iter_pages(page_indices))
+
+    def close(self):
+        """현재 프로세스 PDF 핸들과 캐시 mmap 해제"""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        if self.store is not None:
+            self.store.close()
@@ -0,0 +1,146 @@
+"""
+생성 시간: 2026-10-18 15:10:24
+핵심 내용: 트라이그램 색인 기반 제목(헤딩) 위치 탐색기 (라인별 SequenceMatcher / text.find 반복 대체)
+상세 내용:
+    - TitleLocator 클래스: 텍스트를 1회 라인 분할하며 라인 → 문자 오프셋과 정규화 라인의 트라이그램 색인 생성
+    - locate 메서드: 제목 1개의 최고 점수 라인 (제목 트라이그램을 공유하는 라인만 후보로 점수 계산)
+    - locate_many 메서드: 여러 제목을 한 번에 조회 (색인은 공유)
+    - candidates 메서드: 점수순 상위 후보 라인 목록
+    - 점수: 정규화 제목이 라인에 포함되면 1.0, 아니면 트라이그램 겹침 상위 후보만 SequenceMatcher 비율로 검증
+    - 같은 내용의 라인이 여러 번 나와도 라인 번호별 오프셋을 보관하므로 위치가 정확함
+상태:
+주소: shared/title_locator
+참조:
+"""
+
+import heapq
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+_NON_WORD_RE = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def normalize_line(text: str) -> str:
+    """비교용 정규화 (소문자, 영숫자/한글 외 문자는 공백 1개로)"""
+    return _NON_WORD_RE.sub(' ', text.lower()).strip()
+
+
+def _trigrams(normalized: str) -> List[str]:
+    padded = f" {normalized} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class TitleMatch(NamedTuple):
+    """제목과 일치한 라인"""
+    line_index: int
+    start: int      # 라인 시작 문자 오프셋
+    end: int        # 라인 끝 문자 오프셋 (줄바꿈 제외)
+    score: float
+    line: str
+
+
+class TitleLocator:
+    """
+    텍스트 1개에 대한 제목 위치 탐색기
+    - 생성 1회: O(텍스트 길이)
+    - 조회: 제목 트라이그램의 posting list 길이 + 상위 후보 verify_top개만 SequenceMatcher
+    """
+
+    def __init__(self, text: str, verify_top: int = 8):
+        """
+        Args:
+            text: 검색 대상 텍스트 (챕터 전체 등)
+            verify_top: 트라이그램 겹침 상위 몇 개 라인을 SequenceMatcher로 검증할지
+        """
+        self.text = text
+        self.verify_top = verify_top
+        self.lines: List[str] = []
+        self.offsets: List[int] = []
+        self.normalized: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+
+        offset = 0
+        for line_index, raw_line in enumerate(text.splitlines(keepends=True)):
+            line = raw_line.rstrip('\r\n')
+            self.lines.append(line)
+            self.offsets.append(offset)
+            offset += len(raw_line)
+
+            normalized = normalize_line(line)
+            self.normalized.append(normalized)
+            if normalized:
+                for gram in set(_trigrams(normalized)):
+                    self._postings.setdefault(gram, []).append(line_index)
+
+    def _match(self, line_index: int, score: float) -> TitleMatch:
+        start = self.offsets[line_index]
+        line = self.lines[line_index]
+        return TitleMatch(line_index, start, start + len(line), score, line)
+
+    def candidates(
+        self,
+        title: str,
+        threshold: float = 0.6,
+        min_offset: int = 0,
+        max_offset: Optional[int] = None,
+        limit: int = 5
+    ) -> List[TitleMatch]:
+        """
+        제목과 일치하는 후보 라인 (점수 내림차순, 같은 점수는 앞 라인 우선)
+
+        Args:
+            title: 찾을 제목
+            threshold: 최소 점수 (초과해야 후보)
+            min_offset / max_offset: 라인 시작 오프셋 검색 범위
+            limit: 최대 후보 수
+        """
+        wanted = normalize_line(title)
+        if not wanted:
+            return []
+        grams = set(_trigrams(wanted))
+
+        overlap: Counter = Counter()
+        for gram in grams:
+            overlap.update(self._postings.get(gram, ()))
+
+        in_range = [
+            (line_index, shared) for line_index, shared in overlap.items()
+            if self.offsets[line_index] >= min_offset and (max_offset is None or self.offsets[line_index] <= max_offset)
+        ]
+
+        scored = []
+        # 모든 트라이그램을 공유하는 라인은 포함 여부만 확인
+        for line_index, shared in in_range:
+            if shared == len(grams) and wanted in self.normalized[line_index]:
+                scored.append((1.0, line_index))
+        # 나머지는 겹침 상위 verify_top개만 SequenceMatcher로 검증
+        contained = {line_index for _, line_index in scored}
+        top_lines = heapq.nsmallest(
+            self.verify_top,
+            (item for item in in_range if item[0] not in contained),
+            key=lambda item: (-item[1], item[0])
+        )
+        for line_index, _ in top_lines:
+            score = SequenceMatcher(None, wanted, self.normalized[line_index]).ratio()
+            if score > threshold:
+                scored.append((score, line_index))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [self._match(line_index, score) for score, line_index in scored[:limit]]
+
+    def locate(
+        self,
+        title: str,
+        threshold: float = 0.6,
+        min_offset: int = 0,
+        max_offset: Optional[int] = None
+    ) -> Optional[TitleMatch]:
+        """제목의 최고 점수 라인 (없으면 None)"""
+        found = self.candidates(title, threshold, min_offset, max_offset, limit=1)
+        return found[0] if found else None
+
+    def locate_many(self, titles: Iterable[str], threshold: float = 0.6) -> Dict[str, Optional[TitleMatch]]:
+        """여러 제목의 최고 점수 라인 {제목: TitleMatch 또는 None}"""
+        return {title: self.locate(title, threshold) for title in titles}